@@ -180,7 +180,8 @@ async def main():
         # Create RiskManager with loaded config
         risk_manager = await RiskManager.create(
             config=runtime_config.risk_config,
-            timers_config=runtime_config.timers_config
+            timers_config=runtime_config.timers_config,
+            events_config=runtime_config.events_config
         )
 
         console.print("[green]Risk Manager initialized![/green]")
@@ -206,6 +207,7 @@ async def main():
             instruments=runtime_config.risk_config.general.instruments,
             config=runtime_config.risk_config,
             event_bus=risk_manager.event_bus,
+            events_config=runtime_config.events_config,
         )
 
         # Connect to SDK
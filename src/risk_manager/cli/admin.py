@@ -6,6 +6,7 @@ Provides commands for:
 - Configuration management (show, edit, validate, reload)
 - Rule management (list, enable, disable, configure)
 - Lockout management (list, remove, history)
+- History analytics (pnl, symbols, violations) and archive compaction
 - Monitoring (status, logs)
 
 All commands require administrator privileges (UAC elevation on Windows).
@@ -13,6 +14,7 @@ All commands require administrator privileges (UAC elevation on Windows).
 
 import asyncio
 import ctypes
+import functools
 import os
 import platform
 import subprocess
@@ -69,6 +71,7 @@ def require_admin(func):
 
     If not admin, shows error message and exits.
     """
+    @functools.wraps(func)  # Typer reads the command's parameters from the signature
     def wrapper(*args, **kwargs):
         if not is_admin():
             console.print()
@@ -147,6 +150,37 @@ def save_risk_config(config: dict) -> None:
     console.print(f"[green]Configuration saved: {config_file}[/green]")
 
 
+def open_history():
+    """
+    Open the state database and its Parquet archive.
+
+    Paths come from risk_config.yaml (general.database); the trading-day
+    reset comes from timers_config.yaml when present.
+
+    Returns:
+        (Database, archive directory)
+    """
+    from risk_manager.state.database import Database
+
+    database_config = (load_risk_config().get("general") or {}).get("database") or {}
+    db_path = Path(database_config.get("path", "data/risk_state.db"))
+    archive_dir = Path(database_config.get("archive_directory", "data/archive/"))
+
+    if not db_path.exists():
+        console.print(f"[red]Database not found: {db_path}[/red]")
+        raise typer.Exit(code=1)
+
+    reset_kwargs = {}
+    timers_file = get_config_dir() / "timers_config.yaml"
+    if timers_file.exists():
+        with open(timers_file, 'r') as f:
+            daily_reset = (yaml.safe_load(f) or {}).get("daily_reset") or {}
+        if "time" in daily_reset and "timezone" in daily_reset:
+            reset_kwargs = {"reset_time": daily_reset["time"], "reset_timezone": daily_reset["timezone"]}
+
+    return Database(db_path, **reset_kwargs), archive_dir
+
+
 # ==============================================================================
 # SERVICE CONTROL GROUP
 # ==============================================================================
@@ -1079,25 +1113,162 @@ def lockouts_history(
     console.print()
 
     try:
-        # TODO: Load lockout history from database
+        from risk_manager.state.analytics import TradeAnalytics
+
+        database, archive_dir = open_history()
+        history = TradeAnalytics(database, archive_dir).lockout_history(account_id, limit)
+        database.close()
+
         table = Table(title="Lockout History", box=box.ROUNDED)
-        table.add_column("Date", style="cyan", no_wrap=True)
+        table.add_column("Locked At", style="cyan", no_wrap=True)
         table.add_column("Account", style="white", no_wrap=True)
+        table.add_column("Rule", style="white", no_wrap=True)
         table.add_column("Reason", style="dim")
-        table.add_column("Duration", style="yellow")
+        table.add_column("Expires", style="yellow")
 
-        # Example data (replace with actual database query)
-        # table.add_row("2025-10-28", "PRAC-V2-126244", "RULE-003: Daily Loss", "Until Reset")
+        for row in history.iter_rows(named=True):
+            table.add_row(
+                row["locked_at"], row["account_id"], row["rule_id"], row["reason"],
+                row["expires_at"] or "Until Reset"
+            )
 
         console.print(table)
         console.print()
-        console.print("[dim]No lockout history[/dim]")
+        if history.is_empty():
+            console.print("[dim]No lockout history[/dim]")
 
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]Error loading history: {e}[/red]")
         raise typer.Exit(code=1)
 
 
+# ==============================================================================
+# ANALYTICS GROUP
+# ==============================================================================
+
+analytics = typer.Typer(help="Trade history analytics (live database + archive)")
+app.add_typer(analytics, name="analytics")
+
+
+def print_frame(frame, title: str, money_columns: tuple = ()) -> None:
+    """Render a polars DataFrame as a Rich table."""
+    table = Table(title=title, box=box.ROUNDED)
+    for column in frame.columns:
+        table.add_column(column, style="cyan" if column == frame.columns[0] else "white")
+
+    for row in frame.iter_rows():
+        cells = []
+        for column, value in zip(frame.columns, row):
+            if value is None:
+                cells.append("-")
+            elif column in money_columns:
+                cells.append(f"${value:,.2f}")
+            elif isinstance(value, float):
+                cells.append(f"{value:.2f}")
+            else:
+                cells.append(str(value))
+        table.add_row(*cells)
+
+    console.print(table)
+    if frame.is_empty():
+        console.print("[dim]No data[/dim]")
+
+
+@analytics.command("pnl")
+def analytics_pnl(
+    account_id: Optional[str] = typer.Option(None, "--account", "-a", help="Filter by account ID"),
+    weeks: float = typer.Option(4, "--weeks", "-w", help="Look-back in weeks")
+):
+    """Show the daily P&L curve."""
+    from risk_manager.state.analytics import TradeAnalytics
+
+    try:
+        database, archive_dir = open_history()
+        curve = TradeAnalytics(database, archive_dir).pnl_curve(account_id, weeks)
+        database.close()
+        print_frame(curve, f"P&L Curve (last {weeks:g} weeks)",
+                    money_columns=("realized_pnl", "cumulative_pnl", "drawdown"))
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error loading P&L curve: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
+@analytics.command("symbols")
+def analytics_symbols(
+    account_id: Optional[str] = typer.Option(None, "--account", "-a", help="Filter by account ID"),
+    weeks: float = typer.Option(4, "--weeks", "-w", help="Look-back in weeks")
+):
+    """Show per-symbol trade statistics."""
+    from risk_manager.state.analytics import TradeAnalytics
+
+    try:
+        database, archive_dir = open_history()
+        stats = TradeAnalytics(database, archive_dir).symbol_stats(account_id, weeks)
+        database.close()
+        print_frame(stats, f"Symbol Stats (last {weeks:g} weeks)",
+                    money_columns=("realized_pnl", "avg_pnl"))
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error loading symbol stats: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
+@analytics.command("violations")
+def analytics_violations(
+    account_id: Optional[str] = typer.Option(None, "--account", "-a", help="Filter by account ID"),
+    weeks: float = typer.Option(4, "--weeks", "-w", help="Look-back in weeks")
+):
+    """Show how often each rule locked accounts out."""
+    from risk_manager.state.analytics import TradeAnalytics
+
+    try:
+        database, archive_dir = open_history()
+        frequency = TradeAnalytics(database, archive_dir).violation_frequency(account_id, weeks)
+        database.close()
+        print_frame(frequency, f"Violation Frequency (last {weeks:g} weeks)")
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error loading violations: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
+@analytics.command("compact")
+@require_admin
+def analytics_compact(
+    retain_days: Optional[int] = typer.Option(
+        None, "--retain-days", help="Closed trading days to keep in SQLite (default: config)"
+    )
+):
+    """Move closed trading days from SQLite into the Parquet archive."""
+    from risk_manager.state.archive import TradeArchive
+
+    try:
+        database, archive_dir = open_history()
+        if retain_days is None:
+            database_config = (load_risk_config().get("general") or {}).get("database") or {}
+            retain_days = database_config.get("archive_retain_days", 1)
+
+        archive = TradeArchive(database, archive_dir, retain_days=retain_days)
+        console.print(f"[cyan]Archiving rows before {archive.cutoff().isoformat()}...[/cyan]")
+        archived = archive.compact()
+        database.close()
+
+        for table_name, count in archived.items():
+            console.print(f"  {table_name}: {count} row(s)")
+        console.print(f"[green]Archive: {archive_dir}[/green]")
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error compacting database: {e}[/red]")
+        raise typer.Exit(code=1)
+
+
 # ==============================================================================
 # SETUP WIZARD
 # ==============================================================================
@@ -60,7 +60,8 @@ class RuntimeConfig:
         config_dir: Path,
         risk_config_path: Path,
         accounts_config_path: Path,
-        timers_config=None  # Optional timers config
+        timers_config=None,  # Optional timers config
+        events_config=None  # Optional events config
     ):
         """Initialize runtime configuration."""
         self.risk_config = risk_config
@@ -71,6 +72,7 @@ class RuntimeConfig:
         self.risk_config_path = risk_config_path
         self.accounts_config_path = accounts_config_path
         self.timers_config = timers_config
+        self.events_config = events_config
 
     def __repr__(self) -> str:
         """String representation for logging."""
@@ -200,6 +202,28 @@ def load_runtime_config(
 
     console.print()
 
+    # 2c. Load events configuration (optional)
+    console.print("[bold]2c. Loading events configuration[/bold]")
+    events_config = None
+    events_config_path = config_dir / "events_config.yaml"
+
+    if events_config_path.exists():
+        console.print(f"   File: {events_config_path.absolute()}")
+        try:
+            events_config = loader.load_events_config()
+            console.print(f"   OK: Events configuration loaded")
+            console.print(
+                f"   OK: Queue size: {events_config.processing.max_queue_size} per lane "
+                f"({events_config.processing.backpressure_strategy})"
+            )
+        except Exception as e:
+            console.print(f"[yellow]   WARN: Events configuration loading failed: {e}[/yellow]")
+            console.print(f"[yellow]   Events will be dispatched inline[/yellow]")
+    else:
+        console.print(f"   SKIP: events_config.yaml not found (events will be dispatched inline)")
+
+    console.print()
+
     # 3. Load accounts configuration
     console.print("[bold]3. Loading accounts configuration[/bold]")
     console.print(f"   File: {accounts_config_path.absolute()}")
@@ -256,7 +280,8 @@ def load_runtime_config(
         config_dir=config_dir,
         risk_config_path=risk_config_path,
         accounts_config_path=accounts_config_path,
-        timers_config=timers_config
+        timers_config=timers_config,
+        events_config=events_config
     )
 
 
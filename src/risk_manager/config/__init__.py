@@ -64,6 +64,7 @@ try:
     GeneralConfig,
     LoggingConfig,
     DatabaseConfig,
+    JournalConfig,
     NotificationsConfig,
     DiscordConfig,
     TelegramConfig,
@@ -120,6 +121,16 @@ try:
     AdvancedApiConfig,
     ConnectionPoolConfig,
     SSLConfig,
+
+    # Events Configuration
+    EventsConfig,
+    QuoteEventsConfig,
+    PositionEventsConfig,
+    OrderEventsConfig,
+    TradeEventsConfig,
+    AccountEventsConfig,
+    BarEventsConfig,
+    EventProcessingConfig,
 )
     # If import successful, set __all__ with models
     _models_available = True
@@ -151,6 +162,7 @@ if _models_available:
     "GeneralConfig",
     "LoggingConfig",
     "DatabaseConfig",
+    "JournalConfig",
     "NotificationsConfig",
     "DiscordConfig",
     "TelegramConfig",
@@ -208,6 +220,16 @@ if _models_available:
     "ConnectionPoolConfig",
     "SSLConfig",
 
+    # Events
+    "EventsConfig",
+    "QuoteEventsConfig",
+    "PositionEventsConfig",
+    "OrderEventsConfig",
+    "TradeEventsConfig",
+    "AccountEventsConfig",
+    "BarEventsConfig",
+    "EventProcessingConfig",
+
     # Environment utilities
     "load_env_file",
     "substitute_env_vars",
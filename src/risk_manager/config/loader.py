@@ -353,6 +353,44 @@ class ConfigLoader:
         # Validate
         return self._validate_with_pydantic(data, ApiConfig, file_path)
 
+    def load_events_config(self, file_name: str = "events_config.yaml") -> BaseModel | None:
+        """Load events configuration (quote throttling, priorities, backpressure).
+
+        Args:
+            file_name: Name of events config file (default: events_config.yaml)
+
+        Returns:
+            EventsConfig instance (validated) or None if file not found
+
+        Note:
+            This config file is OPTIONAL. If not present, defaults will be used.
+
+        Example:
+            events = loader.load_events_config()
+            if events:
+                print(f"Backpressure: {events.processing.backpressure_strategy}")
+        """
+        file_path = self.config_dir / file_name
+
+        # Events config is optional - return None if not found
+        if not file_path.exists():
+            logger.info(f"Events config file not found (optional): {file_name}")
+            return None
+
+        # Load YAML
+        data = self._load_yaml_file(file_path)
+
+        # Import model (deferred to avoid circular import)
+        try:
+            from .models import EventsConfig
+        except ImportError:
+            raise ConfigurationError(
+                "EventsConfig model not found. Ensure Agent 1 has created models.py"
+            )
+
+        # Validate
+        return self._validate_with_pydantic(data, EventsConfig, file_path)
+
     def load_all_configs(self) -> dict[str, BaseModel]:
         """Load all configuration files.
 
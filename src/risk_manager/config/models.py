@@ -1,11 +1,12 @@
 """
 Pydantic Configuration Models for Risk Manager V34
 
-This module contains ALL configuration models for the four config files:
+This module contains ALL configuration models for the five config files:
 1. timers_config.yaml - Daily resets, lockouts, session hours, holidays
 2. risk_config.yaml - All 13 risk rules
 3. accounts.yaml - Account credentials and multi-account support
 4. api_config.yaml - API connection settings
+5. events_config.yaml - Event routing, quote throttling, priorities
 
 All models use Pydantic v2 with comprehensive validation.
 """
@@ -525,6 +526,32 @@ class DatabaseConfig(BaseModel):
         default=24, ge=1, description="Backup interval in hours"
     )
     max_backups: int = Field(default=7, ge=1, description="Maximum backup files to keep")
+    archive_directory: str = Field(
+        default="data/archive/", description="Parquet archive of closed trading days"
+    )
+    archive_retain_days: int = Field(
+        default=1, ge=0, description="Closed trading days kept in SQLite before archiving"
+    )
+
+
+class JournalConfig(BaseModel):
+    """Binary event journal configuration (audit, crash recovery, replay)."""
+
+    enabled: bool = Field(default=False, description="Record every published event")
+    directory: str = Field(default="data/journal/", description="Journal segment directory")
+    segment_max_mb: int = Field(
+        default=64, ge=1, description="Rotate to a new segment past this size in MB"
+    )
+    fsync_interval_ms: int = Field(
+        default=200, ge=1, description="Max time between fsyncs in milliseconds"
+    )
+    fsync_batch_size: int = Field(
+        default=256, ge=1, description="Fsync after this many unsynced records"
+    )
+    exclude_event_types: list[str] = Field(
+        default_factory=list,
+        description="Event types not to record (e.g., ['market_data_updated'])",
+    )
 
 
 class GeneralConfig(BaseModel):
@@ -543,6 +570,9 @@ class GeneralConfig(BaseModel):
     database: DatabaseConfig = Field(
         default_factory=DatabaseConfig, description="Database configuration"
     )
+    journal: JournalConfig = Field(
+        default_factory=JournalConfig, description="Event journal configuration"
+    )
     notifications: NotificationsConfig = Field(
         default_factory=NotificationsConfig, description="Notifications configuration"
     )
@@ -1486,3 +1516,125 @@ class ApiConfig(BaseModel):
     advanced: AdvancedApiConfig = Field(
         default_factory=AdvancedApiConfig, description="Advanced settings"
     )
+
+
+# ==============================================================================
+# EVENTS CONFIGURATION MODELS
+# ==============================================================================
+
+EventPriorityLevel = Literal["critical", "high", "normal"]
+
+
+class QuoteEventsConfig(BaseModel):
+    """Quote (market data) event configuration (RULE-004, RULE-005)."""
+
+    enabled: bool = Field(default=True, description="Enable quote subscription")
+    symbols: list[str] = Field(
+        default_factory=list, description="Symbol filter (empty = auto-track positions)"
+    )
+    update_interval_ms: int = Field(
+        default=1000, ge=100, le=5000, description="Quote update throttle (milliseconds)"
+    )
+    fields: list[str] = Field(
+        default_factory=lambda: ["last", "bid", "ask"], description="Price fields to track"
+    )
+    auto_subscribe_on_position: bool = Field(
+        default=True, description="Subscribe to quotes when a position opens"
+    )
+    auto_unsubscribe_on_close: bool = Field(
+        default=True, description="Unsubscribe from quotes when a position closes"
+    )
+    buffer_size: int = Field(default=10, ge=1, description="Quote buffer size")
+    buffer_flush_interval_ms: int = Field(
+        default=500, gt=0, description="Quote buffer flush interval (milliseconds)"
+    )
+
+
+class PositionEventsConfig(BaseModel):
+    """Position event configuration."""
+
+    enabled: bool = Field(default=True, description="Enable position events")
+    priority: EventPriorityLevel = Field(default="critical", description="Processing priority")
+
+
+class OrderEventsConfig(BaseModel):
+    """Order event configuration."""
+
+    enabled: bool = Field(default=True, description="Enable order events")
+    priority_map: dict[str, EventPriorityLevel] = Field(
+        default_factory=lambda: {
+            "PLACED": "critical",
+            "FILLED": "critical",
+            "REJECTED": "critical",
+            "CANCELLED": "normal",
+            "MODIFIED": "normal",
+            "PARTIAL_FILL": "high",
+        },
+        description="Processing priority per order event",
+    )
+
+
+class TradeEventsConfig(BaseModel):
+    """Trade execution event configuration (RULE-003, RULE-013)."""
+
+    enabled: bool = Field(default=True, description="Enable trade events")
+    priority: EventPriorityLevel = Field(default="critical", description="Processing priority")
+    track_pnl: bool = Field(default=True, description="Track realized P&L from trades")
+
+
+class AccountEventsConfig(BaseModel):
+    """Account status event configuration (RULE-010)."""
+
+    enabled: bool = Field(default=True, description="Enable account events")
+    priority: EventPriorityLevel = Field(default="critical", description="Processing priority")
+
+
+class BarEventsConfig(BaseModel):
+    """Bar event configuration (optional)."""
+
+    enabled: bool = Field(default=False, description="Enable bar events")
+    priority: EventPriorityLevel = Field(default="normal", description="Processing priority")
+
+
+class EventProcessingConfig(BaseModel):
+    """Event queue and backpressure configuration."""
+
+    max_queue_size: int = Field(
+        default=1000, ge=1, description="Max queued events per lane before backpressure"
+    )
+    backpressure_strategy: Literal["drop_oldest", "drop_newest", "block"] = Field(
+        default="drop_oldest", description="Action when a normal/market data lane is full (the critical lane never drops)"
+    )
+    processing_timeout_ms: int = Field(
+        default=100, gt=0, description="Max time per event before warning (milliseconds)"
+    )
+    concurrent_handlers: bool = Field(
+        default=False, description="Run an event's async handlers concurrently"
+    )
+    handler_timeout_ms: int = Field(
+        default=5000, gt=0, description="Cancel a handler that runs longer than this (milliseconds, concurrent mode only)"
+    )
+
+
+class EventsConfig(BaseModel):
+    """Complete events configuration (events_config.yaml)."""
+
+    quotes: QuoteEventsConfig = Field(
+        default_factory=QuoteEventsConfig, description="Quote events"
+    )
+    positions: PositionEventsConfig = Field(
+        default_factory=PositionEventsConfig, description="Position events"
+    )
+    orders: OrderEventsConfig = Field(
+        default_factory=OrderEventsConfig, description="Order events"
+    )
+    trades: TradeEventsConfig = Field(
+        default_factory=TradeEventsConfig, description="Trade events"
+    )
+    account: AccountEventsConfig = Field(
+        default_factory=AccountEventsConfig, description="Account events"
+    )
+    bars: BarEventsConfig = Field(default_factory=BarEventsConfig, description="Bar events")
+    processing: EventProcessingConfig = Field(
+        default_factory=EventProcessingConfig, description="Queueing and backpressure"
+    )
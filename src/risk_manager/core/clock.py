@@ -0,0 +1,103 @@
+"""
+Clock sources for the risk manager.
+
+Live trading reads the system clock. Replay (and tests) drive a
+VirtualClock instead, so cooldowns, lockouts and daily resets follow the
+recorded timeline rather than wall time.
+
+Example:
+    ```python
+    clock = VirtualClock(datetime(2025, 1, 17, 14, 30, tzinfo=timezone.utc))
+    clock.now(timezone.utc)   # 2025-01-17 14:30:00+00:00
+    clock.advance(90)
+    clock.now(timezone.utc)   # 2025-01-17 14:31:30+00:00
+    ```
+"""
+
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone, tzinfo
+
+
+class Clock(ABC):
+    """Source of the current time."""
+
+    @abstractmethod
+    def now(self, tz: tzinfo | None = None) -> datetime:
+        """
+        Current time, with the same semantics as ``datetime.now(tz)``.
+
+        Naive local time when ``tz`` is None, aware in ``tz`` otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def monotonic(self) -> float:
+        """Seconds on a clock that never goes backwards."""
+        pass
+
+
+class SystemClock(Clock):
+    """Wall clock of the host."""
+
+    def now(self, tz: tzinfo | None = None) -> datetime:
+        return datetime.now(tz)
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+
+class VirtualClock(Clock):
+    """
+    Manually driven clock.
+
+    Time only moves when ``set()`` or ``advance()`` is called. It never
+    moves backwards: setting an earlier time is ignored, so out-of-order
+    input cannot undo an expiry that already happened.
+    """
+
+    def __init__(self, start: datetime | None = None):
+        """
+        Initialize virtual clock.
+
+        Args:
+            start: Initial time (naive values are taken as UTC).
+                Defaults to the current wall time.
+        """
+        if start is None:
+            start = datetime.now(timezone.utc)
+        self._now = self._as_utc(start)
+        self._monotonic = 0.0
+
+    @staticmethod
+    def _as_utc(moment: datetime) -> datetime:
+        if moment.tzinfo is None:
+            return moment.replace(tzinfo=timezone.utc)
+        return moment.astimezone(timezone.utc)
+
+    def now(self, tz: tzinfo | None = None) -> datetime:
+        if tz is None:
+            return self._now.astimezone().replace(tzinfo=None)
+        return self._now.astimezone(tz)
+
+    def monotonic(self) -> float:
+        return self._monotonic
+
+    def set(self, moment: datetime) -> bool:
+        """
+        Move the clock forward to ``moment``.
+
+        Returns:
+            True if the clock moved, False if ``moment`` was not later
+        """
+        moment = self._as_utc(moment)
+        if moment <= self._now:
+            return False
+        self._monotonic += (moment - self._now).total_seconds()
+        self._now = moment
+        return True
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward by ``seconds``."""
+        if seconds > 0:
+            self.set(self._now + timedelta(seconds=seconds))
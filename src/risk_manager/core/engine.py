@@ -25,6 +25,9 @@ class RiskEngine:
         self.rules: list[Any] = []  # Will be filled with rule objects
         self.running = False
 
+        # EventType → rules that consume it (rebuilt lazily after add_rule)
+        self._dispatch_table: dict[EventType, list[Any]] | None = None
+
         # State tracking
         self.daily_pnl = 0.0
         self.peak_balance = 0.0
@@ -63,19 +66,43 @@ class RiskEngine:
     def add_rule(self, rule: Any) -> None:
         """Add a risk rule."""
         self.rules.append(rule)
+        self._dispatch_table = None
         logger.info(f"Added rule: {rule.__class__.__name__}")
 
+    def _build_dispatch_table(self) -> dict[EventType, list[Any]]:
+        """Precompute EventType → rules, preserving registration order.
+
+        Rules without a declared ``event_types`` set receive every event.
+        """
+        table: dict[EventType, list[Any]] = {event_type: [] for event_type in EventType}
+        for rule in self.rules:
+            event_types = getattr(rule, "event_types", None)
+            if not isinstance(event_types, (set, frozenset)):
+                event_types = EventType
+            for event_type in event_types:
+                table[event_type].append(rule)
+        return table
+
+    def get_rules_for_event(self, event_type: EventType) -> list[Any]:
+        """Return the rules that consume ``event_type``, in registration order."""
+        if self._dispatch_table is None:
+            self._dispatch_table = self._build_dispatch_table()
+        return self._dispatch_table.get(event_type, [])
+
     async def evaluate_rules(self, event: RiskEvent) -> list[dict[str, Any]]:
-        """Evaluate all rules against an event.
+        """Evaluate the rules that consume this event type.
 
         Returns:
             List of violations detected by rules. Empty list if no violations.
         """
+        rules = self.get_rules_for_event(event.event_type)
+
         # Checkpoint 6: Event received (simple text format)
-        if len(self.rules) > 0:
-            logger.info(f"📨 Event: {event.event_type.value} → evaluating {len(self.rules)} rules")
+        if rules:
+            logger.info(f"📨 Event: {event.event_type.value} → evaluating {len(rules)} rules")
         else:
-            logger.debug(f"📨 Event received: {event.event_type.value} - no rules configured")
+            logger.debug(f"📨 Event received: {event.event_type.value} - no rules consume this event")
+            return []
 
         # ═══════════════════════════════════════════════════════════════
         # ⭐ PRE-CHECK LAYER: Respect timers/schedules from ALL rules
@@ -85,7 +112,7 @@ class RiskEngine:
         # ═══════════════════════════════════════════════════════════════
 
         if self.lockout_manager:
-            account_id = event.data.get("account_id")
+            account_id = event.account_id
 
             if account_id and self.lockout_manager.is_locked_out(account_id):
                 lockout_info = self.lockout_manager.get_lockout_info(account_id)
@@ -99,7 +126,7 @@ class RiskEngine:
                         f"<yellow>🔒 HARD LOCKOUT ACTIVE</yellow>\n"
                         f"   Reason: {reason}\n"
                         f"   Until: {until}\n"
-                        f"   ❌ Skipping ALL {len(self.rules)} rules (account locked)"
+                        f"   ❌ Skipping ALL {len(rules)} rules (account locked)"
                     )
                 elif lockout_type == 'cooldown':
                     remaining = lockout_info.get('remaining_seconds', 0)
@@ -107,17 +134,17 @@ class RiskEngine:
                         f"<yellow>⏱️  COOLDOWN ACTIVE</yellow>\n"
                         f"   Reason: {reason}\n"
                         f"   Remaining: {remaining}s\n"
-                        f"   ❌ Skipping ALL {len(self.rules)} rules (cooldown active)"
+                        f"   ❌ Skipping ALL {len(rules)} rules (cooldown active)"
                     )
                 else:
                     logger.opt(colors=True).warning(
                         f"<yellow>⚠️  LOCKOUT ACTIVE ({lockout_type})</yellow>\n"
                         f"   Reason: {reason}\n"
-                        f"   ❌ Skipping ALL {len(self.rules)} rules (lockout active)"
+                        f"   ❌ Skipping ALL {len(rules)} rules (lockout active)"
                     )
 
                 # Log each rule being skipped (debug level for detailed troubleshooting)
-                for rule in self.rules:
+                for rule in rules:
                     rule_name = rule.__class__.__name__.replace('Rule', '')
                     logger.debug(f"   ❌ {rule_name} - NOT EVALUATED (lockout active)")
 
@@ -125,12 +152,12 @@ class RiskEngine:
                 return []
 
         # ✅ PRE-CHECK PASSED - No lockout active, evaluate rules normally
-        logger.opt(colors=True).debug(f"<green>✅ PRE-CHECK PASSED: No lockout active, evaluating {len(self.rules)} rules</green>")
+        logger.opt(colors=True).debug(f"<green>✅ PRE-CHECK PASSED: No lockout active, evaluating {len(rules)} rules</green>")
 
         violations = []
         rule_results = []  # Track results for summary
 
-        for rule in self.rules:
+        for rule in rules:
             try:
                 violation = await rule.evaluate(event, self)
 
@@ -242,8 +269,8 @@ class RiskEngine:
 
         # MaxContractsPerInstrument - show position size
         if "MaxContractsPerInstrument" in rule_name:
-            symbol = event.data.get("symbol")
-            size = event.data.get("size", 0)
+            symbol = event.symbol
+            size = event.size or 0
             if symbol and size != 0:
                 limit = rule.limits.get(symbol) if hasattr(rule, "limits") else None
                 if limit is not None:
@@ -407,7 +434,8 @@ class RiskEngine:
         # Execute enforcement via TradingIntegration
         if self.trading_integration:
             try:
-                await self.trading_integration.flatten_position(contract_id)
+                # Shielded: a risk action must finish even if the caller is cancelled
+                await asyncio.shield(self.trading_integration.flatten_position(contract_id))
                 logger.success(f"✅ Position closed: {symbol}")
             except Exception as e:
                 logger.error(f"❌ Failed to close position {symbol}: {e}")
@@ -432,7 +460,8 @@ class RiskEngine:
         # Execute enforcement via TradingIntegration
         if self.trading_integration:
             try:
-                await self.trading_integration.flatten_all()
+                # Shielded: a risk action must finish even if the caller is cancelled
+                await asyncio.shield(self.trading_integration.flatten_all())
                 logger.success(f"✅ All positions flattened")
             except Exception as e:
                 logger.error(f"❌ Failed to flatten positions: {e}")
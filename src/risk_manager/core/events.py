@@ -1,10 +1,20 @@
 """Event system for risk management."""
 
 import asyncio
-from dataclasses import dataclass, field
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from risk_manager.config.models import EventsConfig
+
+logger = logging.getLogger(__name__)
 
 
 class EventType(str, Enum):
@@ -57,24 +67,172 @@ class EventType(str, Enum):
     AI_ALERT = "ai_alert"
 
 
-@dataclass
+# Typed hot-path fields mirrored into ``event.data`` for dict-based consumers
+_TYPED_FIELDS = ("account_id", "symbol", "contract_id", "size", "price")
+
+
 class RiskEvent:
-    """Risk management event."""
+    """Risk management event.
+
+    Slotted and allocation-light for the hot path: creation only records
+    integer monotonic and wall-clock ns timestamps, and the ``datetime``/ISO
+    forms are built on first access. ``account_id``, ``symbol``, ``contract_id``, ``size`` and ``price``
+    are typed attributes that rules read directly.
+
+    ``data`` remains available as a compatibility shim. Passing ``data=`` fills
+    the typed fields from it; passing the typed fields as keywords (with or
+    without extra ``data``) merges them into the dict only when ``data`` is
+    first read.
+    """
+
+    __slots__ = (
+        "event_type",
+        "source",
+        "severity",
+        "position",
+        "account_id",
+        "symbol",
+        "contract_id",
+        "size",
+        "price",
+        "ts_ns",
+        "_wall_ns",
+        "_data",
+        "_data_pending",
+        "_timestamp",
+        "_iso",
+    )
+
+    def __init__(
+        self,
+        event_type: EventType,
+        timestamp: datetime | None = None,
+        data: dict[str, Any] | None = None,
+        source: str = "risk_manager",
+        severity: str = "info",  # info, warning, error, critical
+        position: Any = None,  # Shadow mode: risk_manager.domain.types.Position when available
+        *,
+        account_id: Any = None,
+        symbol: str | None = None,
+        contract_id: str | None = None,
+        size: int | None = None,
+        price: float | None = None,
+        ts_ns: int | None = None,
+    ):
+        self.event_type = event_type
+        self.source = source
+        self.severity = severity
+        self.position = position
+        # Wall time is sampled per event (not derived from a fixed offset to
+        # the monotonic clock), so NTP slews and host suspend do not skew it
+        self._wall_ns = time.time_ns()
+        if ts_ns is None:
+            self.ts_ns = time.monotonic_ns()
+        else:
+            self.ts_ns = ts_ns
+            self._wall_ns -= time.monotonic_ns() - ts_ns
+        self._timestamp = timestamp
+        self._iso = None
+
+        self.account_id = account_id
+        self.symbol = symbol
+        self.contract_id = contract_id
+        self.size = size
+        self.price = price
+
+        self._data = data
+        # Typed keywords were given - merge them into data when it is read
+        self._data_pending = (
+            account_id is not None
+            or symbol is not None
+            or contract_id is not None
+            or size is not None
+            or price is not None
+        )
+        if data:
+            self._fill_typed_fields(data)
+
+    def _fill_typed_fields(self, data: dict[str, Any]) -> None:
+        if self.account_id is None:
+            self.account_id = data.get("account_id")
+        if self.symbol is None:
+            self.symbol = data.get("symbol")
+        if self.contract_id is None:
+            self.contract_id = data.get("contract_id")
+        if self.size is None:
+            self.size = data.get("size")
+        if self.price is None:
+            self.price = data.get("price")
 
-    event_type: EventType
-    timestamp: datetime = field(default_factory=datetime.now)
-    data: dict[str, Any] = field(default_factory=dict)
-    source: str = "risk_manager"
-    severity: str = "info"  # info, warning, error, critical
+    @property
+    def data(self) -> dict[str, Any]:
+        """Event payload as a dict (built from the typed fields on demand)."""
+        if self._data is None:
+            self._data = {}
+        if self._data_pending:
+            self._data_pending = False
+            data = self._data
+            for name in _TYPED_FIELDS:
+                value = getattr(self, name)
+                if value is not None:
+                    data.setdefault(name, value)
+            if self.contract_id is not None:
+                data.setdefault("contractId", self.contract_id)
+        return self._data
 
-    # Shadow mode: Canonical domain types (optional, populated by adapter)
-    position: Any = None  # Will be risk_manager.domain.types.Position when available
+    @data.setter
+    def data(self, value: dict[str, Any]) -> None:
+        self._data = value
+        self._data_pending = False
+        self.account_id = self.symbol = self.contract_id = self.size = self.price = None
+        if value:
+            self._fill_typed_fields(value)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock creation time (built lazily from ``wall_ns``)."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._wall_ns / 1_000_000_000)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
+        self._iso = None
+
+    @property
+    def wall_ns(self) -> int:
+        """Wall-clock creation time as integer nanoseconds since the epoch."""
+        if self._timestamp is not None:
+            return int(self._timestamp.timestamp() * 1_000_000_000)
+        return self._wall_ns
+
+    @property
+    def timestamp_iso(self) -> str:
+        """ISO-8601 form of ``timestamp``, built once on first use."""
+        if self._iso is None:
+            self._iso = self.timestamp.isoformat()
+        return self._iso
+
+    def snapshot(self) -> "RiskEvent":
+        """Shallow copy for readers on another thread.
+
+        Copies the slots and the ``data`` dict as given, without building
+        ``data`` from the typed fields, so later changes by handlers on the
+        event loop do not race with the reader.
+        """
+        copy = RiskEvent.__new__(RiskEvent)
+        for name in self.__slots__:
+            setattr(copy, name, getattr(self, name))
+        if self._data is not None:
+            copy._data = dict(self._data)
+        return copy
 
     def to_dict(self) -> dict[str, Any]:
         """Convert event to dictionary."""
         return {
             "event_type": self.event_type.value,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "data": self.data,
             "source": self.source,
             "severity": self.severity,
@@ -91,39 +249,505 @@ class RiskEvent:
             severity=data.get("severity", "info"),
         )
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RiskEvent):
+            return NotImplemented
+        return (
+            self.event_type == other.event_type
+            and self.timestamp == other.timestamp
+            and self.data == other.data
+            and self.source == other.source
+            and self.severity == other.severity
+        )
+
+    __hash__ = None  # Mutable, like the dataclass it replaced
+
+    def __repr__(self) -> str:
+        return (
+            f"RiskEvent(event_type={self.event_type!r}, data={self.data!r}, "
+            f"source={self.source!r}, severity={self.severity!r})"
+        )
+
+
+class EventPriority(str, Enum):
+    """Dispatch lanes for the queued EventBus, highest priority first."""
+
+    CRITICAL = "critical"  # Positions, fills, enforcement - never wait behind quotes
+    NORMAL = "normal"
+    MARKET_DATA = "market_data"  # Conflatable: latest value per symbol/contract wins
+
+
+class BackpressurePolicy(str, Enum):
+    """What a full lane does with a new event."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    BLOCK = "block"
+
+
+# Default lane per event type (anything not listed is NORMAL)
+DEFAULT_EVENT_PRIORITIES: dict[EventType, EventPriority] = {
+    EventType.POSITION_OPENED: EventPriority.CRITICAL,
+    EventType.POSITION_CLOSED: EventPriority.CRITICAL,
+    EventType.POSITION_UPDATED: EventPriority.CRITICAL,
+    EventType.ORDER_PLACED: EventPriority.CRITICAL,
+    EventType.ORDER_FILLED: EventPriority.CRITICAL,
+    EventType.ORDER_REJECTED: EventPriority.CRITICAL,
+    EventType.TRADE_EXECUTED: EventPriority.CRITICAL,
+    EventType.PNL_UPDATED: EventPriority.CRITICAL,
+    EventType.RULE_VIOLATED: EventPriority.CRITICAL,
+    EventType.ENFORCEMENT_ACTION: EventPriority.CRITICAL,
+    EventType.DAILY_LOSS_LIMIT: EventPriority.CRITICAL,
+    EventType.SDK_DISCONNECTED: EventPriority.CRITICAL,
+    EventType.AUTH_FAILED: EventPriority.CRITICAL,
+    EventType.CONNECTION_LOST: EventPriority.CRITICAL,
+    EventType.MARKET_DATA_UPDATED: EventPriority.MARKET_DATA,
+    EventType.UNREALIZED_PNL_UPDATE: EventPriority.MARKET_DATA,
+}
+
+# events_config.yaml priority levels → lanes ("high" shares the critical lane)
+_CONFIG_PRIORITY_LANES = {
+    "critical": EventPriority.CRITICAL,
+    "high": EventPriority.CRITICAL,
+    "normal": EventPriority.NORMAL,
+}
+
+# events_config.yaml orders.priority_map keys → internal event types
+_CONFIG_ORDER_EVENTS = {
+    "PLACED": EventType.ORDER_PLACED,
+    "FILLED": EventType.ORDER_FILLED,
+    "REJECTED": EventType.ORDER_REJECTED,
+    "CANCELLED": EventType.ORDER_CANCELLED,
+    "MODIFIED": EventType.ORDER_UPDATED,
+}
+
+
+class EventLane:
+    """Bounded FIFO of events for one priority level.
+
+    A conflating lane keys market data by (event type, contract/symbol) so a
+    newer update replaces the queued one in place instead of taking a slot.
+
+    A lossless lane never drops or blocks: past capacity it keeps growing,
+    counts the overflow and logs an alarm each time it crosses capacity.
+    """
+
+    def __init__(
+        self,
+        priority: EventPriority,
+        capacity: int,
+        policy: BackpressurePolicy,
+        conflate: bool = False,
+        lossless: bool = False,
+    ):
+        if capacity < 1:
+            raise ValueError("Lane capacity must be at least 1")
+        self.priority = priority
+        self.capacity = capacity
+        self.policy = policy
+        self.conflate = conflate
+        self.lossless = lossless
+        self._events: OrderedDict[Hashable, RiskEvent] = OrderedDict()
+        self._seq = itertools.count()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._alarmed = False
+
+        # Metrics
+        self.high_water = 0
+        self.enqueued = 0
+        self.dispatched = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.overflowed = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def _key(self, event: RiskEvent) -> Hashable:
+        if self.conflate:
+            instrument = event.contract_id or event.symbol
+            if instrument is not None:
+                return (event.event_type, instrument)
+        return next(self._seq)
+
+    def offer(self, event: RiskEvent, policy: BackpressurePolicy | None = None) -> bool:
+        """Add an event without waiting. Returns False if the event was dropped."""
+        policy = policy or self.policy
+        key = self._key(event)
+
+        if key in self._events:
+            self._events[key] = event  # Latest value wins, keeps its queue slot
+            self.conflated += 1
+            return True
+
+        if len(self._events) >= self.capacity:
+            if self.lossless:
+                if not self._alarmed:
+                    # Alarm once per excursion past capacity
+                    self._alarmed = True
+                    logger.error(
+                        f"🚨 {self.priority.value} event lane over capacity ({self.capacity}) - "
+                        f"growing instead of dropping; the dispatcher is falling behind"
+                    )
+                self.overflowed += 1
+                self._append(key, event)
+                return True
+            if policy == BackpressurePolicy.DROP_NEWEST:
+                self.dropped += 1
+                return False
+            # DROP_OLDEST (BLOCK callers wait for space before offering)
+            self._events.popitem(last=False)
+            self.dropped += 1
+
+        self._append(key, event)
+        return True
+
+    def _append(self, key: Hashable, event: RiskEvent) -> None:
+        self._events[key] = event
+        self.enqueued += 1
+        self.high_water = max(self.high_water, len(self._events))
+        if len(self._events) >= self.capacity:
+            self._not_full.clear()
+
+    async def wait_not_full(self) -> None:
+        """Wait until the lane has room for another event (lossless lanes never wait)."""
+        while not self.lossless and len(self._events) >= self.capacity:
+            await self._not_full.wait()
+
+    def pop(self) -> RiskEvent | None:
+        """Remove and return the oldest event, or None if empty."""
+        if not self._events:
+            return None
+        _, event = self._events.popitem(last=False)
+        self.dispatched += 1
+        if len(self._events) < self.capacity:
+            self._not_full.set()
+            self._alarmed = False
+        return event
+
+    def get_stats(self) -> dict[str, int]:
+        """Return depth and counters for this lane."""
+        return {
+            "depth": len(self._events),
+            "capacity": self.capacity,
+            "high_water": self.high_water,
+            "enqueued": self.enqueued,
+            "dispatched": self.dispatched,
+            "dropped": self.dropped,
+            "conflated": self.conflated,
+            "overflowed": self.overflowed,
+        }
+
+
+@dataclass
+class HandlerStats:
+    """Latency and outcome counters for one event handler."""
+
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    slow: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.calls += 1
+        self.total_seconds += elapsed
+        if elapsed > self.max_seconds:
+            self.max_seconds = elapsed
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "slow": self.slow,
+            "avg_ms": (self.total_seconds / self.calls * 1000) if self.calls else 0.0,
+            "max_ms": self.max_seconds * 1000,
+        }
+
 
 class EventBus:
-    """Simple event bus for distributing events."""
+    """Simple event bus for distributing events.
+
+    By default ``publish()`` awaits every handler inline. With ``queued=True``
+    events are placed on bounded priority lanes and a dispatcher task (see
+    ``start()``) drains CRITICAL before NORMAL before MARKET_DATA, so a quote
+    burst can never delay a fill or position close. The backpressure policy
+    only applies to the NORMAL and MARKET_DATA lanes; the CRITICAL lane is
+    lossless and grows past capacity (with an alarm) instead.
+
+    With ``concurrent=True`` the async handlers of a single event run side by
+    side in a TaskGroup, so one slow subscriber no longer delays the others.
+    In that mode ``handler_timeout`` (seconds) cancels a handler that
+    overruns; sequential dispatch never cancels a handler, since rule
+    handlers run enforcement (flatten) inline. Handlers slower than
+    ``slow_handler_threshold`` are logged. Per-handler
+    latency and timeout counters are available from ``get_handler_stats()``.
+    """
+
+    def __init__(
+        self,
+        queued: bool = False,
+        max_queue_size: int | dict[EventPriority, int] = 1000,
+        backpressure: BackpressurePolicy | str = BackpressurePolicy.DROP_OLDEST,
+        priority_map: dict[EventType, EventPriority] | None = None,
+        concurrent: bool = False,
+        handler_timeout: float | None = None,
+        slow_handler_threshold: float | None = None,
+    ):
+        # {event_type: [(handler, is_coroutine_function), ...]}
+        self._handlers: dict[EventType, list[tuple[Any, bool]]] = {}
 
-    def __init__(self):
-        self._handlers: dict[EventType, list] = {}
+        self.concurrent = concurrent
+        self.handler_timeout = handler_timeout
+        self.slow_handler_threshold = slow_handler_threshold
+        self._handler_stats: dict[str, HandlerStats] = {}
+
+        # Taps see every published event before it is queued or dispatched
+        self._taps: list = []
+
+        self.queued = queued
+        self._priority_map = dict(DEFAULT_EVENT_PRIORITIES)
+        if priority_map:
+            self._priority_map.update(priority_map)
+
+        policy = BackpressurePolicy(backpressure)
+        self._lanes: dict[EventPriority, EventLane] = {}
+        for priority in EventPriority:
+            capacity = max_queue_size.get(priority, 1000) if isinstance(max_queue_size, dict) else max_queue_size
+            self._lanes[priority] = EventLane(
+                priority,
+                capacity,
+                policy,
+                conflate=priority == EventPriority.MARKET_DATA,
+                # Fills, closes and enforcement must never be dropped
+                lossless=priority == EventPriority.CRITICAL,
+            )
+
+        self._dispatcher_task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @classmethod
+    def from_config(cls, events_config: "EventsConfig") -> "EventBus":
+        """Create a queued EventBus from events_config.yaml settings.
+
+        Reads ``processing.max_queue_size``/``backpressure_strategy`` and the
+        ``priority``/``priority_map`` keys of the positions, orders and trades
+        sections.
+        """
+        priority_map: dict[EventType, EventPriority] = {}
+
+        position_lane = _CONFIG_PRIORITY_LANES[events_config.positions.priority]
+        for event_type in (EventType.POSITION_OPENED, EventType.POSITION_UPDATED, EventType.POSITION_CLOSED):
+            priority_map[event_type] = position_lane
+
+        for name, level in events_config.orders.priority_map.items():
+            event_type = _CONFIG_ORDER_EVENTS.get(name.upper())
+            if event_type is not None:
+                priority_map[event_type] = _CONFIG_PRIORITY_LANES[level]
+
+        priority_map[EventType.TRADE_EXECUTED] = _CONFIG_PRIORITY_LANES[events_config.trades.priority]
+
+        processing = events_config.processing
+        return cls(
+            queued=True,
+            max_queue_size=processing.max_queue_size,
+            backpressure=processing.backpressure_strategy,
+            priority_map=priority_map,
+            concurrent=processing.concurrent_handlers,
+            handler_timeout=processing.handler_timeout_ms / 1000,
+            slow_handler_threshold=processing.processing_timeout_ms / 1000,
+        )
 
     def subscribe(self, event_type: EventType, handler) -> None:
         """Subscribe to event type."""
         if event_type not in self._handlers:
             self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        # Resolve sync vs async once here rather than on every publish
+        self._handlers[event_type].append((handler, asyncio.iscoroutinefunction(handler)))
 
     def unsubscribe(self, event_type: EventType, handler) -> None:
         """Unsubscribe from event type."""
-        if event_type in self._handlers:
-            self._handlers[event_type].remove(handler)
+        subscriptions = self._handlers.get(event_type)
+        if subscriptions is None:
+            return
+        for index, (subscribed, _) in enumerate(subscriptions):
+            if subscribed == handler:
+                del subscriptions[index]
+                return
+        raise ValueError(f"Handler not subscribed to {event_type.value}")
+
+    def add_tap(self, tap) -> None:
+        """Register a sync callable that sees every published event.
+
+        Taps run inline in ``publish()`` regardless of event type (e.g. the
+        event journal), so they must be cheap and must not block.
+        """
+        self._taps.append(tap)
+
+    def remove_tap(self, tap) -> None:
+        """Remove a previously registered tap."""
+        self._taps.remove(tap)
+
+    def get_priority(self, event_type: EventType) -> EventPriority:
+        """Return the lane an event type is queued on."""
+        return self._priority_map.get(event_type, EventPriority.NORMAL)
 
     async def publish(self, event: RiskEvent) -> None:
-        """Publish event to all subscribers."""
-        if event.event_type in self._handlers:
-            for handler in self._handlers[event.event_type]:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
+        """Publish event to all subscribers (or enqueue it in queued mode)."""
+        for tap in self._taps:
+            try:
+                tap(event)
+            except Exception as e:
+                logger.error(f"Error in event tap {_handler_name(tap)}: {e}", exc_info=True)
+
+        if not self.queued:
+            await self._dispatch(event)
+            return
+
+        lane = self._lanes[self.get_priority(event.event_type)]
+        policy = lane.policy
+
+        if policy == BackpressurePolicy.BLOCK and not lane.lossless:
+            if asyncio.current_task() is self._dispatcher_task:
+                # Handlers publishing from the dispatcher must never wait on
+                # themselves - fall back to dropping the oldest event.
+                policy = BackpressurePolicy.DROP_OLDEST
+            else:
+                await lane.wait_not_full()
+
+        if not lane.offer(event, policy):
+            logger.warning(
+                f"Event dropped ({lane.priority.value} lane full): {event.event_type.value}"
+            )
+            return
+
+        self._idle.clear()
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start the dispatcher task (queued mode only)."""
+        if not self.queued or (self._dispatcher_task and not self._dispatcher_task.done()):
+            return
+        self._dispatcher_task = asyncio.create_task(self._dispatch_loop())
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop the dispatcher task, optionally processing queued events first."""
+        if self._dispatcher_task is None:
+            return
+        if drain:
+            await self.drain()
+        self._dispatcher_task.cancel()
+        try:
+            await self._dispatcher_task
+        except asyncio.CancelledError:
+            pass
+        self._dispatcher_task = None
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been dispatched."""
+        if self.queued and self._dispatcher_task is not None:
+            await self._idle.wait()
+
+    def get_lane_stats(self) -> dict[str, dict[str, int]]:
+        """Return per-lane depth and counters."""
+        return {priority.value: lane.get_stats() for priority, lane in self._lanes.items()}
+
+    def get_handler_stats(self) -> dict[str, dict[str, float]]:
+        """Return per-handler call, error, timeout and latency counters."""
+        return {name: stats.as_dict() for name, stats in self._handler_stats.items()}
+
+    def _next_event(self) -> RiskEvent | None:
+        for lane in self._lanes.values():  # Declared in priority order
+            event = lane.pop()
+            if event is not None:
+                return event
+        return None
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            event = self._next_event()
+            if event is None:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            await self._dispatch(event)
+
+    async def _dispatch(self, event: RiskEvent) -> None:
+        """Deliver an event to its subscribers."""
+        subscriptions = self._handlers.get(event.event_type)
+        if not subscriptions:
+            return
+
+        if not self.concurrent or len(subscriptions) == 1:
+            for handler, is_async in subscriptions:
+                await self._run_handler(handler, is_async, event)
+            return
+
+        # Sync handlers cannot overlap anyway - run them inline first, then
+        # fan the async ones out so a slow subscriber only delays itself.
+        async_handlers = []
+        for handler, is_async in subscriptions:
+            if is_async:
+                async_handlers.append(handler)
+            else:
+                await self._run_handler(handler, False, event)
+
+        if len(async_handlers) == 1:
+            await self._run_handler(async_handlers[0], True, event)
+        elif async_handlers:
+            # _run_handler never raises, so one failure cannot cancel siblings
+            async with asyncio.TaskGroup() as group:
+                for handler in async_handlers:
+                    group.create_task(self._run_handler(handler, True, event))
+
+    async def _run_handler(self, handler, is_async: bool, event: RiskEvent) -> None:
+        """Run one handler with timeout, error isolation and latency tracking."""
+        name = _handler_name(handler)
+        stats = self._handler_stats.get(name)
+        if stats is None:
+            stats = self._handler_stats[name] = HandlerStats()
+
+        started = time.perf_counter()
+        try:
+            if is_async:
+                if self.handler_timeout is None or not self.concurrent:
+                    await handler(event)
+                else:
+                    async with asyncio.timeout(self.handler_timeout):
                         await handler(event)
-                    else:
-                        handler(event)
-                except Exception as e:
-                    # Log error but continue processing other handlers
-                    # This prevents one faulty handler from crashing the event bus
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.error(
-                        f"Error in event handler {handler.__name__}: {e}",
-                        exc_info=True
-                    )
+            else:
+                handler(event)
+        except TimeoutError:
+            stats.timeouts += 1
+            logger.warning(
+                f"Event handler {name} timed out after {self.handler_timeout:.3f}s "
+                f"on {event.event_type.value}"
+            )
+        except Exception as e:
+            # Log error but continue processing other handlers
+            # This prevents one faulty handler from crashing the event bus
+            stats.errors += 1
+            logger.error(
+                f"Error in event handler {name}: {e}",
+                exc_info=True
+            )
+        finally:
+            elapsed = time.perf_counter() - started
+            stats.record(elapsed)
+            if self.slow_handler_threshold is not None and elapsed > self.slow_handler_threshold:
+                stats.slow += 1
+                logger.warning(
+                    f"Slow event handler {name}: {elapsed * 1000:.1f}ms "
+                    f"on {event.event_type.value}"
+                )
+
+
+def _handler_name(handler) -> str:
+    """Stable display name for a subscribed handler."""
+    return getattr(handler, "__qualname__", None) or getattr(handler, "__name__", None) or repr(handler)
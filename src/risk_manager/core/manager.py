@@ -9,8 +9,11 @@ from project_x_py.utils import ProjectXLogger
 
 from risk_manager.config.models import RiskConfig
 from risk_manager.config.loader import ConfigLoader
+from risk_manager.core.clock import Clock
 from risk_manager.core.engine import RiskEngine
 from risk_manager.core.events import EventBus, EventType, RiskEvent
+from risk_manager.core.scheduler import Scheduler
+from risk_manager.core.trading_calendar import TradingCalendar
 
 # Get SDK logger for standardized logging
 sdk_logger = ProjectXLogger.get_logger(__name__)
@@ -24,14 +27,39 @@ class RiskManager:
     Coordinates all components and provides a clean API.
     """
 
-    def __init__(self, config: RiskConfig, timers_config=None):
+    def __init__(
+        self,
+        config: RiskConfig,
+        timers_config=None,
+        events_config=None,
+        configure_logging: bool = True,
+        clock: Clock | None = None,
+        scheduler: Scheduler | None = None,
+    ):
         self.config = config
         self.timers_config = timers_config  # Will be loaded if None
-        self.event_bus = EventBus()
+        self.events_config = events_config  # Optional EventsConfig (priority lanes, quote conflation)
+        self.clock = clock  # Shared by every time-dependent component (None = system clock)
+
+        # events_config.yaml switches the bus to queued priority lanes
+        if events_config is not None:
+            self.event_bus = EventBus.from_config(events_config)
+        else:
+            self.event_bus = EventBus()
+
+        # Event journal (records every published event when enabled)
+        self.journal = self._create_journal()
+
+        # Background jobs of every component (lockout expiry, timers, polling)
+        # (replay passes a manual scheduler driven by its virtual clock)
+        self.scheduler = scheduler if scheduler is not None else Scheduler()
 
         # Component references (will be initialized)
         self.trading_integration = None
         self.ai_integration = None
+        self.database = None  # State database (created when rules are loaded)
+        self.archive = None  # Parquet compaction of closed trading days (created with the database)
+        self.calendar = None  # Trading calendar (built from timers_config when rules are loaded)
         self.monitoring = None
 
         # Create engine (trading_integration will be set later)
@@ -41,13 +69,39 @@ class RiskManager:
         self.running = False
         self._tasks: list[asyncio.Task] = []
 
-        # Setup logging
-        self._setup_logging()
+        # Setup logging (embedders such as the replay engine keep their own sinks)
+        if configure_logging:
+            self._setup_logging()
 
         # Checkpoint 1: Service start
         sdk_logger.info("🚀 Risk Manager starting...")
         logger.info("Risk Manager initialized")
 
+    def _create_journal(self):
+        """Create the event journal and tap it into the bus, if enabled."""
+        journal_config = getattr(self.config.general, "journal", None)
+        if getattr(journal_config, "enabled", False) is not True:
+            return None
+
+        from risk_manager.state.event_journal import EventJournal
+
+        exclude = []
+        for name in journal_config.exclude_event_types:
+            try:
+                exclude.append(EventType(name))
+            except ValueError:
+                logger.warning(f"Unknown event type in journal.exclude_event_types: {name}")
+
+        journal = EventJournal(
+            directory=journal_config.directory,
+            segment_max_bytes=journal_config.segment_max_mb * 1024 * 1024,
+            fsync_interval=journal_config.fsync_interval_ms / 1000,
+            fsync_batch_size=journal_config.fsync_batch_size,
+            exclude_event_types=exclude,
+        )
+        self.event_bus.add_tap(journal.append)
+        return journal
+
     def _setup_logging(self) -> None:
         """Configure logging."""
         # Access logging config from nested structure
@@ -83,6 +137,7 @@ class RiskManager:
         config: RiskConfig | None = None,
         config_file: str | Path | None = None,
         timers_config=None,  # Optional TimersConfig
+        events_config=None,  # Optional EventsConfig
         enable_ai: bool = False,
     ) -> "RiskManager":
         """
@@ -93,6 +148,8 @@ class RiskManager:
             rules: Dictionary of rule configurations
             config: RiskConfig object (optional)
             config_file: Path to config YAML file (optional)
+            timers_config: TimersConfig object (optional)
+            events_config: EventsConfig object (optional, enables queued event bus)
             enable_ai: Enable AI features (requires Claude API key)
 
         Returns:
@@ -106,6 +163,7 @@ class RiskManager:
         """
         # Load config
         loaded_timers_config = timers_config  # Use parameter if provided
+        loaded_events_config = events_config
         if config is None:
             if config_file:
                 config_path = Path(config_file)
@@ -117,6 +175,12 @@ class RiskManager:
                         loaded_timers_config = loader.load_timers_config()
                     except Exception as e:
                         logger.warning(f"Could not load timers_config.yaml: {e}")
+                # Also load events_config if not provided (optional file)
+                if loaded_events_config is None:
+                    try:
+                        loaded_events_config = loader.load_events_config()
+                    except Exception as e:
+                        logger.warning(f"Could not load events_config.yaml: {e}")
             else:
                 # For tests without config file, this won't work with nested structure
                 # Tests should provide a config object directly
@@ -129,7 +193,11 @@ class RiskManager:
                     setattr(config, key, value)
 
         # Create instance
-        manager = cls(config, timers_config=loaded_timers_config)
+        manager = cls(
+            config,
+            timers_config=loaded_timers_config,
+            events_config=loaded_events_config,
+        )
 
         # Checkpoint 2: Config loaded
         sdk_logger.info(f"✅ Config loaded: {len(rules) if rules else 0} custom rules, monitoring {len(instruments) if instruments else 0} instruments")
@@ -156,6 +224,8 @@ class RiskManager:
             instruments=instruments,
             config=self.config,
             event_bus=self.event_bus,
+            events_config=self.events_config,
+            scheduler=self.scheduler,
         )
 
         await self.trading_integration.connect()
@@ -234,23 +304,48 @@ class RiskManager:
         from risk_manager.rules.session_block_outside import SessionBlockOutsideRule
         from risk_manager.rules.auth_loss_guard import AuthLossGuardRule
         from risk_manager.rules.trade_management import TradeManagementRule
+        from risk_manager.state.archive import TradeArchive
         from risk_manager.state.database import Database
         from risk_manager.state.pnl_tracker import PnLTracker
         from risk_manager.state.lockout_manager import LockoutManager
         from risk_manager.state.timer_manager import TimerManager
+        from risk_manager.state.trade_counter import TradeCounter
 
         # Initialize state managers (shared across rules)
         db_path = Path(self.config.general.database.path)
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create Database instance
-        db = Database(db_path=str(db_path))
+        # Create Database instance (trading day follows the configured daily reset)
+        reset_kwargs = {}
+        if self.timers_config:
+            reset_kwargs = {
+                "reset_time": self.timers_config.daily_reset.time,
+                "reset_timezone": self.timers_config.daily_reset.timezone,
+            }
+        db = Database(db_path=str(db_path), clock=self.clock, **reset_kwargs)
+        self.database = db
+
+        # Daily compaction of closed trading days into the Parquet archive
+        database_config = self.config.general.database
+        self.archive = TradeArchive(
+            database=db,
+            archive_dir=database_config.archive_directory,
+            clock=self.clock,
+            retain_days=database_config.archive_retain_days,
+            scheduler=self.scheduler,
+        )
+
+        # Reset instants and session boundaries (holidays, early closes, DST)
+        if self.timers_config:
+            self.calendar = TradingCalendar.from_config(self.timers_config, clock=self.clock)
 
         # Create state managers with Database object
         # Note: TimerManager must be created first to be passed to LockoutManager
-        timer_manager = TimerManager()
-        pnl_tracker = PnLTracker(db=db)
-        lockout_manager = LockoutManager(database=db, timer_manager=timer_manager)
+        timer_manager = TimerManager(clock=self.clock, scheduler=self.scheduler)
+        pnl_tracker = PnLTracker(db=db, clock=self.clock, scheduler=self.scheduler)
+        lockout_manager = LockoutManager(
+            database=db, timer_manager=timer_manager, clock=self.clock, scheduler=self.scheduler
+        )
 
         # Wire lockout_manager to engine for PRE-CHECK layer
         self.engine.lockout_manager = lockout_manager
@@ -293,6 +388,8 @@ class RiskManager:
                 pnl_tracker=pnl_tracker,
                 lockout_manager=lockout_manager,
                 action="flatten",
+                clock=self.clock,
+                calendar=self.calendar,
             )
             self.add_rule(rule)
             rules_loaded += 1
@@ -305,6 +402,8 @@ class RiskManager:
                 pnl_tracker=pnl_tracker,
                 lockout_manager=lockout_manager,
                 action="flatten",
+                clock=self.clock,
+                calendar=self.calendar,
             )
             self.add_rule(rule)
             rules_loaded += 1
@@ -379,12 +478,17 @@ class RiskManager:
                 ),
             }
 
+            # Window counts live in memory; the trades table is the durable record
+            trade_counter = TradeCounter(database=db, clock=self.clock)
+            trade_counter.hydrate()
+
             rule = TradeFrequencyLimitRule(
                 limits=limits,
                 cooldown_on_breach=cooldown_on_breach,
                 timer_manager=timer_manager,
                 db=db,
                 action="cooldown",
+                trade_counter=trade_counter,
             )
             self.add_rule(rule)
             rules_loaded += 1
@@ -422,21 +526,34 @@ class RiskManager:
         # RULE-009: Session Block Outside
         if self.config.rules.session_block_outside.enabled and self.timers_config:
             # Build config dict from timers_config.session_hours
+            session_hours = self.timers_config.session_hours
             session_config = {
-                "enabled": self.timers_config.session_hours.enabled,
-                "start": self.timers_config.session_hours.start,
-                "end": self.timers_config.session_hours.end,
-                "timezone": self.timers_config.session_hours.timezone,
-                "allowed_days": self.timers_config.session_hours.allowed_days,
+                "enabled": True,
+                "global_session": {
+                    "enabled": session_hours.enabled,
+                    "start": session_hours.start,
+                    "end": session_hours.end,
+                    "timezone": session_hours.timezone,
+                    "allowed_days": session_hours.allowed_days,
+                },
+                "block_weekends": not {5, 6} & set(session_hours.allowed_days),
             }
 
+            session_calendar = self.calendar
+            if not self.config.rules.session_block_outside.respect_holidays:
+                session_calendar = TradingCalendar.from_config(
+                    self.timers_config, clock=self.clock, holidays=False
+                )
+
             rule = SessionBlockOutsideRule(
                 config=session_config,
                 lockout_manager=lockout_manager,
+                clock=self.clock,
+                calendar=session_calendar,
             )
             self.add_rule(rule)
             rules_loaded += 1
-            logger.info(f"✅ Loaded: SessionBlockOutsideRule (session={session_config['start']}-{session_config['end']})")
+            logger.info(f"✅ Loaded: SessionBlockOutsideRule (session={session_hours.start}-{session_hours.end})")
         elif self.config.rules.session_block_outside.enabled and not self.timers_config:
             logger.warning("⚠️ SessionBlockOutsideRule requires timers_config.yaml (skipped)")
 
@@ -541,6 +658,21 @@ class RiskManager:
             else:
                 logger.info("✅ STARTUP STATE: No active lockouts, all accounts operational")
 
+        # Start event journal writer thread
+        if self.journal:
+            self.journal.start()
+
+        # Start background jobs (timer deadlines, lockout expiry)
+        self.scheduler.start()
+        lockout_manager = getattr(self.engine, "lockout_manager", None)
+        if lockout_manager:
+            if lockout_manager.timer_manager:
+                await lockout_manager.timer_manager.start()
+            await lockout_manager.start()
+
+        # Start event dispatcher (no-op unless the bus is queued)
+        await self.event_bus.start()
+
         # Start risk engine
         await self.engine.start()
 
@@ -571,6 +703,7 @@ class RiskManager:
 
         # Stop components
         await self.engine.stop()
+        await self.event_bus.stop()
 
         if self.trading_integration:
             await self.trading_integration.disconnect()
@@ -578,6 +711,21 @@ class RiskManager:
         if self.ai_integration:
             await self.ai_integration.stop()
 
+        lockout_manager = getattr(self.engine, "lockout_manager", None)
+        if lockout_manager:
+            await lockout_manager.stop()
+            if lockout_manager.timer_manager:
+                await lockout_manager.timer_manager.stop()
+        await self.scheduler.stop()
+
+        # Apply queued state writes (lockouts, P&L, reset log)
+        if self.database:
+            await asyncio.to_thread(self.database.close)
+
+        # Close journal last so shutdown events are recorded
+        if self.journal:
+            await asyncio.to_thread(self.journal.close)
+
         # Cancel all tasks
         for task in self._tasks:
             task.cancel()
@@ -614,5 +762,10 @@ class RiskManager:
         return {
             "running": self.running,
             "engine": self.engine.get_stats(),
+            "event_lanes": self.event_bus.get_lane_stats() if self.event_bus.queued else {},
+            "event_handlers": self.event_bus.get_handler_stats(),
+            "journal": self.journal.get_stats() if self.journal else None,
+            "database_writes": self.database.get_write_stats() if self.database else None,
+            "scheduler": self.scheduler.get_stats(),
             "trading": self.trading_integration.get_stats() if self.trading_integration else {},
         }
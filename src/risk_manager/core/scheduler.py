@@ -0,0 +1,501 @@
+"""
+Runtime Scheduler
+
+A single asyncio task that runs the process's background jobs: lockout
+expiry, timer deadlines, reset checks, order polling, price polling and
+the status bar, SDK health checks and the heartbeat. Components register
+periodic or one-shot jobs instead of each running its own sleep loop, so
+the process wakes only when some job is actually due.
+
+Key Features:
+- Min-heap of due times on the monotonic clock; one wakeup runs every
+  job due within ``slack`` seconds of each other
+- Periodic jobs stay on their interval grid; periods missed while the
+  loop was busy are coalesced into a single run
+- Optional jitter (uniform, per run) to spread jobs with equal intervals
+- Skip-if-running: an async job still in flight is not started again
+- Per-job metrics: runs, skips, coalesced periods, errors, runtime and
+  lateness (get_stats())
+- Optional injected clock; a manual scheduler on a VirtualClock has no
+  task and runs its jobs from advance_to(), so replays are deterministic
+
+Example:
+    ```python
+    scheduler = Scheduler()
+    scheduler.start()
+
+    scheduler.every("heartbeat", 30.0, send_heartbeat)
+    job = scheduler.call_later("grace_123", 30.0, on_grace_expired)
+    job.reschedule(10.0)    # move it earlier
+    job.cancel()
+
+    scheduler.get_stats()   # {"wakeups": ..., "jobs": {...}}
+    await scheduler.stop()
+    ```
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from loguru import logger
+
+from risk_manager.core.clock import Clock
+
+JobFunc = Callable[[], Any | Awaitable[Any]]
+
+
+class Job:
+    """
+    A job registered with a Scheduler.
+
+    Returned by Scheduler.every() and Scheduler.call_later(); use it to
+    cancel or reschedule the job and to read its metrics.
+    """
+
+    def __init__(
+        self,
+        scheduler: "Scheduler",
+        name: str,
+        func: JobFunc,
+        interval: float | None,
+        jitter: float,
+        skip_if_running: bool,
+    ):
+        self.scheduler = scheduler
+        self.name = name
+        self.func = func
+        self.interval = interval  # None = one-shot
+        self.jitter = jitter
+        self.skip_if_running = skip_if_running
+
+        self.due: float | None = None  # Monotonic due time (None = dormant)
+        self._base: float = 0.0  # Interval grid point of the next run (periodic)
+        self._seq = 0  # Heap entries with another seq are stale
+        self._cancelled = False
+        self._tasks: set[asyncio.Task] = set()
+
+        # Metrics
+        self.runs = 0
+        self.skipped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.total_runtime = 0.0
+        self.max_runtime = 0.0
+        self.last_runtime = 0.0
+        self.max_lateness = 0.0
+
+    def cancel(self) -> None:
+        """Cancel the job and any run still in flight (idempotent)."""
+        self.scheduler._cancel(self)
+
+    def cancelled(self) -> bool:
+        """True once cancel() has been called."""
+        return self._cancelled
+
+    def done(self) -> bool:
+        """True if the job will not run again (cancelled or fired one-shot)."""
+        return self._cancelled or (self.due is None and not self.running)
+
+    @property
+    def running(self) -> bool:
+        """True while an async run of this job is in flight."""
+        return bool(self._tasks)
+
+    def reschedule(self, delay: float | None) -> None:
+        """
+        Move the next run to ``delay`` seconds from now.
+
+        For periodic jobs the interval grid restarts from the new run.
+
+        Args:
+            delay: Seconds from now, or None to leave the job dormant
+                until the next reschedule()
+
+        Raises:
+            RuntimeError: If the job was cancelled
+        """
+        self.scheduler._reschedule(self, delay)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get job metrics.
+
+        Returns:
+            Dictionary with runs, skipped, coalesced, errors, runtime and
+            lateness figures (milliseconds) and the next due time
+        """
+        return {
+            "interval": self.interval,
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "running": self.running,
+            "avg_runtime_ms": (self.total_runtime / self.runs * 1000) if self.runs else 0.0,
+            "max_runtime_ms": self.max_runtime * 1000,
+            "last_runtime_ms": self.last_runtime * 1000,
+            "total_runtime_ms": self.total_runtime * 1000,
+            "max_lateness_ms": self.max_lateness * 1000,
+            "next_run_in": (
+                max(self.due - self.scheduler._time(), 0.0) if self.due is not None else None
+            ),
+        }
+
+
+class Scheduler:
+    """
+    Runs periodic and one-shot jobs from one background task.
+
+    Jobs may be sync or async callables. Sync jobs run inline in the
+    scheduler task and should be short; async jobs are started as tasks.
+    A job that raises is logged and counted, and keeps its schedule.
+    """
+
+    def __init__(self, slack: float = 0.01, clock: Clock | None = None, manual: bool = False):
+        """
+        Initialize the scheduler.
+
+        Args:
+            slack: Jobs due within this many seconds of a wakeup run in
+                that wakeup instead of waking the loop again
+            clock: Optional clock whose monotonic time jobs are due on
+                (defaults to the system monotonic clock)
+            manual: Never start a task; jobs only run from advance_to()
+                (requires a VirtualClock)
+        """
+        self.slack = slack
+        self.clock = clock
+        self.manual = manual
+        self.jobs: dict[str, Job] = {}
+        self.wakeups = 0
+
+        # (due, seq, job) - an entry is stale once job._seq moved on
+        self._heap: list[tuple[float, int, Job]] = []
+        self._seq = itertools.count(1)
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._time = clock.monotonic if clock is not None else time.monotonic
+
+    @property
+    def running(self) -> bool:
+        """True while the scheduler task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """
+        Start the scheduler task (no-op if already running).
+
+        Must be called from a running event loop. Jobs registered before
+        start() run once it has started. A manual scheduler is not started.
+        """
+        if self.running or self.manual:
+            return
+
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run_loop())
+        logger.debug("Scheduler started")
+
+    async def stop(self) -> None:
+        """Stop the scheduler task and cancel in-flight job runs."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        in_flight = [task for job in self.jobs.values() for task in job._tasks]
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+        logger.debug("Scheduler stopped")
+
+    def every(
+        self,
+        name: str,
+        interval: float,
+        func: JobFunc,
+        *,
+        jitter: float = 0.0,
+        first_delay: float | None = None,
+        skip_if_running: bool = True,
+    ) -> Job:
+        """
+        Register a periodic job.
+
+        Args:
+            name: Unique job name
+            interval: Seconds between runs (must be > 0)
+            func: Sync or async callable taking no arguments
+            jitter: Each run is delayed by a random 0..jitter seconds
+            first_delay: Seconds until the first run (default: interval)
+            skip_if_running: Skip a run while the previous one is in flight
+
+        Returns:
+            The registered Job
+
+        Raises:
+            ValueError: If interval/jitter are invalid or the name is taken
+        """
+        if interval <= 0:
+            raise ValueError(f"Job interval must be positive, got {interval}")
+        if jitter < 0:
+            raise ValueError(f"Job jitter cannot be negative, got {jitter}")
+
+        job = self._register(Job(self, name, func, interval, jitter, skip_if_running))
+        self._reschedule(job, interval if first_delay is None else first_delay)
+        return job
+
+    def call_later(
+        self,
+        name: str,
+        delay: float | None,
+        func: JobFunc,
+        *,
+        skip_if_running: bool = True,
+    ) -> Job:
+        """
+        Register a one-shot job.
+
+        The job stays registered until it fires; job.reschedule() moves it
+        (also from inside its own run, to fire again).
+
+        Args:
+            name: Unique job name
+            delay: Seconds until the run, or None to register it dormant
+            func: Sync or async callable taking no arguments
+            skip_if_running: Skip the run while a previous one is in flight
+
+        Returns:
+            The registered Job
+
+        Raises:
+            ValueError: If the name is taken
+        """
+        job = self._register(Job(self, name, func, None, 0.0, skip_if_running))
+        self._reschedule(job, delay)
+        return job
+
+    def get_job(self, name: str) -> Job | None:
+        """Get a registered job by name."""
+        return self.jobs.get(name)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with running, wakeups (loop iterations since
+            creation), jobs (count) and per_job (name -> Job.stats())
+        """
+        return {
+            "running": self.running,
+            "wakeups": self.wakeups,
+            "jobs": len(self.jobs),
+            "per_job": {name: job.stats() for name, job in self.jobs.items()},
+        }
+
+    def _register(self, job: Job) -> Job:
+        """Add a job to the registry, replacing a finished one of that name."""
+        existing = self.jobs.get(job.name)
+        if existing is not None and not existing.done():
+            raise ValueError(f"Job {job.name!r} is already scheduled")
+        self.jobs[job.name] = job
+        return job
+
+    def _reschedule(self, job: Job, delay: float | None) -> None:
+        """Set a job's next run (None = dormant)."""
+        if job._cancelled:
+            raise RuntimeError(f"Job {job.name!r} was cancelled")
+
+        self.jobs.setdefault(job.name, job)
+        if delay is None:
+            job.due = None
+            job._seq = next(self._seq)  # Invalidate its heap entry
+            return
+
+        job._base = self._time() + max(delay, 0.0)
+        self._push(job, job._base)
+
+    def _cancel(self, job: Job) -> None:
+        """Cancel a job and its in-flight runs (except the calling one)."""
+        if job._cancelled:
+            return
+
+        job._cancelled = True
+        job.due = None
+        job._seq = next(self._seq)
+        if self.jobs.get(job.name) is job:
+            del self.jobs[job.name]
+
+        current = asyncio.current_task() if self._has_loop() else None
+        for task in list(job._tasks):
+            if task is not current:
+                task.cancel()
+
+        self._compact_heap()
+
+    @staticmethod
+    def _has_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+
+    def _push(self, job: Job, base: float) -> None:
+        """Schedule a job at ``base`` plus jitter; wake the loop if it is now first."""
+        self._compact_heap()
+        due = base + (random.uniform(0.0, job.jitter) if job.jitter else 0.0)
+        job.due = due
+        job._seq = next(self._seq)
+        entry = (due, job._seq, job)
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry and self._wakeup is not None:
+            self._wakeup.set()
+
+    @staticmethod
+    def _is_live(entry: tuple[float, int, Job]) -> bool:
+        """True if a heap entry is the job's current schedule."""
+        return entry[1] == entry[2]._seq and not entry[2]._cancelled
+
+    def _compact_heap(self) -> None:
+        """Drop stale entries once they outnumber registered jobs."""
+        if len(self._heap) > 2 * len(self.jobs) + 64:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+
+    def _next_due(self) -> float | None:
+        """Due time of the earliest live job (None = nothing scheduled)."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def _next_delay(self) -> float | None:
+        """Seconds until the earliest live job (None = nothing scheduled)."""
+        due = self._next_due()
+        return None if due is None else max(due - self._time(), 0.0)
+
+    async def advance_to(self, moment: float) -> int:
+        """
+        Drive a manual scheduler: run every job due up to ``moment``.
+
+        Jobs run in due order, each with the clock advanced to its due
+        time; async runs are awaited before the next job, so the outcome
+        depends only on the clock. The clock ends at ``moment``.
+
+        Args:
+            moment: Target time on the clock's monotonic scale
+
+        Returns:
+            Number of wakeups that ran jobs
+        """
+        wakeups = 0
+        while (due := self._next_due()) is not None and due <= moment:
+            self.clock.advance(due - self._time())
+            self._run_due()
+            wakeups += 1
+            in_flight = [task for job in list(self.jobs.values()) for task in job._tasks]
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+        self.clock.advance(moment - self._time())
+        self.wakeups += wakeups
+        return wakeups
+
+    def _run_due(self) -> None:
+        """Run every job due within the slack of now."""
+        now = self._time()
+        due: list[Job] = []
+        while self._heap and self._heap[0][0] <= now + self.slack:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                due.append(entry[2])
+
+        for job in due:
+            self._run_job(job, now)
+
+    def _run_job(self, job: Job, now: float) -> None:
+        """Advance a job's schedule, then run it."""
+        job.max_lateness = max(job.max_lateness, now - job.due)
+
+        if job.interval is None:
+            job.due = None
+        else:
+            # Next grid point after now; the periods in between are coalesced
+            periods = max(math.floor((now - job._base) / job.interval) + 1, 1)
+            job.coalesced += periods - 1
+            job._base += periods * job.interval
+            self._push(job, job._base)
+
+        if job.running and job.skip_if_running:
+            job.skipped += 1
+            return
+
+        started = self._time()
+        try:
+            result = job.func()
+        except Exception as e:
+            job.errors += 1
+            logger.error(f"Scheduled job {job.name} failed: {e}", exc_info=True)
+            self._record(job, started)
+            return
+
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            job._tasks.add(task)
+            task.add_done_callback(lambda t: self._finish(job, t, started))
+        else:
+            self._record(job, started)
+            self._retire(job)
+
+    def _finish(self, job: Job, task: asyncio.Task, started: float) -> None:
+        """Done callback of an async run."""
+        job._tasks.discard(task)
+        if not task.cancelled():
+            error = task.exception()
+            if error is not None:
+                job.errors += 1
+                logger.opt(exception=error).error(f"Scheduled job {job.name} failed: {error}")
+            self._record(job, started)
+        self._retire(job)
+
+    def _record(self, job: Job, started: float) -> None:
+        """Count a run and its runtime."""
+        runtime = self._time() - started
+        job.runs += 1
+        job.last_runtime = runtime
+        job.total_runtime += runtime
+        job.max_runtime = max(job.max_runtime, runtime)
+
+    def _retire(self, job: Job) -> None:
+        """Unregister a one-shot job that fired and was not rescheduled."""
+        if job.done() and self.jobs.get(job.name) is job:
+            del self.jobs[job.name]
+
+    async def _run_loop(self) -> None:
+        """Scheduler task - sleeps until the earliest due job."""
+        while True:
+            try:
+                self._run_due()
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self._next_delay())
+                except TimeoutError:
+                    pass
+                self.wakeups += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in scheduler loop: {e}", exc_info=True)
+                await asyncio.sleep(1)
@@ -0,0 +1,415 @@
+"""
+Trading Calendar
+
+Daily/weekly reset instants and session open/close boundaries, built from
+timers_config.yaml and precomputed as epoch-microsecond UTC instants.
+Reset checks and session checks become integer comparisons (a bisect into
+a sorted list) instead of timezone arithmetic on every call.
+
+Key Features:
+- Wall-clock times in the configured timezone, converted with zoneinfo
+  (DST-aware); with ``dst.auto_adjust: false`` the standard-time offset
+  is used all year
+- Sessions only on allowed weekdays, none on holidays, and closing at the
+  early-close time on early-close days
+- A window of ``horizon_days`` is precomputed around the queried moment
+  and rebuilt when a query falls outside it, so replayed or back-dated
+  moments work too
+- next_boundary(): the next reset or session open/close, for jobs that
+  sleep until something changes
+
+Example:
+    ```python
+    calendar = TradingCalendar.from_config(timers_config)
+    calendar.is_session_open()                   # True/False
+    calendar.next_reset()                        # next daily reset (UTC)
+    calendar.next_reset(weekday=0)               # next Monday reset (UTC)
+    calendar.next_session_open()                 # skips weekends/holidays
+    ```
+"""
+
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Mapping
+from datetime import UTC, date, datetime, time, timedelta, timezone, tzinfo
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from loguru import logger
+
+from risk_manager.core.clock import Clock
+
+WEEKDAYS = {
+    "Monday": 0, "Tuesday": 1, "Wednesday": 2, "Thursday": 3,
+    "Friday": 4, "Saturday": 5, "Sunday": 6,
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_US = timedelta(microseconds=1)
+_MAX_EXTENSIONS = 60  # Give up looking for the next instant after this many windows
+
+
+def _parse_time(value: str | time) -> time:
+    """Parse ``HH:MM`` (or pass a time through)."""
+    if isinstance(value, time):
+        return value
+    hour, minute = map(int, value.split(":"))
+    return time(hour, minute)
+
+
+def _to_us(moment: datetime) -> int:
+    """Epoch microseconds of a datetime (naive = local time, as timestamp())."""
+    if moment.tzinfo is None:
+        moment = moment.astimezone()
+    return (moment - _EPOCH) // _ONE_US
+
+
+def _from_us(us: int) -> datetime:
+    """Aware UTC datetime of epoch microseconds."""
+    return _EPOCH + timedelta(microseconds=us)
+
+
+def _standard_time(tz: ZoneInfo) -> tzinfo:
+    """Fixed offset of a zone's standard time (the smaller of Jan/Jul)."""
+    year = datetime.now().year
+    offset = min(
+        datetime(year, 1, 1, tzinfo=tz).utcoffset(),
+        datetime(year, 7, 1, tzinfo=tz).utcoffset(),
+    )
+    return timezone(offset)
+
+
+class _Boundaries:
+    """
+    Sorted instants generated per local calendar day over a sliding window.
+
+    ``generate(day)`` returns the instants (epoch µs) belonging to a day.
+    """
+
+    def __init__(self, tz: tzinfo, horizon_days: int, generate: Callable[[date], Iterable[int]]):
+        self.tz = tz
+        self.horizon_days = horizon_days
+        self.generate = generate
+        self.instants: list[int] = []
+        self.first_day: date | None = None
+        self.last_day: date | None = None
+        self.lo_us = 0  # Queries in [lo_us, hi_us) are covered
+        self.hi_us = 0
+
+    def _day_start_us(self, day: date) -> int:
+        return _to_us(datetime.combine(day, time(0), tzinfo=self.tz))
+
+    def _build(self, first_day: date, last_day: date) -> None:
+        self.instants = []
+        self.first_day = first_day
+        self.last_day = first_day - timedelta(days=1)
+        self._extend(last_day)
+
+    def _extend(self, last_day: date) -> None:
+        day = self.last_day + timedelta(days=1)
+        while day <= last_day:
+            self.instants.extend(self.generate(day))
+            day += timedelta(days=1)
+        self.last_day = last_day
+        # A day's instants may spill past midnight UTC, so the covered range
+        # stops one day short on both ends
+        self.lo_us = self._day_start_us(self.first_day + timedelta(days=1))
+        self.hi_us = self._day_start_us(self.last_day)
+
+    def cover(self, us: int) -> None:
+        """Make sure ``us`` lies inside the precomputed window."""
+        if self.lo_us <= us < self.hi_us:
+            return
+        day = _from_us(us).astimezone(self.tz).date()
+        self._build(day - timedelta(days=1), day + timedelta(days=self.horizon_days))
+
+    def index_after(self, us: int) -> int | None:
+        """Index of the first instant > ``us`` (None if there is none nearby)."""
+        self.cover(us)
+        index = bisect_right(self.instants, us)
+        extensions = 0
+        while index == len(self.instants):
+            if extensions == _MAX_EXTENSIONS:
+                return None
+            self._extend(self.last_day + timedelta(days=self.horizon_days))
+            extensions += 1
+        return index
+
+
+class TradingCalendar:
+    """
+    Precomputed reset and session calendar.
+
+    All query methods take an optional moment (default: now from the
+    injected clock) and return aware UTC datetimes; the ``*_us`` variants
+    work on epoch microseconds.
+    """
+
+    DEFAULT_HORIZON_DAYS = 14
+
+    def __init__(
+        self,
+        reset_time: str | time = "17:00",
+        reset_timezone: str = "America/New_York",
+        session_start: str | time = "09:30",
+        session_end: str | time = "16:00",
+        session_timezone: str | None = None,
+        allowed_days: Iterable[int] = (0, 1, 2, 3, 4),
+        holidays: Iterable[str | date] = (),
+        early_closes: Mapping[str | date, str | time] | None = None,
+        auto_adjust_dst: bool = True,
+        notify_dst_change: bool = False,
+        clock: Clock | None = None,
+        horizon_days: int = DEFAULT_HORIZON_DAYS,
+    ):
+        """
+        Initialize the trading calendar.
+
+        Args:
+            reset_time: Daily reset wall time (HH:MM)
+            reset_timezone: IANA timezone of reset times
+            session_start: Session open wall time (HH:MM)
+            session_end: Session close wall time (HH:MM, after the open)
+            session_timezone: IANA timezone of session times (default:
+                reset_timezone)
+            allowed_days: Weekdays with a session (0=Monday)
+            holidays: Dates without a session
+            early_closes: Date -> close time for shortened sessions
+            auto_adjust_dst: Follow DST (False: standard time all year)
+            notify_dst_change: Log DST changes inside the precomputed window
+            clock: Optional clock (defaults to the system clock)
+            horizon_days: Days precomputed ahead of the queried moment
+        """
+        self.reset_time = _parse_time(reset_time)
+        self.reset_timezone = ZoneInfo(reset_timezone)
+        self.session_start = _parse_time(session_start)
+        self.session_end = _parse_time(session_end)
+        self.session_timezone = ZoneInfo(session_timezone or reset_timezone)
+        self.allowed_days = frozenset(allowed_days)
+        self.holidays = frozenset(
+            day if isinstance(day, date) else date.fromisoformat(day) for day in holidays
+        )
+        self.early_closes: dict[date, time] = {
+            (day if isinstance(day, date) else date.fromisoformat(day)): _parse_time(close)
+            for day, close in (early_closes or {}).items()
+        }
+        self.auto_adjust_dst = auto_adjust_dst
+        self.notify_dst_change = notify_dst_change
+        self.clock = clock
+        self.horizon_days = horizon_days
+
+        if self.session_end <= self.session_start:
+            raise ValueError(
+                f"Session end ({self.session_end}) must be after start ({self.session_start})"
+            )
+
+        self._reset_tz = self._wall_tz(self.reset_timezone)
+        self._session_tz = self._wall_tz(self.session_timezone)
+        self._resets: dict[tuple[time, int | None], _Boundaries] = {}
+        # Opens and closes alternate: even index = open, odd index = close
+        self._sessions = _Boundaries(self._session_tz, horizon_days, self._session_instants)
+        self._dst_notified: set = set()
+
+    @classmethod
+    def from_config(
+        cls,
+        timers_config: Any,
+        clock: Clock | None = None,
+        holidays: bool = True,
+    ) -> "TradingCalendar":
+        """
+        Build the calendar from a TimersConfig (timers_config.yaml).
+
+        Holidays and early closes apply only when ``holidays.enabled``
+        (and ``holidays`` is True); weekday restrictions only when
+        ``session_hours.enabled``.
+        """
+        session = timers_config.session_hours
+        holiday_config = timers_config.holidays
+        dst = timers_config.advanced.dst
+
+        holiday_dates: list[str] = []
+        early_closes: dict[str, str] = {}
+        if holidays and holiday_config.enabled:
+            holiday_dates = [day for days in holiday_config.dates.values() for day in days]
+            early_closes = {close.date: close.close_time for close in holiday_config.early_close}
+
+        return cls(
+            reset_time=timers_config.daily_reset.time,
+            reset_timezone=timers_config.daily_reset.timezone,
+            session_start=session.start,
+            session_end=session.end,
+            session_timezone=session.timezone,
+            allowed_days=session.allowed_days if session.enabled else range(7),
+            holidays=holiday_dates,
+            early_closes=early_closes,
+            auto_adjust_dst=dst.auto_adjust,
+            notify_dst_change=dst.notify_on_change,
+            clock=clock,
+        )
+
+    def _now(self) -> datetime:
+        """Current UTC time from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.now(UTC)
+        return datetime.now(UTC)
+
+    def _us(self, moment: datetime | None) -> int:
+        return _to_us(self._now() if moment is None else moment)
+
+    def _wall_tz(self, tz: ZoneInfo) -> tzinfo:
+        """Zone used to place wall times (fixed standard time without DST)."""
+        return tz if self.auto_adjust_dst else _standard_time(tz)
+
+    def _wall_us(self, day: date, wall: time, tz: tzinfo) -> int:
+        """Epoch microseconds of a wall time on a local day."""
+        return _to_us(datetime.combine(day, wall, tzinfo=tz))
+
+    # ------------------------------------------------------------------
+    # Resets
+    # ------------------------------------------------------------------
+
+    def _reset_series(self, reset_time: str | time | None, weekday: int | None) -> _Boundaries:
+        wall = self.reset_time if reset_time is None else _parse_time(reset_time)
+        key = (wall, weekday)
+        series = self._resets.get(key)
+        if series is None:
+            def generate(day: date) -> list[int]:
+                if weekday is not None and day.weekday() != weekday:
+                    return []
+                self._check_dst(day)
+                return [self._wall_us(day, wall, self._reset_tz)]
+
+            series = self._resets[key] = _Boundaries(self._reset_tz, self.horizon_days, generate)
+        return series
+
+    def next_reset_us(
+        self,
+        after_us: int,
+        reset_time: str | time | None = None,
+        weekday: int | str | None = None,
+    ) -> int:
+        """
+        First reset strictly after ``after_us``.
+
+        Args:
+            after_us: Epoch microseconds
+            reset_time: Wall time (HH:MM, default: the configured reset time)
+            weekday: Only this weekday (0=Monday or a day name) for weekly
+                resets; None for daily resets
+
+        Returns:
+            Epoch microseconds of the reset
+        """
+        if isinstance(weekday, str):
+            weekday = WEEKDAYS[weekday]
+        series = self._reset_series(reset_time, weekday)
+        index = series.index_after(after_us)  # May rebuild series.instants
+        return series.instants[index]
+
+    def next_reset(
+        self,
+        moment: datetime | None = None,
+        reset_time: str | time | None = None,
+        weekday: int | str | None = None,
+    ) -> datetime:
+        """
+        Next reset after ``moment`` (default: now).
+
+        A reset exactly at ``moment`` counts as passed, so this is always
+        in the future.
+
+        Returns:
+            Reset time (aware UTC)
+        """
+        return _from_us(self.next_reset_us(self._us(moment), reset_time, weekday))
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    def close_time(self, day: date) -> time | None:
+        """Session close wall time on ``day`` (None if there is no session)."""
+        if day.weekday() not in self.allowed_days or day in self.holidays:
+            return None
+        close = min(self.early_closes.get(day, self.session_end), self.session_end)
+        return close if close > self.session_start else None
+
+    def is_holiday(self, day: date) -> bool:
+        """True if ``day`` is a configured holiday."""
+        return day in self.holidays
+
+    def _session_instants(self, day: date) -> list[int]:
+        close = self.close_time(day)
+        if close is None:
+            return []
+        return [
+            self._wall_us(day, self.session_start, self._session_tz),
+            self._wall_us(day, close, self._session_tz),
+        ]
+
+    def is_session_open_us(self, us: int) -> bool:
+        """True if ``us`` falls inside a session ([open, close))."""
+        self._sessions.cover(us)
+        # Odd count of boundaries at or before us = inside a session
+        return bisect_right(self._sessions.instants, us) % 2 == 1
+
+    def is_session_open(self, moment: datetime | None = None) -> bool:
+        """True if ``moment`` (default: now) falls inside a session."""
+        return self.is_session_open_us(self._us(moment))
+
+    def next_session_open(self, moment: datetime | None = None) -> datetime | None:
+        """
+        Next session open strictly after ``moment`` (default: now).
+
+        Returns:
+            Open time (aware UTC), or None if no session is configured
+        """
+        us = self._us(moment)
+        index = self._sessions.index_after(us)
+        if index is not None and index % 2 == 1:  # Inside a session: skip its close
+            index = self._sessions.index_after(self._sessions.instants[index])
+        if index is None:
+            return None
+        return _from_us(self._sessions.instants[index])
+
+    def session_bounds(self, moment: datetime | None = None) -> tuple[datetime, datetime] | None:
+        """Open and close (aware UTC) of the session containing ``moment``, if any."""
+        us = self._us(moment)
+        self._sessions.cover(us)
+        index = bisect_right(self._sessions.instants, us)
+        if index % 2 == 0:
+            return None
+        return _from_us(self._sessions.instants[index - 1]), _from_us(self._sessions.instants[index])
+
+    # ------------------------------------------------------------------
+    # Boundaries
+    # ------------------------------------------------------------------
+
+    def next_boundary_us(self, after_us: int) -> int:
+        """Next daily reset or session open/close strictly after ``after_us``."""
+        candidates = [self.next_reset_us(after_us)]
+        index = self._sessions.index_after(after_us)  # May rebuild the instants
+        if index is not None:
+            candidates.append(self._sessions.instants[index])
+        return min(candidates)
+
+    def next_boundary(self, moment: datetime | None = None) -> datetime:
+        """Next daily reset or session open/close after ``moment`` (aware UTC)."""
+        return _from_us(self.next_boundary_us(self._us(moment)))
+
+    def seconds_until(self, instant_us: int, moment: datetime | None = None) -> float:
+        """Seconds from ``moment`` (default: now) until ``instant_us`` (>= 0)."""
+        return max((instant_us - self._us(moment)) / 1_000_000, 0.0)
+
+    def _check_dst(self, day: date) -> None:
+        """Log a UTC offset change of the reset time (once per day)."""
+        if not (self.notify_dst_change and self.auto_adjust_dst) or day in self._dst_notified:
+            return
+        before = datetime.combine(day - timedelta(days=1), self.reset_time, tzinfo=self.reset_timezone)
+        after = datetime.combine(day, self.reset_time, tzinfo=self.reset_timezone)
+        if before.utcoffset() != after.utcoffset():
+            self._dst_notified.add(day)
+            logger.info(
+                f"DST change on {day.isoformat()}: {self.reset_timezone.key} is now "
+                f"UTC{after.strftime('%z')}, reset at {after.astimezone(UTC).strftime('%H:%M')} UTC"
+            )
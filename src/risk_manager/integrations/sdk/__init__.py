@@ -8,8 +8,11 @@ to these specialized modules internally.
 
 Modules:
     - protective_orders: Stop loss and take profit caching
+    - order_mirror: Local mirror of working orders and open positions
     - market_data: Quote updates and price polling
+    - quote_conflator: Latest-value-wins quote buffering per symbol
     - event_router: SDK event routing to risk system
+    - event_dedup: Drops per-instrument copies of SDK events
     - order_polling: Background order discovery
     - connection_manager: SDK lifecycle management
     - pnl_tracker: Position tracking and P&L calculation
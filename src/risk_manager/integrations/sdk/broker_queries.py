@@ -0,0 +1,214 @@
+"""
+Broker Query Module
+
+Shared layer in front of the read-only broker queries used to find orders
+and positions (get_position_orders, search_open_orders, get_all_positions).
+
+The Challenge:
+    - Several events for one contract often arrive together
+    - ProtectiveOrderCache, OrderPollingService and the flatten fallback
+      each issued their own identical SDK calls
+    - Every call is a broker round-trip counted against the API rate limit
+
+The Solution:
+    - Single flight: concurrent identical queries share one in-flight call;
+      account-wide queries are keyed without the instrument, so calls
+      through different instruments share one broker call too
+    - Short TTL: a result is reused for `ttl` seconds (a few hundred ms)
+    - Order/position events invalidate the affected kind of query, so a
+      fresh event is never answered from an older result
+    - Hit, miss and coalesce counters in get_stats()
+
+Results are shared between callers and must not be mutated.
+
+Usage:
+    queries = BrokerQueryCache(ttl=0.25)
+
+    orders = await queries.get_position_orders(symbol, instrument, contract_id)
+    orders = await queries.search_open_orders(instrument)
+    positions = await queries.get_all_positions(instrument, contract_id)
+
+    queries.invalidate(BrokerQueryCache.ORDERS)  # after order events
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+
+from risk_manager.core.clock import Clock
+
+
+class BrokerQueryCache:
+    """
+    Single-flight, short-TTL cache for read-only broker queries.
+
+    Keys are tuples whose first element is the query kind (ORDERS or
+    POSITIONS) so that events can invalidate one kind at a time.
+    """
+
+    DEFAULT_TTL = 0.25  # Seconds a result is reused
+
+    ORDERS = "orders"
+    POSITIONS = "positions"
+
+    def __init__(self, ttl: float = DEFAULT_TTL, clock: Clock | None = None):
+        """
+        Initialize an empty query cache.
+
+        Args:
+            ttl: Seconds a result is reused (0 disables caching but keeps
+                single flight)
+            clock: Optional clock (defaults to the system monotonic clock)
+
+        Raises:
+            ValueError: If ttl is negative
+        """
+        if ttl < 0:
+            raise ValueError("ttl must not be negative")
+
+        self.ttl = ttl
+        self.clock = clock
+
+        # {key: (expires_at, result)}
+        self._results: dict[tuple, tuple[float, Any]] = {}
+        # {key: task of the call in flight}
+        self._in_flight: dict[tuple, asyncio.Task] = {}
+        # Bumped by invalidate(); results fetched across a bump are not stored
+        self._generations: dict[str, int] = {}
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def _monotonic(self) -> float:
+        """Monotonic seconds from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.monotonic()
+        return time.monotonic()
+
+    # ========================================================================
+    # Queries
+    # ========================================================================
+
+    async def get_position_orders(self, symbol: str, instrument, contract_id: str) -> list[Any]:
+        """Working orders of one contract (instrument.orders.get_position_orders)."""
+        return await self.query(
+            (self.ORDERS, "position_orders", symbol, contract_id),
+            lambda: instrument.orders.get_position_orders(contract_id),
+        )
+
+    async def search_open_orders(self, instrument, contract_id: str | None = None) -> list[Any]:
+        """
+        Open orders of the account (instrument.orders.search_open_orders).
+
+        The broker call is account-wide, so any instrument serves it and
+        one call is shared by all; pass contract_id to get only its orders.
+        """
+        orders = await self.query(
+            (self.ORDERS, "open_orders"),
+            lambda: instrument.orders.search_open_orders(),
+        )
+        return self._for_contract(orders, contract_id)
+
+    async def get_all_positions(self, instrument, contract_id: str | None = None) -> list[Any]:
+        """
+        Open positions of the account (instrument.positions.get_all_positions).
+
+        Account-wide like search_open_orders(); pass contract_id to get
+        only that contract's positions.
+        """
+        positions = await self.query(
+            (self.POSITIONS, "all_positions"),
+            lambda: instrument.positions.get_all_positions(),
+        )
+        return self._for_contract(positions, contract_id)
+
+    @staticmethod
+    def _for_contract(items: list[Any], contract_id: str | None) -> list[Any]:
+        """Items of one contract (a new list), or the shared result as is."""
+        if contract_id is None:
+            return items
+        return [item for item in items if getattr(item, "contractId", None) == contract_id]
+
+    async def query(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached result, join an identical call in flight, or fetch.
+
+        The broker call runs as its own task, so cancelling one caller
+        (e.g. by a handler timeout) never cancels it for the others.
+        Errors are not cached; every caller waiting on a failed call gets
+        the exception.
+
+        Args:
+            key: Query key; key[0] is the query kind
+            fetch: Zero-argument coroutine function performing the query
+
+        Returns:
+            Query result
+        """
+        cached = self._results.get(key)
+        if cached is not None:
+            if cached[0] > self._monotonic():
+                self.hits += 1
+                return cached[1]
+            del self._results[key]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._fetch(key, fetch, self._generations.get(key[0], 0)))
+            # Retrieve the outcome even if every caller has gone away
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._in_flight[key] = task
+
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: tuple, fetch: Callable[[], Awaitable[Any]], generation: int) -> Any:
+        """Run one broker call and cache its result (unless invalidated meanwhile)."""
+        try:
+            result = await fetch()
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            if self._in_flight.get(key) is asyncio.current_task():
+                del self._in_flight[key]
+
+        if self.ttl > 0 and self._generations.get(key[0], 0) == generation:
+            self._results[key] = (self._monotonic() + self.ttl, result)
+        return result
+
+    def invalidate(self, kind: str | None = None) -> None:
+        """
+        Drop cached results (and stop sharing calls in flight).
+
+        Args:
+            kind: ORDERS or POSITIONS, or None for everything
+        """
+        kinds = [kind] if kind is not None else [self.ORDERS, self.POSITIONS]
+        for name in kinds:
+            self._generations[name] = self._generations.get(name, 0) + 1
+        for store in (self._results, self._in_flight):
+            for key in [k for k in store if kind is None or k[0] == kind]:
+                del store[key]
+        logger.debug(f"Broker query cache invalidated: {kind or 'all'}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss/coalesce metrics."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            "cached": len(self._results),
+            "in_flight": len(self._in_flight),
+        }
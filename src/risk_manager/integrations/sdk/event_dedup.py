@@ -0,0 +1,122 @@
+"""
+Event Deduplication Module
+
+Drops the copies of an SDK event delivered once per instrument manager.
+
+The Challenge:
+    - The SDK EventBus emits order and position events from each instrument
+      manager separately, so one order fill arrives 3x with 3 instruments
+    - The copies must be dropped before symbol extraction, logging and
+      protective-order lookups, which are the expensive part of ingestion
+    - The previous TTL dict was rescanned (O(n)) on every event
+
+The Solution:
+    - Identities are kept in insertion order with their first-seen time;
+      since the TTL is shared, the oldest identity always expires first
+    - Expiry pops from the front, so each identity is inserted and removed
+      once (amortized O(1) per event)
+    - The identity should include the fields that distinguish genuine
+      updates (e.g. size and price of a position), so only true copies
+      are dropped
+
+Usage:
+    dedup = EventDeduplicator(ttl=5.0)
+
+    if dedup.is_duplicate("order_filled", order.id):
+        return  # Copy from another instrument manager
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from risk_manager.core.clock import Clock
+
+
+class EventDeduplicator:
+    """
+    Expiring set of recently seen event identities.
+
+    An identity is a duplicate while it is younger than `ttl` seconds.
+    """
+
+    DEFAULT_TTL = 5.0  # Seconds an identity is remembered
+
+    def __init__(self, ttl: float = DEFAULT_TTL, clock: Clock | None = None):
+        """
+        Initialize an empty deduplicator.
+
+        Args:
+            ttl: Seconds an event identity is remembered
+            clock: Optional clock (defaults to the system monotonic clock)
+
+        Raises:
+            ValueError: If ttl is negative
+        """
+        if ttl < 0:
+            raise ValueError("ttl must not be negative")
+
+        self.ttl = ttl
+        self.clock = clock
+
+        # {(event_type, identity): first seen (monotonic)}, oldest first
+        self._seen: OrderedDict[tuple[str, Hashable], float] = OrderedDict()
+
+        # Metrics
+        self.unique = 0
+        self.duplicates = 0
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def _monotonic(self) -> float:
+        """Monotonic seconds from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.monotonic()
+        return time.monotonic()
+
+    def is_duplicate(self, event_type: str, identity: Hashable) -> bool:
+        """
+        Check an event and remember it if it is new.
+
+        Args:
+            event_type: Type of event (e.g., "order_filled", "position_updated")
+            identity: Hashable identity of the event (order id, or a tuple
+                of the fields that make an update distinct)
+
+        Returns:
+            True if the same event was seen within the TTL
+        """
+        now = self._monotonic()
+        self._expire(now)
+
+        key = (event_type, identity)
+        if key in self._seen:
+            self.duplicates += 1
+            return True
+
+        self._seen[key] = now
+        self.unique += 1
+        return False
+
+    def _expire(self, now: float) -> None:
+        """Drop identities older than the TTL (oldest are at the front)."""
+        seen = self._seen
+        while seen:
+            key, first_seen = next(iter(seen.items()))
+            if now - first_seen <= self.ttl:
+                break
+            del seen[key]
+
+    def clear(self) -> None:
+        """Forget all identities."""
+        self._seen.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get deduplication metrics."""
+        return {
+            "ttl": self.ttl,
+            "tracked": len(self._seen),
+            "unique": self.unique,
+            "duplicates": self.duplicates,
+        }
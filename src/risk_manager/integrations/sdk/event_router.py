@@ -10,7 +10,7 @@ This module handles ALL 16 event types from the SDK:
 
 Each handler:
 1. Validates and extracts event data
-2. Performs deduplication (prevents 3x events from 3 instruments)
+2. Performs deduplication first (prevents 3x events from 3 instruments)
 3. Delegates to specialized processors (caches, calculators, correlators)
 4. Logs human-readable messages
 5. Publishes enriched events to risk event bus
@@ -18,12 +18,13 @@ Each handler:
 After extraction, TradingIntegration is purely facade + connection orchestration.
 """
 
-import time
-from typing import Any
+from typing import Any, Hashable
 from loguru import logger
 
 from risk_manager.core.events import EventBus, RiskEvent, EventType
 from risk_manager.integrations.adapters import adapter
+from risk_manager.integrations.sdk.broker_queries import BrokerQueryCache
+from risk_manager.integrations.sdk.event_dedup import EventDeduplicator
 
 
 class EventRouter:
@@ -41,6 +42,9 @@ class EventRouter:
         pnl_calculator,
         order_polling,
         event_bus: EventBus,
+        order_mirror=None,
+        broker_queries: BrokerQueryCache | None = None,
+        event_dedup: EventDeduplicator | None = None,
     ):
         """
         Initialize event router with all dependencies.
@@ -51,12 +55,20 @@ class EventRouter:
             pnl_calculator: UnrealizedPnLCalculator instance
             order_polling: OrderPollingService instance
             event_bus: EventBus for publishing risk events
+            order_mirror: Optional OrderMirror kept current from order and
+                position events (serves stop/target lookups once synced)
+            broker_queries: Optional shared BrokerQueryCache, invalidated
+                when order/position events make its results stale
+            event_dedup: Optional shared EventDeduplicator (a private one
+                is used if omitted)
         """
         self._protective_cache = protective_cache
         self._order_correlator = order_correlator
         self._pnl_calculator = pnl_calculator
         self._order_polling = order_polling
         self._event_bus = event_bus
+        self._order_mirror = order_mirror
+        self._broker_queries = broker_queries
 
         # Will be set externally after initialization
         self._client = None
@@ -68,11 +80,10 @@ class EventRouter:
         self._get_stop_loss_fn = None
         self._get_take_profit_fn = None
 
-        # Deduplication cache
+        # Deduplication
         # SDK EventBus emits events from each instrument manager separately,
         # so a single order can trigger 3 identical events (one per instrument)
-        self._event_cache: dict[tuple[str, str], float] = {}
-        self._event_cache_ttl = 5.0
+        self._event_dedup = event_dedup or EventDeduplicator()
 
         logger.debug("EventRouter initialized")
 
@@ -95,33 +106,18 @@ class EventRouter:
         self._get_stop_loss_fn = get_stop_loss_fn
         self._get_take_profit_fn = get_take_profit_fn
 
-    def _is_duplicate_event(self, event_type: str, entity_id: str) -> bool:
+    def _is_duplicate_event(self, event_type: str, identity: Hashable) -> bool:
         """
         Check if this event is a duplicate.
 
         The SDK EventBus emits events from each instrument manager separately,
         so a single order can trigger 3 identical events (one per instrument).
 
-        We use a TTL-based cache (5 seconds) to deduplicate events.
+        Identities are remembered for 5 seconds (see EventDeduplicator). They
+        include the fields that make an update distinct, so a genuine second
+        update within the window is not dropped.
         """
-        current_time = time.time()
-        cache_key = (event_type, entity_id)
-
-        # Clean expired entries
-        expired_keys = [
-            k for k, timestamp in self._event_cache.items()
-            if current_time - timestamp > self._event_cache_ttl
-        ]
-        for k in expired_keys:
-            del self._event_cache[k]
-
-        # Check if seen recently
-        if cache_key in self._event_cache:
-            return True
-
-        # Mark as seen
-        self._event_cache[cache_key] = current_time
-        return False
+        return self._event_dedup.is_duplicate(event_type, identity)
 
     # ============================================================================
     # Helper Methods (7 methods)
@@ -243,13 +239,29 @@ class EventRouter:
             return False  # Conservative: don't assume unless we're certain
         return False
 
+    def _mirror_order(self, order) -> None:
+        """Record a working order in the order mirror (if any)."""
+        if self._order_mirror is not None:
+            self._order_mirror.upsert_order(order)
+        self._invalidate_queries(BrokerQueryCache.ORDERS)
+
+    def _unmirror_order(self, order) -> None:
+        """Drop a no-longer-working order from the order mirror (if any)."""
+        if self._order_mirror is not None:
+            self._order_mirror.remove_order(order.id)
+        self._invalidate_queries(BrokerQueryCache.ORDERS)
+
+    def _invalidate_queries(self, kind: str) -> None:
+        """Drop cached broker query results made stale by an event."""
+        if self._broker_queries is not None:
+            self._broker_queries.invalidate(kind)
+
     # ============================================================================
     # ORDER Event Handlers (8 handlers)
     # ============================================================================
 
     async def _on_order_placed(self, event) -> None:
         """Handle ORDER_PLACED event from SDK EventBus."""
-        logger.debug(f"🔔 ORDER_PLACED event received")
         try:
             data = event.data if hasattr(event, 'data') else {}
 
@@ -259,9 +271,11 @@ class EventRouter:
                 return
 
             # Check for duplicate FIRST (prevents 3x events from 3 instruments)
-            if self._is_duplicate_event("order_placed", str(order.id)):
+            if self._is_duplicate_event("order_placed", order.id):
                 return
 
+            logger.debug(f"🔔 ORDER_PLACED event received")
+
             # Debug: Show payload AFTER dedup (only for unique events)
             logger.debug(f"📦 ORDER_PLACED Payload: order_id={order.id}, type={order.type}, stopPrice={order.stopPrice}")
 
@@ -276,7 +290,8 @@ class EventRouter:
             # Order details at DEBUG level only
             logger.debug(f"Order ID: {order.id}, Type: {order.type} ({order.type_str}), Stop: {order.stopPrice}, Limit: {order.limitPrice}, Status: {order.status}")
 
-            # Cache active protective orders (delegated to cache module)
+            # Mirror the working order and cache active protective orders
+            self._mirror_order(order)
             self._protective_cache.update_from_order_placed(order)
 
             # Mark order as seen by polling service (prevents duplicate logging)
@@ -308,7 +323,6 @@ class EventRouter:
 
     async def _on_order_filled(self, event) -> None:
         """Handle ORDER_FILLED event from SDK EventBus."""
-        logger.debug(f"🔔 ORDER_FILLED event received")
         try:
             data = event.data if hasattr(event, 'data') else {}
 
@@ -318,9 +332,11 @@ class EventRouter:
                 return
 
             # Check for duplicate FIRST (prevents 3x events from 3 instruments)
-            if self._is_duplicate_event("order_filled", str(order.id)):
+            if self._is_duplicate_event("order_filled", order.id):
                 return
 
+            logger.debug(f"🔔 ORDER_FILLED event received")
+
             # Debug: Show payload AFTER dedup (only for unique events)
             logger.debug(f"📦 ORDER_FILLED Payload: order_id={order.id}, type={order.type}, stopPrice={order.stopPrice}")
 
@@ -341,6 +357,7 @@ class EventRouter:
 
             # Remove from known orders (it's filled now) - Delegated to OrderPollingService
             self._order_polling.mark_order_unseen(order.id)
+            self._unmirror_order(order)
 
             # Track this fill for correlation with position updates - Delegated to OrderCorrelator
             is_sl = self._is_stop_loss(order)
@@ -391,24 +408,28 @@ class EventRouter:
 
     async def _on_order_partial_fill(self, event) -> None:
         """Handle ORDER_PARTIAL_FILL event from SDK EventBus."""
-        logger.debug(f"🔔 ORDER_PARTIAL_FILL event received")
         try:
             data = event.data if hasattr(event, 'data') else {}
 
-            # Debug: Show full payload
-            logger.debug(f"📦 ORDER_PARTIAL_FILL Payload: {data}")
-
             order = data.get('order') if isinstance(data, dict) else None
 
             if not order:
                 return
 
             # Check for duplicate (prevents 3x events from 3 instruments)
-            if self._is_duplicate_event("order_partial_fill", str(order.id)):
+            if self._is_duplicate_event("order_partial_fill", (order.id, order.fillVolume)):
                 return
 
+            logger.debug(f"🔔 ORDER_PARTIAL_FILL event received")
+
+            # Debug: Show full payload AFTER dedup (only for unique events)
+            logger.debug(f"📦 ORDER_PARTIAL_FILL Payload: {data}")
+
             symbol = self._extract_symbol_fn(order.contractId)
 
+            # Still working with the remaining size
+            self._mirror_order(order)
+
             logger.info(
                 f"📊 ORDER PARTIALLY FILLED - {symbol} | ID: {order.id} | Filled: {order.fillVolume}/{order.size} @ ${order.filledPrice:.2f}"
             )
@@ -418,28 +439,30 @@ class EventRouter:
 
     async def _on_order_cancelled(self, event) -> None:
         """Handle ORDER_CANCELLED event from SDK EventBus."""
-        logger.debug(f"🔔 ORDER_CANCELLED event received")
         try:
             data = event.data if hasattr(event, 'data') else {}
 
-            # Debug: Show full payload
-            logger.debug(f"📦 ORDER_CANCELLED Payload: {data}")
-
             order = data.get('order') if isinstance(data, dict) else None
 
             if not order:
                 return
 
             # Check for duplicate (prevents 3x events from 3 instruments)
-            if self._is_duplicate_event("order_cancelled", str(order.id)):
+            if self._is_duplicate_event("order_cancelled", order.id):
                 return
 
+            logger.debug(f"🔔 ORDER_CANCELLED event received")
+
+            # Debug: Show full payload AFTER dedup (only for unique events)
+            logger.debug(f"📦 ORDER_CANCELLED Payload: {data}")
+
             symbol = self._extract_symbol_fn(order.contractId)
 
             logger.info(f"❌ ORDER CANCELLED - {symbol} | ID: {order.id}")
 
             # Remove from known orders (it's cancelled now) - Delegated to OrderPollingService
             self._order_polling.mark_order_unseen(order.id)
+            self._unmirror_order(order)
 
             # Remove from active caches (order is now cancelled)
             # Note: Cache removal is idempotent (safe to call even if not in cache)
@@ -451,47 +474,51 @@ class EventRouter:
 
     async def _on_order_rejected(self, event) -> None:
         """Handle ORDER_REJECTED event from SDK EventBus."""
-        logger.debug(f"🔔 ORDER_REJECTED event received")
         try:
             data = event.data if hasattr(event, 'data') else {}
 
-            # Debug: Show full payload
-            logger.debug(f"📦 ORDER_REJECTED Payload: {data}")
-
             order = data.get('order') if isinstance(data, dict) else None
 
             if not order:
                 return
 
             # Check for duplicate (prevents 3x events from 3 instruments)
-            if self._is_duplicate_event("order_rejected", str(order.id)):
+            if self._is_duplicate_event("order_rejected", order.id):
                 return
 
+            logger.debug(f"🔔 ORDER_REJECTED event received")
+
+            # Debug: Show full payload AFTER dedup (only for unique events)
+            logger.debug(f"📦 ORDER_REJECTED Payload: {data}")
+
             symbol = self._extract_symbol_fn(order.contractId)
 
             logger.warning(f"⛔ ORDER REJECTED - {symbol} | ID: {order.id}")
 
+            self._unmirror_order(order)
+
         except Exception as e:
             logger.error(f"Error handling ORDER_REJECTED: {e}")
 
     async def _on_order_modified(self, event) -> None:
         """Handle ORDER_MODIFIED event from SDK EventBus."""
-        logger.debug(f"🔔 ORDER_MODIFIED event received")
         try:
             data = event.data if hasattr(event, 'data') else {}
 
-            # Debug: Show full payload at DEBUG level
-            logger.debug(f"📦 ORDER_MODIFIED Payload: {data}")
-
             order = data.get('order') if isinstance(data, dict) else None
 
             if not order:
                 return
 
             # Check for duplicate (prevents 3x events from 3 instruments)
-            if self._is_duplicate_event("order_modified", str(order.id)):
+            if self._is_duplicate_event("order_modified", (order.id, order.size, order.stopPrice, order.limitPrice)):
                 return
 
+            logger.debug(f"🔔 ORDER_MODIFIED event received")
+
+            # Debug: Show full payload AFTER dedup (only for unique events)
+            logger.debug(f"📦 ORDER_MODIFIED Payload: {data}")
+
             symbol = self._extract_symbol_fn(order.contractId)
             order_type_str = order.type_str
 
@@ -503,35 +530,39 @@ class EventRouter:
             # Order details at DEBUG level only
             logger.debug(f"Order ID: {order.id}, Type: {order.type} ({order_type_str}), Stop: {order.stopPrice}, Limit: {order.limitPrice}, Status: {order.status}")
 
-            # Invalidate protective cache (order parameters changed)
-            # This forces a fresh query on next position update
-            self._protective_cache.invalidate_for_order(order.id)
+            # Mirror the new parameters and invalidate the protective cache
+            # (forces a fresh lookup on next position update)
+            self._mirror_order(order)
+            self._protective_cache.invalidate(order.contractId)
 
         except Exception as e:
             logger.error(f"Error handling ORDER_MODIFIED: {e}")
 
     async def _on_order_expired(self, event) -> None:
         """Handle ORDER_EXPIRED event from SDK EventBus."""
-        logger.debug(f"🔔 ORDER_EXPIRED event received")
         try:
             data = event.data if hasattr(event, 'data') else {}
 
-            # Debug: Show full payload
-            logger.debug(f"📦 ORDER_EXPIRED Payload: {data}")
-
             order = data.get('order') if isinstance(data, dict) else None
 
             if not order:
                 return
 
             # Check for duplicate (prevents 3x events from 3 instruments)
-            if self._is_duplicate_event("order_expired", str(order.id)):
+            if self._is_duplicate_event("order_expired", order.id):
                 return
 
+            logger.debug(f"🔔 ORDER_EXPIRED event received")
+
+            # Debug: Show full payload AFTER dedup (only for unique events)
+            logger.debug(f"📦 ORDER_EXPIRED Payload: {data}")
+
             symbol = self._extract_symbol_fn(order.contractId)
 
             logger.info(f"⏰ ORDER EXPIRED - {symbol} | ID: {order.id}")
 
+            self._unmirror_order(order)
+
         except Exception as e:
             logger.error(f"Error handling ORDER_EXPIRED: {e}")
 
@@ -561,15 +592,15 @@ class EventRouter:
         Handle POSITION events (OPENED, CLOSED, UPDATED).
 
         This is the most complex handler because it:
-        1. Checks protective orders BEFORE dedup (critical for detecting silent orders)
-        2. Performs deduplication
+        1. Performs deduplication first, keyed on the position's state
+           (copies are dropped; a genuine update within the TTL is not)
+        2. Updates the order mirror and queries protective orders
+           (stop loss / take profit; dictionary reads once the mirror is synced)
         3. Correlates with recent ORDER_FILLED events
         4. Calculates realized P&L for CLOSED positions
         5. Tracks OPENED positions in P&L calculator
-        6. Queries protective orders (stop loss / take profit)
-        7. Publishes enriched event to risk bus
+        6. Publishes enriched event to risk bus
         """
-        logger.debug(f"🔔 POSITION_{action_name} event received")
         try:
             data = event.data if hasattr(event, 'data') else {}
 
@@ -580,31 +611,43 @@ class EventRouter:
             unrealized_pnl = data.get('unrealizedPnl', 0.0)
             pos_type = data.get('type', 0)
 
-            # CRITICAL: Check protective orders BEFORE dedup
-            # Second order placements don't trigger unique events!
-            # Must query on EVERY event to catch them
+            # Check for duplicate FIRST (prevents 3x events from 3 instruments)
+            dedup_key = (contract_id, pos_type, size, avg_price)
+            if self._is_duplicate_event(f"position_{action_name.lower()}", dedup_key):
+                return
+
+            logger.debug(f"🔔 POSITION_{action_name} event received")
+
+            self._invalidate_queries(BrokerQueryCache.POSITIONS)
+            if self._order_mirror is not None:
+                if action_name == "CLOSED":
+                    self._order_mirror.remove_position(contract_id)
+                else:
+                    self._order_mirror.update_position(contract_id, avg_price, pos_type, size)
+
+            # Look up protective orders once - the result is reused for
+            # logging and the risk event below. Orders placed without a
+            # position change arrive via order events and polling.
+            stop_loss = take_profit = None
             if action_name in ["OPENED", "UPDATED"]:
-                logger.debug(f"Checking protective orders (pre-dedup)")
+                # Don't leave an open position to the slow (flat account) poll rate
+                self._order_polling.poll_soon()
 
-                # Always invalidate cache and query fresh
-                self._protective_cache.invalidate(contract_id)
+                logger.debug(f"Checking protective orders")
+
+                # Without a synced mirror only a fresh broker query sees new orders
+                if self._order_mirror is None or not self._order_mirror.synced:
+                    self._protective_cache.invalidate(contract_id)
 
                 # Query with position data from event
-                stop_loss_early = await self._get_stop_loss_fn(
+                stop_loss = await self._get_stop_loss_fn(
                     contract_id, avg_price, pos_type
                 )
-                take_profit_early = await self._get_take_profit_fn(
+                take_profit = await self._get_take_profit_fn(
                     contract_id, avg_price, pos_type
                 )
 
-                # Log findings (DEBUG level for early check)
-                logger.debug(f"Pre-dedup query: SL={bool(stop_loss_early)}, TP={bool(take_profit_early)}")
-
-            # Check for duplicate (prevents 3x events from 3 instruments)
-            # Use contract_id + action for deduplication key
-            dedup_key = f"{contract_id}_{action_name}"
-            if self._is_duplicate_event(f"position_{action_name.lower()}", dedup_key):
-                return  # Exit after protective order check
+                logger.debug(f"Protective order query: SL={bool(stop_loss)}, TP={bool(take_profit)}")
 
             # Debug: Show payload AFTER dedup (only for unique events)
             logger.debug(f"📦 POSITION_{action_name} Payload keys: {list(data.keys())}")
@@ -634,25 +677,8 @@ class EventRouter:
             )
 
             # Show active stop loss/take profit for this position (if any)
-            # CRITICAL: Always check on EVERY event, even if deduped for logging
-            # This ensures we catch new orders that don't trigger unique events
+            # (looked up above)
             if action_name in ["OPENED", "UPDATED"]:
-                logger.debug("Checking protective orders (post-dedup)")
-
-                # ALWAYS invalidate cache on position updates
-                # This forces a fresh query EVERY time, catching new orders
-                logger.debug("Invalidating protective order cache")
-                self._protective_cache.invalidate(contract_id)
-
-                # Pass position data from event to avoid hanging get_all_positions() call
-                # pos_type: 1=LONG, 2=SHORT
-                stop_loss = await self._get_stop_loss_fn(
-                    contract_id, avg_price, pos_type
-                )
-                take_profit = await self._get_take_profit_fn(
-                    contract_id, avg_price, pos_type
-                )
-
                 if stop_loss:
                     logger.info(f"  🛡️  Stop Loss: ${stop_loss['stop_price']:,.2f}")
                 else:
@@ -671,13 +697,17 @@ class EventRouter:
             }
 
             # Get active stop loss/take profit data for this position
-            # Note: We already queried this above for logging, cache will make this instant
-            stop_loss_for_event = await self._get_stop_loss_fn(
-                contract_id, avg_price, pos_type
-            )
-            take_profit_for_event = await self._get_take_profit_fn(
-                contract_id, avg_price, pos_type
-            )
+            # (OPENED/UPDATED reuse the lookup above)
+            if action_name in ["OPENED", "UPDATED"]:
+                stop_loss_for_event = stop_loss
+                take_profit_for_event = take_profit
+            else:
+                stop_loss_for_event = await self._get_stop_loss_fn(
+                    contract_id, avg_price, pos_type
+                )
+                take_profit_for_event = await self._get_take_profit_fn(
+                    contract_id, avg_price, pos_type
+                )
 
             # Calculate realized P&L for CLOSED positions (delegated to UnrealizedPnLCalculator)
             # SDK doesn't provide profitAndLoss, so we calculate it ourselves!
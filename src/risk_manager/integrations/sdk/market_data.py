@@ -7,6 +7,7 @@ Handles real-time market data from the ProjectX SDK:
 - OHLC bars
 - Price polling
 - Status bar display
+- Quote conflation (optional, latest-value-wins per symbol)
 
 This module solves the "quote events don't fire" problem by implementing
 price polling as a backup mechanism for P&L calculations.
@@ -19,7 +20,7 @@ The Challenge:
 
 The Solution:
     - Primary: Subscribe to QUOTE_UPDATE events (fast when they work)
-    - Fallback: Poll instrument.last_price every 0.5s (background task)
+    - Fallback: Poll instrument.last_price every 0.5s (scheduler job)
     - Hybrid: Use whichever provides data
     - Status bar: Display live P&L updates
 
@@ -43,13 +44,32 @@ Usage:
 
     # Stop status bar
     await handler.stop_status_bar()
+
+Quote Conflation:
+    Pass the `events.quotes` config to coalesce quote bursts. Only the
+    latest quote per symbol is processed every buffer_flush_interval_ms,
+    MARKET_DATA_UPDATED is published at most every update_interval_ms per
+    symbol, and a quote that breaches a rule limit set on the calculator
+    (set_pnl_limits) is processed immediately.
+
+    handler = MarketDataHandler(
+        pnl_calculator=pnl_calc,
+        event_bus=event_bus,
+        instruments=["MNQ", "ES"],
+        quote_config=events_config.quotes,
+    )
+    await handler.start_quote_conflation()
+    ...
+    await handler.stop_quote_conflation()
 """
 
-import asyncio
+import time
 from typing import Any
 from loguru import logger
 
 from risk_manager.core.events import EventBus, RiskEvent, EventType
+from risk_manager.core.scheduler import Job, Scheduler
+from risk_manager.integrations.sdk.quote_conflator import ConflatedQuote, QuoteConflator
 
 
 class MarketDataHandler:
@@ -63,11 +83,15 @@ class MarketDataHandler:
     4. Status bar display (live P&L updates)
     """
 
+    STATUS_BAR_INTERVAL = 0.5  # Seconds between status bar updates / price polls
+
     def __init__(
         self,
         pnl_calculator,
         event_bus: EventBus,
         instruments: list[str],
+        quote_config=None,
+        scheduler: Scheduler | None = None,
     ):
         """
         Initialize market data handler.
@@ -76,6 +100,10 @@ class MarketDataHandler:
             pnl_calculator: UnrealizedPnLCalculator instance
             event_bus: Event bus for publishing risk events
             instruments: List of instrument symbols (e.g., ["MNQ", "ES"])
+            quote_config: Optional QuoteEventsConfig. When given,
+                quotes are conflated per symbol instead of processed one by one.
+            scheduler: Optional shared scheduler for the status bar job
+                (a private one is started with the status bar if omitted)
         """
         self.pnl_calculator = pnl_calculator
         self.event_bus = event_bus
@@ -88,8 +116,25 @@ class MarketDataHandler:
         # Running state
         self._running = False
 
-        # Status bar task
-        self._status_bar_task = None
+        # Status bar job
+        self.scheduler = scheduler
+        self._owns_scheduler = scheduler is None
+        self._status_bar_job: Job | None = None
+        self._poll_count = 0
+        self._prices_found = False
+
+        # Quote conflation (disabled unless a quote config is supplied)
+        self._conflator: QuoteConflator | None = None
+        self._market_data_interval = 0.0
+        self._last_market_data_publish: dict[str, float] = {}
+
+        if quote_config is not None:
+            self._conflator = QuoteConflator(
+                flush_callback=self.process_quote,
+                flush_interval_ms=quote_config.buffer_flush_interval_ms,
+                buffer_size=quote_config.buffer_size,
+            )
+            self._market_data_interval = quote_config.update_interval_ms / 1000.0
 
     def set_client(self, client):
         """
@@ -177,51 +222,114 @@ class MarketDataHandler:
             # DEBUG logging only - quote updates are too frequent for INFO
             logger.debug(f"Quote: {symbol} @ ${market_price:.2f} (bid: ${bid:.2f}, ask: ${ask:.2f})")
 
-            # Update unrealized P&L calculator (silent)
-            self.pnl_calculator.update_quote(symbol, market_price)
-
-            # Check if any position has significant P&L change
-            # Only emit UNREALIZED_PNL_UPDATE if P&L changed by $10+
-            positions_to_check = self.pnl_calculator.get_positions_by_symbol(symbol)
-            for contract_id in positions_to_check:
-                if self.pnl_calculator.has_significant_pnl_change(contract_id, threshold=10.0):
-                    # Get updated P&L
-                    unrealized_pnl = self.pnl_calculator.calculate_unrealized_pnl(contract_id)
-                    if unrealized_pnl is not None:
-                        # Emit unrealized P&L update event
-                        await self.event_bus.publish(RiskEvent(
-                            event_type=EventType.UNREALIZED_PNL_UPDATE,
-                            data={
-                                'account_id': self._client.account_info.id if self._client else None,  # ← CRITICAL: Rules need account_id
-                                'contract_id': contract_id,
-                                'contractId': contract_id,  # ← CRITICAL: Rules need contractId (for enforcement)
-                                'symbol': symbol,
-                                'unrealized_pnl': float(unrealized_pnl),
-                            },
-                            source="trading_sdk"
-                        ))
-                        logger.info(f"💹 Unrealized P&L update: {symbol} ${float(unrealized_pnl):+.2f}")
-
-            # Also publish MARKET_DATA_UPDATED for backward compatibility
-            risk_event = RiskEvent(
-                event_type=EventType.MARKET_DATA_UPDATED,
-                data={
-                    "symbol": symbol,
-                    "price": market_price,
-                    "bid": bid,
-                    "ask": ask,
-                    "last": last_price,
-                    "timestamp": quote_data.get('timestamp'),
-                },
-                source="trading_sdk",
-            )
+            timestamp = quote_data.get('timestamp')
+
+            if self._conflator is None:
+                await self.process_quote(ConflatedQuote(
+                    symbol=symbol,
+                    bid=bid,
+                    ask=ask,
+                    last=last_price,
+                    price=market_price,
+                    timestamp=timestamp,
+                ))
+                return
 
-            await self.event_bus.publish(risk_event)
+            await self._conflator.submit(
+                symbol,
+                bid,
+                ask,
+                last_price,
+                market_price,
+                timestamp,
+                urgent=self._crosses_pnl_threshold(symbol, market_price),
+            )
 
         except Exception as e:
             logger.error(f"Error handling quote update: {e}")
             logger.exception(e)
 
+    async def process_quote(self, quote: ConflatedQuote) -> None:
+        """
+        Apply a (possibly conflated) quote to P&L and publish risk events.
+
+        Called directly per quote when conflation is off, or by the
+        QuoteConflator on each flush when it is on.
+
+        Args:
+            quote: Latest quote for one symbol
+        """
+        symbol = quote.symbol
+
+        # Update unrealized P&L calculator (silent)
+        self.pnl_calculator.update_quote(symbol, quote.price)
+
+        # Emit UNREALIZED_PNL_UPDATE if P&L changed by $10+, or right away
+        # when this quote breaches a rule limit (price-trigger index)
+        triggered = self.pnl_calculator.check_pnl_triggers(symbol)
+        positions_to_check = self.pnl_calculator.get_positions_by_symbol(symbol)
+        for contract_id in positions_to_check:
+            significant = self.pnl_calculator.has_significant_pnl_change(contract_id, threshold=10.0)
+            if significant or contract_id in triggered:
+                # Get updated P&L
+                unrealized_pnl = self.pnl_calculator.calculate_unrealized_pnl(contract_id)
+                if unrealized_pnl is not None:
+                    # Emit unrealized P&L update event
+                    # Typed fields (account_id, contract_id, symbol) are what rules
+                    # read; event.data (incl. contractId) is only built if asked for
+                    await self.event_bus.publish(RiskEvent(
+                        event_type=EventType.UNREALIZED_PNL_UPDATE,
+                        account_id=self._client.account_info.id if self._client else None,  # ← CRITICAL: Rules need account_id
+                        contract_id=contract_id,
+                        symbol=symbol,
+                        price=quote.price,  # Quote behind this P&L (lets journal replays rebuild it)
+                        data={'unrealized_pnl': float(unrealized_pnl)},
+                        source="trading_sdk"
+                    ))
+                    logger.info(f"💹 Unrealized P&L update: {symbol} ${float(unrealized_pnl):+.2f}")
+
+        # Throttle MARKET_DATA_UPDATED per symbol when conflating
+        if self._market_data_interval and not quote.urgent:
+            now = time.monotonic()
+            last_publish = self._last_market_data_publish.get(symbol)
+            if last_publish is not None and now - last_publish < self._market_data_interval:
+                return
+            self._last_market_data_publish[symbol] = now
+
+        # Also publish MARKET_DATA_UPDATED for backward compatibility
+        risk_event = RiskEvent(
+            event_type=EventType.MARKET_DATA_UPDATED,
+            symbol=symbol,
+            price=quote.price,
+            data={
+                "bid": quote.bid,
+                "ask": quote.ask,
+                "last": quote.last,
+                "timestamp": quote.timestamp,
+            },
+            source="trading_sdk",
+        )
+
+        await self.event_bus.publish(risk_event)
+
+    def _crosses_pnl_threshold(self, symbol: str, price: float) -> bool:
+        """
+        Check whether a new price breaches a rule limit (P&L trigger).
+
+        O(1) per symbol: the calculator evaluates the price against the
+        symbol's aggregate value and trigger levels without applying it.
+        A position with no processed quote yet counts as a crossing so its
+        first price is never held back.
+
+        Args:
+            symbol: Normalized instrument symbol
+            price: Incoming market price
+
+        Returns:
+            True if the quote should bypass conflation
+        """
+        return self.pnl_calculator.would_trigger_at(symbol, price)
+
     async def handle_data_update(self, data: Any) -> None:
         """
         Handle DATA_UPDATE event (alternative market data source).
@@ -318,40 +426,69 @@ class MarketDataHandler:
 
     async def start_status_bar(self) -> None:
         """
-        Start the status bar update task.
+        Start the status bar update job.
 
-        Creates a background task that updates unrealized P&L display
+        Registers a scheduler job that updates unrealized P&L display
         every 0.5 seconds and polls prices as fallback.
         """
-        if self._status_bar_task and not self._status_bar_task.done():
+        if self._status_bar_job and not self._status_bar_job.done():
             logger.warning("Status bar task already running")
             return
 
         self._running = True
-        self._status_bar_task = asyncio.create_task(self._update_status_bar())
+        if self.scheduler is None:
+            self.scheduler = Scheduler()
+        self.scheduler.start()
+        self._status_bar_job = self.scheduler.every(
+            "status_bar", self.STATUS_BAR_INTERVAL, self._update_status_bar, first_delay=0
+        )
         logger.debug("Status bar task started")
 
     async def stop_status_bar(self) -> None:
         """
-        Stop the status bar update task.
-
-        Cancels the background task gracefully.
+        Stop the status bar update job.
         """
         self._running = False
 
-        if self._status_bar_task and not self._status_bar_task.done():
-            self._status_bar_task.cancel()
-            try:
-                await self._status_bar_task
-            except asyncio.CancelledError:
-                pass
+        if self._status_bar_job and not self._status_bar_job.done():
+            self._status_bar_job.cancel()
+            print()  # Print newline to move cursor to next line
             logger.debug("Status bar task stopped")
+        if self._owns_scheduler and self.scheduler:
+            await self.scheduler.stop()
+
+    # ========================================================================
+    # Quote Conflation (Background Task)
+    # ========================================================================
+
+    async def start_quote_conflation(self) -> None:
+        """Start the conflator's interval flush task (no-op when disabled)."""
+        if self._conflator is None:
+            return
+        await self._conflator.start()
 
-    async def _update_status_bar(self) -> None:
+    async def stop_quote_conflation(self) -> None:
+        """Stop the conflator, processing any quotes still pending."""
+        if self._conflator is None:
+            return
+        await self._conflator.stop()
+
+    def get_conflation_stats(self) -> dict[str, Any] | None:
         """
-        Background task that updates the unrealized P&L status bar.
+        Get quote conflation statistics.
 
-        Updates every 0.5 seconds with current unrealized P&L.
+        Returns:
+            Conflator stats, or None if conflation is disabled
+        """
+        if self._conflator is None:
+            return None
+        return self._conflator.get_stats()
+
+    def _update_status_bar(self) -> None:
+        """
+        Scheduler job that updates the unrealized P&L status bar.
+
+        Runs every 0.5 seconds with current unrealized P&L.
         Uses carriage return (\\r) to overwrite the same line.
 
         When other logs print, they interrupt the status bar (new line),
@@ -361,49 +498,36 @@ class MarketDataHandler:
         ALSO POLLS PRICES: Since quote events don't fire, we poll
         instrument.last_price every 0.5s to update the calculator.
         """
-        logger.debug("Status bar update task started")
-        poll_count = 0
-        prices_found = False
-
-        while self._running:
-            try:
-                # Poll prices from instruments (since quote events don't fire)
-                if self._suite:
-                    for symbol in self.instruments:
-                        try:
-                            instrument = self._suite.get(symbol)
-                            if instrument and hasattr(instrument, 'last_price'):
-                                price = instrument.last_price
-                                if price and price > 0:
-                                    # Update calculator with polled price
-                                    self.pnl_calculator.update_quote(symbol, price)
-                                    logger.debug(f"Polled price: {symbol} @ ${price:.2f}")
-                                    if not prices_found:
-                                        prices_found = True
-                                        logger.info(f"💹 Price polling active: {symbol} @ ${price:.2f}")
-                                else:
-                                    # Log when prices are None/0 (but only occasionally)
-                                    if poll_count % 10 == 0:  # Every 5 seconds
-                                        logger.debug(f"Polled {symbol}: last_price is None/0")
-                        except Exception as e:
-                            logger.debug(f"Error polling price for {symbol}: {e}")
-
-                poll_count += 1
-
-                # Calculate total unrealized P&L
-                total_pnl = self.pnl_calculator.calculate_total_unrealized_pnl()
-
-                # Print status bar (overwrites same line)
-                # \r = carriage return, end='' prevents newline, flush=True ensures immediate print
-                print(f"\r📊 Unrealized P&L: ${float(total_pnl):+.2f}  ", end="", flush=True)
-
-                # Wait 0.5 seconds before next update
-                await asyncio.sleep(0.5)
-
-            except asyncio.CancelledError:
-                logger.debug("Status bar task cancelled")
-                print()  # Print newline to move cursor to next line
-                break
-            except Exception as e:
-                logger.debug(f"Error in status bar update: {e}")
-                await asyncio.sleep(1.0)  # Back off on error
+        try:
+            # Poll prices from instruments (since quote events don't fire)
+            if self._suite:
+                for symbol in self.instruments:
+                    try:
+                        instrument = self._suite.get(symbol)
+                        if instrument and hasattr(instrument, 'last_price'):
+                            price = instrument.last_price
+                            if price and price > 0:
+                                # Update calculator with polled price
+                                self.pnl_calculator.update_quote(symbol, price)
+                                logger.debug(f"Polled price: {symbol} @ ${price:.2f}")
+                                if not self._prices_found:
+                                    self._prices_found = True
+                                    logger.info(f"💹 Price polling active: {symbol} @ ${price:.2f}")
+                            else:
+                                # Log when prices are None/0 (but only occasionally)
+                                if self._poll_count % 10 == 0:  # Every 5 seconds
+                                    logger.debug(f"Polled {symbol}: last_price is None/0")
+                    except Exception as e:
+                        logger.debug(f"Error polling price for {symbol}: {e}")
+
+            self._poll_count += 1
+
+            # Calculate total unrealized P&L
+            total_pnl = self.pnl_calculator.calculate_total_unrealized_pnl()
+
+            # Print status bar (overwrites same line)
+            # \r = carriage return, end='' prevents newline, flush=True ensures immediate print
+            print(f"\r📊 Unrealized P&L: ${float(total_pnl):+.2f}  ", end="", flush=True)
+
+        except Exception as e:
+            logger.debug(f"Error in status bar update: {e}")
@@ -0,0 +1,261 @@
+"""
+Order Mirror Module
+
+Local materialized copy of the account's working orders and open positions.
+
+The Challenge:
+    - Every POSITION_OPENED/UPDATED needs the position's stop loss and take profit
+    - Asking the broker each time costs several round-trips per event
+      (get_position_orders, search_open_orders, get_all_positions)
+    - Busy accounts emit position events in bursts
+
+The Solution:
+    - Order events (placed, modified, filled, cancelled, ...) and position
+      events keep the mirror current
+    - OrderPollingService feeds every account snapshot it fetches into
+      reconcile_from(), repairing drift from missed events (e.g. stops
+      placed in the broker UI) without a second snapshot query
+    - Stop/target lookups become dictionary reads once the first
+      snapshot has been applied (`synced`)
+
+Usage:
+    mirror = OrderMirror()
+    polling.set_mirror(mirror)  # Snapshots come from order polling
+
+    # From event handlers
+    mirror.upsert_order(order)
+    mirror.remove_order(order.id)
+    mirror.update_position(contract_id, avg_price, pos_type, size)
+
+    # Lookups
+    orders = mirror.get_orders(contract_id)
+    position = mirror.get_position(contract_id)
+"""
+
+from typing import Any
+
+from loguru import logger
+
+
+def order_key(order) -> tuple:
+    """Fields that identify a working order's state (a change means it was modified)."""
+    return (order.contractId, order.type, order.side, order.size, order.stopPrice, order.limitPrice)
+
+
+class OrderMirror:
+    """
+    Mirror of working orders and open positions for the connected account.
+
+    Orders are indexed by id and by contract; positions by contract. Events
+    that arrive while a snapshot is being fetched (between begin_reconcile()
+    and reconcile_from()) win over the (older) snapshot.
+    """
+
+    def __init__(self):
+        """Initialize an empty mirror."""
+        # Working orders: {order_id: order} and {contract_id: {order_id: order}}
+        self._orders: dict[int, Any] = {}
+        self._orders_by_contract: dict[str, dict[int, Any]] = {}
+
+        # Open positions: {contract_id: {"avg_price": float, "type": int, "size": int}}
+        self._positions: dict[str, dict[str, Any]] = {}
+
+        # True once a snapshot has been applied
+        self.synced = False
+
+        # Ids touched by events while a snapshot is in flight (None = idle)
+        self._touched_orders: set[int] | None = None
+        self._touched_positions: set[str] | None = None
+
+        # Statistics
+        self.reconciliations = 0
+        self.drift_corrections = 0
+
+    # ========================================================================
+    # Orders
+    # ========================================================================
+
+    def upsert_order(self, order) -> None:
+        """
+        Add or replace a working order (placed, modified, partially filled).
+
+        Args:
+            order: Order object from SDK
+        """
+        previous = self._orders.get(order.id)
+        if previous is not None and previous.contractId != order.contractId:
+            self._drop_from_contract(previous)
+        self._orders[order.id] = order
+        self._orders_by_contract.setdefault(order.contractId, {})[order.id] = order
+        if self._touched_orders is not None:
+            self._touched_orders.add(order.id)
+
+    def remove_order(self, order_id: int) -> None:
+        """
+        Remove an order that is no longer working (filled, cancelled,
+        rejected, expired). Idempotent.
+
+        Args:
+            order_id: Order ID
+        """
+        order = self._orders.pop(order_id, None)
+        if order is not None:
+            self._drop_from_contract(order)
+        if self._touched_orders is not None:
+            self._touched_orders.add(order_id)
+
+    def _drop_from_contract(self, order) -> None:
+        """Remove an order from the per-contract index."""
+        contract_orders = self._orders_by_contract.get(order.contractId)
+        if contract_orders is None:
+            return
+        contract_orders.pop(order.id, None)
+        if not contract_orders:
+            del self._orders_by_contract[order.contractId]
+
+    def get_orders(self, contract_id: str) -> list[Any]:
+        """
+        Get the working orders of a contract.
+
+        Args:
+            contract_id: Contract ID
+
+        Returns:
+            Working orders (empty list if none)
+        """
+        return list(self._orders_by_contract.get(contract_id, {}).values())
+
+    def get_order(self, order_id: int) -> Any | None:
+        """Get a working order by id, or None."""
+        return self._orders.get(order_id)
+
+    # ========================================================================
+    # Positions
+    # ========================================================================
+
+    def update_position(self, contract_id: str, avg_price: float, pos_type: int, size: int) -> None:
+        """
+        Record a position's current state (a flat position is removed).
+
+        Args:
+            contract_id: Contract ID
+            avg_price: Average entry price
+            pos_type: Position type (1=LONG, 2=SHORT, 0=FLAT)
+            size: Position size
+        """
+        if pos_type == 0 or size == 0:
+            self._positions.pop(contract_id, None)
+        else:
+            self._positions[contract_id] = {"avg_price": avg_price, "type": pos_type, "size": size}
+        if self._touched_positions is not None:
+            self._touched_positions.add(contract_id)
+
+    def remove_position(self, contract_id: str) -> None:
+        """Remove a closed position. Idempotent."""
+        self.update_position(contract_id, 0.0, 0, 0)
+
+    def get_position(self, contract_id: str) -> dict[str, Any] | None:
+        """
+        Get a mirrored position.
+
+        Returns:
+            {"avg_price", "type", "size"} or None if not open
+        """
+        return self._positions.get(contract_id)
+
+    # ========================================================================
+    # Reconciliation
+    # ========================================================================
+
+    def begin_reconcile(self) -> None:
+        """Start recording event updates; call before fetching a snapshot."""
+        self._touched_orders = set()
+        self._touched_positions = set()
+
+    def end_reconcile(self) -> None:
+        """Stop recording event updates (idempotent; e.g. after a failed fetch)."""
+        self._touched_orders = None
+        self._touched_positions = None
+
+    def reconcile_from(self, orders: list[Any], positions: list[Any]) -> int:
+        """
+        Replace the mirror with a broker snapshot, keeping event updates
+        recorded since begin_reconcile().
+
+        Args:
+            orders: All working orders of the account
+            positions: All open positions of the account
+
+        Returns:
+            Number of corrections applied
+        """
+        if self._touched_orders is None:
+            self.begin_reconcile()
+        try:
+            drift = self._apply_orders(orders) + self._apply_positions(positions)
+        finally:
+            self.end_reconcile()
+
+        self.reconciliations += 1
+        self.drift_corrections += drift
+        if drift and self.synced:
+            logger.info(f"🔄 Order mirror reconciled: {drift} correction(s)")
+        self.synced = True
+        return drift
+
+    def _apply_orders(self, orders: list[Any]) -> int:
+        """Apply an order snapshot; returns the number of corrections."""
+        snapshot = {order.id: order for order in orders}
+        drift = 0
+
+        for order_id in list(self._orders):
+            if order_id not in snapshot and order_id not in self._touched_orders:
+                order = self._orders.pop(order_id)
+                self._drop_from_contract(order)
+                drift += 1
+
+        for order_id, order in snapshot.items():
+            if order_id in self._touched_orders:
+                continue
+            previous = self._orders.get(order_id)
+            if previous is None or order_key(previous) != order_key(order):
+                drift += 1
+            if previous is not None and previous.contractId != order.contractId:
+                self._drop_from_contract(previous)
+            self._orders[order_id] = order
+            self._orders_by_contract.setdefault(order.contractId, {})[order_id] = order
+
+        return drift
+
+    def _apply_positions(self, positions: list[Any]) -> int:
+        """Apply a position snapshot; returns the number of corrections."""
+        snapshot = {
+            position.contractId: {"avg_price": position.avgPrice, "type": position.type, "size": position.size}
+            for position in positions
+            if position.type != 0 and position.size != 0
+        }
+        drift = 0
+
+        for contract_id in list(self._positions):
+            if contract_id not in snapshot and contract_id not in self._touched_positions:
+                del self._positions[contract_id]
+                drift += 1
+
+        for contract_id, position in snapshot.items():
+            if contract_id in self._touched_positions:
+                continue
+            if self._positions.get(contract_id) != position:
+                self._positions[contract_id] = position
+                drift += 1
+
+        return drift
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get mirror statistics."""
+        return {
+            "synced": self.synced,
+            "orders": len(self._orders),
+            "positions": len(self._positions),
+            "reconciliations": self.reconciliations,
+            "drift_corrections": self.drift_corrections,
+        }
@@ -8,12 +8,18 @@ The Challenge:
     - Especially common for stops placed via broker UI
     - Without detection, "No Stop Loss Grace Period" rule can't work
     - Can't rely solely on event-driven architecture
+    - Querying orders per position (N+1 calls) every cycle burns rate limit
 
 The Solution:
-    - Background task polls for working orders every 5 seconds
-    - Tracks seen orders to avoid duplicate logging
+    - One bulk open-orders query (plus one positions query) per poll
+    - Each snapshot is diffed against the previous one; only added,
+      changed and removed orders are processed and passed to listeners
+    - Adaptive interval: FAST_INTERVAL while a position has no stop,
+      POLL_INTERVAL while all positions are protected, SLOW_INTERVAL when flat;
+      poll_soon() (on position events) cuts a slow wait short
+    - Each snapshot also reconciles the OrderMirror (one snapshot path)
+    - Seen-order tracking is pruned to the working orders of each snapshot
     - Integrates with ProtectiveOrderCache for stop loss detection
-    - Lightweight and non-intrusive
 
 Usage:
     # Initialize
@@ -21,6 +27,8 @@ Usage:
     service.set_suite(suite)
     service.set_protective_cache(protective_cache)
     service.set_helpers(extract_symbol_fn, get_side_name_fn)
+    service.set_mirror(mirror)  # Optional: reconcile the OrderMirror from snapshots
+    service.add_listener(on_diff)  # Optional: on_diff(added, changed, removed)
 
     # Start polling
     await service.start_polling()
@@ -28,13 +36,22 @@ Usage:
     # Mark order as seen (from event handlers)
     service.mark_order_seen(order_id)
 
+    # Position opened/updated: poll within FAST_INTERVAL
+    service.poll_soon()
+
     # Stop polling
     await service.stop_polling()
 """
 
-import asyncio
 from loguru import logger
-from typing import Callable
+from typing import Any, Callable
+
+from risk_manager.core.scheduler import Job, Scheduler
+from risk_manager.integrations.sdk.broker_queries import BrokerQueryCache
+from risk_manager.integrations.sdk.order_mirror import OrderMirror, order_key
+
+
+OrderDiffListener = Callable[[list[Any], list[Any], list[Any]], None]
 
 
 class OrderPollingService:
@@ -45,11 +62,31 @@ class OrderPollingService:
     events for all orders, especially protective stops placed via UI.
     """
 
-    def __init__(self):
-        """Initialize order polling service."""
+    FAST_INTERVAL = 1.0  # Seconds between polls while a position has no stop
+    POLL_INTERVAL = 5.0  # Seconds between polls while all positions are protected
+    SLOW_INTERVAL = 30.0  # Seconds between polls while the account is flat
+    JOB_NAME = "order_polling"
+
+    STOP_ORDER_TYPES = (3, 4, 5)  # STOP_LIMIT, STOP, TRAILING_STOP
+
+    def __init__(
+        self,
+        scheduler: Scheduler | None = None,
+        broker_queries: BrokerQueryCache | None = None,
+    ):
+        """
+        Initialize order polling service.
+
+        Args:
+            scheduler: Optional shared scheduler (a private one is started
+                with polling if omitted)
+            broker_queries: Optional shared BrokerQueryCache (a private one
+                is used if omitted)
+        """
         # SDK references (set after connection)
         self._suite = None
         self._protective_cache = None
+        self._mirror: OrderMirror | None = None
 
         # Helper function references (set externally)
         self._extract_symbol_fn: Callable[[str], str] | None = None
@@ -57,12 +94,32 @@ class OrderPollingService:
 
         # Running state
         self._running = False
+        self.interval = self.POLL_INTERVAL
+        # Set by poll_soon(); the next re-arm uses FAST_INTERVAL
+        self._poll_soon = False
 
-        # Polling task
-        self._poll_task = None
+        # Polling job
+        self.scheduler = scheduler
+        self._owns_scheduler = scheduler is None
+        self._poll_job: Job | None = None
 
-        # Track seen orders (to avoid duplicate logging)
+        # Track seen orders (to avoid duplicate logging); pruned every poll
         self._known_orders: set[int] = set()
+        # Ids marked by events while a poll is in flight (None = idle)
+        self._marked_during_poll: set[int] | None = None
+
+        # Previous snapshot: {order_id: order}
+        self._snapshot: dict[int, Any] = {}
+        self._listeners: list[OrderDiffListener] = []
+
+        # Single-flight / short-TTL layer for broker queries
+        self._broker_queries = broker_queries or BrokerQueryCache()
+
+        # Statistics
+        self.polls = 0
+        self.orders_added = 0
+        self.orders_changed = 0
+        self.orders_removed = 0
 
     def set_suite(self, suite):
         """
@@ -82,6 +139,15 @@ class OrderPollingService:
         """
         self._protective_cache = protective_cache
 
+    def set_mirror(self, mirror: OrderMirror):
+        """
+        Set the OrderMirror reconciled from every snapshot.
+
+        Args:
+            mirror: OrderMirror instance
+        """
+        self._mirror = mirror
+
     def set_helpers(self, extract_symbol_fn: Callable[[str], str], get_side_name_fn: Callable[[int], str]):
         """
         Set helper function references.
@@ -93,35 +159,51 @@ class OrderPollingService:
         self._extract_symbol_fn = extract_symbol_fn
         self._get_side_name_fn = get_side_name_fn
 
+    def add_listener(self, listener: OrderDiffListener):
+        """
+        Register a callback for snapshot diffs.
+
+        Called as listener(added, changed, removed) after each poll whose
+        snapshot differs from the previous one. `removed` holds the last
+        polled version of each order that is no longer working.
+
+        Args:
+            listener: Callback receiving lists of orders
+        """
+        self._listeners.append(listener)
+
     async def start_polling(self):
         """
-        Start the background polling task.
+        Start the background polling job.
 
-        Creates a task that polls for orders every 5 seconds.
+        The first poll runs right away (it also syncs the OrderMirror);
+        each poll then picks the delay until the next one (see
+        _choose_interval).
         """
-        if self._poll_task and not self._poll_task.done():
+        if self._poll_job and not self._poll_job.done():
             logger.warning("Order polling task already running")
             return
 
         self._running = True
-        self._poll_task = asyncio.create_task(self._poll_orders())
+        if self.scheduler is None:
+            self.scheduler = Scheduler()
+        self.scheduler.start()
+        self._poll_job = self.scheduler.call_later(self.JOB_NAME, 0, self._on_poll)
         logger.debug("Order polling task started")
 
     async def stop_polling(self):
         """
-        Stop the background polling task.
+        Stop the background polling job.
 
-        Cancels the task gracefully.
+        Cancels the job (and a poll in flight).
         """
         self._running = False
 
-        if self._poll_task and not self._poll_task.done():
-            self._poll_task.cancel()
-            try:
-                await self._poll_task
-            except asyncio.CancelledError:
-                pass
+        if self._poll_job and not self._poll_job.done():
+            self._poll_job.cancel()
             logger.debug("Order polling task stopped")
+        if self._owns_scheduler and self.scheduler:
+            await self.scheduler.stop()
 
     def mark_order_seen(self, order_id: int):
         """
@@ -133,6 +215,8 @@ class OrderPollingService:
             order_id: Order ID to mark as seen
         """
         self._known_orders.add(order_id)
+        if self._marked_during_poll is not None:
+            self._marked_during_poll.add(order_id)
 
     def mark_order_unseen(self, order_id: int):
         """
@@ -143,70 +227,171 @@ class OrderPollingService:
         """
         self._known_orders.discard(order_id)
 
+    def poll_soon(self):
+        """
+        Poll within FAST_INTERVAL (e.g. a position just opened).
+
+        Cuts a longer wait (SLOW_INTERVAL while flat) short; a poll already
+        in flight re-arms with FAST_INTERVAL.
+        """
+        self._poll_soon = True
+        job = self._poll_job
+        if job is None or job.done() or job.running:
+            return
+        next_run_in = job.stats()["next_run_in"]
+        if next_run_in is None or next_run_in > self.FAST_INTERVAL:
+            job.reschedule(self.FAST_INTERVAL)
+
+    async def _on_poll(self):
+        """Scheduler job: poll, then re-arm with the chosen interval."""
+        try:
+            await self._poll_orders()
+        finally:
+            if self._poll_job is not None and not self._poll_job.cancelled():
+                self._poll_job.reschedule(self.FAST_INTERVAL if self._poll_soon else self.interval)
+
     async def _poll_orders(self):
         """
-        Background task that polls for active orders periodically.
+        Poll the account's working orders and process the snapshot diff.
 
-        Runs every 5 seconds and checks for new working orders.
-        Integrates with ProtectiveOrderCache to detect protective stops.
+        Integrates with ProtectiveOrderCache to detect protective stops
+        and updates `interval` for the next poll.
         """
-        logger.debug("Order polling task started")
+        if not self._suite:
+            logger.debug("Suite not available yet")
+            return
 
-        while self._running:
+        self._poll_soon = False
+        self._marked_during_poll = set()
+        if self._mirror is not None:
+            self._mirror.begin_reconcile()
+        try:
+            snapshot = await self._fetch_snapshot()
+            if snapshot is None:
+                return
+            orders, positions = snapshot
+
+            if self._mirror is not None:
+                self._mirror.reconcile_from(orders, positions)
+
+            current = {order.id: order for order in orders}
+            added, changed, removed = self._diff(current)
+            self._snapshot = current
+            self.polls += 1
+            logger.debug(
+                f"Polling found {len(current)} working orders "
+                f"(+{len(added)} ~{len(changed)} -{len(removed)})"
+            )
+
+            self._process_diff(added, changed, removed)
+
+            # Bounded: only working orders (and ones just reported by events) stay known
+            self._known_orders &= current.keys() | self._marked_during_poll
+
+            self.interval = self._choose_interval(orders, positions)
+        except Exception as e:
+            logger.warning(f"Error polling orders: {e}")
+            import traceback
+            logger.debug(traceback.format_exc())
+        finally:
+            self._marked_during_poll = None
+            if self._mirror is not None:
+                self._mirror.end_reconcile()
+
+    async def _fetch_snapshot(self) -> tuple[list[Any], list[Any]] | None:
+        """
+        Fetch all working orders and open positions of the account.
+
+        Both calls are account-wide, so one instrument's managers serve all.
+
+        Returns:
+            (orders, positions), or None if the broker could not be queried
+        """
+        for symbol, instrument in self._suite.items():
+            orders_manager = getattr(instrument, 'orders', None)
+            positions_manager = getattr(instrument, 'positions', None)
+            if not hasattr(orders_manager, 'search_open_orders') or positions_manager is None:
+                continue
+            try:
+                orders = await self._broker_queries.search_open_orders(instrument)
+                positions = await self._broker_queries.get_all_positions(instrument)
+            except Exception as e:
+                logger.debug(f"Error getting orders via {symbol}: {e}")
+                return None
+            return list(orders), list(positions)
+
+        logger.debug("No instrument can serve an order snapshot")
+        return None
+
+    def _diff(self, current: dict[int, Any]) -> tuple[list[Any], list[Any], list[Any]]:
+        """Compare a snapshot with the previous one: (added, changed, removed)."""
+        added = []
+        changed = []
+        for order_id, order in current.items():
+            previous = self._snapshot.get(order_id)
+            if previous is None:
+                added.append(order)
+            elif order_key(previous) != order_key(order):
+                changed.append(order)
+        removed = [order for order_id, order in self._snapshot.items() if order_id not in current]
+        return added, changed, removed
+
+    def _process_diff(self, added: list[Any], changed: list[Any], removed: list[Any]) -> None:
+        """Log new orders, update the protective cache and notify listeners."""
+        for order in added:
+            if order.id not in self._known_orders:
+                self._known_orders.add(order.id)
+
+                # Log new orders at INFO level (concise)
+                if self._extract_symbol_fn and self._get_side_name_fn:
+                    symbol = self._extract_symbol_fn(order.contractId)
+                    side_name = self._get_side_name_fn(order.side)
+                    logger.info(f"🔍 NEW ORDER (polling): {symbol} {order.type_str} {side_name} {order.size}")
+                    logger.debug(f"Stop: {order.stopPrice}, Limit: {order.limitPrice}, Status: {order.status}")
+
+        if self._protective_cache:
+            # Check if it's a protective order and cache it
+            for order in added + changed:
+                self._protective_cache.update_from_order_placed(order)
+            for order in removed:
+                self._protective_cache.remove_order(order.contractId, order.id)
+
+        self.orders_added += len(added)
+        self.orders_changed += len(changed)
+        self.orders_removed += len(removed)
+
+        if not (added or changed or removed):
+            return
+        for listener in self._listeners:
             try:
-                await asyncio.sleep(5)  # Poll every 5 seconds
-
-                if not self._suite:
-                    logger.debug("Suite not available yet")
-                    continue
-
-                # Get all working orders from all instruments
-                # Note: get_position_orders() requires contract_id, so we need to get positions first
-                orders = []
-                for symbol, instrument in self._suite.items():
-                    if not hasattr(instrument, 'positions') or not hasattr(instrument, 'orders'):
-                        continue
-
-                    # Get all positions for this instrument
-                    try:
-                        positions = await instrument.positions.get_all_positions()
-                        for position in positions:
-                            # Get orders for this position's contract (needs await)
-                            position_orders = await instrument.orders.get_position_orders(position.contractId)
-                            orders.extend(position_orders)
-                    except Exception as e:
-                        logger.debug(f"Error getting orders for {symbol}: {e}")
-                        continue
-
-                logger.debug(f"Polling found {len(orders)} working orders")
-
-                for order in orders:
-                    order_id = order.id
-
-                    # Skip if we've already seen this order
-                    if order_id in self._known_orders:
-                        continue
-
-                    # Mark as seen
-                    self._known_orders.add(order_id)
-
-                    # Log new orders at INFO level (concise)
-                    if self._extract_symbol_fn and self._get_side_name_fn:
-                        symbol = self._extract_symbol_fn(order.contractId)
-                        side_name = self._get_side_name_fn(order.side)
-                        logger.info(f"🔍 NEW ORDER (polling): {symbol} {order.type_str} {side_name} {order.size}")
-                        logger.debug(f"Stop: {order.stopPrice}, Limit: {order.limitPrice}, Status: {order.status}")
-
-                    # Check if it's a protective order and cache it
-                    if self._protective_cache:
-                        self._protective_cache.update_from_order_placed(order)
-
-            except asyncio.CancelledError:
-                logger.debug("Order polling task cancelled")
-                break
+                listener(added, changed, removed)
             except Exception as e:
-                logger.warning(f"Error polling orders: {e}")
-                import traceback
-                logger.debug(traceback.format_exc())
+                logger.warning(f"Order diff listener failed: {e}")
 
-        logger.debug("Order polling task stopped")
+    def _choose_interval(self, orders: list[Any], positions: list[Any]) -> float:
+        """
+        Pick the delay until the next poll.
+
+        Returns:
+            FAST_INTERVAL if an open position has no working stop order,
+            POLL_INTERVAL if all are protected, SLOW_INTERVAL if flat
+        """
+        open_contracts = {p.contractId for p in positions if p.type != 0 and p.size != 0}
+        if not open_contracts:
+            return self.SLOW_INTERVAL
+        stopped = {o.contractId for o in orders if o.type in self.STOP_ORDER_TYPES}
+        if open_contracts - stopped:
+            return self.FAST_INTERVAL
+        return self.POLL_INTERVAL
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get polling statistics."""
+        return {
+            "interval": self.interval,
+            "polls": self.polls,
+            "working_orders": len(self._snapshot),
+            "known_orders": len(self._known_orders),
+            "orders_added": self.orders_added,
+            "orders_changed": self.orders_changed,
+            "orders_removed": self.orders_removed,
+        }
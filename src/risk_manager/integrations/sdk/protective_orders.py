@@ -13,7 +13,8 @@ The Challenge:
 
 The Solution:
     - Cache stop/TP orders when ORDER_PLACED fires (event-based)
-    - Query SDK directly when cache is empty (fallback)
+    - Read stop/TP from the OrderMirror once it is synced (no broker calls)
+    - Query SDK directly when cache is empty (fallback without a mirror)
     - Use semantic analysis to determine order intent (stop loss vs take profit vs entry)
     - Invalidate cache on position updates to force fresh queries
 
@@ -33,6 +34,7 @@ Usage:
     # Initialize
     cache = ProtectiveOrderCache()
     cache.set_suite(suite)  # Provide SDK access
+    cache.set_mirror(mirror)  # Optional: serve lookups from the OrderMirror
 
     # Query (checks cache first, queries SDK if needed)
     stop = await cache.get_stop_loss(contract_id, position_price, position_type)
@@ -41,7 +43,7 @@ Usage:
 
     # Update cache from events
     cache.update_from_order_placed(order)  # Add to cache
-    cache.remove_order(contract_id)  # Remove on fill/cancel
+    cache.remove_order(contract_id, order_id)  # Remove on fill/cancel
     cache.invalidate(contract_id)  # Force refresh on next query
 """
 
@@ -49,6 +51,8 @@ import time
 from typing import Any, Callable
 from loguru import logger
 
+from risk_manager.integrations.sdk.broker_queries import BrokerQueryCache
+
 
 class ProtectiveOrderCache:
     """
@@ -61,8 +65,14 @@ class ProtectiveOrderCache:
     4. Cache invalidation (force refresh when needed)
     """
 
-    def __init__(self):
-        """Initialize empty caches."""
+    def __init__(self, broker_queries: BrokerQueryCache | None = None):
+        """
+        Initialize empty caches.
+
+        Args:
+            broker_queries: Optional shared BrokerQueryCache for SDK
+                fallback queries (a private one is used if omitted)
+        """
         # Active stop loss cache
         # Format: {contract_id: {"order_id": int, "stop_price": float, "side": str, "quantity": int, "timestamp": float}}
         self._active_stop_losses: dict[str, dict[str, Any]] = {}
@@ -74,6 +84,12 @@ class ProtectiveOrderCache:
         # SDK suite reference (set externally)
         self._suite = None
 
+        # Order/position mirror (set externally, optional)
+        self._mirror = None
+
+        # Single-flight / short-TTL layer for SDK fallback queries
+        self._broker_queries = broker_queries or BrokerQueryCache()
+
         # Helper function references (set externally)
         self._extract_symbol_fn: Callable[[str], str] | None = None
         self._get_side_name_fn: Callable[[int], str] | None = None
@@ -87,6 +103,15 @@ class ProtectiveOrderCache:
         """
         self._suite = suite
 
+    def set_mirror(self, mirror):
+        """
+        Set the order/position mirror that serves lookups once synced.
+
+        Args:
+            mirror: OrderMirror instance
+        """
+        self._mirror = mirror
+
     def set_helpers(self, extract_symbol_fn: Callable[[str], str], get_side_name_fn: Callable[[int], str]):
         """
         Set helper function references.
@@ -123,6 +148,11 @@ class ProtectiveOrderCache:
             Stop loss data dict or None if no active stop loss
             Dict format: {"order_id": int, "stop_price": float, "side": str, "quantity": int, "timestamp": float}
         """
+        # Synced mirror: dictionary reads, always current
+        if self._mirror is not None and self._mirror.synced:
+            self._refresh_from_mirror(contract_id, position_entry_price, position_type)
+            return self._active_stop_losses.get(contract_id)
+
         # Check cache first (fast path)
         cached = self._active_stop_losses.get(contract_id)
         if cached:
@@ -154,6 +184,11 @@ class ProtectiveOrderCache:
             Take profit data dict or None if no active take profit
             Dict format: {"order_id": int, "take_profit_price": float, "side": str, "quantity": int, "timestamp": float}
         """
+        # Synced mirror: dictionary reads, always current
+        if self._mirror is not None and self._mirror.synced:
+            self._refresh_from_mirror(contract_id, position_entry_price, position_type)
+            return self._active_take_profits.get(contract_id)
+
         # Check cache first (fast path)
         cached = self._active_take_profits.get(contract_id)
         if cached:
@@ -242,6 +277,20 @@ class ProtectiveOrderCache:
             del self._active_take_profits[contract_id]
             logger.debug(f"Removed take profit from cache: {contract_id}")
 
+    def remove_order(self, contract_id: str, order_id: int | None = None) -> None:
+        """
+        Remove cached stop loss / take profit of a contract (filled/cancelled).
+
+        Args:
+            contract_id: Contract ID
+            order_id: Only remove entries for this order (None = both entries)
+        """
+        for cache in (self._active_stop_losses, self._active_take_profits):
+            entry = cache.get(contract_id)
+            if entry is not None and (order_id is None or entry["order_id"] == order_id):
+                del cache[contract_id]
+                logger.debug(f"Removed protective order {entry['order_id']} from cache: {contract_id}")
+
     def invalidate(self, contract_id: str) -> None:
         """
         Invalidate cache for a contract (force refresh on next query).
@@ -304,34 +353,25 @@ class ProtectiveOrderCache:
                 return None
 
             # Query orders
-            working_orders = await instrument.orders.get_position_orders(contract_id)
+            working_orders = await self._broker_queries.get_position_orders(symbol, instrument, contract_id)
             logger.debug(f"get_position_orders returned {len(working_orders)} orders")
 
             # If empty, try search_open_orders - queries broker API for ALL orders
             orders_obj = instrument.orders
             if len(working_orders) == 0 and hasattr(orders_obj, 'search_open_orders'):
                 logger.debug("Trying search_open_orders (broker API query)...")
-                all_orders = await orders_obj.search_open_orders()
-                logger.debug(f"search_open_orders returned {len(all_orders)} orders")
-
-                # Filter for this contract
-                working_orders = [o for o in all_orders if o.contractId == contract_id]
-                logger.debug(f"Filtered to {len(working_orders)} orders for {contract_id}")
+                working_orders = await self._broker_queries.search_open_orders(instrument, contract_id)
+                logger.debug(f"search_open_orders returned {len(working_orders)} orders for {contract_id}")
 
             # Get position data for semantic analysis
             if position_entry_price is None or position_type is None:
                 logger.debug("Position data not provided, fetching from SDK...")
 
                 try:
-                    all_positions = await instrument.positions.get_all_positions()
-                    logger.debug(f"get_all_positions returned {len(all_positions)} positions")
+                    positions = await self._broker_queries.get_all_positions(instrument, contract_id)
+                    logger.debug(f"get_all_positions returned {len(positions)} positions for {contract_id}")
 
-                    position = None
-                    for pos in all_positions:
-                        if pos.contractId == contract_id:
-                            position = pos
-                            logger.debug("Found matching position")
-                            break
+                    position = positions[0] if positions else None
 
                     if not position:
                         logger.warning(f"No position found for {contract_id}")
@@ -351,45 +391,9 @@ class ProtectiveOrderCache:
             logger.debug(f"Position: {pos_direction} @ ${position_entry_price:.2f}")
 
             # Analyze orders using semantic layer
-            stop_loss_data = None
-            take_profit_data = None
-
-            for order in working_orders:
-                if order.contractId == contract_id:
-                    # Determine trigger price
-                    trigger_price = order.stopPrice if order.stopPrice else order.limitPrice
-
-                    logger.debug(f"Order #{order.id}: type={order.type_str}, trigger=${trigger_price}")
-
-                    # Use semantic analysis to determine intent
-                    intent = self._determine_order_intent(order, position_entry_price, position_type)
-                    logger.debug(f"Semantic intent: {intent}")
-
-                    if intent == "stop_loss":
-                        # Found stop loss!
-                        stop_loss_data = {
-                            "order_id": order.id,
-                            "stop_price": trigger_price,
-                            "side": self._get_side_name_fn(order.side) if self._get_side_name_fn else str(order.side),
-                            "quantity": order.size,
-                            "timestamp": time.time(),
-                        }
-                        # Cache it
-                        self._active_stop_losses[contract_id] = stop_loss_data
-                        logger.debug(f"Found stop loss: ${trigger_price:,.2f}")
-
-                    elif intent == "take_profit":
-                        # Found take profit!
-                        take_profit_data = {
-                            "order_id": order.id,
-                            "take_profit_price": trigger_price,
-                            "side": self._get_side_name_fn(order.side) if self._get_side_name_fn else str(order.side),
-                            "quantity": order.size,
-                            "timestamp": time.time(),
-                        }
-                        # Cache it
-                        self._active_take_profits[contract_id] = take_profit_data
-                        logger.debug(f"Found take profit: ${trigger_price:,.2f}")
+            stop_loss_data = self._classify_orders(
+                contract_id, working_orders, position_entry_price, position_type
+            )
 
             # Return stop loss (if found)
             if stop_loss_data:
@@ -406,10 +410,98 @@ class ProtectiveOrderCache:
             logger.error(traceback.format_exc())
             return None
 
+    def _refresh_from_mirror(
+        self,
+        contract_id: str,
+        position_entry_price: float = None,
+        position_type: int = None,
+    ) -> None:
+        """
+        Rebuild a contract's cached stop loss and take profit from the mirror.
+
+        Args:
+            contract_id: Contract ID
+            position_entry_price: Optional entry price (defaults to the mirrored position)
+            position_type: Optional position type (defaults to the mirrored position)
+        """
+        if position_entry_price is None or position_type is None:
+            position = self._mirror.get_position(contract_id)
+            if position is not None:
+                position_entry_price = position["avg_price"]
+                position_type = position["type"]
+
+        self._active_stop_losses.pop(contract_id, None)
+        self._active_take_profits.pop(contract_id, None)
+        self._classify_orders(
+            contract_id, self._mirror.get_orders(contract_id), position_entry_price, position_type
+        )
+
     # ========================================================================
     # Semantic Analysis (Order Intent Detection)
     # ========================================================================
 
+    def _classify_orders(
+        self,
+        contract_id: str,
+        working_orders: list,
+        position_entry_price: float,
+        position_type: int,
+    ) -> dict[str, Any] | None:
+        """
+        Find and cache a position's stop loss and take profit among its orders.
+
+        Args:
+            contract_id: Contract ID of the position
+            working_orders: Working orders to analyze
+            position_entry_price: Position's average entry price
+            position_type: Position type (1=LONG, 2=SHORT)
+
+        Returns:
+            Stop loss data dict or None if no stop found
+        """
+        stop_loss_data = None
+
+        for order in working_orders:
+            if order.contractId != contract_id:
+                continue
+
+            # Determine trigger price
+            trigger_price = order.stopPrice if order.stopPrice else order.limitPrice
+
+            logger.debug(f"Order #{order.id}: type={order.type_str}, trigger=${trigger_price}")
+
+            # Use semantic analysis to determine intent
+            intent = self._determine_order_intent(order, position_entry_price, position_type)
+            logger.debug(f"Semantic intent: {intent}")
+
+            if intent == "stop_loss":
+                # Found stop loss!
+                stop_loss_data = {
+                    "order_id": order.id,
+                    "stop_price": trigger_price,
+                    "side": self._get_side_name_fn(order.side) if self._get_side_name_fn else str(order.side),
+                    "quantity": order.size,
+                    "timestamp": time.time(),
+                }
+                # Cache it
+                self._active_stop_losses[contract_id] = stop_loss_data
+                logger.debug(f"Found stop loss: ${trigger_price:,.2f}")
+
+            elif intent == "take_profit":
+                # Found take profit!
+                take_profit_data = {
+                    "order_id": order.id,
+                    "take_profit_price": trigger_price,
+                    "side": self._get_side_name_fn(order.side) if self._get_side_name_fn else str(order.side),
+                    "quantity": order.size,
+                    "timestamp": time.time(),
+                }
+                # Cache it
+                self._active_take_profits[contract_id] = take_profit_data
+                logger.debug(f"Found take profit: ${trigger_price:,.2f}")
+
+        return stop_loss_data
+
     def _determine_order_intent(
         self, order, position_entry_price: float, position_type: int
     ) -> str:
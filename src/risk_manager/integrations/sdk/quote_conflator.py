@@ -0,0 +1,249 @@
+"""
+Quote Conflator Module
+
+Coalesces bursts of quote updates so only the latest price per symbol
+reaches the P&L calculator and the event bus.
+
+The Challenge:
+    - QUOTE_UPDATE fires many times per second per symbol
+    - Every quote used to trigger a P&L recalculation and 1+ bus publishes
+    - Intermediate prices are stale the moment the next quote arrives
+    - Under load the bus spends its time on prices nobody will act on
+
+The Solution:
+    - Keep only the latest bid/ask/last per symbol (latest-value-wins)
+    - Flush pending quotes every buffer_flush_interval_ms
+    - Flush early when buffer_size updates have piled up
+    - Flush a symbol immediately when its quote is marked urgent
+      (e.g. the price crossed a rule threshold)
+
+Usage:
+    conflator = QuoteConflator(
+        flush_callback=handler.process_quote,  # async (ConflatedQuote) -> None
+        flush_interval_ms=500,
+        buffer_size=10,
+    )
+    await conflator.start()
+
+    # From the SDK quote callback
+    await conflator.submit(symbol, bid, ask, last, price, timestamp, urgent=False)
+
+    # Shutdown (flushes anything still pending)
+    await conflator.stop()
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+
+@dataclass(slots=True)
+class ConflatedQuote:
+    """Latest quote for a symbol plus how many raw updates it replaced."""
+
+    symbol: str
+    bid: float
+    ask: float
+    last: float
+    price: float
+    timestamp: Any = None
+    updates: int = 1
+    urgent: bool = False
+
+
+class QuoteConflator:
+    """
+    Latest-value-wins quote buffer keyed by symbol.
+
+    Only the most recent quote per symbol is kept. Pending quotes are handed
+    to ``flush_callback`` on a fixed interval, when the buffer fills up, or
+    straight away for urgent quotes.
+    """
+
+    def __init__(
+        self,
+        flush_callback: Callable[[ConflatedQuote], Awaitable[None]],
+        flush_interval_ms: int = 500,
+        buffer_size: int = 10,
+    ):
+        """
+        Initialize quote conflator.
+
+        Args:
+            flush_callback: Coroutine called with each flushed ConflatedQuote
+            flush_interval_ms: Maximum time a quote waits before being flushed
+            buffer_size: Number of buffered updates that forces an early flush
+        """
+        self._flush_callback = flush_callback
+        self._flush_interval = max(flush_interval_ms, 1) / 1000.0
+        self._buffer_size = max(buffer_size, 1)
+
+        self._pending: dict[str, ConflatedQuote] = {}
+        self._pending_updates = 0
+
+        self._running = False
+        self._flush_task = None
+
+        # Stats
+        self._received = 0
+        self._flushed = 0
+        self._urgent_flushes = 0
+        self._full_flushes = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Number of symbols with a quote waiting to be flushed."""
+        return len(self._pending)
+
+    async def submit(
+        self,
+        symbol: str,
+        bid: float,
+        ask: float,
+        last: float,
+        price: float,
+        timestamp: Any = None,
+        urgent: bool = False,
+    ) -> None:
+        """
+        Buffer a quote, replacing any pending quote for the same symbol.
+
+        Args:
+            symbol: Normalized instrument symbol (e.g. "MNQ")
+            bid: Bid price
+            ask: Ask price
+            last: Last traded price (0.0 if unknown)
+            price: Price used for P&L (last or bid/ask midpoint)
+            timestamp: Quote timestamp from the SDK, passed through as-is
+            urgent: Flush this symbol now instead of waiting for the interval
+        """
+        self._received += 1
+        self._pending_updates += 1
+
+        pending = self._pending.get(symbol)
+        if pending is None:
+            self._pending[symbol] = ConflatedQuote(
+                symbol=symbol,
+                bid=bid,
+                ask=ask,
+                last=last,
+                price=price,
+                timestamp=timestamp,
+            )
+        else:
+            pending.bid = bid
+            pending.ask = ask
+            pending.last = last
+            pending.price = price
+            pending.timestamp = timestamp
+            pending.updates += 1
+
+        if urgent:
+            self._urgent_flushes += 1
+            await self._flush_symbol(symbol, urgent=True)
+        elif self._pending_updates >= self._buffer_size:
+            self._full_flushes += 1
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Flush every pending quote.
+
+        Returns:
+            Number of symbols flushed
+        """
+        if not self._pending:
+            self._pending_updates = 0
+            return 0
+
+        pending = self._pending
+        self._pending = {}
+        self._pending_updates = 0
+
+        for quote in pending.values():
+            await self._deliver(quote)
+
+        return len(pending)
+
+    async def _flush_symbol(self, symbol: str, urgent: bool = False) -> None:
+        """Flush a single symbol's pending quote."""
+        quote = self._pending.pop(symbol, None)
+        if quote is None:
+            return
+
+        self._pending_updates = max(self._pending_updates - quote.updates, 0)
+        quote.urgent = urgent
+        await self._deliver(quote)
+
+    async def _deliver(self, quote: ConflatedQuote) -> None:
+        """Hand a quote to the flush callback, isolating its errors."""
+        self._flushed += 1
+        try:
+            await self._flush_callback(quote)
+        except Exception as e:
+            logger.error(f"Error processing conflated quote for {quote.symbol}: {e}")
+            logger.exception(e)
+
+    # ========================================================================
+    # Background Flush Task
+    # ========================================================================
+
+    async def start(self) -> None:
+        """Start the interval flush task."""
+        if self._flush_task and not self._flush_task.done():
+            logger.warning("Quote conflator already running")
+            return
+
+        self._running = True
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.debug(
+            f"Quote conflator started (interval={self._flush_interval * 1000:.0f}ms, "
+            f"buffer_size={self._buffer_size})"
+        )
+
+    async def stop(self) -> None:
+        """Stop the interval flush task and flush anything still pending."""
+        self._running = False
+
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+
+        self._flush_task = None
+        await self.flush()
+        logger.debug("Quote conflator stopped")
+
+    async def _flush_loop(self) -> None:
+        """Flush pending quotes every flush interval."""
+        while self._running:
+            try:
+                await asyncio.sleep(self._flush_interval)
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.debug(f"Error in quote conflator flush loop: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get conflation statistics.
+
+        Returns:
+            Dict with received/flushed counts and the conflation ratio
+        """
+        return {
+            "received": self._received,
+            "flushed": self._flushed,
+            "conflated": self._received - self._flushed - self._pending_updates,
+            "pending": len(self._pending),
+            "urgent_flushes": self._urgent_flushes,
+            "full_flushes": self._full_flushes,
+            "flush_interval_ms": int(self._flush_interval * 1000),
+            "buffer_size": self._buffer_size,
+        }
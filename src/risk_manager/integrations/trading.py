@@ -47,16 +47,16 @@ Workflow:
 
 import asyncio
 import os
-import time
 from collections import defaultdict
-from typing import Any
+from typing import Any, Hashable
 
 from loguru import logger
 from project_x_py import ProjectX, TradingSuite, EventType as SDKEventType
 from project_x_py.realtime import ProjectXRealtimeClient
 
-from risk_manager.config.models import RiskConfig
+from risk_manager.config.models import EventsConfig, RiskConfig
 from risk_manager.core.events import EventBus, EventType, RiskEvent
+from risk_manager.core.scheduler import Scheduler
 from risk_manager.integrations.adapters import adapter
 from risk_manager.errors import MappingError, UnitsError
 from risk_manager.integrations.tick_economics import (
@@ -72,6 +72,9 @@ from risk_manager.integrations.unrealized_pnl import UnrealizedPnLCalculator
 from risk_manager.integrations.sdk.protective_orders import ProtectiveOrderCache
 from risk_manager.integrations.sdk.market_data import MarketDataHandler
 from risk_manager.integrations.sdk.order_polling import OrderPollingService
+from risk_manager.integrations.sdk.order_mirror import OrderMirror
+from risk_manager.integrations.sdk.broker_queries import BrokerQueryCache
+from risk_manager.integrations.sdk.event_dedup import EventDeduplicator
 from risk_manager.integrations.sdk.order_correlator import OrderCorrelator
 from risk_manager.integrations.sdk.event_router import EventRouter
 
@@ -87,10 +90,19 @@ class TradingIntegration:
     2. SignalR WebSocket connection (real-time events)
     """
 
-    def __init__(self, instruments: list[str], config: RiskConfig, event_bus: EventBus):
+    def __init__(
+        self,
+        instruments: list[str],
+        config: RiskConfig,
+        event_bus: EventBus,
+        events_config: EventsConfig | None = None,
+        scheduler: Scheduler | None = None,
+        broker_query_ttl: float = BrokerQueryCache.DEFAULT_TTL,
+    ):
         self.instruments = instruments
         self.config = config
         self.event_bus = event_bus
+        self.events_config = events_config
         self.suite: TradingSuite | None = None
         self.client: ProjectX | None = None
         self.realtime: ProjectXRealtimeClient | None = None
@@ -99,14 +111,17 @@ class TradingIntegration:
         # Contract ID → Symbol mapping (populated as events arrive)
         self.contract_to_symbol: dict[str, str] = {}
 
-        # Event deduplication cache: {(event_type, entity_id): timestamp}
+        # Event deduplication (O(1) expiring set of event identities)
         # Prevents duplicate events from multiple instrument managers
-        self._event_cache: dict[tuple[str, str], float] = {}
-        self._event_cache_ttl = 5.0  # seconds
+        self._event_dedup = EventDeduplicator(ttl=EventDeduplicator.DEFAULT_TTL)
+
+        # Shared broker query layer (single flight + short TTL cache)
+        # Collapses identical order/position queries from all modules below
+        self._broker_queries = BrokerQueryCache(ttl=broker_query_ttl)
 
         # Order polling service (to detect protective stops that don't emit events)
         # NEW: Delegated to OrderPollingService module
-        self._order_polling = OrderPollingService()
+        self._order_polling = OrderPollingService(scheduler=scheduler, broker_queries=self._broker_queries)
 
         # Order correlator (correlates fills with position closes for exit type detection)
         # NEW: Delegated to OrderCorrelator module
@@ -114,18 +129,29 @@ class TradingIntegration:
 
         # Protective order cache (stop loss and take profit)
         # NEW: Delegated to ProtectiveOrderCache module
-        self._protective_cache = ProtectiveOrderCache()
+        self._protective_cache = ProtectiveOrderCache(broker_queries=self._broker_queries)
+
+        # Order/position mirror (event-maintained, reconciled from every polling snapshot)
+        # Serves stop/target lookups without broker round-trips once synced
+        self._order_mirror = OrderMirror()
+        self._protective_cache.set_mirror(self._order_mirror)
+        self._order_polling.set_mirror(self._order_mirror)
 
         # Unrealized P&L calculator (for both floating and realized P&L)
         # MUST be created BEFORE MarketDataHandler (which depends on it)
         self.pnl_calculator = UnrealizedPnLCalculator()
+        loss_limit, profit_target = self._unrealized_pnl_limits()
+        self.pnl_calculator.set_pnl_limits(loss_limit=loss_limit, profit_target=profit_target)
 
         # Market data handler (quote updates, price polling, status bar)
         # NEW: Delegated to MarketDataHandler module
+        # Quote conflation is enabled when an events config is supplied
         self._market_data = MarketDataHandler(
             pnl_calculator=self.pnl_calculator,
             event_bus=event_bus,
-            instruments=instruments
+            instruments=instruments,
+            quote_config=events_config.quotes if events_config else None,
+            scheduler=scheduler,
         )
 
         # Event router (handles ALL SDK event callbacks)
@@ -136,13 +162,37 @@ class TradingIntegration:
             pnl_calculator=self.pnl_calculator,
             order_polling=self._order_polling,
             event_bus=event_bus,
+            order_mirror=self._order_mirror,
+            broker_queries=self._broker_queries,
+            event_dedup=self._event_dedup,
         )
 
         # Status bar update task is now managed by MarketDataHandler
 
         logger.info(f"Trading integration initialized for: {instruments}")
 
-    def _is_duplicate_event(self, event_type: str, entity_id: str) -> bool:
+    def _unrealized_pnl_limits(self) -> tuple[float | None, float | None]:
+        """
+        Collect the unrealized P&L levels that rules act on.
+
+        Returns:
+            (loss limit of RULE-004, profit target of RULE-005), each None
+            when the rule is disabled or not configured
+        """
+        limits = []
+        rules = getattr(self.config, "rules", None)
+        for rule_name, field in (
+            ("daily_unrealized_loss", "limit"),
+            ("max_unrealized_profit", "target"),
+        ):
+            rule_config = getattr(rules, rule_name, None)
+            value = None
+            if rule_config is not None and getattr(rule_config, "enabled", False) is True:
+                value = getattr(rule_config, field, None)
+            limits.append(float(value) if isinstance(value, (int, float)) else None)
+        return limits[0], limits[1]
+
+    def _is_duplicate_event(self, event_type: str, entity_id: Hashable) -> bool:
         """
         Check if this event is a duplicate.
 
@@ -151,30 +201,13 @@ class TradingIntegration:
 
         Args:
             event_type: Type of event (e.g., "order_filled", "position_opened")
-            entity_id: Unique identifier (order_id or position_id)
+            entity_id: Unique identity (order_id, or a tuple of the fields
+                that make an update distinct)
 
         Returns:
             True if this is a duplicate event (recently seen)
         """
-        current_time = time.time()
-        cache_key = (event_type, entity_id)
-
-        # Clean old entries from cache
-        expired_keys = [
-            key for key, timestamp in self._event_cache.items()
-            if current_time - timestamp > self._event_cache_ttl
-        ]
-        for key in expired_keys:
-            del self._event_cache[key]
-
-        # Check if we've seen this event recently
-        if cache_key in self._event_cache:
-            logger.debug(f"🔄 Duplicate {event_type} event for {entity_id} - skipping")
-            return True
-
-        # Mark event as seen
-        self._event_cache[cache_key] = current_time
-        return False
+        return self._event_dedup.is_duplicate(event_type, entity_id)
 
     async def get_stop_loss_for_position(
         self,
@@ -397,6 +430,9 @@ class TradingIntegration:
         await self._market_data.stop_status_bar()
         logger.debug("Status bar task stopped (MarketDataHandler)")
 
+        # Stop quote conflation (flushes pending quotes)
+        await self._market_data.stop_quote_conflation()
+
         # Disconnect in reverse order
         if self.suite:
             await self.suite.disconnect()
@@ -529,12 +565,19 @@ class TradingIntegration:
             logger.info("📡 Listening for events: ORDER (8 types), POSITION (3 types), MARKET DATA (4 types)")
 
             # Start order polling task (to catch protective stops that don't emit events) - Delegated to OrderPollingService
+            # The first poll runs immediately and also syncs the order mirror
             await self._order_polling.start_polling()
-            logger.info("🔄 Started order polling task (5s interval - OrderPollingService)")
+            logger.info(
+                f"🔄 Started order polling task ({OrderPollingService.FAST_INTERVAL:.0f}-"
+                f"{OrderPollingService.SLOW_INTERVAL:.0f}s adaptive interval - OrderPollingService)"
+            )
 
             # Start status bar update task (for real-time P&L display) - Delegated to MarketDataHandler
             await self._market_data.start_status_bar()
             logger.info("📊 Started unrealized P&L status bar (0.5s refresh - MarketDataHandler)")
+
+            # Start quote conflation flush task (no-op unless configured)
+            await self._market_data.start_quote_conflation()
             logger.info("=" * 80)
 
         except Exception as e:
@@ -559,7 +602,7 @@ class TradingIntegration:
             logger.error(f"❌ Failed to close positions for {symbol}: {e}")
             # Fallback: manual approach if SDK method fails
             logger.warning(f"Attempting manual position closing for {symbol}")
-            positions = await context.positions.get_all_positions()
+            positions = await self._broker_queries.get_all_positions(context)
 
             for position in positions:
                 if position.size != 0:
@@ -571,6 +614,9 @@ class TradingIntegration:
                         size=abs(position.size),
                     )
                     logger.info(f"Closed {symbol} position: {position.size} contracts (manual)")
+        finally:
+            # Positions and orders changed (or may have)
+            self._broker_queries.invalidate()
 
     async def flatten_all(self) -> None:
         """Flatten all positions across all instruments."""
@@ -621,4 +667,8 @@ class TradingIntegration:
             "connected": self.suite is not None,
             "running": self.running,
             "instruments": self.instruments,
+            "event_dedup": self._event_dedup.get_stats(),
+            "order_polling": self._order_polling.get_stats(),
+            "order_mirror": self._order_mirror.get_stats(),
+            "broker_queries": self._broker_queries.get_stats(),
         }
@@ -10,31 +10,87 @@ Calculates floating P&L based on:
 This calculator processes quote updates silently (no logging) and only emits
 events when P&L changes significantly. This prevents log spam while maintaining
 accurate real-time P&L tracking.
+
+Arithmetic is integer fixed-point: prices are converted once to integer
+price units (PRICE_SCALE per point), tick size and tick value (in cents)
+are precomputed per symbol when a position is tracked, and P&L is
+price units / tick units x tick value cents x size. Prices on the tick
+grid give exact integer cents; the public methods only build a Decimal
+for their return value.
+
+Positions are indexed by symbol, and each symbol keeps running sums of
+its positions' P&L weights (net signed size x tick value) and
+weight x entry. A quote updates that symbol's P&L and the account total
+in O(1), however many positions are open.
+
+With rule limits set (set_pnl_limits), each symbol also holds the price
+levels at which a position reaches the profit target. The levels are
+recomputed only when positions or limits change, so check_pnl_triggers()
+costs a couple of integer comparisons per quote (plus the running total
+against the account-wide loss limit). would_trigger_at() answers the same
+question for an incoming price without applying it.
 """
 
 from decimal import Decimal
-from typing import Dict, Optional
+
 from loguru import logger
 
 from risk_manager.integrations.tick_economics import (
+    UnitsError,
     get_tick_economics_safe,
     normalize_symbol,
-    UnitsError,
 )
 
+PRICE_SCALE = 1_000_000  # Integer price units per point
+
+
+def to_price_units(price: float) -> int:
+    """Convert a price (float, Decimal or numeric string) to integer price units."""
+    return round(float(price) * PRICE_SCALE)
+
 
 class UnrealizedPnLCalculator:
     """Calculate floating P&L for open positions."""
 
     def __init__(self):
         """Initialize calculator with empty position and quote tracking."""
-        self._open_positions: Dict[str, Dict] = {}  # {contract_id: position_data}
-        self._latest_quotes: Dict[str, Decimal] = {}  # {symbol: last_price}
-        self._last_logged_pnl: Dict[str, Decimal] = {}  # {contract_id: last_logged_pnl}
+        self._open_positions: dict[str, dict] = {}  # {contract_id: position_data}
+        self._latest_quotes: dict[str, int] = {}  # {symbol: last_price in price units}
+        self._last_logged_pnl: dict[str, int] = {}  # {contract_id: last_logged_pnl in cents}
+        self._tick_specs: dict[str, tuple[int, int]] = {}  # {symbol: (tick_units, tick_value_cents)}
+
+        # Per-symbol index and running aggregates, in micro-cents (cents / PRICE_SCALE):
+        # {symbol: {"contracts": {contract_id: position}, "weight": int,
+        #           "entry_weight": int, "value": int}}
+        # symbol P&L = quote_units * weight - entry_weight (0 until quoted)
+        self._symbols: dict[str, dict] = {}
+        self._total_value = 0  # Sum of symbol values (micro-cents)
+
+        # Rule limits in micro-cents (None = not enforced) and breach state
+        self._loss_limit: int | None = None  # Total P&L at or below triggers (RULE-004)
+        self._profit_target: int | None = None  # Position P&L at or above triggers (RULE-005)
+        self._loss_breached = False
+
+    def _tick_spec(self, symbol: str) -> tuple[int, int]:
+        """
+        Tick size in price units and tick value in cents for a normalized symbol.
+
+        Raises:
+            UnitsError: If the symbol is unknown
+        """
+        spec = self._tick_specs.get(symbol)
+        if spec is None:
+            tick_info = get_tick_economics_safe(symbol)
+            tick_units = to_price_units(tick_info['size'])
+            if tick_units <= 0 or PRICE_SCALE % tick_units:
+                raise UnitsError(f"Tick size {tick_info['size']} of {symbol} is not representable")
+            spec = (tick_units, round(tick_info['tick_value'] * 100))
+            self._tick_specs[symbol] = spec
+        return spec
 
     def update_position(self, contract_id: str, entry_data: dict) -> None:
         """
-        Track an opened position.
+        Track an opened position (replaces an existing one with the same id).
 
         Args:
             contract_id: Unique identifier for this position
@@ -48,16 +104,28 @@ class UnrealizedPnLCalculator:
             symbol = entry_data['symbol']
             # Normalize symbol and validate tick economics exist
             normalized = normalize_symbol(symbol)
-            get_tick_economics_safe(normalized)  # Validates symbol is known
+            tick_units, tick_value_cents = self._tick_spec(normalized)
 
-            self._open_positions[contract_id] = {
+            size = abs(entry_data['size'])  # Always positive
+            side = entry_data['side'].lower()  # 'long' or 'short'
+            cents_per_tick = tick_value_cents * size * (1 if side == 'long' else -1)
+            position = {
                 'entry_price': Decimal(str(entry_data['price'])),
-                'size': abs(entry_data['size']),  # Always positive
-                'side': entry_data['side'].lower(),  # 'long' or 'short'
+                'size': size,
+                'side': side,
                 'symbol': normalized,  # Store normalized symbol
                 'original_symbol': symbol,  # Keep original for logging
+                # Integer P&L inputs: cents = (price - entry) units * cents_per_tick / tick_units
+                'entry_units': to_price_units(entry_data['price']),
+                'tick_units': tick_units,
+                'cents_per_tick': cents_per_tick,
+                # Same in micro-cents per price unit (symbol aggregates)
+                'weight': cents_per_tick * (PRICE_SCALE // tick_units),
             }
-            self._last_logged_pnl[contract_id] = Decimal('0')
+            self._untrack(contract_id)
+            self._open_positions[contract_id] = position
+            self._track(contract_id, position)
+            self._last_logged_pnl[contract_id] = 0
             logger.debug(
                 f"Position tracked: {contract_id} - {entry_data['side']} "
                 f"{entry_data['size']} {symbol} @ ${entry_data['price']:.2f}"
@@ -73,11 +141,154 @@ class UnrealizedPnLCalculator:
             contract_id: Position identifier to remove
         """
         if contract_id in self._open_positions:
-            del self._open_positions[contract_id]
+            self._untrack(contract_id)
             logger.debug(f"Position removed from tracking: {contract_id}")
         if contract_id in self._last_logged_pnl:
             del self._last_logged_pnl[contract_id]
 
+    def _track(self, contract_id: str, position: dict) -> None:
+        """Add a position to its symbol's index and aggregates."""
+        book = self._symbols.get(position['symbol'])
+        if book is None:
+            book = {
+                "contracts": {}, "weight": 0, "entry_weight": 0, "value": 0,
+                # Profit-target trigger prices (units): longs at/above upper, shorts at/below lower
+                "upper": None, "lower": None, "target_hit": False,
+            }
+            self._symbols[position['symbol']] = book
+        book["contracts"][contract_id] = position
+        book["weight"] += position['weight']
+        book["entry_weight"] += position['entry_units'] * position['weight']
+        self._revalue(position['symbol'], book)
+        self._set_triggers(book)
+        self._loss_breached = False
+
+    def _untrack(self, contract_id: str) -> None:
+        """Remove a position from tracking, its symbol's index and aggregates."""
+        position = self._open_positions.pop(contract_id, None)
+        if position is None:
+            return
+        symbol = position['symbol']
+        book = self._symbols[symbol]
+        del book["contracts"][contract_id]
+        book["weight"] -= position['weight']
+        book["entry_weight"] -= position['entry_units'] * position['weight']
+        self._revalue(symbol, book)
+        if book["contracts"]:
+            self._set_triggers(book)
+        else:
+            del self._symbols[symbol]
+        self._loss_breached = False
+
+    def _revalue(self, symbol: str, book: dict) -> None:
+        """Recompute a symbol's P&L from its aggregates and adjust the total."""
+        price_units = self._latest_quotes.get(symbol)
+        value = 0 if price_units is None else price_units * book["weight"] - book["entry_weight"]
+        self._total_value += value - book["value"]
+        book["value"] = value
+
+    def _set_triggers(self, book: dict) -> None:
+        """Recompute a symbol's profit-target trigger prices from its positions."""
+        upper = lower = None
+        target = self._profit_target
+        if target is not None:
+            for position in book["contracts"].values():
+                # P&L reaches the target once (price - entry) x weight >= target
+                weight = position['weight']
+                if weight > 0:
+                    level = position['entry_units'] - (-target // weight)
+                    upper = level if upper is None else min(upper, level)
+                elif weight < 0:
+                    level = position['entry_units'] + (-target // -weight)
+                    lower = level if lower is None else max(lower, level)
+        book["upper"] = upper
+        book["lower"] = lower
+        book["target_hit"] = False
+
+    def set_pnl_limits(
+        self,
+        loss_limit: float | None = None,
+        profit_target: float | None = None,
+    ) -> None:
+        """
+        Set the rule limits watched by check_pnl_triggers().
+
+        Args:
+            loss_limit: Total unrealized loss limit in dollars (negative,
+                RULE-004), or None to not watch it
+            profit_target: Per-position profit target in dollars (positive,
+                RULE-005), or None to not watch it
+        """
+        scale = 100 * PRICE_SCALE
+        self._loss_limit = None if loss_limit is None else round(loss_limit * scale)
+        self._profit_target = None if profit_target is None else round(profit_target * scale)
+        self._loss_breached = False
+        for book in self._symbols.values():
+            self._set_triggers(book)
+
+    def check_pnl_triggers(self, symbol: str) -> list[str]:
+        """
+        Check the latest quote of a symbol against the rule limits.
+
+        Reports a breach once, on the quote that crosses a limit; it is
+        re-armed when the price moves back or positions change.
+
+        Args:
+            symbol: Instrument symbol (will be normalized)
+
+        Returns:
+            Contract ids of the symbol's positions when a limit was just
+            breached, otherwise an empty list
+        """
+        normalized = normalize_symbol(symbol)
+        book = self._symbols.get(normalized)
+        price_units = self._latest_quotes.get(normalized)
+        if book is None or price_units is None:
+            return []
+
+        target_hit, loss_hit = self._limits_hit(book, price_units, self._total_value)
+
+        fired = (target_hit and not book["target_hit"]) or (loss_hit and not self._loss_breached)
+        book["target_hit"] = target_hit
+        self._loss_breached = loss_hit
+        return list(book["contracts"]) if fired else []
+
+    def would_trigger_at(self, symbol: str, price: float) -> bool:
+        """
+        Check whether a price would fire check_pnl_triggers() (O(1)).
+
+        Read-only: the stored quote and breach state are untouched, so
+        callers can decide how urgently to process a quote before applying
+        it. A symbol whose positions have no price yet always qualifies.
+
+        Args:
+            symbol: Instrument symbol (will be normalized)
+            price: Market price to evaluate at
+
+        Returns:
+            True if the price breaches a limit that has not fired yet
+        """
+        normalized = normalize_symbol(symbol)
+        book = self._symbols.get(normalized)
+        if book is None:
+            return False
+        if normalized not in self._latest_quotes:
+            return True
+
+        price_units = to_price_units(price)
+        total = self._total_value - book["value"] + price_units * book["weight"] - book["entry_weight"]
+        target_hit, loss_hit = self._limits_hit(book, price_units, total)
+        return (target_hit and not book["target_hit"]) or (loss_hit and not self._loss_breached)
+
+    def _limits_hit(self, book: dict, price_units: int, total_value: int) -> tuple[bool, bool]:
+        """(profit target hit, loss limit hit) for a symbol price and account total."""
+        target_hit = (
+            (book["upper"] is not None and price_units >= book["upper"])
+            or (book["lower"] is not None and price_units <= book["lower"])
+        )
+        loss_hit = self._loss_limit is not None and total_value <= self._loss_limit
+        return target_hit, loss_hit
+
     def update_quote(self, symbol: str, price: float) -> None:
         """
         Update latest market price for symbol (silent - no logging).
@@ -89,13 +300,16 @@ class UnrealizedPnLCalculator:
         try:
             # Normalize symbol before storing
             normalized = normalize_symbol(symbol)
-            self._latest_quotes[normalized] = Decimal(str(price))
+            self._latest_quotes[normalized] = to_price_units(price)
+            book = self._symbols.get(normalized)
+            if book is not None:
+                self._revalue(normalized, book)
             # NO LOGGING - this happens multiple times per second
         except Exception as e:
             # Only log errors at DEBUG level to avoid spam
             logger.debug(f"Error updating quote for {symbol}: {e}")
 
-    def calculate_unrealized_pnl(self, contract_id: str) -> Optional[Decimal]:
+    def calculate_unrealized_pnl(self, contract_id: str) -> Decimal | None:
         """
         Calculate floating P&L for a specific position.
 
@@ -110,49 +324,85 @@ class UnrealizedPnLCalculator:
             Decimal: Unrealized P&L in USD (positive = profit, negative = loss)
             None: If position not found or quote not available
         """
-        if contract_id not in self._open_positions:
+        position = self._open_positions.get(contract_id)
+        if position is None:
             return None
 
-        position = self._open_positions[contract_id]
-        symbol = position['symbol']
-
-        if symbol not in self._latest_quotes:
+        price_units = self._latest_quotes.get(position['symbol'])
+        if price_units is None:
             return None
 
-        try:
-            # Get tick economics
-            tick_info = get_tick_economics_safe(symbol)
-            tick_size = Decimal(str(tick_info['size']))
-            tick_value = Decimal(str(tick_info['tick_value']))
+        return self._pnl_dollars(position, price_units)
 
-            # Calculate price difference
-            entry_price = position['entry_price']
-            current_price = self._latest_quotes[symbol]
+    def calculate_unrealized_pnl_cents(self, contract_id: str) -> int | None:
+        """
+        Integer variant of calculate_unrealized_pnl() (no Decimal allocation).
 
-            if position['side'] == 'long':
-                price_diff = current_price - entry_price
-            else:  # short
-                price_diff = entry_price - current_price
+        Args:
+            contract_id: Position identifier
 
-            # Convert to ticks
-            ticks = price_diff / tick_size
+        Returns:
+            int: Unrealized P&L in cents (off-tick prices rounded to the cent)
+            None: If position not found or quote not available
+        """
+        position = self._open_positions.get(contract_id)
+        if position is None:
+            return None
 
-            # Calculate P&L
-            unrealized_pnl = ticks * tick_value * position['size']
+        price_units = self._latest_quotes.get(position['symbol'])
+        if price_units is None:
+            return None
 
-            return unrealized_pnl
+        return self._pnl_cents(position, price_units)
 
-        except (UnitsError, KeyError, ZeroDivisionError) as e:
-            logger.error(
-                f"Error calculating P&L for {contract_id} ({symbol}): {e}"
-            )
+    def calculate_unrealized_pnl_at(
+        self,
+        contract_id: str,
+        price: float
+    ) -> Decimal | None:
+        """
+        Calculate floating P&L for a position at a hypothetical price.
+
+        Does not touch the stored quote, so callers can ask "what would the
+        P&L be at this price" before deciding whether to publish it.
+
+        Args:
+            contract_id: Position identifier
+            price: Market price to evaluate at
+
+        Returns:
+            Decimal: Unrealized P&L in USD at the given price
+            None: If position not found or calculation error
+        """
+        position = self._open_positions.get(contract_id)
+        if position is None:
             return None
 
+        return self._pnl_dollars(position, to_price_units(price))
+
+    @staticmethod
+    def _pnl_numerator(position: dict, price_units: int) -> int:
+        """P&L in cents times tick_units (exact integer)."""
+        return (price_units - position['entry_units']) * position['cents_per_tick']
+
+    def _pnl_cents(self, position: dict, price_units: int) -> int:
+        """P&L in cents, rounded half away from zero for off-tick prices."""
+        return self._round_div(self._pnl_numerator(position, price_units), position['tick_units'])
+
+    def _pnl_dollars(self, position: dict, price_units: int) -> Decimal:
+        """Exact P&L in dollars."""
+        numerator = self._pnl_numerator(position, price_units)
+        cents, remainder = divmod(numerator, position['tick_units'])
+        if remainder == 0:
+            return Decimal(cents).scaleb(-2)
+        # Off the tick grid: fractional ticks
+        return Decimal(numerator) / Decimal(position['tick_units'] * 100)
+
     def calculate_realized_pnl(
         self,
         contract_id: str,
         exit_price: float
-    ) -> Optional[Decimal]:
+    ) -> Decimal | None:
         """
         Calculate realized P&L when a position closes.
 
@@ -178,65 +428,70 @@ class UnrealizedPnLCalculator:
             return None
 
         position = self._open_positions[contract_id]
-        symbol = position['symbol']
-
-        try:
-            # Get tick economics
-            tick_info = get_tick_economics_safe(symbol)
-            tick_size = Decimal(str(tick_info['size']))
-            tick_value = Decimal(str(tick_info['tick_value']))
-
-            # Calculate price difference
-            entry_price = position['entry_price']
-            exit = Decimal(str(exit_price))
-
-            if position['side'] == 'long':
-                # Long: profit when exit > entry
-                price_diff = exit - entry_price
-            else:  # short
-                # Short: profit when entry > exit
-                price_diff = entry_price - exit
+        exit_units = to_price_units(exit_price)
+        realized_pnl = self._pnl_dollars(position, exit_units)
 
-            # Convert to ticks
-            ticks = price_diff / tick_size
+        direction = 1 if position['side'] == 'long' else -1
+        ticks = (exit_units - position['entry_units']) * direction / position['tick_units']
+        logger.debug(
+            f"Realized P&L calculated for {contract_id}: "
+            f"Entry ${float(position['entry_price']):.2f} → Exit ${float(exit_price):.2f} = "
+            f"{ticks:.1f} ticks × {position['size']} = ${float(realized_pnl):+,.2f}"
+        )
 
-            # Calculate realized P&L
-            realized_pnl = ticks * tick_value * position['size']
-
-            logger.debug(
-                f"Realized P&L calculated for {contract_id}: "
-                f"Entry ${float(entry_price):.2f} → Exit ${float(exit):.2f} = "
-                f"{float(ticks):.1f} ticks × ${float(tick_value):.2f} × {position['size']} = "
-                f"${float(realized_pnl):+,.2f}"
-            )
-
-            return realized_pnl
-
-        except (UnitsError, KeyError, ZeroDivisionError) as e:
-            logger.error(
-                f"Error calculating realized P&L for {contract_id} ({symbol}): {e}"
-            )
-            return None
+        return realized_pnl
 
     def calculate_total_unrealized_pnl(self) -> Decimal:
         """
         Calculate total unrealized P&L across all open positions.
 
-        Used by RULE-004 (Daily Unrealized Loss).
+        Used by RULE-004 (Daily Unrealized Loss). O(1): the total is kept
+        up to date by quote and position updates.
 
         Returns:
             Decimal: Total unrealized P&L in USD
         """
-        total = Decimal('0')
+        return self._micro_cents_to_dollars(self._total_value)
+
+    def calculate_total_unrealized_pnl_cents(self) -> int:
+        """
+        Integer variant of calculate_total_unrealized_pnl().
+
+        Returns:
+            int: Total unrealized P&L in cents
+        """
+        return self._round_div(self._total_value, PRICE_SCALE)
 
-        for contract_id in self._open_positions:
-            pnl = self.calculate_unrealized_pnl(contract_id)
-            if pnl is not None:
-                total += pnl
+    def calculate_symbol_unrealized_pnl(self, symbol: str) -> Decimal:
+        """
+        Calculate unrealized P&L of all open positions in one symbol (O(1)).
 
-        return total
+        Args:
+            symbol: Instrument symbol (will be normalized)
 
-    def get_open_positions(self) -> Dict[str, Dict]:
+        Returns:
+            Decimal: Unrealized P&L in USD (0 without positions or quote)
+        """
+        book = self._symbols.get(normalize_symbol(symbol))
+        return self._micro_cents_to_dollars(book["value"] if book else 0)
+
+    @staticmethod
+    def _round_div(numerator: int, denominator: int) -> int:
+        """Integer division rounded half away from zero."""
+        quotient, remainder = divmod(abs(numerator), denominator)
+        if 2 * remainder >= denominator:
+            quotient += 1
+        return quotient if numerator >= 0 else -quotient
+
+    @staticmethod
+    def _micro_cents_to_dollars(value: int) -> Decimal:
+        """Exact dollars of a micro-cent amount (2 places when whole cents)."""
+        cents, remainder = divmod(value, PRICE_SCALE)
+        if remainder == 0:
+            return Decimal(cents).scaleb(-2)
+        return Decimal(value) / Decimal(PRICE_SCALE * 100)
+
+    def get_open_positions(self) -> dict[str, dict]:
         """
         Get all currently tracked open positions.
 
@@ -271,20 +526,20 @@ class UnrealizedPnLCalculator:
         Returns:
             True if P&L changed by more than threshold
         """
-        current_pnl = self.calculate_unrealized_pnl(contract_id)
+        current_pnl = self.calculate_unrealized_pnl_cents(contract_id)
         if current_pnl is None:
             return False
 
-        last_pnl = self._last_logged_pnl.get(contract_id, Decimal('0'))
+        last_pnl = self._last_logged_pnl.get(contract_id, 0)
         change = abs(current_pnl - last_pnl)
 
-        if change >= Decimal(str(threshold)):
+        if change >= round(threshold * 100):
             self._last_logged_pnl[contract_id] = current_pnl
             return True
 
         return False
 
-    def get_positions_by_symbol(self, symbol: str) -> Dict[str, Dict]:
+    def get_positions_by_symbol(self, symbol: str) -> dict[str, dict]:
         """
         Get all positions for a specific symbol.
 
@@ -294,16 +549,15 @@ class UnrealizedPnLCalculator:
         Returns:
             Dictionary of {contract_id: position_data} for matching symbol
         """
-        normalized = normalize_symbol(symbol)
-        return {
-            cid: pos
-            for cid, pos in self._open_positions.items()
-            if pos['symbol'] == normalized
-        }
+        book = self._symbols.get(normalize_symbol(symbol))
+        return dict(book["contracts"]) if book else {}
 
     def clear_all(self) -> None:
         """Clear all tracked positions and quotes (used for testing/reset)."""
         self._open_positions.clear()
         self._latest_quotes.clear()
         self._last_logged_pnl.clear()
+        self._symbols.clear()
+        self._total_value = 0
+        self._loss_breached = False
         logger.info("Unrealized P&L calculator cleared")
@@ -0,0 +1,37 @@
+"""
+Replay - Deterministic Rule Backtesting
+
+Runs recorded sessions (event journal segments or captured SignalR payloads)
+through the production RiskEngine on a virtual clock, to evaluate a risk
+configuration without trading it live.
+
+Usage:
+    python -m risk_manager.replay data/journal --risk-config risk_config.yaml
+"""
+
+from risk_manager.replay.broker import BrokerCall, ReplayBroker
+from risk_manager.replay.engine import (
+    ReplayEnforcement,
+    ReplayEngine,
+    ReplayResult,
+    ReplayViolation,
+)
+from risk_manager.replay.sources import (
+    SignalRTranslator,
+    journal_events,
+    read_signalr_capture,
+    signalr_events,
+)
+
+__all__ = [
+    "BrokerCall",
+    "ReplayBroker",
+    "ReplayEnforcement",
+    "ReplayEngine",
+    "ReplayResult",
+    "ReplayViolation",
+    "SignalRTranslator",
+    "journal_events",
+    "read_signalr_capture",
+    "signalr_events",
+]
@@ -0,0 +1,87 @@
+"""
+Replay CLI
+
+Usage:
+    python -m risk_manager.replay data/journal
+    python -m risk_manager.replay capture.jsonl --risk-config strict_risk_config.yaml
+    python -m risk_manager.replay data/journal --show-violations
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from risk_manager.replay.engine import ReplayEngine, ReplayResult
+from risk_manager.replay.sources import ENGINE_EVENT_TYPES, journal_events, signalr_events
+from risk_manager.state.event_journal import SEGMENT_SUFFIX, read_segment
+
+app = typer.Typer(
+    name="replay",
+    help="Replay recorded sessions through the risk engine",
+    add_completion=False,
+)
+console = Console()
+
+
+def _input_events(source: Path, account_id: Optional[int]):
+    """Pick the reader for a journal directory, a single segment or a capture file."""
+    if source.is_dir():
+        return journal_events(source)
+    if source.suffix == SEGMENT_SUFFIX:
+        return (e for e in read_segment(source) if e.event_type not in ENGINE_EVENT_TYPES)
+    return signalr_events(source, account_id=account_id)
+
+
+def _print_result(result: ReplayResult, show_violations: bool) -> None:
+    summary = result.summary()
+
+    table = Table(title="Replay Summary", show_header=False)
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value")
+    table.add_row("Events", f"{summary['events']:,}")
+    table.add_row("Session span", f"{summary['start_time']} → {summary['end_time']}")
+    table.add_row("Elapsed", f"{summary['elapsed_seconds']:.3f}s")
+    table.add_row("Throughput", f"{summary['events_per_second']:,.0f} events/sec")
+    table.add_row("Violations", str(summary["violations"]))
+    for rule, count in summary["violations_by_rule"].items():
+        table.add_row(f"  {rule}", str(count))
+    table.add_row("Enforcement actions", str(summary["enforcement_actions"]))
+    for action, count in summary["enforcement_by_action"].items():
+        table.add_row(f"  {action}", str(count))
+    console.print(table)
+
+    if show_violations and result.violations:
+        detail = Table(title="Violations")
+        detail.add_column("Time (UTC)")
+        detail.add_column("Rule")
+        detail.add_column("Message")
+        for violation in result.violations:
+            detail.add_row(
+                violation.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+                violation.rule,
+                str(violation.violation.get("message", "")),
+            )
+        console.print(detail)
+
+
+@app.command()
+def replay(
+    source: Path = typer.Argument(..., exists=True, help="Journal directory, .rmj segment, or SignalR capture (.jsonl/.json)"),
+    config_dir: Path = typer.Option(Path("config"), "--config-dir", help="Directory holding the config files"),
+    risk_config: str = typer.Option("risk_config.yaml", "--risk-config", help="Risk config file to evaluate"),
+    account_id: Optional[int] = typer.Option(None, "--account-id", help="Account id for capture messages without one"),
+    show_violations: bool = typer.Option(False, "--show-violations", help="List every violation"),
+    verbose: bool = typer.Option(False, "--verbose", help="Keep risk manager logging on (slow)"),
+) -> None:
+    """Replay a recorded session against a risk configuration."""
+    engine = ReplayEngine.from_config_dir(config_dir, risk_config_file=risk_config, quiet=not verbose)
+    result = asyncio.run(engine.run(_input_events(source, account_id)))
+    _print_result(result, show_violations)
+
+
+if __name__ == "__main__":
+    app()
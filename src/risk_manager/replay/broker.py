@@ -0,0 +1,147 @@
+"""
+Replay Broker
+
+Stand-in for TradingIntegration during replay. Rules query it for open
+positions and unrealized P&L; the engine sends it flatten/close calls.
+Positions and quotes are tracked from the replayed events with the same
+UnrealizedPnLCalculator the live integration uses. Enforcement calls are
+recorded instead of being sent anywhere.
+
+Note: the recorded stream is not rewritten after a counterfactual flatten.
+If a new limit set closes a position the live session kept open, later
+recorded updates for that contract still arrive; the enforcement record
+shows where the replayed configuration would have intervened.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from risk_manager.core.clock import Clock
+from risk_manager.core.events import EventType, RiskEvent
+from risk_manager.integrations.unrealized_pnl import UnrealizedPnLCalculator
+
+
+@dataclass(slots=True)
+class BrokerCall:
+    """One enforcement call the engine made against the broker."""
+
+    action: str  # "flatten_position" or "flatten_all"
+    timestamp: datetime
+    target: str | None = None
+    closed: list[str] = field(default_factory=list)
+
+
+class ReplayBroker:
+    """TradingIntegration replacement that tracks state from replayed events."""
+
+    def __init__(self, clock: Clock, instruments: list[str] | None = None):
+        """
+        Initialize replay broker.
+
+        Args:
+            clock: Replay clock (timestamps recorded enforcement calls)
+            instruments: Instruments reported in get_stats()
+        """
+        self.clock = clock
+        self.instruments = list(instruments or [])
+        self.pnl_calculator = UnrealizedPnLCalculator()
+        self.running = False
+        self.calls: list[BrokerCall] = []
+
+    # ========================================================================
+    # Lifecycle (called by RiskManager.start/stop)
+    # ========================================================================
+
+    async def start(self) -> None:
+        self.running = True
+
+    async def disconnect(self) -> None:
+        self.running = False
+
+    # ========================================================================
+    # State Tracking
+    # ========================================================================
+
+    def observe(self, event: RiskEvent) -> None:
+        """
+        Update tracked positions and quotes from an input event.
+
+        Mirrors what the live EventRouter/MarketDataHandler do to the shared
+        calculator before the event is published.
+        """
+        event_type = event.event_type
+
+        if event_type in (EventType.MARKET_DATA_UPDATED, EventType.UNREALIZED_PNL_UPDATE):
+            if event.symbol and event.price:
+                self.pnl_calculator.update_quote(event.symbol, event.price)
+
+        elif event_type == EventType.POSITION_OPENED:
+            contract_id = event.contract_id
+            if not contract_id or not event.symbol:
+                return
+            data = event.data
+            size = event.size or 0
+            side = data.get("side")
+            if side not in ("long", "short"):
+                side = "long" if size > 0 else "short"
+            self.pnl_calculator.update_position(contract_id, {
+                "price": data.get("average_price", event.price or 0.0),
+                "size": size,
+                "side": side,
+                "symbol": event.symbol,
+            })
+
+        elif event_type == EventType.POSITION_CLOSED:
+            if event.contract_id:
+                self.pnl_calculator.remove_position(event.contract_id)
+
+    # ========================================================================
+    # TradingIntegration API used by rules and the engine
+    # ========================================================================
+
+    async def flatten_position(self, symbol: str) -> None:
+        """Record a close of every tracked position for a contract or symbol."""
+        closed = [
+            contract_id
+            for contract_id, position in self.pnl_calculator.get_open_positions().items()
+            if symbol in (contract_id, position["symbol"], position.get("original_symbol"))
+        ]
+        for contract_id in closed:
+            self.pnl_calculator.remove_position(contract_id)
+        self.calls.append(BrokerCall(
+            action="flatten_position",
+            timestamp=self.clock.now(timezone.utc),
+            target=symbol,
+            closed=closed,
+        ))
+
+    async def flatten_all(self) -> None:
+        """Record a close of every tracked position."""
+        closed = list(self.pnl_calculator.get_open_positions())
+        for contract_id in closed:
+            self.pnl_calculator.remove_position(contract_id)
+        self.calls.append(BrokerCall(
+            action="flatten_all",
+            timestamp=self.clock.now(timezone.utc),
+            closed=closed,
+        ))
+
+    def get_total_unrealized_pnl(self) -> float:
+        return float(self.pnl_calculator.calculate_total_unrealized_pnl())
+
+    def get_position_unrealized_pnl(self, contract_id: str) -> float | None:
+        pnl = self.pnl_calculator.calculate_unrealized_pnl(contract_id)
+        return float(pnl) if pnl is not None else None
+
+    def get_open_positions(self) -> dict[str, dict[str, Any]]:
+        return self.pnl_calculator.get_open_positions()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "connected": False,
+            "running": self.running,
+            "instruments": self.instruments,
+            "replay": True,
+            "enforcement_calls": len(self.calls),
+        }
@@ -0,0 +1,312 @@
+"""
+Replay Engine
+
+Feeds a recorded event stream through a real RiskEngine built from a
+risk_config.yaml, as fast as the CPU allows, on a virtual clock.
+
+How it works:
+- A RiskManager is assembled exactly as in production (same rule loading,
+  same bus subscriptions) but with a throwaway SQLite database and archive, no journal,
+  and a ReplayBroker in place of the TradingIntegration
+- Time comes from a VirtualClock that follows the recorded timestamps and
+  is injected into every time-dependent component
+- The manager's scheduler is manual and runs on the same clock: before
+  each event, every scheduled job (timer deadlines, lockout expiry, reset
+  checks, P&L day preload) due before it runs at its own due time, and
+  every timer is fired at its own timestamp, so cooldowns and grace
+  periods expire exactly when they would have live
+- Daily P&L keys, lockout-until-reset times and session windows all read
+  the virtual clock, so daily resets follow the recording too
+- RULE_VIOLATED and ENFORCEMENT_ACTION events are collected off the bus
+
+Example:
+    ```python
+    replay = ReplayEngine.from_config_dir("config", risk_config_file="strict.yaml")
+    result = await replay.run_journal("data/journal")
+    print(result.summary())
+    ```
+"""
+
+import logging
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from loguru import logger
+
+from risk_manager.config.models import RiskConfig
+from risk_manager.core.clock import VirtualClock
+from risk_manager.core.events import EventType, RiskEvent
+from risk_manager.core.manager import RiskManager
+from risk_manager.core.scheduler import Scheduler
+from risk_manager.replay.broker import BrokerCall, ReplayBroker
+from risk_manager.replay.sources import event_time, journal_events, signalr_events
+
+
+@dataclass(slots=True)
+class ReplayViolation:
+    """A RULE_VIOLATED event raised during replay."""
+
+    timestamp: datetime
+    rule: str
+    violation: dict[str, Any]
+
+
+@dataclass(slots=True)
+class ReplayEnforcement:
+    """An ENFORCEMENT_ACTION event raised during replay."""
+
+    timestamp: datetime
+    action: str
+    data: dict[str, Any]
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of one replay run."""
+
+    events: int = 0
+    elapsed_seconds: float = 0.0
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    violations: list[ReplayViolation] = field(default_factory=list)
+    enforcement_actions: list[ReplayEnforcement] = field(default_factory=list)
+    broker_calls: list[BrokerCall] = field(default_factory=list)
+
+    @property
+    def events_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.events / self.elapsed_seconds
+
+    def violations_by_rule(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for violation in self.violations:
+            counts[violation.rule] = counts.get(violation.rule, 0) + 1
+        return counts
+
+    def enforcement_by_action(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for enforcement in self.enforcement_actions:
+            counts[enforcement.action] = counts.get(enforcement.action, 0) + 1
+        return counts
+
+    def summary(self) -> dict[str, Any]:
+        """Get counts and throughput for display."""
+        return {
+            "events": self.events,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "events_per_second": round(self.events_per_second, 1),
+            "start_time": self.start_time.isoformat() if self.start_time else None,
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "violations": len(self.violations),
+            "violations_by_rule": self.violations_by_rule(),
+            "enforcement_actions": len(self.enforcement_actions),
+            "enforcement_by_action": self.enforcement_by_action(),
+        }
+
+
+@contextmanager
+def _quiet_logging(enabled: bool) -> Iterator[None]:
+    """
+    Silence risk_manager log output (per-event logging dominates replay time).
+
+    Covers loguru and the SDK's stdlib checkpoint loggers.
+    """
+    if not enabled:
+        yield
+        return
+
+    stdlib_loggers = [
+        item for name, item in logging.Logger.manager.loggerDict.items()
+        if name.startswith("risk_manager") and isinstance(item, logging.Logger) and not item.disabled
+    ]
+    logger.disable("risk_manager")
+    for item in stdlib_loggers:
+        item.disabled = True
+    try:
+        yield
+    finally:
+        logger.enable("risk_manager")
+        for item in stdlib_loggers:
+            item.disabled = False
+
+
+class ReplayEngine:
+    """
+    Replay recorded events through the production rule set.
+
+    Each run builds a fresh RiskManager, so runs are independent and
+    deterministic for the same input and configuration.
+    """
+
+    def __init__(
+        self,
+        config: RiskConfig,
+        timers_config=None,
+        quiet: bool = True,
+    ):
+        """
+        Initialize replay engine.
+
+        Args:
+            config: Risk configuration to evaluate (the limit set under test)
+            timers_config: Optional TimersConfig (needed by the cooldown,
+                trade-frequency and session rules, as in production)
+            quiet: Disable risk_manager log output while replaying
+        """
+        self.config = config
+        self.timers_config = timers_config
+        self.quiet = quiet
+
+    @classmethod
+    def from_config_dir(
+        cls,
+        config_dir: str | Path = "config",
+        risk_config_file: str = "risk_config.yaml",
+        timers_config_file: str = "timers_config.yaml",
+        quiet: bool = True,
+    ) -> "ReplayEngine":
+        """
+        Build a replay engine from YAML configuration files.
+
+        Args:
+            config_dir: Directory holding the config files
+            risk_config_file: Risk config to evaluate
+            timers_config_file: Timers config (skipped if the file is missing)
+            quiet: Disable risk_manager log output while replaying
+        """
+        from risk_manager.config.loader import ConfigLoader
+
+        loader = ConfigLoader(config_dir=config_dir)
+        config = loader.load_risk_config(risk_config_file)
+        timers_config = None
+        if (Path(config_dir) / timers_config_file).exists():
+            timers_config = loader.load_timers_config(timers_config_file)
+        return cls(config, timers_config=timers_config, quiet=quiet)
+
+    async def run_journal(self, directory: str | Path) -> ReplayResult:
+        """Replay an event journal directory."""
+        return await self.run(journal_events(directory))
+
+    async def run_signalr(self, path: str | Path, account_id: Any = None) -> ReplayResult:
+        """Replay a captured SignalR payload file."""
+        return await self.run(signalr_events(path, account_id=account_id))
+
+    async def run(self, events: Iterable[RiskEvent]) -> ReplayResult:
+        """
+        Replay events in order.
+
+        Args:
+            events: Input events with their recorded timestamps
+
+        Returns:
+            ReplayResult with violations, enforcement actions and throughput
+        """
+        result = ReplayResult()
+        with _quiet_logging(self.quiet):
+            events = iter(events)
+            first = next(events, None)
+            if first is None:
+                return result
+            await self._replay(chain((first,), events), VirtualClock(event_time(first)), result)
+        return result
+
+    # ========================================================================
+    # Internals
+    # ========================================================================
+
+    async def _replay(
+        self, events: Iterator[RiskEvent], clock: VirtualClock, result: ReplayResult
+    ) -> None:
+        """Run the event loop of one replay on ``clock``."""
+        result.start_time = clock.now(timezone.utc)
+
+        with tempfile.TemporaryDirectory(prefix="risk-replay-") as tmp_dir:
+            manager, broker = await self._build_manager(clock, Path(tmp_dir))
+            self._record_outputs(manager, clock, result)
+            await manager.start()
+
+            started = time.perf_counter()
+            try:
+                for event in events:
+                    moment = event_time(event)
+                    await self._fire_due_deadlines(manager, clock, moment)
+                    clock.set(moment)
+                    broker.observe(event)
+                    await manager.event_bus.publish(event)
+                    result.events += 1
+                result.elapsed_seconds = time.perf_counter() - started
+            finally:
+                await manager.stop()
+
+        result.end_time = clock.now(timezone.utc)
+        result.broker_calls = list(broker.calls)
+
+    async def _build_manager(
+        self, clock: VirtualClock, work_dir: Path
+    ) -> tuple[RiskManager, ReplayBroker]:
+        """Assemble a production RiskManager wired to a replay broker."""
+        config = self.config.model_copy(deep=True)
+        config.general.database.path = str(work_dir / "replay_state.db")
+        config.general.database.archive_directory = str(work_dir / "archive")
+        journal_config = getattr(config.general, "journal", None)
+        if journal_config is not None:
+            journal_config.enabled = False
+
+        manager = RiskManager(
+            config,
+            timers_config=self.timers_config,
+            configure_logging=False,
+            clock=clock,
+            scheduler=Scheduler(clock=clock, manual=True),
+        )
+        broker = ReplayBroker(clock, instruments=config.general.instruments)
+        manager.trading_integration = broker
+        manager.engine.trading_integration = broker
+        await manager._add_default_rules()
+        return manager, broker
+
+    @staticmethod
+    def _record_outputs(manager: RiskManager, clock: VirtualClock, result: ReplayResult) -> None:
+        """Collect violations and enforcement actions from the bus."""
+
+        async def on_violation(event: RiskEvent) -> None:
+            result.violations.append(ReplayViolation(
+                timestamp=clock.now(timezone.utc),
+                rule=event.data.get("rule", "unknown"),
+                violation=event.data.get("violation", {}),
+            ))
+
+        async def on_enforcement(event: RiskEvent) -> None:
+            result.enforcement_actions.append(ReplayEnforcement(
+                timestamp=clock.now(timezone.utc),
+                action=event.data.get("action", "unknown"),
+                data=dict(event.data),
+            ))
+
+        manager.event_bus.subscribe(EventType.RULE_VIOLATED, on_violation)
+        manager.event_bus.subscribe(EventType.ENFORCEMENT_ACTION, on_enforcement)
+
+    @staticmethod
+    async def _fire_due_deadlines(
+        manager: RiskManager, clock: VirtualClock, moment: datetime
+    ) -> None:
+        """Run scheduled jobs and fire timers due at or before ``moment`` in order, then expire lockouts."""
+        ahead = (moment - clock.now(timezone.utc)).total_seconds()
+        await manager.scheduler.advance_to(clock.monotonic() + max(ahead, 0.0))
+
+        lockout_manager = manager.engine.lockout_manager
+        if lockout_manager is None:
+            return
+
+        if lockout_manager.timer_manager is not None:
+            await lockout_manager.timer_manager.advance_to(moment)
+        else:
+            clock.set(moment)
+        lockout_manager.check_expired_lockouts()
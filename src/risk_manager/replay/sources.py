@@ -0,0 +1,374 @@
+"""
+Replay Sources
+
+Turn recorded input into the RiskEvent stream the live system published.
+
+Two inputs are supported:
+- Event journal segments (``state.event_journal``): already the exact events
+  that were on the bus, so they are replayed as-is minus the engine's own
+  output (violations, enforcement, lifecycle events), which the replay
+  regenerates.
+- Captured SignalR gateway payloads, shaped like the fixtures in
+  ``tests/fixtures/signalr_events.py``. ``SignalRTranslator`` plays the part
+  of the SDK + EventRouter + MarketDataHandler: it classifies position
+  updates as opened/updated/closed, computes realized P&L on close from the
+  last fill, and turns quotes into MARKET_DATA_UPDATED and
+  UNREALIZED_PNL_UPDATE events.
+
+Capture file format (JSON lines, one gateway message per line):
+    {"type": "position", "data": {"accountId": 123, "contractId": "CON.F.US.MNQ.U25", ...}}
+    {"type": "quote", "data": {"contractId": "CON.F.US.MNQ.U25", "bid": ..., "timestamp": ...}}
+
+``type`` is one of ``trade``, ``position``, ``order``, ``quote``, ``account``
+(the ``GatewayUser*`` prefixes are accepted too).
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from loguru import logger
+
+from risk_manager.core.events import EventType, RiskEvent
+from risk_manager.errors import MappingError
+from risk_manager.integrations.adapters import SDKAdapter
+from risk_manager.integrations.unrealized_pnl import UnrealizedPnLCalculator
+from risk_manager.state.event_journal import EventJournalReader
+
+# Events the engine emits itself - regenerated by the replay, never fed in
+ENGINE_EVENT_TYPES = frozenset({
+    EventType.RULE_VIOLATED,
+    EventType.RULE_WARNING,
+    EventType.ENFORCEMENT_ACTION,
+    EventType.SYSTEM_STARTED,
+    EventType.SYSTEM_STOPPED,
+})
+
+# GatewayUserOrder.state → risk event (5 = partial fill has no risk event)
+ORDER_STATE_EVENTS = {
+    2: EventType.ORDER_PLACED,
+    3: EventType.ORDER_FILLED,
+    4: EventType.ORDER_CANCELLED,
+    6: EventType.ORDER_REJECTED,
+}
+
+# GatewayUserPosition.type
+POSITION_LONG = 1
+POSITION_SHORT = 2
+
+# Same threshold MarketDataHandler uses before emitting UNREALIZED_PNL_UPDATE
+UNREALIZED_PNL_CHANGE_THRESHOLD = 10.0
+
+_KIND_ALIASES = {
+    "gatewayusertrade": "trade",
+    "gatewayuserposition": "position",
+    "gatewayuserorder": "order",
+    "gatewayuseraccount": "account",
+    "marketquote": "quote",
+    "gatewayquote": "quote",
+}
+
+
+def parse_timestamp(value: Any) -> datetime | None:
+    """
+    Parse a gateway timestamp into an aware UTC datetime.
+
+    Accepts ISO-8601 strings (``Z`` suffix included), epoch seconds or
+    milliseconds, and datetimes (naive values are taken as UTC).
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, (int, float)):
+        seconds = value / 1000 if value > 1e11 else value
+        return datetime.fromtimestamp(seconds, timezone.utc)
+    else:
+        try:
+            moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def event_time(event: RiskEvent) -> datetime:
+    """Recorded wall time of an event as an aware UTC datetime."""
+    return datetime.fromtimestamp(event.wall_ns / 1_000_000_000, timezone.utc)
+
+
+def journal_events(directory: str | Path) -> Iterator[RiskEvent]:
+    """Iterate the input events recorded in a journal directory."""
+    for event in EventJournalReader(directory):
+        if event.event_type not in ENGINE_EVENT_TYPES:
+            yield event
+
+
+def read_signalr_capture(path: str | Path) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Iterate ``(kind, payload)`` pairs from a capture file.
+
+    Accepts JSON lines or a single JSON array of the same objects.
+    """
+    path = Path(path)
+    with open(path, encoding="utf-8") as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        if first == "[":
+            records = json.load(f)
+        else:
+            records = (json.loads(line) for line in f if line.strip())
+
+        for record in records:
+            kind = record.get("type") or record.get("kind")
+            payload = record.get("data") or record.get("payload")
+            if not kind or not isinstance(payload, dict):
+                logger.warning(f"Skipping malformed capture record in {path}: {record}")
+                continue
+            yield kind, payload
+
+
+class SignalRTranslator:
+    """
+    Translate captured gateway payloads into risk events.
+
+    Stateful: position sizes, entry prices and the last fill per contract are
+    tracked so that position updates can be classified and realized P&L
+    computed the same way the live EventRouter does.
+    """
+
+    def __init__(self, account_id: Any = None):
+        """
+        Initialize translator.
+
+        Args:
+            account_id: Account to stamp on events whose payload has none
+                (quotes; the live router uses the connected account)
+        """
+        self.account_id = account_id
+        self._adapter = SDKAdapter()
+        self._calculator = UnrealizedPnLCalculator()
+        self._position_sizes: dict[str, int] = {}
+        self._last_fill_price: dict[str, float] = {}
+        self._last_time: datetime | None = None
+
+    def translate(self, kind: str, payload: dict[str, Any]) -> list[RiskEvent]:
+        """
+        Translate one gateway message.
+
+        Args:
+            kind: Message kind (trade, position, order, quote, account)
+            payload: Gateway payload dict
+
+        Returns:
+            Risk events in the order the live system would publish them
+        """
+        kind = kind.lower()
+        kind = _KIND_ALIASES.get(kind, kind)
+        if kind == "trade":
+            return self._translate_trade(payload)
+        if kind == "position":
+            return self._translate_position(payload)
+        if kind == "order":
+            return self._translate_order(payload)
+        if kind == "quote":
+            return self._translate_quote(payload)
+        if kind == "account":
+            return []
+        logger.debug(f"Unknown capture message kind: {kind}")
+        return []
+
+    def translate_all(self, messages: Iterable[tuple[str, dict[str, Any]]]) -> Iterator[RiskEvent]:
+        """Translate a stream of ``(kind, payload)`` pairs."""
+        for kind, payload in messages:
+            yield from self.translate(kind, payload)
+
+    # ========================================================================
+    # Message Handlers
+    # ========================================================================
+
+    def _symbol(self, contract_id: str | None) -> str | None:
+        if not contract_id:
+            return None
+        try:
+            return self._adapter.normalize_symbol(contract_id)
+        except MappingError:
+            return contract_id
+
+    def _time(self, value: Any) -> datetime | None:
+        """Parse a payload timestamp, falling back to the previous message's."""
+        moment = parse_timestamp(value)
+        if moment is None:
+            return self._last_time
+        self._last_time = moment
+        return moment
+
+    def _account(self, payload: dict[str, Any]) -> Any:
+        account_id = payload.get("accountId")
+        if account_id is None:
+            return self.account_id
+        if self.account_id is None:
+            self.account_id = account_id
+        return account_id
+
+    def _translate_trade(self, payload: dict[str, Any]) -> list[RiskEvent]:
+        contract_id = payload.get("contractId")
+        return [RiskEvent(
+            event_type=EventType.TRADE_EXECUTED,
+            timestamp=self._time(payload.get("executionTime") or payload.get("creationTimestamp")),
+            account_id=self._account(payload),
+            symbol=self._symbol(contract_id),
+            contract_id=contract_id,
+            size=payload.get("quantity", payload.get("size")),
+            price=payload.get("exitPrice", payload.get("price")),
+            data={
+                "trade_id": payload.get("id"),
+                "profitAndLoss": payload.get("profitAndLoss"),
+                "raw_data": payload,
+            },
+            source="trading_sdk",
+        )]
+
+    def _translate_position(self, payload: dict[str, Any]) -> list[RiskEvent]:
+        contract_id = payload.get("contractId")
+        if not contract_id:
+            return []
+
+        symbol = self._symbol(contract_id)
+        size = payload.get("size", 0) or 0
+        avg_price = payload.get("averagePrice", 0.0) or 0.0
+        pos_type = payload.get("type", 0)
+        previous = self._position_sizes.get(contract_id, 0)
+
+        realized_pnl = None
+        if size == 0:
+            if previous == 0:
+                return []
+            event_type = EventType.POSITION_CLOSED
+            exit_price = self._last_fill_price.pop(contract_id, None) or avg_price
+            realized = self._calculator.calculate_realized_pnl(contract_id, exit_price)
+            if realized is not None:
+                realized_pnl = float(realized)
+            self._calculator.remove_position(contract_id)
+            self._position_sizes.pop(contract_id, None)
+        else:
+            event_type = EventType.POSITION_OPENED if previous == 0 else EventType.POSITION_UPDATED
+            self._position_sizes[contract_id] = size
+            self._calculator.update_position(contract_id, {
+                "price": avg_price,
+                "size": size,
+                "side": "short" if pos_type == POSITION_SHORT else "long",
+                "symbol": symbol,
+            })
+
+        if pos_type == POSITION_SHORT:
+            side = "short"
+        elif size:
+            side = "long"
+        else:
+            side = "flat"
+
+        return [RiskEvent(
+            event_type=event_type,
+            timestamp=self._time(payload.get("updatedAt") or payload.get("createdAt")),
+            account_id=self._account(payload),
+            symbol=symbol,
+            contract_id=contract_id,
+            size=size,
+            data={
+                "side": side,
+                "average_price": avg_price,
+                "profitAndLoss": realized_pnl,
+                "action": event_type.value.removeprefix("position_"),
+                "raw_data": payload,
+            },
+            source="trading_sdk",
+        )]
+
+    def _translate_order(self, payload: dict[str, Any]) -> list[RiskEvent]:
+        event_type = ORDER_STATE_EVENTS.get(payload.get("state"))
+        if event_type is None:
+            return []
+
+        contract_id = payload.get("contractId")
+        fill_price = payload.get("fillPrice", payload.get("filledPrice"))
+        if event_type == EventType.ORDER_FILLED and contract_id and fill_price is not None:
+            self._last_fill_price[contract_id] = fill_price
+
+        return [RiskEvent(
+            event_type=event_type,
+            timestamp=self._time(payload.get("updatedAt") or payload.get("createdAt")),
+            account_id=self._account(payload),
+            symbol=self._symbol(contract_id),
+            contract_id=contract_id,
+            size=payload.get("filledSize") or payload.get("size"),
+            price=fill_price if fill_price is not None else payload.get("limitPrice"),
+            data={
+                "order_id": payload.get("id"),
+                "type": payload.get("type"),
+                "side": payload.get("side"),
+                "stopPrice": payload.get("stopPrice"),
+                "limitPrice": payload.get("limitPrice"),
+                "raw_data": payload,
+            },
+            source="trading_sdk",
+        )]
+
+    def _translate_quote(self, payload: dict[str, Any]) -> list[RiskEvent]:
+        symbol = self._symbol(payload.get("contractId") or payload.get("symbol"))
+        if not symbol:
+            return []
+
+        bid = payload.get("bid") or 0.0
+        ask = payload.get("ask") or 0.0
+        last = payload.get("last", payload.get("lastPrice")) or 0.0
+        if last > 0:
+            price = last
+        elif bid > 0 and ask > 0:
+            price = (bid + ask) / 2.0
+        else:
+            return []
+
+        timestamp = self._time(payload.get("timestamp"))
+        events = []
+
+        # Same order as MarketDataHandler.process_quote: P&L first, then quote
+        self._calculator.update_quote(symbol, price)
+        for contract_id in self._calculator.get_positions_by_symbol(symbol):
+            if not self._calculator.has_significant_pnl_change(
+                contract_id, threshold=UNREALIZED_PNL_CHANGE_THRESHOLD
+            ):
+                continue
+            unrealized_pnl = self._calculator.calculate_unrealized_pnl(contract_id)
+            if unrealized_pnl is None:
+                continue
+            events.append(RiskEvent(
+                event_type=EventType.UNREALIZED_PNL_UPDATE,
+                timestamp=timestamp,
+                account_id=self.account_id,
+                contract_id=contract_id,
+                symbol=symbol,
+                price=price,
+                data={"unrealized_pnl": float(unrealized_pnl)},
+                source="trading_sdk",
+            ))
+
+        events.append(RiskEvent(
+            event_type=EventType.MARKET_DATA_UPDATED,
+            timestamp=timestamp,
+            symbol=symbol,
+            price=price,
+            data={"bid": bid, "ask": ask, "last": last, "timestamp": payload.get("timestamp")},
+            source="trading_sdk",
+        ))
+        return events
+
+
+def signalr_events(path: str | Path, account_id: Any = None) -> Iterator[RiskEvent]:
+    """Iterate the risk events translated from a SignalR capture file."""
+    translator = SignalRTranslator(account_id=account_id)
+    return translator.translate_all(read_signalr_capture(path))
@@ -48,6 +48,13 @@ class AuthLossGuardRule(RiskRule):
         )
     """
 
+    event_types = frozenset({
+        EventType.SDK_DISCONNECTED,
+        EventType.SDK_CONNECTED,
+        EventType.AUTH_FAILED,
+        EventType.AUTH_SUCCESS,
+    })
+
     def __init__(
         self,
         alert_on_disconnect: bool = True,
@@ -88,15 +95,10 @@ class AuthLossGuardRule(RiskRule):
             Alert dictionary if connection issue detected, None otherwise
         """
         # Only monitor SDK health events
-        if event.event_type not in [
-            EventType.SDK_DISCONNECTED,
-            EventType.SDK_CONNECTED,
-            EventType.AUTH_FAILED,
-            EventType.AUTH_SUCCESS,
-        ]:
+        if event.event_type not in self.event_types:
             return None
 
-        account_id = event.data.get("account_id")
+        account_id = event.account_id
         if not account_id:
             return None
 
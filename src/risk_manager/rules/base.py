@@ -1,9 +1,9 @@
 """Base class for risk rules."""
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from risk_manager.core.events import RiskEvent
+from risk_manager.core.events import EventType, RiskEvent
 
 if TYPE_CHECKING:
     from risk_manager.core.engine import RiskEngine
@@ -12,6 +12,11 @@ if TYPE_CHECKING:
 class RiskRule(ABC):
     """Base class for all risk rules."""
 
+    # Event types this rule consumes. RiskEngine builds its dispatch table
+    # from this, so a rule is only invoked for events it can act on.
+    # None means "all events" (kept for custom rules that predate routing).
+    event_types: ClassVar[frozenset[EventType] | None] = None
+
     def __init__(self, action: str = "alert"):
         """
         Initialize risk rule.
@@ -71,6 +71,11 @@ class CooldownAfterLossRule(RiskRule):
         )
     """
 
+    event_types = frozenset({
+        EventType.TRADE_EXECUTED,
+        EventType.POSITION_CLOSED,
+    })
+
     def __init__(
         self,
         loss_thresholds: list[dict[str, float]],
@@ -154,14 +159,11 @@ class CooldownAfterLossRule(RiskRule):
             return None
 
         # Only evaluate trade execution and position close events
-        if event.event_type not in [
-            EventType.TRADE_EXECUTED,
-            EventType.POSITION_CLOSED,
-        ]:
+        if event.event_type not in self.event_types:
             return None
 
         # Extract account ID
-        account_id = event.data.get("account_id")
+        account_id = event.account_id
         if not account_id:
             logger.debug(f"Event missing account_id: {event.data}")
             return None
@@ -12,6 +12,11 @@ if TYPE_CHECKING:
 class DailyLossRule(RiskRule):
     """Enforce maximum daily loss limit."""
 
+    event_types = frozenset({
+        EventType.PNL_UPDATED,
+        EventType.POSITION_CLOSED,
+    })
+
     def __init__(self, limit: float, action: str = "flatten"):
         """
         Initialize daily loss rule.
@@ -32,7 +37,7 @@ class DailyLossRule(RiskRule):
             return None
 
         # Only evaluate on P&L update events
-        if event.event_type not in [EventType.PNL_UPDATED, EventType.POSITION_CLOSED]:
+        if event.event_type not in self.event_types:
             return None
 
         # Check if daily P&L exceeds limit
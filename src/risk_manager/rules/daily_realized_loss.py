@@ -26,9 +26,11 @@ from typing import TYPE_CHECKING, Any, Optional
 from loguru import logger
 
 from risk_manager.core.events import EventType, RiskEvent
+from risk_manager.core.trading_calendar import TradingCalendar
 from risk_manager.rules.base import RiskRule
 
 if TYPE_CHECKING:
+    from risk_manager.core.clock import Clock
     from risk_manager.core.engine import RiskEngine
     from risk_manager.state.lockout_manager import LockoutManager
     from risk_manager.state.pnl_tracker import PnLTracker
@@ -65,6 +67,11 @@ class DailyRealizedLossRule(RiskRule):
         )
     """
 
+    event_types = frozenset({
+        EventType.POSITION_CLOSED,   # ← PRIMARY: Has calculated realized P&L from trading integration
+        EventType.TRADE_EXECUTED,    # ← For test compatibility
+    })
+
     def __init__(
         self,
         limit: float,
@@ -73,6 +80,8 @@ class DailyRealizedLossRule(RiskRule):
         action: str = "flatten",
         reset_time: str = "17:00",
         timezone_name: str = "America/New_York",
+        clock: Optional["Clock"] = None,
+        calendar: Optional[TradingCalendar] = None,
     ):
         """
         Initialize daily realized loss rule.
@@ -84,6 +93,9 @@ class DailyRealizedLossRule(RiskRule):
             action: Action to take on violation (default: "flatten")
             reset_time: Daily reset time in HH:MM format (default: "17:00")
             timezone_name: Timezone name (default: "America/New_York")
+            clock: Optional clock for the reset math (defaults to the system clock)
+            calendar: Optional trading calendar; its reset time and timezone
+                replace ``reset_time``/``timezone_name``
 
         Raises:
             ValueError: If limit is not negative
@@ -96,8 +108,14 @@ class DailyRealizedLossRule(RiskRule):
         self.limit = limit
         self.pnl_tracker = pnl_tracker
         self.lockout_manager = lockout_manager
-        self.reset_time = reset_time
-        self.timezone_name = timezone_name
+        self.clock = clock
+        if calendar is None:
+            calendar = TradingCalendar(
+                reset_time=reset_time, reset_timezone=timezone_name, clock=clock
+            )
+        self.calendar = calendar
+        self.reset_time = calendar.reset_time.strftime("%H:%M")
+        self.timezone_name = calendar.reset_timezone.key
 
         logger.info(
             f"DailyRealizedLossRule initialized: limit=${limit:.2f}, "
@@ -140,17 +158,14 @@ class DailyRealizedLossRule(RiskRule):
         # CRITICAL: POSITION_CLOSED is the PRIMARY trigger!
         # Trading integration calculates realized P&L and adds it to POSITION_CLOSED events
         # ORDER_FILLED events do NOT have profitAndLoss (half-turn trades)
-        if event.event_type not in [
-            EventType.POSITION_CLOSED,   # ← PRIMARY: Has calculated realized P&L from trading integration
-            EventType.TRADE_EXECUTED,    # ← For test compatibility
-        ]:
+        if event.event_type not in self.event_types:
             logger.debug(f"   ❌ Event type {event.event_type} not in trigger list, skipping")
             return None
 
         logger.info(f"   ✅ Event type matches! Processing {event.event_type}")
 
         # Extract account ID
-        account_id = event.data.get("account_id")
+        account_id = event.account_id
         logger.debug(f"   account_id from event: {account_id}")
         if not account_id:
             logger.warning(f"   ❌ Event missing account_id! Event data: {event.data}")
@@ -256,6 +271,12 @@ class DailyRealizedLossRule(RiskRule):
             f"{violation['message']}"
         )
 
+    def _now(self, tz) -> datetime:
+        """Current time in ``tz`` from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.now(tz)
+        return datetime.now(tz)
+
     def _calculate_next_reset_time(self) -> datetime:
         """
         Calculate next daily reset time based on configured reset_time.
@@ -263,12 +284,9 @@ class DailyRealizedLossRule(RiskRule):
         Returns:
             Next reset datetime (timezone-aware UTC)
 
-        Logic:
-        - Parse reset_time (e.g., "17:00")
-        - Get current time in configured timezone
-        - If current time < reset time today → reset today
-        - If current time >= reset time today → reset tomorrow
-        - Convert to UTC for storage
+        The next reset comes from the trading calendar's precomputed reset
+        instants (DST-aware wall time in the configured timezone); a reset
+        exactly now counts as passed.
 
         Example:
             reset_time = "17:00"
@@ -278,30 +296,11 @@ class DailyRealizedLossRule(RiskRule):
             Current: 6:00 PM ET → Next reset: 5:00 PM ET tomorrow
         """
         try:
-            import pytz
-
-            # Parse reset time (HH:MM)
-            reset_hour, reset_minute = map(int, self.reset_time.split(":"))
-
-            # Get current time in configured timezone
-            tz = pytz.timezone(self.timezone_name)
-            now = datetime.now(tz)
-
-            # Calculate next reset time
-            next_reset = now.replace(
-                hour=reset_hour, minute=reset_minute, second=0, microsecond=0
-            )
-
-            # If we're past reset time today, schedule for tomorrow
-            if now >= next_reset:
-                next_reset += timedelta(days=1)
-
-            # Convert to UTC for consistency
-            next_reset_utc = next_reset.astimezone(pytz.utc)
+            next_reset_utc = self.calendar.next_reset(self._now(timezone.utc))
 
             logger.debug(
-                f"Next reset time: {next_reset.isoformat()} "
-                f"({self.timezone_name}) = {next_reset_utc.isoformat()} (UTC)"
+                f"Next reset time: {next_reset_utc.isoformat()} (UTC), "
+                f"{self.reset_time} {self.timezone_name}"
             )
 
             return next_reset_utc
@@ -309,4 +308,4 @@ class DailyRealizedLossRule(RiskRule):
         except Exception as e:
             logger.error(f"Error calculating reset time: {e}", exc_info=True)
             # Fallback: 24 hours from now
-            return datetime.now(timezone.utc) + timedelta(days=1)
+            return self._now(timezone.utc) + timedelta(days=1)
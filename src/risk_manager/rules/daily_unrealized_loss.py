@@ -3,7 +3,8 @@ RULE-004: Daily Unrealized Loss (Account-Wide Floating Loss Limit)
 
 Purpose: Monitor total unrealized loss across ALL open positions
 Category: Trade-by-Trade (Category 1)
-Trigger: UNREALIZED_PNL_UPDATE events (when P&L changes $10+)
+Trigger: UNREALIZED_PNL_UPDATE events (when P&L changes $10+ or a quote
+         crosses the limit's trigger price)
 Enforcement: Flatten all positions when total unrealized loss exceeds limit (no lockout)
 
 This rule monitors the combined floating loss across all open positions
@@ -57,6 +58,13 @@ class DailyUnrealizedLossRule(RiskRule):
         - Trader can immediately place new trades
     """
 
+    event_types = frozenset({
+        EventType.UNREALIZED_PNL_UPDATE,
+        EventType.POSITION_OPENED,
+        EventType.POSITION_UPDATED,  # Check P&L when position data changes
+        EventType.POSITION_CLOSED,
+    })
+
     def __init__(
         self,
         loss_limit: float,
@@ -109,12 +117,7 @@ class DailyUnrealizedLossRule(RiskRule):
             return None
 
         # Only evaluate on relevant events
-        if event.event_type not in [
-            EventType.UNREALIZED_PNL_UPDATE,
-            EventType.POSITION_OPENED,
-            EventType.POSITION_UPDATED,  # Check P&L when position data changes
-            EventType.POSITION_CLOSED,
-        ]:
+        if event.event_type not in self.event_types:
             return None
 
         # Get total unrealized P&L across all positions from TradingIntegration
@@ -28,6 +28,11 @@ class MaxContractsPerInstrumentRule(RiskRule):
     - unknown_symbol_action: "block", "allow_with_limit:N", "allow_unlimited"
     """
 
+    event_types = frozenset({
+        EventType.POSITION_OPENED,
+        EventType.POSITION_UPDATED,
+    })
+
     def __init__(
         self,
         limits: dict[str, int],
@@ -75,13 +80,13 @@ class MaxContractsPerInstrumentRule(RiskRule):
             True if rule is violated, False otherwise
         """
         # Only process position events
-        if event.event_type not in [EventType.POSITION_OPENED, EventType.POSITION_UPDATED]:
+        if event.event_type not in self.event_types:
             return False
 
         # Extract position data
-        symbol = event.data.get("symbol")
-        contract_id = event.data.get("contract_id")
-        size = event.data.get("size", 0)
+        symbol = event.symbol
+        contract_id = event.contract_id
+        size = event.size or 0
 
         if not symbol or not contract_id:
             logger.warning("Position event missing symbol or contract_id")
@@ -12,6 +12,12 @@ if TYPE_CHECKING:
 class MaxPositionRule(RiskRule):
     """Enforce maximum position size limit."""
 
+    event_types = frozenset({
+        EventType.POSITION_OPENED,
+        EventType.POSITION_UPDATED,
+        EventType.ORDER_FILLED,
+    })
+
     def __init__(self, max_contracts: int, action: str = "reject", per_instrument: bool = False):
         """
         Initialize max position rule.
@@ -34,11 +40,7 @@ class MaxPositionRule(RiskRule):
             return None
 
         # Only evaluate on position events
-        if event.event_type not in [
-            EventType.POSITION_OPENED,
-            EventType.POSITION_UPDATED,
-            EventType.ORDER_FILLED,
-        ]:
+        if event.event_type not in self.event_types:
             return None
 
         # Calculate total position size
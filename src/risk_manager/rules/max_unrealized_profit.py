@@ -3,7 +3,8 @@ RULE-005: Max Unrealized Profit (Per-Position Take Profit)
 
 Purpose: Close individual positions when unrealized profit hits target
 Category: Trade-by-Trade (Category 1)
-Trigger: UNREALIZED_PNL_UPDATE events (when P&L changes $10+)
+Trigger: UNREALIZED_PNL_UPDATE events (when P&L changes $10+ or a quote
+         crosses the limit's trigger price)
 Enforcement: Close ONLY the winning position(s) that hit target (no lockout)
 
 This rule monitors each open position individually for profit targets.
@@ -57,6 +58,12 @@ class MaxUnrealizedProfitRule(RiskRule):
         - Trader can immediately place new trades
     """
 
+    event_types = frozenset({
+        EventType.UNREALIZED_PNL_UPDATE,
+        EventType.POSITION_OPENED,
+        EventType.POSITION_UPDATED,  # Check P&L when position data changes
+    })
+
     def __init__(
         self,
         target: float,
@@ -109,11 +116,7 @@ class MaxUnrealizedProfitRule(RiskRule):
             return None
 
         # Only evaluate on relevant events
-        if event.event_type not in [
-            EventType.UNREALIZED_PNL_UPDATE,
-            EventType.POSITION_OPENED,
-            EventType.POSITION_UPDATED,  # Check P&L when position data changes
-        ]:
+        if event.event_type not in self.event_types:
             return None
 
         # Get trading integration for accessing position P&L
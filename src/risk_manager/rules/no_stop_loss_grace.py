@@ -48,6 +48,12 @@ class NoStopLossGraceRule(RiskRule):
     - Trade-by-trade enforcement (no lockout)
     """
 
+    event_types = frozenset({
+        EventType.POSITION_OPENED,
+        EventType.ORDER_PLACED,
+        EventType.POSITION_CLOSED,
+    })
+
     def __init__(
         self,
         grace_period_seconds: int = 10,
@@ -129,9 +135,9 @@ class NoStopLossGraceRule(RiskRule):
             None (no immediate violation)
         """
         # Extract position data
-        contract_id = event.data.get("contract_id")
-        symbol = event.data.get("symbol")
-        size = event.data.get("size", 0)
+        contract_id = event.contract_id
+        symbol = event.symbol
+        size = event.size or 0
 
         # Validate required fields
         if not contract_id:
@@ -179,10 +185,10 @@ class NoStopLossGraceRule(RiskRule):
             None
         """
         # Extract order data
-        contract_id = event.data.get("contract_id")
+        contract_id = event.contract_id
         order_type = event.data.get("type")
         stop_price = event.data.get("stopPrice")
-        symbol = event.data.get("symbol")
+        symbol = event.symbol
 
         # Validate required fields
         if not contract_id:
@@ -219,8 +225,8 @@ class NoStopLossGraceRule(RiskRule):
         Returns:
             None
         """
-        contract_id = event.data.get("contract_id")
-        symbol = event.data.get("symbol")
+        contract_id = event.contract_id
+        symbol = event.symbol
 
         if not contract_id:
             return None
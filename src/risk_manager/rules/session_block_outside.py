@@ -9,13 +9,14 @@ Trigger: POSITION_OPENED, POSITION_UPDATED events
 Enforcement: Hard lockout until next session start
 
 Configuration:
-    - global_session: Global session hours (start, end, timezone)
+    - global_session: Global session hours (start, end, timezone, allowed_days)
     - block_weekends: Block trading on Saturday/Sunday
     - lockout_outside_session: Set lockout when outside session
 
 Dependencies:
     - Lockout Manager: Set/clear hard lockouts
-    - Timezone Library: pytz/zoneinfo for timezone conversion
+    - Trading Calendar: precomputed session boundaries (holidays, early
+      closes, DST)
 """
 
 from datetime import datetime, time, timedelta
@@ -25,9 +26,11 @@ from zoneinfo import ZoneInfo
 from loguru import logger
 
 from risk_manager.core.events import EventType, RiskEvent
+from risk_manager.core.trading_calendar import TradingCalendar
 from risk_manager.rules.base import RiskRule
 
 if TYPE_CHECKING:
+    from risk_manager.core.clock import Clock
     from risk_manager.core.engine import RiskEngine
     from risk_manager.state.lockout_manager import LockoutManager
 
@@ -47,11 +50,13 @@ class SessionBlockOutsideRule(RiskRule):
     5. Auto-unlocks when session starts
 
     Features:
-    - Timezone-aware time checking (uses zoneinfo)
+    - Session check is a lookup in a precomputed TradingCalendar
     - Weekend blocking (configurable)
+    - Holidays and early closes (when a calendar built from
+      timers_config.yaml is passed in)
     - DST-aware (handles daylight saving time transitions)
     - Hard lockout until next session start
-    - Skip weekends when calculating next session start
+    - Skip weekends/holidays when calculating next session start
     - Multi-symbol support (applies to entire account)
 
     Example:
@@ -71,10 +76,17 @@ class SessionBlockOutsideRule(RiskRule):
         )
     """
 
+    event_types = frozenset({
+        EventType.POSITION_OPENED,
+        EventType.POSITION_UPDATED,
+    })
+
     def __init__(
         self,
         config: dict[str, Any],
         lockout_manager: "LockoutManager",
+        clock: Optional["Clock"] = None,
+        calendar: Optional[TradingCalendar] = None,
     ):
         """
         Initialize session block outside rule.
@@ -82,6 +94,9 @@ class SessionBlockOutsideRule(RiskRule):
         Args:
             config: Rule configuration dictionary from risk_config.yaml
             lockout_manager: Lockout manager instance for lockout management
+            clock: Optional clock for the session check (defaults to the system clock)
+            calendar: Optional trading calendar; its session hours, holidays
+                and early closes replace the session hours in ``config``
 
         Raises:
             ValueError: If time format is invalid or timezone is invalid
@@ -91,6 +106,7 @@ class SessionBlockOutsideRule(RiskRule):
         # Parse configuration
         self.enabled = config.get("enabled", True)
         self.lockout_manager = lockout_manager
+        self.clock = clock
 
         # Global session config
         global_session = config.get("global_session", {})
@@ -127,6 +143,28 @@ class SessionBlockOutsideRule(RiskRule):
         self.block_weekends = config.get("block_weekends", True)
         self.lockout_outside_session = config.get("lockout_outside_session", True)
 
+        # Session calendar
+        if calendar is None:
+            allowed_days = global_session.get(
+                "allowed_days", range(5) if self.block_weekends else range(7)
+            )
+            try:
+                calendar = TradingCalendar(
+                    reset_timezone=self.timezone_name,
+                    session_start=self.session_start,
+                    session_end=self.session_end,
+                    allowed_days=allowed_days,
+                    clock=clock,
+                )
+            except ValueError as e:
+                raise ValueError(f"Invalid session hours in config: {e}")
+        else:
+            self.session_start = calendar.session_start
+            self.session_end = calendar.session_end
+            self.timezone = calendar.session_timezone
+            self.timezone_name = self.timezone.key
+        self.calendar = calendar
+
         logger.info(
             f"SessionBlockOutsideRule initialized: "
             f"session={self.session_start.strftime('%H:%M')}-{self.session_end.strftime('%H:%M')} "
@@ -134,6 +172,12 @@ class SessionBlockOutsideRule(RiskRule):
             f"block_weekends={self.block_weekends}"
         )
 
+    def _now(self, tz) -> datetime:
+        """Current time in ``tz`` from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.now(tz)
+        return datetime.now(tz)
+
     async def evaluate(
         self, event: RiskEvent, engine: "RiskEngine"
     ) -> dict[str, Any] | None:
@@ -153,22 +197,18 @@ class SessionBlockOutsideRule(RiskRule):
         3. Extract account_id from event
         4. Check if account is already locked (skip if locked)
         5. Get current time in configured timezone
-        6. Check if weekend (if weekend blocking enabled)
-        7. Check if inside session hours
-        8. Return violation if outside hours or weekend
+        6. Check if inside a session (calendar lookup)
+        7. Return violation if weekend (when blocked), holiday or outside hours
         """
         if not self.enabled or not self.global_session_enabled:
             return None
 
         # Only evaluate position-related events
-        if event.event_type not in [
-            EventType.POSITION_OPENED,
-            EventType.POSITION_UPDATED,
-        ]:
+        if event.event_type not in self.event_types:
             return None
 
         # Extract account ID
-        account_id = event.data.get("account_id")
+        account_id = event.account_id
         if not account_id:
             logger.debug(f"Event missing account_id: {event.data}")
             return None
@@ -179,7 +219,10 @@ class SessionBlockOutsideRule(RiskRule):
             return None
 
         # Get current time in configured timezone
-        now = datetime.now(self.timezone)
+        now = self._now(self.timezone)
+        if self.calendar.is_session_open(now):
+            return None
+
         current_time = now.time()
         current_weekday = now.weekday()  # Monday=0, Sunday=6
 
@@ -204,43 +247,43 @@ class SessionBlockOutsideRule(RiskRule):
                 "next_session_start": next_session_start,
             }
 
-        # Check if inside session hours
-        # Session is [start, end), so end time is exclusive
-        is_inside_session = self.session_start <= current_time < self.session_end
-
-        if not is_inside_session:
-            # Determine if before or after session
-            if current_time < self.session_start:
-                reason = f"before session start ({self.session_start.strftime('%H:%M')})"
-            else:
-                reason = f"after session end ({self.session_end.strftime('%H:%M')})"
+        # Outside session hours (sessions are [start, end)) - find out why
+        close = self.calendar.close_time(now.date())
+        if self.calendar.is_holiday(now.date()):
+            reason = "a market holiday"
+        elif close is None:
+            day_name = now.strftime("%A")
+            reason = f"not a trading day ({day_name})"
+        elif current_time < self.session_start:
+            reason = f"before session start ({self.session_start.strftime('%H:%M')})"
+        elif close < self.session_end:
+            reason = f"after early close ({close.strftime('%H:%M')})"
+        else:
+            reason = f"after session end ({self.session_end.strftime('%H:%M')})"
 
-            logger.warning(
-                f"Trading attempted outside session hours for account {account_id}: "
-                f"Current: {current_time.strftime('%H:%M')} {self.timezone_name}, {reason}"
-            )
-
-            next_session_start = self._calculate_next_session_start(now)
-
-            return {
-                "rule": "SessionBlockOutsideRule",
-                "message": (
-                    f"Trading outside session hours: "
-                    f"{current_time.strftime('%H:%M')} {self.timezone_name} is {reason}"
-                ),
-                "account_id": account_id,
-                "current_time": now.isoformat(),
-                "current_time_str": current_time.strftime("%H:%M"),
-                "session_start": self.session_start.strftime("%H:%M"),
-                "session_end": self.session_end.strftime("%H:%M"),
-                "timezone": self.timezone_name,
-                "action": self.action,
-                "lockout_required": self.lockout_outside_session,
-                "next_session_start": next_session_start,
-            }
+        logger.warning(
+            f"Trading attempted outside session hours for account {account_id}: "
+            f"Current: {current_time.strftime('%H:%M')} {self.timezone_name}, {reason}"
+        )
 
-        # Inside session hours and not weekend
-        return None
+        next_session_start = self._calculate_next_session_start(now)
+
+        return {
+            "rule": "SessionBlockOutsideRule",
+            "message": (
+                f"Trading outside session hours: "
+                f"{current_time.strftime('%H:%M')} {self.timezone_name} is {reason}"
+            ),
+            "account_id": account_id,
+            "current_time": now.isoformat(),
+            "current_time_str": current_time.strftime("%H:%M"),
+            "session_start": self.session_start.strftime("%H:%M"),
+            "session_end": self.session_end.strftime("%H:%M"),
+            "timezone": self.timezone_name,
+            "action": self.action,
+            "lockout_required": self.lockout_outside_session,
+            "next_session_start": next_session_start,
+        }
 
     async def enforce(
         self, account_id: str, violation: dict[str, Any], engine: "RiskEngine"
@@ -292,18 +335,15 @@ class SessionBlockOutsideRule(RiskRule):
 
     def _calculate_next_session_start(self, current_time: datetime) -> datetime:
         """
-        Calculate next session start time, skipping weekends.
+        Calculate next session start time, skipping non-trading days.
 
         Args:
             current_time: Current datetime (timezone-aware)
 
         Returns:
-            Next session start datetime (timezone-aware)
+            Next session start datetime (timezone-aware, session timezone)
 
-        Logic:
-        1. If before session start today AND weekday → session start today
-        2. If after session start today OR weekend → next weekday session start
-        3. Skip weekends: Friday → Monday, Saturday → Monday, Sunday → Monday
+        The calendar skips weekends (when blocked) and holidays.
 
         Example:
             Current: Wednesday 7:00 AM ET → Next: Wednesday 9:30 AM ET
@@ -311,28 +351,11 @@ class SessionBlockOutsideRule(RiskRule):
             Current: Friday 5:00 PM ET → Next: Monday 9:30 AM ET
             Current: Saturday 11:00 AM ET → Next: Monday 9:30 AM ET
         """
-        now = current_time
-        current_time_only = now.time()
-        current_weekday = now.weekday()
-
-        # Calculate next session start
-        next_start = now.replace(
-            hour=self.session_start.hour,
-            minute=self.session_start.minute,
-            second=0,
-            microsecond=0,
-        )
-
-        # If before session start today AND weekday, use today
-        if current_time_only < self.session_start and current_weekday < 5:
-            return next_start
-
-        # Otherwise, go to next day
-        next_start = next_start + timedelta(days=1)
-
-        # Skip weekends: if next day is Saturday, go to Monday
-        while next_start.weekday() >= 5:  # Saturday=5, Sunday=6
-            next_start = next_start + timedelta(days=1)
+        next_start = self.calendar.next_session_open(current_time)
+        if next_start is None:
+            # No trading days configured - lock for a day at a time
+            next_start = current_time + timedelta(days=1)
+        next_start = next_start.astimezone(self.timezone)
 
         logger.debug(
             f"Next session start: {next_start.isoformat()} "
@@ -37,6 +37,13 @@ class SymbolBlocksRule(RiskRule):
     - NO lockout (can trade other symbols)
     """
 
+    event_types = frozenset({
+        EventType.ORDER_PLACED,
+        EventType.POSITION_OPENED,
+        EventType.POSITION_UPDATED,
+        EventType.ORDER_FILLED,
+    })
+
     def __init__(self, blocked_symbols: list[str], action: str = "close"):
         """
         Initialize Symbol Blocks rule.
@@ -96,16 +103,11 @@ class SymbolBlocksRule(RiskRule):
             return None
 
         # Only evaluate relevant events (orders and positions)
-        if event.event_type not in [
-            EventType.ORDER_PLACED,
-            EventType.POSITION_OPENED,
-            EventType.POSITION_UPDATED,
-            EventType.ORDER_FILLED,
-        ]:
+        if event.event_type not in self.event_types:
             return None
 
         # Extract symbol from event
-        symbol = event.data.get("symbol")
+        symbol = event.symbol
         if not symbol:
             # No symbol in event, nothing to check
             return None
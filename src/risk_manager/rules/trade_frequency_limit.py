@@ -20,7 +20,8 @@ Configuration:
 
 Dependencies:
     - Timer Manager: Set/clear cooldown timers
-    - Database: Track trade timestamps in rolling windows
+    - Trade Counter: In-memory rolling window counts (optional)
+    - Database: Durable trade history (counts come from here without a Trade Counter)
 """
 
 from datetime import datetime, timedelta
@@ -34,6 +35,7 @@ from risk_manager.rules.base import RiskRule
 if TYPE_CHECKING:
     from risk_manager.core.engine import RiskEngine
     from risk_manager.state.timer_manager import TimerManager
+    from risk_manager.state.trade_counter import TradeCounter
 
 
 class TradeFrequencyLimitRule(RiskRule):
@@ -55,6 +57,7 @@ class TradeFrequencyLimitRule(RiskRule):
     - Multi-account support (independent tracking)
     - Auto-unlock via timer expiry
     - Database persistence for crash recovery
+    - With a TradeCounter, counts are served from memory (no SQL per trade)
 
     Example:
         rule = TradeFrequencyLimitRule(
@@ -69,10 +72,15 @@ class TradeFrequencyLimitRule(RiskRule):
                 'per_session_breach': 3600    # 1 hour
             },
             timer_manager=timer_manager,
-            db=db
+            db=db,
+            trade_counter=trade_counter,
         )
     """
 
+    event_types = frozenset({
+        EventType.TRADE_EXECUTED,
+    })
+
     def __init__(
         self,
         limits: dict[str, int],
@@ -80,6 +88,7 @@ class TradeFrequencyLimitRule(RiskRule):
         timer_manager: "TimerManager",
         db: Any,
         action: str = "cooldown",
+        trade_counter: Optional["TradeCounter"] = None,
     ):
         """
         Initialize trade frequency limit rule.
@@ -96,6 +105,9 @@ class TradeFrequencyLimitRule(RiskRule):
             timer_manager: Timer manager instance for cooldown management
             db: Database instance for trade tracking
             action: Action to take on violation (default: "cooldown")
+            trade_counter: Optional in-memory counter. When given, each
+                TRADE_EXECUTED is recorded in it and counts come from memory
+                instead of the database.
 
         Raises:
             ValueError: If any limit is not positive
@@ -111,6 +123,7 @@ class TradeFrequencyLimitRule(RiskRule):
         self.cooldown_on_breach = cooldown_on_breach
         self.timer_manager = timer_manager
         self.db = db
+        self.trade_counter = trade_counter
 
         logger.info(
             f"TradeFrequencyLimitRule initialized: "
@@ -147,21 +160,32 @@ class TradeFrequencyLimitRule(RiskRule):
             return None
 
         # Only evaluate on trade execution events
-        if event.event_type != EventType.TRADE_EXECUTED:
+        if event.event_type not in self.event_types:
             return None
 
         # Extract account ID
-        account_id = event.data.get("account_id")
+        account_id = event.account_id
         if not account_id:
             logger.debug(f"Event missing account_id: {event.data}")
             return None
 
         # Get trade counts in rolling windows
         try:
+            if self.trade_counter is not None:
+                self.trade_counter.record(
+                    account_id,
+                    trade_id=event.data.get("trade_id"),
+                    symbol=event.data.get("symbol", ""),
+                    side=event.data.get("side", ""),
+                    quantity=event.data.get("quantity", 0),
+                    price=event.data.get("price", 0.0),
+                    realized_pnl=event.data.get("profitAndLoss"),
+                )
+
             # Check per-minute limit (highest priority - shortest cooldown)
             per_minute_limit = self.limits.get('per_minute', 0)
             if per_minute_limit > 0:
-                minute_count = self.db.get_trade_count(account_id, window=60)
+                minute_count = self._window_count(account_id, 60)
                 if minute_count > per_minute_limit:
                     logger.warning(
                         f"Per-minute trade limit breached for account {account_id}: "
@@ -184,7 +208,7 @@ class TradeFrequencyLimitRule(RiskRule):
             # Check per-hour limit (second priority)
             per_hour_limit = self.limits.get('per_hour', 0)
             if per_hour_limit > 0:
-                hour_count = self.db.get_trade_count(account_id, window=3600)
+                hour_count = self._window_count(account_id, 3600)
                 if hour_count > per_hour_limit:
                     logger.warning(
                         f"Per-hour trade limit breached for account {account_id}: "
@@ -207,7 +231,7 @@ class TradeFrequencyLimitRule(RiskRule):
             # Check per-session limit (lowest priority)
             per_session_limit = self.limits.get('per_session', 0)
             if per_session_limit > 0:
-                session_count = self.db.get_session_trade_count(account_id)
+                session_count = self._session_count(account_id)
                 if session_count > per_session_limit:
                     logger.warning(
                         f"Per-session trade limit breached for account {account_id}: "
@@ -234,6 +258,18 @@ class TradeFrequencyLimitRule(RiskRule):
         # No limit breached
         return None
 
+    def _window_count(self, account_id: Any, window: int) -> int:
+        """Trades in the last ``window`` seconds, from memory when possible."""
+        if self.trade_counter is not None:
+            return self.trade_counter.count(account_id, window)
+        return self.db.get_trade_count(account_id, window=window)
+
+    def _session_count(self, account_id: Any) -> int:
+        """Trades in the current session, from memory when possible."""
+        if self.trade_counter is not None:
+            return self.trade_counter.session_count(account_id)
+        return self.db.get_session_trade_count(account_id)
+
     async def enforce(
         self, account_id: str, violation: dict[str, Any], engine: "RiskEngine"
     ) -> None:
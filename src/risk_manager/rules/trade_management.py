@@ -57,6 +57,11 @@ class TradeManagementRule(RiskRule):
         - As price rises to 6010, trailing stop moves to 6008
     """
 
+    event_types = frozenset({
+        EventType.POSITION_OPENED,
+        EventType.POSITION_UPDATED,
+    })
+
     def __init__(
         self,
         config: Dict[str, Any],
@@ -124,14 +129,11 @@ class TradeManagementRule(RiskRule):
             return None
 
         # Only evaluate position events
-        if event.event_type not in [
-            EventType.POSITION_OPENED,
-            EventType.POSITION_UPDATED,
-        ]:
+        if event.event_type not in self.event_types:
             return None
 
         # Get symbol from event
-        symbol = event.data.get("symbol")
+        symbol = event.symbol
         if not symbol:
             return None
 
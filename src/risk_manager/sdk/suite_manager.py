@@ -5,13 +5,13 @@ Manages the Project-X SDK TradingSuite instances for multiple instruments.
 Handles initialization, reconnection, and cleanup.
 """
 
-import asyncio
 from typing import Any
 
 from loguru import logger
 from project_x_py import TradingSuite
 
 from risk_manager.core.events import EventBus
+from risk_manager.core.scheduler import Job, Scheduler
 
 
 class SuiteManager:
@@ -25,17 +25,23 @@ class SuiteManager:
     - Graceful shutdown
     """
 
-    def __init__(self, event_bus: EventBus):
+    HEALTH_CHECK_INTERVAL = 30.0  # Seconds between health checks
+
+    def __init__(self, event_bus: EventBus, scheduler: Scheduler | None = None):
         """
         Initialize the suite manager.
 
         Args:
             event_bus: Event bus for publishing SDK events
+            scheduler: Optional shared scheduler for the health check job
+                (a private one is started with the manager if omitted)
         """
         self.event_bus = event_bus
         self.suites: dict[str, TradingSuite] = {}
         self.running = False
-        self._health_check_task: asyncio.Task[Any] | None = None
+        self.scheduler = scheduler
+        self._owns_scheduler = scheduler is None
+        self._health_check_job: Job | None = None
 
         logger.info("SuiteManager initialized")
 
@@ -133,21 +139,26 @@ class SuiteManager:
         self.running = True
         logger.info("SuiteManager started")
 
-        # Start health check task
-        self._health_check_task = asyncio.create_task(self._health_check_loop())
+        # Register health check job (first check right away)
+        if self._health_check_job and not self._health_check_job.done():
+            return
+        if self.scheduler is None:
+            self.scheduler = Scheduler()
+        self.scheduler.start()
+        self._health_check_job = self.scheduler.every(
+            "suite_health_check", self.HEALTH_CHECK_INTERVAL, self._check_health, first_delay=0
+        )
 
     async def stop(self) -> None:
         """Stop the suite manager and disconnect all suites."""
         self.running = False
         logger.info("Stopping SuiteManager...")
 
-        # Cancel health check task
-        if self._health_check_task:
-            self._health_check_task.cancel()
-            try:
-                await self._health_check_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel health check job
+        if self._health_check_job:
+            self._health_check_job.cancel()
+        if self._owns_scheduler and self.scheduler:
+            await self.scheduler.stop()
 
         # Disconnect all suites
         for symbol in list(self.suites.keys()):
@@ -155,33 +166,21 @@ class SuiteManager:
 
         logger.success("SuiteManager stopped")
 
-    async def _health_check_loop(self) -> None:
-        """Background task to monitor suite health."""
-        while self.running:
+    async def _check_health(self) -> None:
+        """Scheduler job - logs suites whose realtime connection dropped."""
+        for symbol, suite in self.suites.items():
             try:
-                # Check each suite's health
-                for symbol, suite in self.suites.items():
-                    try:
-                        # Check if realtime connection is active
-                        if hasattr(suite, "realtime") and suite.realtime:
-                            if not suite.realtime.is_connected:
-                                logger.warning(
-                                    f"TradingSuite for {symbol} disconnected, attempting reconnect..."
-                                )
-                                # SDK handles auto-reconnection
-                                # We just log for visibility
-
-                    except Exception as e:
-                        logger.error(f"Health check failed for {symbol}: {e}")
-
-                # Check every 30 seconds
-                await asyncio.sleep(30)
-
-            except asyncio.CancelledError:
-                break
+                # Check if realtime connection is active
+                if hasattr(suite, "realtime") and suite.realtime:
+                    if not suite.realtime.is_connected:
+                        logger.warning(
+                            f"TradingSuite for {symbol} disconnected, attempting reconnect..."
+                        )
+                        # SDK handles auto-reconnection
+                        # We just log for visibility
+
             except Exception as e:
-                logger.error(f"Health check loop error: {e}")
-                await asyncio.sleep(5)
+                logger.error(f"Health check failed for {symbol}: {e}")
 
     async def get_health_status(self) -> dict[str, Any]:
         """
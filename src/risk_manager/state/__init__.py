@@ -5,14 +5,19 @@ Handles SQLite-based state persistence for:
 - Daily P&L tracking (crash recovery)
 - Lockout states (hard lockouts)
 - Cooldown timers (temporary lockouts)
-- Trade history
+- Trade history (with in-memory frequency windows)
 - Daily/weekly resets (automated)
+- Parquet archive of closed trading days, with polars analytics
 """
 
+from risk_manager.state.analytics import TradeAnalytics
+from risk_manager.state.archive import TradeArchive
 from risk_manager.state.database import Database
+from risk_manager.state.event_journal import EventJournal, EventJournalReader
 from risk_manager.state.lockout_manager import LockoutManager
 from risk_manager.state.pnl_tracker import PnLTracker
 from risk_manager.state.reset_scheduler import ResetScheduler
 from risk_manager.state.timer_manager import TimerManager
+from risk_manager.state.trade_counter import TradeCounter
 
-__all__ = ["Database", "LockoutManager", "PnLTracker", "ResetScheduler", "TimerManager"]
+__all__ = ["Database", "EventJournal", "EventJournalReader", "LockoutManager", "PnLTracker", "ResetScheduler", "TimerManager", "TradeAnalytics", "TradeArchive", "TradeCounter"]
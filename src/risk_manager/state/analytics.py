@@ -0,0 +1,252 @@
+"""
+Trade Analytics - History Queries over SQLite and the Parquet Archive
+
+Read-only analytics for the admin CLI and tooling. Each query is a lazy
+polars plan over the archived Parquet files (pruned by account and month)
+plus the rows still in SQLite, so results cover the full history without
+scanning the live tables with SELECT *.
+
+Queries:
+- pnl_curve(): daily realized P&L, cumulative P&L and drawdown
+- symbol_stats(): trades, contracts, P&L and win rate per symbol
+- violation_frequency(): lockouts/cooldowns per rule
+- recent_trades() / lockout_history(): newest rows first
+
+Example:
+    ```python
+    analytics = TradeAnalytics(database=db, archive_dir="data/archive")
+    analytics.pnl_curve("123", weeks=8)
+    analytics.symbol_stats(weeks=4)
+    ```
+"""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from risk_manager.core.clock import Clock
+from risk_manager.state.archive import ARCHIVE_SCHEMAS, ARCHIVE_TIME_COLUMNS, archive_files
+from risk_manager.state.database import Database, epoch_us
+
+_DAILY_PNL_SCHEMA = {
+    "account_id": pl.Utf8,
+    "date": pl.Utf8,
+    "realized_pnl": pl.Float64,
+    "trade_count": pl.Int64,
+}
+
+
+class TradeAnalytics:
+    """
+    History analytics over the live database and its Parquet archive.
+
+    All methods return eager DataFrames; the work is planned lazily so
+    filters are pushed into the Parquet scans.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        archive_dir: str | Path,
+        clock: Clock | None = None,
+    ):
+        """
+        Initialize trade analytics.
+
+        Args:
+            database: Live database
+            archive_dir: Root directory written by TradeArchive
+            clock: Optional clock (defaults to the system clock)
+        """
+        self.database = database
+        self.archive_dir = Path(archive_dir)
+        self.clock = clock
+
+    def _now(self) -> datetime:
+        """Current UTC time from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.now(UTC)
+        return datetime.now(UTC)
+
+    def _since_us(self, weeks: float | None) -> int | None:
+        """Epoch-microsecond start of a look-back of ``weeks`` (None = all)."""
+        if weeks is None:
+            return None
+        return epoch_us(self._now() - timedelta(weeks=weeks))
+
+    def scan(
+        self,
+        table: str,
+        account_id: Any = None,
+        since_us: int | None = None,
+    ) -> pl.LazyFrame:
+        """
+        Lazy scan of an archived table: Parquet files plus live SQLite rows.
+
+        Args:
+            table: One of the archived tables (trades, reset_log, lockout_log)
+            account_id: Only this account (default: all)
+            since_us: Only rows at or after this epoch-microsecond time
+
+        Returns:
+            LazyFrame with the table's archive schema
+        """
+        schema = ARCHIVE_SCHEMAS[table]
+        time_column = ARCHIVE_TIME_COLUMNS[table]
+
+        conditions: list[str] = []
+        params: list[Any] = []
+        if account_id is not None:
+            conditions.append("account_id = ?")
+            params.append(str(account_id))
+        if since_us is not None:
+            conditions.append(f"{time_column} >= ?")
+            params.append(since_us)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        rows = self.database.execute(f"SELECT {', '.join(schema)} FROM {table}{where}", tuple(params))
+        frames = [pl.LazyFrame([tuple(row) for row in rows], schema=schema, orient="row")]
+
+        files = archive_files(self.archive_dir, table, account_id, since_us)
+        if files:
+            archived = pl.scan_parquet(files).cast(schema)
+            if account_id is not None:
+                archived = archived.filter(pl.col("account_id") == str(account_id))
+            if since_us is not None:
+                archived = archived.filter(pl.col(time_column) >= since_us)
+            frames.insert(0, archived)
+
+        return pl.concat(frames, how="vertical")
+
+    def pnl_curve(self, account_id: Any = None, weeks: float | None = 4) -> pl.DataFrame:
+        """
+        Daily realized P&L curve from the daily_pnl rollup.
+
+        Args:
+            account_id: Only this account (default: all accounts)
+            weeks: Look-back in weeks (None = all history)
+
+        Returns:
+            DataFrame with account_id, date, realized_pnl, trade_count,
+            cumulative_pnl and drawdown (cumulative minus its running peak),
+            sorted by account and date
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        if account_id is not None:
+            conditions.append("account_id = ?")
+            params.append(str(account_id))
+        if weeks is not None:
+            conditions.append("date >= ?")
+            params.append((self._now() - timedelta(weeks=weeks)).date().isoformat())
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        rows = self.database.execute(
+            f"SELECT account_id, date, realized_pnl, trade_count FROM daily_pnl{where}",
+            tuple(params),
+        )
+        cumulative = pl.col("realized_pnl").cum_sum().over("account_id")
+
+        return (
+            pl.LazyFrame([tuple(row) for row in rows], schema=_DAILY_PNL_SCHEMA, orient="row")
+            .sort("account_id", "date")
+            .with_columns(cumulative.alias("cumulative_pnl"))
+            .with_columns(
+                (pl.col("cumulative_pnl") - pl.col("cumulative_pnl").cum_max().over("account_id"))
+                .alias("drawdown")
+            )
+            .collect()
+        )
+
+    def symbol_stats(self, account_id: Any = None, weeks: float | None = 4) -> pl.DataFrame:
+        """
+        Per-symbol trade statistics.
+
+        Args:
+            account_id: Only this account (default: all accounts)
+            weeks: Look-back in weeks (None = all history)
+
+        Returns:
+            DataFrame with symbol, trades, contracts, realized_pnl, avg_pnl,
+            wins, losses and win_rate (of trades with non-zero P&L), most
+            traded first
+        """
+        pnl = pl.col("realized_pnl")
+        wins = (pnl > 0).sum()
+        losses = (pnl < 0).sum()
+
+        return (
+            self.scan("trades", account_id, self._since_us(weeks))
+            .group_by("symbol")
+            .agg(
+                pl.len().alias("trades"),
+                pl.col("quantity").sum().alias("contracts"),
+                pnl.sum().alias("realized_pnl"),
+                pnl.mean().alias("avg_pnl"),
+                wins.alias("wins"),
+                losses.alias("losses"),
+                (wins / (wins + losses)).alias("win_rate"),
+            )
+            .sort(["trades", "symbol"], descending=[True, False])
+            .collect()
+        )
+
+    def violation_frequency(self, account_id: Any = None, weeks: float | None = 4) -> pl.DataFrame:
+        """
+        How often each rule locked an account out.
+
+        Args:
+            account_id: Only this account (default: all accounts)
+            weeks: Look-back in weeks (None = all history)
+
+        Returns:
+            DataFrame with rule_id, violations, accounts, per_day (averaged
+            over the look-back) and last_at, most frequent first
+        """
+        days = weeks * 7 if weeks is not None else None
+
+        return (
+            self.scan("lockout_log", account_id, self._since_us(weeks))
+            .group_by("rule_id")
+            .agg(
+                pl.len().alias("violations"),
+                pl.col("account_id").n_unique().alias("accounts"),
+                pl.col("locked_at").max().alias("last_at"),
+            )
+            .with_columns(
+                (pl.col("violations") / days).alias("per_day")
+                if days
+                else pl.lit(None, dtype=pl.Float64).alias("per_day")
+            )
+            .select("rule_id", "violations", "accounts", "per_day", "last_at")
+            .sort(["violations", "rule_id"], descending=[True, False])
+            .collect()
+        )
+
+    def recent_trades(self, account_id: Any = None, limit: int = 20) -> pl.DataFrame:
+        """
+        Newest trades across the live database and the archive.
+
+        Args:
+            account_id: Only this account (default: all accounts)
+            limit: Maximum rows
+
+        Returns:
+            DataFrame with the trades archive schema, newest first
+        """
+        return self.scan("trades", account_id).top_k(limit, by="ts_us").collect()
+
+    def lockout_history(self, account_id: Any = None, limit: int = 50) -> pl.DataFrame:
+        """
+        Newest lockouts/cooldowns across the live database and the archive.
+
+        Args:
+            account_id: Only this account (default: all accounts)
+            limit: Maximum rows
+
+        Returns:
+            DataFrame with the lockout_log archive schema, newest first
+        """
+        return self.scan("lockout_log", account_id).top_k(limit, by="locked_at_us").collect()
@@ -0,0 +1,288 @@
+"""
+Trade Archive - Columnar Compaction of Closed Trading Days
+
+Moves history that the live system no longer reads out of SQLite into
+Parquet files, so ``trades``, ``reset_log`` and ``lockout_log`` stop
+growing without bound. ``daily_pnl`` is the per-account, per-day rollup
+and stays in SQLite.
+
+Layout:
+- ``<archive_dir>/<table>/<account_id>/<YYYY-MM>.parquet``
+- One file per account per month (UTC month of the row's epoch column)
+- Re-running a compaction is safe: files are merged on the table's
+  natural key and replaced atomically before rows are deleted from SQLite
+
+Key Features:
+- Only closed trading days move: everything before the start of the
+  trading day ``retain_days`` back from the current one
+- Rows are read, written and deleted in batches of ``batch_size``; each
+  delete is its own short transaction on the writer connection
+- Files are read by TradeAnalytics through lazy polars scans
+- With a scheduler, compaction runs as a daily job COMPACTION_DELAY
+  seconds after each trading-day reset (off the event loop)
+- Account partitions are percent-encoded, so distinct ids never share a
+  directory
+
+Example:
+    ```python
+    archive = TradeArchive(database=db, archive_dir="data/archive")
+    archive.compact()          # {"trades": 1200, "reset_log": 4, ...}
+    ```
+"""
+
+import asyncio
+import os
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+import polars as pl
+from loguru import logger
+
+from risk_manager.core.clock import Clock
+from risk_manager.core.scheduler import Job, Scheduler
+from risk_manager.state.database import Database, epoch_us
+
+# Parquet schema per archived table (column order = SELECT order)
+ARCHIVE_SCHEMAS: dict[str, dict[str, Any]] = {
+    "trades": {
+        "account_id": pl.Utf8,
+        "trade_id": pl.Utf8,
+        "symbol": pl.Utf8,
+        "side": pl.Utf8,
+        "quantity": pl.Int64,
+        "price": pl.Float64,
+        "realized_pnl": pl.Float64,
+        "timestamp": pl.Utf8,
+        "ts_us": pl.Int64,
+        "trading_day": pl.Utf8,
+    },
+    "reset_log": {
+        "account_id": pl.Utf8,
+        "reset_type": pl.Utf8,
+        "reset_time": pl.Utf8,
+        "triggered_at": pl.Utf8,
+        "triggered_at_us": pl.Int64,
+    },
+    "lockout_log": {
+        "account_id": pl.Utf8,
+        "rule_id": pl.Utf8,
+        "reason": pl.Utf8,
+        "locked_at": pl.Utf8,
+        "locked_at_us": pl.Int64,
+        "expires_at": pl.Utf8,
+    },
+}
+
+# Epoch-microsecond column that decides when a row is closed
+ARCHIVE_TIME_COLUMNS = {
+    "trades": "ts_us",
+    "reset_log": "triggered_at_us",
+    "lockout_log": "locked_at_us",
+}
+
+# Natural key used to merge a batch into an existing month file
+_ARCHIVE_KEYS = {
+    "trades": ["account_id", "trade_id"],
+    "reset_log": ["account_id", "reset_type", "reset_time"],
+    "lockout_log": ["account_id", "rule_id", "locked_at"],
+}
+
+def partition_name(account_id: Any) -> str:
+    """
+    Directory name for an account's partition.
+
+    Percent-encoded (dots included, so "." and ".." stay inside the table
+    directory), which keeps the mapping one-to-one: "a/b" and "a_b" get
+    different directories. An empty id maps to "%", which quote() never
+    produces.
+    """
+    return quote(str(account_id), safe="").replace(".", "%2E") or "%"
+
+
+def archive_files(
+    archive_dir: str | Path,
+    table: str,
+    account_id: Any = None,
+    since_us: int | None = None,
+) -> list[Path]:
+    """
+    Parquet files of an archived table, pruned by account and month.
+
+    Args:
+        archive_dir: Archive root
+        table: Archived table name
+        account_id: Only this account's partition (default: all)
+        since_us: Skip months that end before this epoch-microsecond time
+
+    Returns:
+        Matching files, sorted
+    """
+    root = Path(archive_dir) / table
+    accounts = "*" if account_id is None else partition_name(account_id)
+    files = sorted(root.glob(f"{accounts}/*.parquet"))
+
+    if since_us is not None:
+        since_month = datetime.fromtimestamp(since_us / 1e6, UTC).strftime("%Y-%m")
+        files = [path for path in files if path.stem >= since_month]
+    return files
+
+
+class TradeArchive:
+    """
+    Compacts closed trading days from SQLite into monthly Parquet files.
+    """
+
+    TABLES = tuple(ARCHIVE_SCHEMAS)
+    DEFAULT_BATCH_SIZE = 50_000
+    COMPACTION_DELAY = 300.0  # Seconds after the trading-day reset the daily job runs
+    JOB_NAME = "archive_compact"
+
+    def __init__(
+        self,
+        database: Database,
+        archive_dir: str | Path,
+        clock: Clock | None = None,
+        retain_days: int = 1,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        scheduler: Scheduler | None = None,
+    ):
+        """
+        Initialize trade archive.
+
+        Args:
+            database: Live database to compact
+            archive_dir: Root directory for Parquet files
+            clock: Optional clock (defaults to the system clock)
+            retain_days: Closed trading days to keep in SQLite (1 keeps the
+                previous session, which rolling windows can still reach)
+            batch_size: Rows per read/write/delete batch
+            scheduler: Optional shared scheduler; if given, compact() runs
+                daily, COMPACTION_DELAY seconds after the trading-day reset
+        """
+        self.database = database
+        self.archive_dir = Path(archive_dir)
+        self.clock = clock
+        self.retain_days = retain_days
+        self.batch_size = batch_size
+
+        self._job: Job | None = None
+        if scheduler is not None:
+            self._job = scheduler.call_later(
+                self.JOB_NAME, self._seconds_until_compaction(), self._on_compaction
+            )
+
+    def _now(self) -> datetime:
+        """Current UTC time from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.now(UTC)
+        return datetime.now(UTC)
+
+    def cutoff(self) -> datetime:
+        """
+        Start of the oldest trading day kept in SQLite.
+
+        Rows before this moment belong to closed trading days and are
+        archived by compact().
+        """
+        today = date.fromisoformat(self.database.trading_day(self._now()))
+        oldest_kept = today - timedelta(days=self.retain_days)
+        return self.database.trading_day_start(oldest_kept.isoformat())
+
+    def _seconds_until_compaction(self) -> float:
+        """Delay of the daily job: COMPACTION_DELAY after the next trading-day reset."""
+        now = self._now()
+        tomorrow = date.fromisoformat(self.database.trading_day(now)) + timedelta(days=1)
+        reset = self.database.trading_day_start(tomorrow.isoformat())
+        return (reset - now).total_seconds() + self.COMPACTION_DELAY
+
+    async def _on_compaction(self) -> None:
+        """Daily job - compacts in a worker thread, then re-arms for the next day."""
+        try:
+            await asyncio.to_thread(self.compact)
+        except Exception as e:
+            logger.error(f"Archive compaction failed: {e}", exc_info=True)
+        finally:
+            if self._job is not None and not self._job.cancelled():
+                self._job.reschedule(self._seconds_until_compaction())
+
+    def compact(self, tables: Iterable[str] | None = None) -> dict[str, int]:
+        """
+        Move closed trading days into Parquet.
+
+        Args:
+            tables: Tables to compact (default: all of TABLES)
+
+        Returns:
+            Rows archived per table
+        """
+        cutoff_us = epoch_us(self.cutoff())
+        archived = {}
+
+        for table in tables or self.TABLES:
+            if table not in ARCHIVE_SCHEMAS:
+                raise ValueError(f"Table {table!r} is not archivable (archivable: {self.TABLES})")
+            archived[table] = self._compact_table(table, cutoff_us)
+
+        total = sum(archived.values())
+        if total:
+            logger.info(f"Archived {total} row(s) to {self.archive_dir}: {archived}")
+        return archived
+
+    def _compact_table(self, table: str, cutoff_us: int) -> int:
+        """Archive one table in batches. Returns rows moved."""
+        schema = ARCHIVE_SCHEMAS[table]
+        time_column = ARCHIVE_TIME_COLUMNS[table]
+        query = (
+            f"SELECT id, {', '.join(schema)} FROM {table} "
+            f"WHERE {time_column} < ? ORDER BY id LIMIT ?"
+        )
+        moved = 0
+
+        while True:
+            rows = self.database.execute(query, (cutoff_us, self.batch_size))
+            if not rows:
+                return moved
+
+            batch = pl.DataFrame(
+                [tuple(row) for row in rows],
+                schema={"id": pl.Int64, **schema},
+                orient="row",
+            )
+            self._write_batch(table, batch.drop("id"))
+
+            # Parquet is durable before anything leaves SQLite
+            with self.database.connection() as conn:
+                conn.executemany(
+                    f"DELETE FROM {table} WHERE id = ?",
+                    [(row_id,) for row_id in batch["id"]],
+                )
+                conn.commit()
+            moved += batch.height
+
+    def _write_batch(self, table: str, batch: pl.DataFrame) -> None:
+        """Merge a batch into its account/month files."""
+        time_column = ARCHIVE_TIME_COLUMNS[table]
+        batch = batch.with_columns(
+            pl.from_epoch(pl.col(time_column).fill_null(0), time_unit="us")
+            .dt.strftime("%Y-%m")
+            .alias("_month")
+        )
+
+        for (account_id, month), part in batch.partition_by(
+            ["account_id", "_month"], as_dict=True
+        ).items():
+            path = self.archive_dir / table / partition_name(account_id) / f"{month}.parquet"
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            part = part.drop("_month")
+            if path.exists():
+                part = pl.concat([pl.read_parquet(path), part], how="vertical_relaxed")
+            part = part.unique(subset=_ARCHIVE_KEYS[table], keep="last", maintain_order=True)
+            part = part.sort(time_column)
+
+            tmp = path.with_suffix(".parquet.tmp")
+            part.write_parquet(tmp)
+            os.replace(tmp, path)
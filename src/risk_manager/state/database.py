@@ -3,16 +3,109 @@ SQLite Database Manager
 
 Handles database connection, schema creation, and migrations.
 Thread-safe connection management.
+
+File-backed databases keep long-lived connections: one writer (serialized
+by a lock) and a small pool of readers. All of them run in WAL mode with
+synchronous=NORMAL, so readers never wait on the writer and a commit costs
+a WAL append instead of a full fsync of the main file.
+
+Writes that don't need an answer go through submit_write(): the statement
+is queued and a writer thread applies queued statements in group commits
+(one transaction per batch), so the event loop never waits on disk. Every
+synchronous call (execute, execute_one, execute_write, connection) first
+waits for writes submitted before it, so callers always read their own
+writes. flush() is the explicit barrier for shutdown and tests.
+
+Schema v2 adds integer epoch-microsecond columns next to the ISO TEXT
+times, and a ``trading_day`` on trades that follows the daily reset
+(17:00 America/New_York by default) instead of UTC midnight. Range and
+session queries use those columns through covering indexes.
 """
 
+import queue
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from datetime import time as dt_time
 from pathlib import Path
 from typing import Any, Generator
+from zoneinfo import ZoneInfo
 
 from loguru import logger
 
+from risk_manager.core.clock import Clock
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# SQL fallback for writers that only fill the ISO TEXT column (ms precision)
+_SQL_EPOCH_US = "CAST(ROUND((julianday({column}) - 2440587.5) * 86400000.0) AS INTEGER) * 1000"
+
+# (table, ISO TEXT column, epoch-microsecond column) added in schema v2
+_V2_EPOCH_COLUMNS = (
+    ("trades", "timestamp", "ts_us"),
+    ("lockouts", "locked_at", "locked_at_us"),
+    ("lockouts", "expires_at", "expires_at_us"),
+    ("timers", "expires_at", "expires_at_us"),
+    ("reset_log", "triggered_at", "triggered_at_us"),
+)
+
+
+def _as_datetime(moment: datetime | str) -> datetime:
+    """Parse an ISO string if needed; naive values are taken as UTC."""
+    if isinstance(moment, str):
+        moment = datetime.fromisoformat(moment)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+def epoch_us(moment: datetime | str) -> int:
+    """
+    Convert a datetime (or ISO string) to integer microseconds since the epoch.
+
+    Naive values are taken as UTC, like everywhere else in the database.
+    """
+    return (_as_datetime(moment) - _EPOCH) // timedelta(microseconds=1)
+
+
+def trading_day(
+    moment: datetime | str,
+    reset_time: str = "17:00",
+    timezone_name: str = "America/New_York",
+) -> str:
+    """
+    Trading day a moment belongs to.
+
+    The trading day rolls over at ``reset_time`` in ``timezone_name``: a
+    trade at 18:00 ET on Monday belongs to Tuesday's session.
+
+    Returns:
+        ISO date of the trading day
+    """
+    local = _as_datetime(moment).astimezone(ZoneInfo(timezone_name))
+    hour, minute = map(int, reset_time.split(":"))
+    if local.time() >= dt_time(hour, minute):
+        return (local.date() + timedelta(days=1)).isoformat()
+    return local.date().isoformat()
+
+
+def trading_day_start(
+    day: str,
+    reset_time: str = "17:00",
+    timezone_name: str = "America/New_York",
+) -> datetime:
+    """
+    First moment (UTC) of a trading day: the reset on the previous calendar day.
+
+    Inverse of trading_day(): ``trading_day(trading_day_start(d)) == d``.
+    """
+    hour, minute = map(int, reset_time.split(":"))
+    previous = datetime.fromisoformat(day).date() - timedelta(days=1)
+    local = datetime.combine(previous, dt_time(hour, minute), ZoneInfo(timezone_name))
+    return local.astimezone(timezone.utc)
+
 
 class Database:
     """
@@ -25,21 +118,74 @@ class Database:
     - Query helpers
     """
 
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 3
+
+    # Connection tuning for file-backed databases
+    READER_POOL_SIZE = 4
+    CACHE_SIZE_KIB = 8192  # Page cache per connection
+    STATEMENT_CACHE_SIZE = 256  # Prepared statements kept per connection
+    BUSY_TIMEOUT_MS = 5000
+
+    # Group commit for submit_write()
+    COMMIT_BATCH_SIZE = 256  # Max statements per transaction
+    COMMIT_INTERVAL = 0.002  # Max seconds a batch waits for more statements
 
-    def __init__(self, db_path: str | Path):
+    BACKFILL_BATCH_SIZE = 1000  # Rows per transaction when backfilling v2 columns
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        clock: Clock | None = None,
+        reader_pool_size: int | None = None,
+        reset_time: str = "17:00",
+        reset_timezone: str = "America/New_York",
+    ):
         """
         Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file or ":memory:" for in-memory
+            clock: Optional clock for trade timestamps and windows
+                (defaults to the system clock)
+            reader_pool_size: Max pooled read connections for file-backed
+                databases (default: READER_POOL_SIZE)
+            reset_time: Daily reset (HH:MM) where the trading day rolls over
+            reset_timezone: Timezone of reset_time
         """
+        self.clock = clock
+        self.reset_time = reset_time
+        self.reset_timezone = reset_timezone
         self.db_path = Path(db_path) if db_path != ":memory:" else db_path
         self._persistent_conn = None  # For in-memory databases
 
+        # Long-lived connections for file-backed databases (opened lazily)
+        self._writer_conn: sqlite3.Connection | None = None
+        self._write_lock = threading.RLock()
+        self._pool_lock = threading.Lock()
+        self._reader_pool_size = reader_pool_size or self.READER_POOL_SIZE
+        self._idle_readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._readers: list[sqlite3.Connection] = []
+
+        # Write-behind queue (writer thread started on first submit_write)
+        self._write_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer_thread: threading.Thread | None = None
+        self._writes_done = threading.Condition()
+        self._submitted_seq = 0  # Last sequence number handed out
+        self._applied_seq = 0  # Last sequence number committed (or failed)
+        self._flush_waiters = 0
+
+        # Write-behind stats
+        self._commits = 0
+        self._write_errors = 0
+        self._largest_batch = 0
+
         # For in-memory databases, keep a persistent connection
         if db_path == ":memory:":
-            self._persistent_conn = sqlite3.connect(":memory:")
+            self._persistent_conn = sqlite3.connect(
+                ":memory:",
+                check_same_thread=False,
+                cached_statements=self.STATEMENT_CACHE_SIZE,
+            )
             self._persistent_conn.row_factory = sqlite3.Row
             logger.debug("Using persistent in-memory database connection")
         else:
@@ -48,10 +194,85 @@ class Database:
         self._init_schema()
         logger.info(f"Database initialized at {self.db_path}")
 
+    def _now(self) -> datetime:
+        """Current UTC time from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.now(timezone.utc)
+        return datetime.now(timezone.utc)
+
+    def trading_day(self, moment: datetime | str | None = None) -> str:
+        """
+        Trading day of ``moment`` (default: now) under the configured reset.
+
+        Returns:
+            ISO date of the trading day
+        """
+        return trading_day(
+            self._now() if moment is None else moment, self.reset_time, self.reset_timezone
+        )
+
+    def trading_day_start(self, day: str) -> datetime:
+        """First moment (UTC) of trading day ``day`` under the configured reset."""
+        return trading_day_start(day, self.reset_time, self.reset_timezone)
+
     def _ensure_directory(self) -> None:
         """Ensure database directory exists."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Open a tuned connection to the database file.
+
+        Returns:
+            Connection in WAL mode with row factory and statement cache
+        """
+        conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,  # Pooled connections move between threads
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+            timeout=self.BUSY_TIMEOUT_MS / 1000,
+        )
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{self.CACHE_SIZE_KIB}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}")
+        return conn
+
+    @contextmanager
+    def _reader(self) -> Generator[sqlite3.Connection, None, None]:
+        """
+        Borrow a read connection from the pool.
+
+        In-memory databases have a single connection, shared with writes.
+        File-backed databases open readers on demand up to the pool size;
+        callers beyond that wait for one to be returned.
+        """
+        if self._persistent_conn:
+            with self._write_lock:
+                yield self._persistent_conn
+            return
+
+        try:
+            conn = self._idle_readers.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._pool_lock:
+                if len(self._readers) < self._reader_pool_size:
+                    conn = self._open_connection()
+                    self._readers.append(conn)
+            if conn is None:
+                conn = self._idle_readers.get()
+
+        try:
+            yield conn
+        finally:
+            # Never hand back a connection holding a read snapshot
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle_readers.put(conn)
+
     def _init_schema(self) -> None:
         """Initialize database schema if not exists."""
         with self.connection() as conn:
@@ -73,6 +294,9 @@ class Database:
             if current_version < self.SCHEMA_VERSION:
                 self._apply_migrations(conn, current_version)
 
+            # Trades written before v2, or by tools that bypass this class
+            self._backfill_v2(conn)
+
     def _apply_migrations(self, conn: sqlite3.Connection, from_version: int) -> None:
         """
         Apply database migrations.
@@ -88,7 +312,25 @@ class Database:
             self._migrate_to_v1(cursor)
             cursor.execute(
                 "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
-                (1, datetime.now(timezone.utc).isoformat()),
+                (1, self._now().isoformat()),
+            )
+            conn.commit()
+
+        if from_version < 2:
+            logger.info("Applying schema migration: v2 (epoch columns, trading_day, covering indexes)")
+            self._migrate_to_v2(cursor)
+            cursor.execute(
+                "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (2, self._now().isoformat()),
+            )
+            conn.commit()
+
+        if from_version < 3:
+            logger.info("Applying schema migration: v3 (lockout_log)")
+            self._migrate_to_v3(cursor)
+            cursor.execute(
+                "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (3, self._now().isoformat()),
             )
             conn.commit()
 
@@ -195,13 +437,312 @@ class Database:
 
         logger.success("Schema v1 applied successfully")
 
+    def _migrate_to_v2(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Apply v2 schema.
+
+        Changes:
+        - Integer epoch-microsecond column next to each ISO TEXT time that is
+          queried by range; triggers fill it for writers that only set the
+          TEXT column
+        - trades.trading_day, following the daily reset instead of UTC midnight
+        - Covering indexes for the frequency, session, daily-P&L and lockout
+          queries; the TEXT-timestamp and duplicate daily_pnl indexes go away
+
+        Existing rows are filled afterwards by _backfill_v2().
+        """
+        for table, text_column, us_column in _V2_EPOCH_COLUMNS:
+            existing = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+            if us_column not in existing:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {us_column} INTEGER")
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_{us_column}
+                AFTER INSERT ON {table}
+                WHEN NEW.{us_column} IS NULL AND NEW.{text_column} IS NOT NULL
+                BEGIN
+                    UPDATE {table}
+                    SET {us_column} = {_SQL_EPOCH_US.format(column="NEW." + text_column)}
+                    WHERE id = NEW.id;
+                END
+            """)
+
+        existing = {row[1] for row in cursor.execute("PRAGMA table_info(trades)")}
+        if "trading_day" not in existing:
+            cursor.execute("ALTER TABLE trades ADD COLUMN trading_day TEXT")
+
+        # Rolling-window counts: WHERE account_id = ? AND ts_us >= ?
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_trades_account_ts_us ON trades(account_id, ts_us)"
+        )
+        # Session counts: WHERE account_id = ? AND trading_day = ?
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_trades_account_trading_day "
+            "ON trades(account_id, trading_day)"
+        )
+        # Rows still waiting for a trading_day (kept tiny by the backfill)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_trades_trading_day_pending "
+            "ON trades(id) WHERE trading_day IS NULL"
+        )
+        # Daily ledger load: WHERE date = ? → account_id, realized_pnl, trade_count
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_daily_pnl_date_covering "
+            "ON daily_pnl(date, account_id, realized_pnl, trade_count)"
+        )
+        # Startup restore: WHERE active = 1 AND expires_at_us > ?
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_lockouts_active_expires_covering "
+            "ON lockouts(active, expires_at_us, account_id, reason, expires_at, locked_at)"
+        )
+
+        # Superseded: string-compared timestamps, and a duplicate of the
+        # UNIQUE(account_id, date) index
+        cursor.execute("DROP INDEX IF EXISTS idx_trades_account_timestamp")
+        cursor.execute("DROP INDEX IF EXISTS idx_daily_pnl_account_date")
+
+        logger.success("Schema v2 applied successfully")
+
+    def _migrate_to_v3(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Apply v3 schema.
+
+        Changes:
+        - lockout_log: append-only copy of every lockout/cooldown. The
+          lockouts table keeps one row per (account, rule), so it can't
+          answer how often a rule fired; this log can, and is what the
+          archive moves to Parquet.
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS lockout_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                account_id TEXT NOT NULL,
+                rule_id TEXT NOT NULL,
+                reason TEXT NOT NULL,
+                locked_at TEXT NOT NULL,
+                locked_at_us INTEGER,
+                expires_at TEXT
+            )
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_lockout_log_locked_at_us ON lockout_log(locked_at_us)"
+        )
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_lockouts_log
+            AFTER INSERT ON lockouts
+            BEGIN
+                INSERT INTO lockout_log
+                    (account_id, rule_id, reason, locked_at, locked_at_us, expires_at)
+                VALUES (
+                    NEW.account_id, NEW.rule_id, NEW.reason, NEW.locked_at,
+                    COALESCE(NEW.locked_at_us, {_SQL_EPOCH_US.format(column="NEW.locked_at")}),
+                    NEW.expires_at
+                );
+            END
+        """)
+
+        logger.success("Schema v3 applied successfully")
+
+    def _backfill_v2(self, conn: sqlite3.Connection) -> None:
+        """
+        Fill v2 columns on rows that don't have them yet.
+
+        Runs in batches of BACKFILL_BATCH_SIZE, committing after each, so
+        readers and other connections keep working while a large history
+        is converted.
+        """
+        filled = 0
+
+        for table, text_column, us_column in _V2_EPOCH_COLUMNS:
+            while True:
+                rows = conn.execute(
+                    f"SELECT id, {text_column} FROM {table} "
+                    f"WHERE {us_column} IS NULL AND {text_column} IS NOT NULL LIMIT ?",
+                    (self.BACKFILL_BATCH_SIZE,),
+                ).fetchall()
+                if not rows:
+                    break
+                updates = []
+                for row_id, text in rows:
+                    try:
+                        updates.append((epoch_us(text), row_id))
+                    except ValueError:
+                        updates.append((0, row_id))  # Unparseable: never matches a window
+                conn.executemany(f"UPDATE {table} SET {us_column} = ? WHERE id = ?", updates)
+                conn.commit()
+                filled += len(updates)
+
+        while True:
+            rows = conn.execute(
+                "SELECT id, timestamp FROM trades WHERE trading_day IS NULL LIMIT ?",
+                (self.BACKFILL_BATCH_SIZE,),
+            ).fetchall()
+            if not rows:
+                break
+            updates = []
+            for row_id, text in rows:
+                try:
+                    updates.append((self.trading_day(text), row_id))
+                except ValueError:
+                    updates.append(("", row_id))
+            conn.executemany("UPDATE trades SET trading_day = ? WHERE id = ?", updates)
+            conn.commit()
+            filled += len(updates)
+
+        if filled:
+            logger.info(f"Backfilled v2 columns on {filled} row(s)")
+
+    # ========================================================================
+    # Write-Behind Queue
+    # ========================================================================
+
+    def submit_write(
+        self, query: str, params: tuple[Any, ...] | dict[str, Any] | None = None
+    ) -> None:
+        """
+        Queue a write query for the writer thread (non-blocking).
+
+        Statements are applied in submission order. Failures are logged and
+        counted in get_write_stats(); they cannot be reported to the caller.
+
+        Args:
+            query: SQL query
+            params: Query parameters
+        """
+        with self._writes_done:
+            self._submitted_seq += 1
+            seq = self._submitted_seq
+            if self._writer_thread is None or not self._writer_thread.is_alive():
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="database-writer", daemon=True
+                )
+                self._writer_thread.start()
+        self._write_queue.put((seq, query, params))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Block until every write submitted so far is committed.
+
+        Call via ``asyncio.to_thread`` from async code.
+
+        Args:
+            timeout: Max seconds to wait (None = no limit)
+
+        Returns:
+            True if all writes were applied, False on timeout
+        """
+        if threading.current_thread() is self._writer_thread:
+            return True
+
+        with self._writes_done:
+            target = self._submitted_seq
+            if self._applied_seq >= target:
+                return True
+            self._flush_waiters += 1
+            try:
+                return self._writes_done.wait_for(
+                    lambda: self._applied_seq >= target, timeout
+                )
+            finally:
+                self._flush_waiters -= 1
+
+    def get_write_stats(self) -> dict[str, Any]:
+        """Get write-behind queue counters."""
+        with self._writes_done:
+            return {
+                "submitted": self._submitted_seq,
+                "applied": self._applied_seq,
+                "pending": self._submitted_seq - self._applied_seq,
+                "commits": self._commits,
+                "largest_batch": self._largest_batch,
+                "write_errors": self._write_errors,
+            }
+
+    def _stop_writer(self, timeout: float | None = 5.0) -> None:
+        """Apply pending writes, then stop the writer thread."""
+        if self._writer_thread is None:
+            return
+        self._write_queue.put(None)
+        self._writer_thread.join(timeout)
+        self._writer_thread = None
+
+    def _writer_loop(self) -> None:
+        stop = False
+        while not stop:
+            item = self._write_queue.get()
+            if item is None:
+                break
+
+            # Collect a batch: whatever is queued, plus anything arriving
+            # within COMMIT_INTERVAL unless someone is waiting on a flush
+            batch = [item]
+            deadline = time.monotonic() + self.COMMIT_INTERVAL
+            while len(batch) < self.COMMIT_BATCH_SIZE:
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or self._flush_waiters:
+                        break
+                    try:
+                        item = self._write_queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch: list[tuple[int, str, Any]]) -> None:
+        """Apply a batch in one transaction, falling back to one per statement."""
+        commits = 0
+        errors = 0
+        settled = 0  # Statements committed or given up on
+        try:
+            with self._write_connection() as conn:
+                try:
+                    for _, query, params in batch:
+                        conn.execute(query, params or ())
+                    conn.commit()
+                    commits = 1
+                    settled = len(batch)
+                except Exception as e:
+                    conn.rollback()
+                    logger.warning(f"Group commit of {len(batch)} writes failed ({e}), retrying one by one")
+                    for _, query, params in batch:
+                        try:
+                            conn.execute(query, params or ())
+                            conn.commit()
+                            commits += 1
+                        except Exception as e:
+                            conn.rollback()
+                            errors += 1
+                            logger.error(f"Database write failed: {e} ({query.split()[0]})")
+                        settled += 1
+        except Exception as e:
+            # No usable connection: the batch is lost, but the writer (and
+            # anyone blocked in flush) must keep going
+            errors += len(batch) - settled
+            logger.error(f"Database write batch of {len(batch)} failed: {e}")
+        finally:
+            with self._writes_done:
+                self._applied_seq = batch[-1][0]
+                self._commits += commits
+                self._write_errors += errors
+                self._largest_batch = max(self._largest_batch, len(batch))
+                self._writes_done.notify_all()
+
     @contextmanager
     def connection(self) -> Generator[sqlite3.Connection, None, None]:
         """
         Get a database connection context manager.
 
         For in-memory databases, returns the persistent connection.
-        For file-based databases, creates a new connection per call.
+        For file-based databases, returns the long-lived writer connection.
+        Either way the connection is held exclusively until the block exits,
+        and anything not committed by then is rolled back. Queued writes are
+        applied before the connection is handed out.
 
         Yields:
             SQLite connection with row factory
@@ -211,17 +752,27 @@ class Database:
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM daily_pnl")
         """
-        # Use persistent connection for in-memory databases
-        if self._persistent_conn:
-            yield self._persistent_conn
-        else:
-            # Create new connection for file-based databases
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row  # Enable column access by name
+        self.flush()
+        with self._write_connection() as conn:
+            yield conn
+
+    @contextmanager
+    def _write_connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Hold the writer connection, without waiting for queued writes."""
+        with self._write_lock:
+            # Use persistent connection for in-memory databases
+            if self._persistent_conn:
+                conn = self._persistent_conn
+            else:
+                if self._writer_conn is None:
+                    self._writer_conn = self._open_connection()
+                conn = self._writer_conn
+
             try:
                 yield conn
             finally:
-                conn.close()
+                if conn.in_transaction:
+                    conn.rollback()
 
     def execute(
         self, query: str, params: tuple[Any, ...] | dict[str, Any] | None = None
@@ -236,7 +787,8 @@ class Database:
         Returns:
             List of result rows
         """
-        with self.connection() as conn:
+        self.flush()
+        with self._reader() as conn:
             cursor = conn.cursor()
             if params:
                 cursor.execute(query, params)
@@ -257,13 +809,17 @@ class Database:
         Returns:
             First result row or None
         """
-        with self.connection() as conn:
+        self.flush()
+        with self._reader() as conn:
             cursor = conn.cursor()
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
-            return cursor.fetchone()
+            try:
+                return cursor.fetchone()
+            finally:
+                cursor.close()  # Finish the statement so the snapshot is released
 
     def execute_write(
         self, query: str, params: tuple[Any, ...] | dict[str, Any] | None = None
@@ -287,6 +843,49 @@ class Database:
             conn.commit()
             return cursor.lastrowid or cursor.rowcount
 
+    _TRADE_INSERT = """
+        INSERT {conflict}INTO trades (
+            account_id, trade_id, symbol, side, quantity, price,
+            realized_pnl, timestamp, created_at, ts_us, trading_day
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _trade_params(
+        self,
+        account_id: str,
+        trade_id: str,
+        symbol: str,
+        side: str,
+        quantity: int,
+        price: float,
+        realized_pnl: float | None,
+        timestamp: datetime | str | None,
+    ) -> tuple[Any, ...]:
+        """Build the parameter tuple for a trades INSERT."""
+        now = self._now()
+        if timestamp is None:
+            timestamp = now
+
+        # Ensure timestamp is ISO format string
+        if isinstance(timestamp, datetime):
+            timestamp_str = timestamp.isoformat()
+        else:
+            timestamp_str = timestamp
+
+        return (
+            account_id,
+            trade_id,
+            symbol,
+            side,
+            quantity,
+            price,
+            realized_pnl,
+            timestamp_str,
+            now.isoformat(),
+            epoch_us(timestamp),
+            self.trading_day(timestamp),
+        )
+
     def add_trade(
         self,
         account_id: str,
@@ -314,34 +913,34 @@ class Database:
         Returns:
             Row ID of inserted trade
         """
-        if timestamp is None:
-            timestamp = datetime.now(timezone.utc)
-
-        # Ensure timestamp is ISO format string
-        if isinstance(timestamp, datetime):
-            timestamp_str = timestamp.isoformat()
-        else:
-            timestamp_str = timestamp
+        return self.execute_write(
+            self._TRADE_INSERT.format(conflict=""),
+            self._trade_params(
+                account_id, trade_id, symbol, side, quantity, price, realized_pnl, timestamp
+            ),
+        )
 
-        query = """
-            INSERT INTO trades (
-                account_id, trade_id, symbol, side, quantity, price,
-                realized_pnl, timestamp, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    def submit_trade(
+        self,
+        account_id: str,
+        trade_id: str,
+        symbol: str,
+        side: str,
+        quantity: int,
+        price: float,
+        realized_pnl: float | None = None,
+        timestamp: datetime | None = None,
+    ) -> None:
         """
+        Queue a trade for the writer thread (non-blocking).
 
-        return self.execute_write(
-            query,
-            (
-                account_id,
-                trade_id,
-                symbol,
-                side,
-                quantity,
-                price,
-                realized_pnl,
-                timestamp_str,
-                datetime.now(timezone.utc).isoformat(),
+        Same arguments as add_trade(). A trade already recorded under the
+        same (account_id, trade_id) is ignored.
+        """
+        self.submit_write(
+            self._TRADE_INSERT.format(conflict="OR IGNORE "),
+            self._trade_params(
+                account_id, trade_id, symbol, side, quantity, price, realized_pnl, timestamp
             ),
         )
 
@@ -356,44 +955,67 @@ class Database:
         Returns:
             Number of trades in the window
         """
-        cutoff_time = datetime.now(timezone.utc) - timedelta(seconds=window)
-        cutoff_str = cutoff_time.isoformat()
+        cutoff_us = epoch_us(self._now() - timedelta(seconds=window))
 
         query = """
             SELECT COUNT(*) as count
             FROM trades
-            WHERE account_id = ? AND timestamp >= ?
+            WHERE account_id = ? AND ts_us >= ?
         """
 
-        result = self.execute_one(query, (account_id, cutoff_str))
+        result = self.execute_one(query, (account_id, cutoff_us))
         return result["count"] if result else 0
 
     def get_session_trade_count(self, account_id: str) -> int:
         """
-        Get count of trades for current session (today).
+        Get count of trades for the current trading day.
+
+        The session rolls over at the configured daily reset, not at UTC
+        midnight.
 
         Args:
             account_id: Account identifier
 
         Returns:
-            Number of trades today
+            Number of trades this session
         """
-        today = datetime.now(timezone.utc).date().isoformat()
-
         query = """
             SELECT COUNT(*) as count
             FROM trades
             WHERE account_id = ?
-            AND DATE(timestamp) = ?
+            AND trading_day = ?
         """
 
-        result = self.execute_one(query, (account_id, today))
+        result = self.execute_one(query, (account_id, self.trading_day()))
         return result["count"] if result else 0
 
     def close(self) -> None:
-        """Close database (for cleanup)."""
+        """
+        Close database (for cleanup).
+
+        Pending writes are applied first. File-backed connections are
+        reopened on the next query.
+        """
+        self._stop_writer()
+
         if self._persistent_conn:
             self._persistent_conn.close()
             self._persistent_conn = None
             logger.debug("Closed persistent in-memory connection")
+
+        with self._write_lock:
+            if self._writer_conn is not None:
+                self._writer_conn.close()
+                self._writer_conn = None
+
+        with self._pool_lock:
+            while True:
+                try:
+                    self._idle_readers.get_nowait()
+                except queue.Empty:
+                    break
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+
         logger.info("Database closed")
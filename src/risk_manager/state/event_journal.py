@@ -0,0 +1,388 @@
+"""
+Event Journal
+
+Append-only binary record of every RiskEvent published on the EventBus:
+SDK-derived position/order/trade/quote events as well as the engine's
+RULE_VIOLATED and ENFORCEMENT_ACTION events. Used for audit, crash
+recovery and replay.
+
+On-disk format:
+- Directory of segments named ``events-00000001.rmj``, ``events-00000002.rmj``...
+- Each segment starts with the 4-byte magic ``RMJ\\x01``
+- Followed by records: ``<u32 length><u32 crc32><payload>`` (little-endian)
+- Payload is compact UTF-8 JSON:
+  ``{"type", "wall_ns", "source", "severity", "data"}``
+
+Key Features:
+- append() only takes a snapshot of the event and enqueues it; a writer
+  thread does the JSON encoding and all file I/O
+- Segment rotation at ``segment_max_bytes``
+- fsync batching: every ``fsync_batch_size`` records or ``fsync_interval``
+  seconds, whichever comes first
+- flush() barrier for callers that need records on disk
+- Reader memory-maps segments and stops cleanly at a torn tail record
+- A new segment is started on every open, so a crash never leaves the
+  writer appending after a partial record
+
+Example:
+    ```python
+    journal = EventJournal("data/journal")
+    journal.start()
+    event_bus.add_tap(journal.append)
+    ...
+    journal.close()
+
+    for event in EventJournalReader("data/journal"):
+        print(event.event_type, event.data)
+    ```
+"""
+
+import json
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from loguru import logger
+
+from risk_manager.core.events import EventType, RiskEvent
+
+SEGMENT_MAGIC = b"RMJ\x01"
+SEGMENT_PREFIX = "events-"
+SEGMENT_SUFFIX = ".rmj"
+
+_RECORD_HEADER = struct.Struct("<II")  # payload length, crc32
+
+_STOP = object()
+
+
+def encode_event(event: RiskEvent) -> bytes:
+    """Serialize an event to a journal payload."""
+    return json.dumps(
+        {
+            "type": event.event_type.value,
+            "wall_ns": event.wall_ns,
+            "source": event.source,
+            "severity": event.severity,
+            "data": event.data,
+        },
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
+
+
+def decode_event(payload: bytes | memoryview) -> RiskEvent:
+    """Rebuild a RiskEvent from a journal payload."""
+    record = json.loads(bytes(payload))
+    return RiskEvent(
+        event_type=EventType(record["type"]),
+        timestamp=datetime.fromtimestamp(record["wall_ns"] / 1_000_000_000),
+        data=record.get("data") or {},
+        source=record.get("source", "risk_manager"),
+        severity=record.get("severity", "info"),
+    )
+
+
+def list_segments(directory: str | Path) -> list[Path]:
+    """Return journal segments in write order."""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"))
+
+
+def _segment_number(path: Path) -> int:
+    return int(path.name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+
+
+class EventJournal:
+    """
+    Append-only event journal written by a background thread.
+
+    ``append()`` is safe to call from the event loop: it puts a snapshot of
+    the event on a queue. The writer thread encodes, batches writes, rotates
+    segments and fsyncs.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        fsync_interval: float = 0.2,
+        fsync_batch_size: int = 256,
+        exclude_event_types: Iterable[EventType] = (),
+    ):
+        """
+        Initialize the journal (call start() to begin writing).
+
+        Args:
+            directory: Directory holding the segment files
+            segment_max_bytes: Rotate to a new segment past this size
+            fsync_interval: Max seconds between fsyncs while records are pending
+            fsync_batch_size: Fsync after this many unsynced records
+            exclude_event_types: Event types not to record
+        """
+        self.directory = Path(directory)
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync_interval = fsync_interval
+        self.fsync_batch_size = max(fsync_batch_size, 1)
+        self._exclude = frozenset(exclude_event_types)
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._accepting = False  # True while the writer thread consumes the queue
+
+        # Writer-thread state
+        self._file = None
+        self._segment_path: Path | None = None
+        self._segment_number = 0
+        self._segment_size = 0
+        self._unsynced = 0
+
+        # Stats
+        self._appended = 0
+        self._dropped = 0
+        self._written = 0
+        self._bytes_written = 0
+        self._fsyncs = 0
+        self._segments_opened = 0
+        self._write_errors = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Open a fresh segment and start the writer thread."""
+        if self.running:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        existing = list_segments(self.directory)
+        self._segment_number = _segment_number(existing[-1]) if existing else 0
+        self._open_next_segment()
+
+        self._thread = threading.Thread(
+            target=self._writer_loop, name="event-journal-writer", daemon=True
+        )
+        self._thread.start()
+        self._accepting = True
+        logger.info(f"Event journal started: {self._segment_path}")
+
+    def append(self, event: RiskEvent) -> None:
+        """
+        Queue an event for writing (non-blocking, encoded by the writer).
+
+        Events appended while the writer is not running (before start(),
+        after close()) are dropped and counted, so the queue cannot grow
+        without a consumer.
+        """
+        if event.event_type in self._exclude:
+            return
+        if not self._accepting:
+            self._dropped += 1
+            return
+        self._appended += 1
+        self._queue.put(event.snapshot())
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Block until everything appended so far is written and fsynced.
+
+        Call via ``asyncio.to_thread`` from async code.
+
+        Returns:
+            True if the barrier completed, False on timeout or if not running
+        """
+        if not self.running:
+            return False
+        barrier = threading.Event()
+        self._queue.put(barrier)
+        return barrier.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Write and fsync pending records, then stop the writer thread."""
+        if self._thread is None:
+            return
+        self._accepting = False
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info(f"Event journal closed ({self._written} records written)")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get journal counters."""
+        return {
+            "appended": self._appended,
+            "dropped": self._dropped,
+            "written": self._written,
+            "pending": self._appended - self._written,
+            "bytes_written": self._bytes_written,
+            "fsyncs": self._fsyncs,
+            "segments_opened": self._segments_opened,
+            "write_errors": self._write_errors,
+            "segment": str(self._segment_path) if self._segment_path else None,
+        }
+
+    # ========================================================================
+    # Writer Thread
+    # ========================================================================
+
+    def _writer_loop(self) -> None:
+        sync_deadline = None
+        try:
+            while True:
+                timeout = None
+                if sync_deadline is not None:
+                    timeout = max(sync_deadline - time.monotonic(), 0.0)
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    self._sync()
+                    sync_deadline = None
+                    continue
+
+                if item is _STOP:
+                    break
+                if isinstance(item, threading.Event):
+                    self._sync()
+                    sync_deadline = None
+                    item.set()
+                    continue
+
+                self._write(item)
+                if self._unsynced >= self.fsync_batch_size:
+                    self._sync()
+                    sync_deadline = None
+                elif sync_deadline is None:
+                    sync_deadline = time.monotonic() + self.fsync_interval
+        finally:
+            self._accepting = False
+            # Drain anything queued before the stop marker, then release waiters
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is not _STOP:
+                    self._write(item)
+            self._sync()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _write(self, event: RiskEvent) -> None:
+        try:
+            payload = encode_event(event)
+        except Exception as e:
+            self._write_errors += 1
+            logger.error(f"Event journal could not encode {event.event_type.value}: {e}")
+            return
+
+        try:
+            if self._segment_size >= self.segment_max_bytes:
+                self._sync()
+                self._file.close()
+                self._open_next_segment()
+
+            header = _RECORD_HEADER.pack(len(payload), zlib.crc32(payload))
+            self._file.write(header)
+            self._file.write(payload)
+            record_size = len(header) + len(payload)
+            self._segment_size += record_size
+            self._bytes_written += record_size
+            self._written += 1
+            self._unsynced += 1
+        except Exception as e:
+            self._write_errors += 1
+            logger.error(f"Event journal write failed: {e}")
+
+    def _sync(self) -> None:
+        if self._file is None or not self._unsynced:
+            return
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._fsyncs += 1
+            self._unsynced = 0
+        except Exception as e:
+            self._write_errors += 1
+            logger.error(f"Event journal fsync failed: {e}")
+
+    def _open_next_segment(self) -> None:
+        self._segment_number += 1
+        self._segment_path = self.directory / (
+            f"{SEGMENT_PREFIX}{self._segment_number:08d}{SEGMENT_SUFFIX}"
+        )
+        self._file = open(self._segment_path, "ab")
+        self._file.write(SEGMENT_MAGIC)
+        self._segment_size = len(SEGMENT_MAGIC)
+        self._segments_opened += 1
+
+
+def read_segment(path: str | Path) -> Iterator[RiskEvent]:
+    """
+    Iterate the events in one segment via mmap.
+
+    Stops at the first incomplete or corrupt record (a torn write from a
+    crash); everything before it is returned.
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < len(SEGMENT_MAGIC):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+                logger.warning(f"Not an event journal segment: {path}")
+                return
+
+            view = memoryview(mm)
+            try:
+                offset = len(SEGMENT_MAGIC)
+                while offset + _RECORD_HEADER.size <= size:
+                    length, crc = _RECORD_HEADER.unpack_from(mm, offset)
+                    start = offset + _RECORD_HEADER.size
+                    end = start + length
+                    if end > size:
+                        logger.warning(f"Torn record at {path}:{offset}, stopping")
+                        break
+                    payload = view[start:end]
+                    if zlib.crc32(payload) != crc:
+                        logger.warning(f"Corrupt record at {path}:{offset}, stopping")
+                        payload.release()
+                        break
+                    try:
+                        event = decode_event(payload)
+                    except (ValueError, KeyError) as e:
+                        logger.warning(f"Skipping undecodable record at {path}:{offset}: {e}")
+                        event = None
+                    finally:
+                        payload.release()
+                    offset = end
+                    if event is not None:
+                        yield event
+            finally:
+                view.release()
+
+
+class EventJournalReader:
+    """Iterate every event in a journal directory, oldest segment first."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+
+    def segments(self) -> list[Path]:
+        return list_segments(self.directory)
+
+    def __iter__(self) -> Iterator[RiskEvent]:
+        for segment in self.segments():
+            yield from read_segment(segment)
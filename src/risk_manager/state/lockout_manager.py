@@ -8,17 +8,24 @@ Features:
 - Hard lockouts (until specific datetime)
 - Cooldown timers (duration-based with auto-expiry)
 - SQLite persistence (crash recovery)
-- Background task for auto-expiry
+- O(1) is_locked_out(): each lockout caches its deadline as epoch
+  microseconds, so the PRE-CHECK is a dict lookup and one comparison
+- Min-heap of deadlines: a one-shot scheduler job clears lockouts at
+  their expiry instead of scanning every account each second
 - Integration with Timer Manager (MOD-003) when available
 """
 
 import asyncio
+import heapq
+import itertools
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
 
 from loguru import logger
 
-from risk_manager.state.database import Database
+from risk_manager.core.clock import Clock
+from risk_manager.core.scheduler import Job, Scheduler
+from risk_manager.state.database import Database, epoch_us
 
 
 class LockoutManager:
@@ -28,7 +35,8 @@ class LockoutManager:
     Manages trading account lockouts with:
     - Hard lockouts (until specific time)
     - Cooldown timers (duration-based)
-    - Auto-expiry via background task
+    - Auto-expiry via a scheduler job armed for the earliest deadline
+      (at most MAX_SLEEP seconds away, so clock changes are picked up)
     - SQLite persistence for crash recovery
 
     Public API:
@@ -39,15 +47,21 @@ class LockoutManager:
         - get_remaining_time(account_id): Get remaining time for cooldown
         - clear_lockout(account_id): Remove lockout
         - check_expired_lockouts(): Auto-clear expired lockouts (background task)
+        - next_expiry(): Earliest pending lockout expiry
         - load_lockouts_from_db(): Load lockouts from database on startup
-        - start_background_task(): Start background expiry task
+        - start_background_task(): Run the expiry job until cancelled
         - shutdown(): Gracefully shutdown manager
     """
 
+    MAX_SLEEP = 5.0  # Upper bound on the delay of the expiry job (seconds)
+    JOB_NAME = "lockout_expiry"
+
     def __init__(
         self,
         database: Database,
-        timer_manager: Optional[Any] = None
+        timer_manager: Optional[Any] = None,
+        clock: Optional[Clock] = None,
+        scheduler: Optional[Scheduler] = None,
     ):
         """
         Initialize Lockout Manager.
@@ -55,38 +69,55 @@ class LockoutManager:
         Args:
             database: Database instance for persistence
             timer_manager: Optional Timer Manager instance (MOD-003) for cooldowns
+            clock: Optional clock (defaults to the system clock)
+            scheduler: Optional shared scheduler (a private one is
+                started with the manager if omitted)
         """
         self.database = database
         self.timer_manager = timer_manager
+        self.clock = clock
 
         # In-memory lockout state for fast lookups
-        # Format: {account_id: {"reason": str, "until": datetime, "type": str, "created_at": datetime}}
+        # Format: {account_id: {"reason": str, "until": datetime, "until_us": int,
+        #                       "type": str, "created_at": datetime}}
         self.lockout_state: dict[int, dict[str, Any]] = {}
 
-        # Background task control
+        # (until_us, seq, account_id, lockout) - an entry is stale once
+        # self.lockout_state[account_id] is no longer that lockout
+        self._heap: List[Tuple[int, int, int, dict[str, Any]]] = []
+        self._seq = itertools.count()
+
+        # Expiry job control
         self._running = False
-        self._background_task: Optional[asyncio.Task] = None
+        self.scheduler = scheduler
+        self._owns_scheduler = scheduler is None
+        self._job: Optional[Job] = None
 
         # Load lockouts from database on initialization
         self.load_lockouts_from_db()
 
         logger.info("Lockout Manager initialized")
 
+    def _now(self) -> datetime:
+        """Current UTC time from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.now(timezone.utc)
+        return datetime.now(timezone.utc)
+
     async def start(self) -> None:
         """
         Start the lockout manager.
 
         - Loads lockouts from database
-        - Starts background expiry task
+        - Registers the expiry job
         """
         logger.info("Starting Lockout Manager")
 
         # Load persisted lockouts from database
         self.load_lockouts_from_db()
 
-        # Start background task for auto-expiry
-        self._running = True
-        self._background_task = asyncio.create_task(self._lockout_loop())
+        # Register the auto-expiry job
+        self._start_expiry_job()
 
         logger.success("Lockout Manager started")
 
@@ -94,19 +125,18 @@ class LockoutManager:
         """
         Stop the lockout manager.
 
-        - Stops background expiry task
+        - Cancels the expiry job
         - Persists state to database
         """
         logger.info("Stopping Lockout Manager")
 
-        # Stop background task
+        # Cancel the expiry job
         self._running = False
-        if self._background_task:
-            self._background_task.cancel()
-            try:
-                await self._background_task
-            except asyncio.CancelledError:
-                pass
+        if self._job:
+            self._job.cancel()
+            self._job = None
+        if self._owns_scheduler and self.scheduler:
+            await self.scheduler.stop()
 
         logger.success("Lockout Manager stopped")
 
@@ -158,30 +188,36 @@ class LockoutManager:
         if until.tzinfo is None:
             until = until.replace(tzinfo=timezone.utc)
 
+        now = self._now()
+
         # Update in-memory state
-        self.lockout_state[account_id] = {
+        self._track(account_id, {
             "reason": reason,
             "until": until,
+            "until_us": epoch_us(until),
             "type": "hard_lockout",
-            "created_at": datetime.now(timezone.utc)
-        }
+            "created_at": now
+        })
 
         # Persist to database
-        self.database.execute_write(
+        self.database.submit_write(
             """
             INSERT OR REPLACE INTO lockouts
-            (account_id, rule_id, reason, locked_at, expires_at, unlock_condition, active, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            (account_id, rule_id, reason, locked_at, expires_at, unlock_condition, active, created_at,
+             locked_at_us, expires_at_us)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 str(account_id),
                 "MANUAL",  # rule_id is generic for manual lockouts
                 reason,
-                datetime.now(timezone.utc).isoformat(),
+                now.isoformat(),
                 until.isoformat(),
                 "TIME_BASED",
                 1,  # active
-                datetime.now(timezone.utc).isoformat()
+                now.isoformat(),
+                epoch_us(now),
+                epoch_us(until),
             )
         )
 
@@ -214,33 +250,38 @@ class LockoutManager:
         Example:
             await set_cooldown(123, "Trade frequency limit", 1800)  # 30 min
         """
-        until = datetime.now(timezone.utc) + timedelta(seconds=duration_seconds)
+        now = self._now()
+        until = now + timedelta(seconds=duration_seconds)
 
         # Update in-memory state
-        self.lockout_state[account_id] = {
+        self._track(account_id, {
             "reason": reason,
             "until": until,
+            "until_us": epoch_us(until),
             "type": "cooldown",
             "duration": duration_seconds,
-            "created_at": datetime.now(timezone.utc)
-        }
+            "created_at": now
+        })
 
         # Persist to database
-        self.database.execute_write(
+        self.database.submit_write(
             """
             INSERT OR REPLACE INTO lockouts
-            (account_id, rule_id, reason, locked_at, expires_at, unlock_condition, active, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            (account_id, rule_id, reason, locked_at, expires_at, unlock_condition, active, created_at,
+             locked_at_us, expires_at_us)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 str(account_id),
                 "COOLDOWN",
                 reason,
-                datetime.now(timezone.utc).isoformat(),
+                now.isoformat(),
                 until.isoformat(),
                 f"DURATION_{duration_seconds}",
                 1,  # active
-                datetime.now(timezone.utc).isoformat()
+                now.isoformat(),
+                epoch_us(now),
+                epoch_us(until),
             )
         )
 
@@ -266,7 +307,8 @@ class LockoutManager:
         """
         Check if account is currently locked out.
 
-        Auto-clears expired lockouts when checked.
+        A dict lookup and one integer comparison; an expired lockout reads
+        as unlocked right away and is cleared by the expiry job.
 
         Args:
             account_id: TopstepX account ID
@@ -278,24 +320,8 @@ class LockoutManager:
             if lockout_manager.is_locked_out(123):
                 logger.info("Account is locked out")
         """
-        if account_id not in self.lockout_state:
-            return False
-
-        lockout = self.lockout_state[account_id]
-        now = datetime.now(timezone.utc)
-
-        # Ensure lockout['until'] is timezone-aware
-        until = lockout['until']
-        if until.tzinfo is None:
-            until = until.replace(tzinfo=timezone.utc)
-
-        # Check if lockout expired
-        if now >= until:
-            # Auto-clear expired lockout (synchronously)
-            self.clear_lockout(account_id)
-            return False
-
-        return True
+        lockout = self.lockout_state.get(account_id)
+        return lockout is not None and epoch_us(self._now()) < lockout["until_us"]
 
     def get_lockout_info(self, account_id: int) -> Optional[dict[str, Any]]:
         """
@@ -316,18 +342,14 @@ class LockoutManager:
                 "created_at": datetime(2025, 10, 27, 14, 23)
             }
         """
-        if not self.is_locked_out(account_id):
+        lockout = self.lockout_state.get(account_id)
+        if lockout is None:
             return None
 
-        lockout = self.lockout_state[account_id]
-        now = datetime.now(timezone.utc)
-
-        # Ensure until is timezone-aware
-        until = lockout['until']
-        if until.tzinfo is None:
-            until = until.replace(tzinfo=timezone.utc)
-
-        remaining = (until - now).total_seconds()
+        remaining_us = lockout["until_us"] - epoch_us(self._now())
+        if remaining_us <= 0:
+            return None
+        remaining = remaining_us / 1_000_000
 
         return {
             "reason": lockout['reason'],
@@ -379,10 +401,11 @@ class LockoutManager:
 
         lockout = self.lockout_state[account_id]
         reason = lockout['reason']
-        del self.lockout_state[account_id]
+        del self.lockout_state[account_id]  # Its heap entry goes stale
+        self._compact_heap()
 
         # Remove from database
-        self.database.execute_write(
+        self.database.submit_write(
             "UPDATE lockouts SET active = 0 WHERE account_id = ?",
             (str(account_id),)
         )
@@ -408,26 +431,76 @@ class LockoutManager:
 
     def check_expired_lockouts(self) -> None:
         """
-        Check all lockouts and auto-clear expired ones (synchronous).
+        Auto-clear expired lockouts (synchronous).
 
-        Called every second by background task.
+        Called by the expiry job at the earliest deadline; only lockouts
+        that are due are touched.
         """
-        now = datetime.now(timezone.utc)
-        expired_accounts = []
-
-        for account_id, lockout in list(self.lockout_state.items()):
-            until = lockout['until']
-            if until.tzinfo is None:
-                until = until.replace(tzinfo=timezone.utc)
+        now_us = epoch_us(self._now())
 
-            if now >= until:
-                expired_accounts.append(account_id)
+        # Pop everything due, earliest first
+        expired_accounts = []
+        while self._heap and self._heap[0][0] <= now_us:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                expired_accounts.append(entry[2])
 
         # Clear expired lockouts
         for account_id in expired_accounts:
             self.clear_lockout(account_id)
             logger.info(f"Auto-cleared expired lockout for account {account_id}")
 
+    def next_expiry(self) -> Optional[datetime]:
+        """
+        Get the earliest pending lockout expiry.
+
+        Returns:
+            Expiry time (aware UTC), or None if no lockouts
+        """
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self.lockout_state[self._heap[0][2]]["until"] if self._heap else None
+
+    def _track(self, account_id: int, lockout: dict[str, Any]) -> None:
+        """Store a lockout and move the expiry job if it is the earliest."""
+        self.lockout_state[account_id] = lockout
+        self._compact_heap()  # Replacing a lockout leaves its old entry stale
+        entry = (lockout["until_us"], next(self._seq), account_id, lockout)
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._arm()
+
+    def _is_live(self, entry: Tuple[int, int, int, dict[str, Any]]) -> bool:
+        """True if a heap entry still belongs to an active lockout."""
+        return self.lockout_state.get(entry[2]) is entry[3]
+
+    def _compact_heap(self) -> None:
+        """Drop stale entries once they outnumber active lockouts."""
+        if len(self._heap) > 2 * len(self.lockout_state) + 64:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+
+    def _seconds_until_next(self) -> Optional[float]:
+        """Delay of the expiry job (capped at MAX_SLEEP, None if no lockouts)."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+        delay = (self._heap[0][0] - epoch_us(self._now())) / 1_000_000
+        return min(max(delay, 0.0), self.MAX_SLEEP)
+
+    def _arm(self) -> None:
+        """Point the expiry job at the earliest pending deadline."""
+        if self._job is not None and not self._job.cancelled():
+            self._job.reschedule(self._seconds_until_next())
+
+    def _on_deadline(self) -> None:
+        """Expiry job - clears expired lockouts, then re-arms for the next one."""
+        try:
+            self.check_expired_lockouts()
+        finally:
+            self._arm()
+
     def load_lockouts_from_db(self) -> None:
         """
         Load lockouts from database on startup (synchronous).
@@ -435,15 +508,15 @@ class LockoutManager:
         Loads only active lockouts that haven't expired yet.
         Provides crash recovery - lockouts survive service restarts.
         """
-        now = datetime.now(timezone.utc)
+        now = self._now()
 
         rows = self.database.execute(
             """
             SELECT account_id, reason, expires_at, locked_at
             FROM lockouts
-            WHERE active = 1 AND expires_at > ?
+            WHERE active = 1 AND expires_at_us > ?
             """,
-            (now.isoformat(),)
+            (epoch_us(now),)
         )
 
         for row in rows:
@@ -459,12 +532,13 @@ class LockoutManager:
                 locked_at = locked_at.replace(tzinfo=timezone.utc)
 
             # Restore lockout state
-            self.lockout_state[account_id] = {
+            self._track(account_id, {
                 "reason": reason,
                 "until": expires_at,
+                "until_us": epoch_us(expires_at),
                 "type": "hard_lockout",  # Assume hard lockout after restart
                 "created_at": locked_at
-            }
+            })
 
             # Log each restored lockout for visibility
             remaining = (expires_at - now).total_seconds()
@@ -478,30 +552,29 @@ class LockoutManager:
         else:
             logger.info(f"Loaded {len(self.lockout_state)} lockouts from database")
 
-    async def start_background_task(self) -> None:
-        """
-        Start background task for checking expired lockouts.
-
-        Runs check_expired_lockouts() every second.
-        """
+    def _start_expiry_job(self) -> None:
+        """Register the expiry job, armed for the earliest deadline."""
         self._running = True
-        logger.debug("Lockout expiry background task started")
-
-        while self._running:
-            try:
-                self.check_expired_lockouts()
-            except Exception as e:
-                logger.error(f"Error in lockout expiry task: {e}", exc_info=True)
-
-            # Check every second
-            await asyncio.sleep(1)
+        if self._job:
+            return
 
-        logger.debug("Lockout expiry background task stopped")
+        if self.scheduler is None:
+            self.scheduler = Scheduler()
+        self.scheduler.start()
+        self._job = self.scheduler.call_later(
+            self.JOB_NAME, self._seconds_until_next(), self._on_deadline
+        )
+        logger.debug("Lockout expiry job registered")
 
-    async def _lockout_loop(self) -> None:
+    async def start_background_task(self) -> None:
         """
-        Background task - runs every 1 second.
+        Run the expiry job until this coroutine is cancelled.
 
-        Auto-clears expired lockouts.
+        For callers that drive the manager as a task of their own; start()
+        registers the same job without blocking.
         """
-        await self.start_background_task()
+        self._start_expiry_job()
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await self.stop()
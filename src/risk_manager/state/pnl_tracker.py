@@ -3,13 +3,23 @@ P&L Tracker - Daily Realized P&L Tracking
 
 Tracks daily realized P&L with SQLite persistence for crash recovery.
 Thread-safe, handles multiple accounts.
+
+The in-memory ledger is authoritative: every read is served from memory
+and every change is persisted with one atomic UPSERT, queued for the
+database writer. A day's rows are loaded from SQLite once: today and
+tomorrow up front, and each following day by a periodic scheduler job
+well before its midnight, so the first fill of a new day stays in memory.
+The same job drops days older than RETAIN_DAYS.
 """
 
-from datetime import date, datetime, timezone
+import threading
+from datetime import date, datetime, timedelta, timezone
 from typing import Dict
 
 from loguru import logger
 
+from risk_manager.core.clock import Clock
+from risk_manager.core.scheduler import Job, Scheduler
 from risk_manager.state.database import Database
 
 
@@ -23,18 +33,120 @@ class PnLTracker:
     - Crash recovery (persists to SQLite)
     - Multi-account support
     - Daily reset capability
+    - Memory-only reads (fill → lockout path never touches disk)
+    - Next day preloaded off the fill path (with a scheduler)
+    """
+
+    ROLLOVER_INTERVAL = 3600.0  # Seconds between preload/prune runs
+    RETAIN_DAYS = 1  # Past days kept in memory (yesterday); older ones are reloaded on demand
+    JOB_NAME = "pnl_rollover"
+
+    # Persist a ledger entry; values are absolute so memory and disk agree
+    _UPSERT = """
+        INSERT INTO daily_pnl (account_id, date, realized_pnl, trade_count, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(account_id, date) DO UPDATE SET
+            realized_pnl = excluded.realized_pnl,
+            trade_count = excluded.trade_count,
+            updated_at = excluded.updated_at
     """
 
-    def __init__(self, db: Database):
+    def __init__(
+        self,
+        db: Database,
+        clock: Clock | None = None,
+        scheduler: Scheduler | None = None,
+    ):
         """
         Initialize P&L tracker.
 
         Args:
             db: Database instance for persistence
+            clock: Optional clock deciding "today" (defaults to the system clock)
+            scheduler: Optional shared scheduler; if given, a job preloads
+                the next day and prunes old days every ROLLOVER_INTERVAL
         """
         self.db = db
+        self.clock = clock
+
+        # Ledger: {date_str: {account_id: [realized_pnl, trade_count]}}
+        self._ledger: Dict[str, Dict[str, list]] = {}
+        self._lock = threading.RLock()
+
+        self.roll_over()  # Load today and tomorrow up front
+
+        self._job: Job | None = None
+        if scheduler is not None:
+            self._job = scheduler.every(self.JOB_NAME, self.ROLLOVER_INTERVAL, self.roll_over)
+
         logger.info("PnLTracker initialized")
 
+    def _today(self) -> date:
+        """Current local date from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.now().date()
+        return date.today()
+
+    def _now(self) -> datetime:
+        """Current UTC time from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.now(timezone.utc)
+        return datetime.now(timezone.utc)
+
+    def _day(self, date_str: str) -> Dict[str, list]:
+        """
+        Get the ledger for a date, loading it from SQLite on first use.
+
+        Args:
+            date_str: ISO date
+
+        Returns:
+            {account_id: [realized_pnl, trade_count]} for that date
+        """
+        day = self._ledger.get(date_str)
+        if day is None:
+            with self._lock:
+                day = self._ledger.get(date_str)
+                if day is None:
+                    rows = self.db.execute(
+                        """
+                        SELECT account_id, realized_pnl, trade_count
+                        FROM daily_pnl
+                        WHERE date = ?
+                        """,
+                        (date_str,),
+                    )
+                    day = {
+                        row["account_id"]: [row["realized_pnl"], row["trade_count"]]
+                        for row in rows
+                    }
+                    self._ledger[date_str] = day
+        return day
+
+    def roll_over(self) -> None:
+        """
+        Preload tomorrow and drop days older than RETAIN_DAYS.
+
+        Run by the scheduler job, so the SQLite read for a new day happens
+        before its first fill rather than inside the fill handler.
+        """
+        today = self._today()
+        self._day(today.isoformat())
+        self._day((today + timedelta(days=1)).isoformat())
+
+        oldest = (today - timedelta(days=self.RETAIN_DAYS)).isoformat()
+        with self._lock:
+            for date_str in [d for d in self._ledger if d < oldest]:
+                del self._ledger[date_str]
+
+    def _persist(self, account_id: str, date_str: str, entry: list) -> None:
+        """Queue the UPSERT for one ledger entry."""
+        now = self._now().isoformat()
+        self.db.submit_write(
+            self._UPSERT,
+            (account_id, date_str, entry[0], entry[1], now, now),
+        )
+
     def add_trade_pnl(
         self,
         account_id: str,
@@ -57,59 +169,25 @@ class PnLTracker:
             tracker.add_trade_pnl("ACCOUNT-001", 80.0)    # Add $80 profit
         """
         if trade_date is None:
-            trade_date = date.today()
+            trade_date = self._today()
+        account_id = str(account_id)  # Stored as TEXT; callers pass ints too
 
         date_str = trade_date.isoformat()
-        now = datetime.now(timezone.utc).isoformat()
-
-        # Check if record exists for this account/date
-        row = self.db.execute_one(
-            """
-            SELECT id, realized_pnl, trade_count
-            FROM daily_pnl
-            WHERE account_id = ? AND date = ?
-            """,
-            (account_id, date_str),
-        )
 
-        if row:
-            # Update existing record
-            new_pnl = row["realized_pnl"] + pnl
-            new_count = row["trade_count"] + 1
-
-            self.db.execute_write(
-                """
-                UPDATE daily_pnl
-                SET realized_pnl = ?,
-                    trade_count = ?,
-                    updated_at = ?
-                WHERE id = ?
-                """,
-                (new_pnl, new_count, now, row["id"]),
-            )
-
-            logger.debug(
-                f"Updated P&L for {account_id} on {date_str}: "
-                f"{row['realized_pnl']:.2f} → {new_pnl:.2f} (trade: {pnl:+.2f})"
-            )
-
-            return new_pnl
-
-        else:
-            # Insert new record
-            self.db.execute_write(
-                """
-                INSERT INTO daily_pnl (account_id, date, realized_pnl, trade_count, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (account_id, date_str, pnl, 1, now, now),
-            )
-
-            logger.debug(
-                f"Created P&L record for {account_id} on {date_str}: {pnl:+.2f}"
-            )
+        with self._lock:
+            entry = self._day(date_str).setdefault(account_id, [0.0, 0])
+            old_pnl = entry[0]
+            entry[0] += pnl
+            entry[1] += 1
+            new_pnl = entry[0]
+            self._persist(account_id, date_str, entry)
+
+        logger.debug(
+            f"Updated P&L for {account_id} on {date_str}: "
+            f"{old_pnl:.2f} → {new_pnl:.2f} (trade: {pnl:+.2f})"
+        )
 
-            return pnl
+        return new_pnl
 
     def get_daily_pnl(self, account_id: str, trade_date: date | None = None) -> float:
         """
@@ -128,20 +206,11 @@ class PnLTracker:
                 # Daily loss limit hit!
         """
         if trade_date is None:
-            trade_date = date.today()
+            trade_date = self._today()
+        account_id = str(account_id)
 
-        date_str = trade_date.isoformat()
-
-        row = self.db.execute_one(
-            """
-            SELECT realized_pnl
-            FROM daily_pnl
-            WHERE account_id = ? AND date = ?
-            """,
-            (account_id, date_str),
-        )
-
-        return row["realized_pnl"] if row else 0.0
+        entry = self._day(trade_date.isoformat()).get(account_id)
+        return entry[0] if entry else 0.0
 
     def get_trade_count(self, account_id: str, trade_date: date | None = None) -> int:
         """
@@ -160,20 +229,11 @@ class PnLTracker:
                 # Daily frequency limit hit!
         """
         if trade_date is None:
-            trade_date = date.today()
+            trade_date = self._today()
+        account_id = str(account_id)
 
-        date_str = trade_date.isoformat()
-
-        row = self.db.execute_one(
-            """
-            SELECT trade_count
-            FROM daily_pnl
-            WHERE account_id = ? AND date = ?
-            """,
-            (account_id, date_str),
-        )
-
-        return row["trade_count"] if row else 0
+        entry = self._day(trade_date.isoformat()).get(account_id)
+        return entry[1] if entry else 0
 
     def reset_daily_pnl(self, account_id: str, trade_date: date | None = None) -> None:
         """
@@ -188,21 +248,17 @@ class PnLTracker:
             tracker.reset_daily_pnl("ACCOUNT-001")
         """
         if trade_date is None:
-            trade_date = date.today()
+            trade_date = self._today()
+        account_id = str(account_id)
 
         date_str = trade_date.isoformat()
-        now = datetime.now(timezone.utc).isoformat()
-
-        self.db.execute_write(
-            """
-            UPDATE daily_pnl
-            SET realized_pnl = 0.0,
-                trade_count = 0,
-                updated_at = ?
-            WHERE account_id = ? AND date = ?
-            """,
-            (now, account_id, date_str),
-        )
+
+        with self._lock:
+            entry = self._day(date_str).get(account_id)
+            if entry is not None:
+                entry[0] = 0.0
+                entry[1] = 0
+                self._persist(account_id, date_str, entry)
 
         logger.info(f"Reset daily P&L for {account_id} on {date_str}")
 
@@ -222,20 +278,11 @@ class PnLTracker:
                 print(f"{account_id}: ${pnl:.2f}")
         """
         if trade_date is None:
-            trade_date = date.today()
-
-        date_str = trade_date.isoformat()
+            trade_date = self._today()
 
-        rows = self.db.execute(
-            """
-            SELECT account_id, realized_pnl
-            FROM daily_pnl
-            WHERE date = ?
-            """,
-            (date_str,),
-        )
-
-        return {row["account_id"]: row["realized_pnl"] for row in rows}
+        day = self._day(trade_date.isoformat())
+        with self._lock:
+            return {account_id: entry[0] for account_id, entry in day.items()}
 
     def get_stats(
         self, account_id: str, trade_date: date | None = None
@@ -255,23 +302,15 @@ class PnLTracker:
             print(f"P&L: ${stats['realized_pnl']:.2f}, Trades: {stats['trade_count']}")
         """
         if trade_date is None:
-            trade_date = date.today()
+            trade_date = self._today()
+        account_id = str(account_id)
 
-        date_str = trade_date.isoformat()
-
-        row = self.db.execute_one(
-            """
-            SELECT realized_pnl, trade_count
-            FROM daily_pnl
-            WHERE account_id = ? AND date = ?
-            """,
-            (account_id, date_str),
-        )
+        entry = self._day(trade_date.isoformat()).get(account_id)
 
-        if row:
+        if entry:
             return {
-                "realized_pnl": row["realized_pnl"],
-                "trade_count": row["trade_count"],
+                "realized_pnl": entry[0],
+                "trade_count": entry[1],
             }
         else:
             return {"realized_pnl": 0.0, "trade_count": 0}
@@ -7,10 +7,12 @@ Handles timezone conversion (ET ↔ UTC), DST transitions, and database persiste
 Features:
 - Daily reset at configurable time (default 5:00 PM ET)
 - Weekly reset (configurable day, default Monday)
-- Timezone-aware (ET/EDT ↔ UTC with DST handling)
+- Timezone-aware (ET/EDT ↔ UTC with DST handling, via TradingCalendar)
 - Database persistence (reset_log table)
 - Integration with PnL Tracker and Lockout Manager
-- Background task (check every minute)
+- Scheduler job that sleeps until the next pending reset (at most
+  MAX_SLEEP seconds); each schedule keeps its next reset as an
+  epoch-microsecond instant, so checks are integer comparisons
 
 Database Schema:
     CREATE TABLE reset_log (
@@ -22,14 +24,16 @@ Database Schema:
     );
 """
 
-import asyncio
-from datetime import datetime, timedelta, timezone, time as dt_time
+from datetime import datetime, timezone
 from typing import Any, Optional, Dict
 from zoneinfo import ZoneInfo
 
 from loguru import logger
 
-from risk_manager.state.database import Database
+from risk_manager.core.clock import Clock
+from risk_manager.core.scheduler import Job, Scheduler
+from risk_manager.core.trading_calendar import WEEKDAYS, TradingCalendar
+from risk_manager.state.database import Database, epoch_us
 
 
 class ResetScheduler:
@@ -51,15 +55,21 @@ class ResetScheduler:
         - has_daily_reset(account_id): Check if daily reset scheduled
         - has_weekly_reset(account_id): Check if weekly reset scheduled
         - get_last_reset_time(account_id, reset_type): Get last reset time from DB
-        - start(): Start background task
-        - stop(): Stop background task
+        - start(): Register the reset check job
+        - stop(): Cancel the reset check job
     """
 
+    MAX_SLEEP = 60.0  # Upper bound on the delay of the reset job (seconds)
+    JOB_NAME = "reset_check"
+
     def __init__(
         self,
         database: Database,
         pnl_tracker: Optional[Any] = None,
-        lockout_manager: Optional[Any] = None
+        lockout_manager: Optional[Any] = None,
+        clock: Optional[Clock] = None,
+        scheduler: Optional[Scheduler] = None,
+        calendar: Optional[TradingCalendar] = None,
     ):
         """
         Initialize Reset Scheduler.
@@ -68,22 +78,33 @@ class ResetScheduler:
             database: Database instance for persistence
             pnl_tracker: Optional PnL Tracker instance for P&L reset
             lockout_manager: Optional Lockout Manager instance for lockout clearing
+            clock: Optional clock (defaults to the system clock)
+            scheduler: Optional shared scheduler (a private one is
+                started with the reset scheduler if omitted)
+            calendar: Optional trading calendar (reset times are wall
+                times in its reset timezone; defaults to ET)
         """
         self.database = database
         self.pnl_tracker = pnl_tracker
         self.lockout_manager = lockout_manager
+        self.clock = clock
+        self.calendar = calendar or TradingCalendar(reset_timezone="America/New_York", clock=clock)
 
         # In-memory reset schedules
-        # Format: {account_id: {"reset_time": "17:00", "last_reset": datetime}}
+        # Format: {account_id: {"reset_time": "17:00", "last_reset": datetime,
+        #                       "next_reset_us": int}}
         self.daily_schedules: Dict[str, Dict[str, Any]] = {}
 
         # Weekly schedules
-        # Format: {account_id: {"day": "Monday", "reset_time": "17:00", "last_reset": datetime}}
+        # Format: {account_id: {"day": "Monday", "reset_time": "17:00", "last_reset": datetime,
+        #                       "next_reset_us": int}}
         self.weekly_schedules: Dict[str, Dict[str, Any]] = {}
 
-        # Background task control
+        # Reset check job control
         self.running = False
-        self._background_task: Optional[asyncio.Task] = None
+        self.scheduler = scheduler
+        self._owns_scheduler = scheduler is None
+        self._job: Optional[Job] = None
 
         # Timezone
         self.et_tz = ZoneInfo("America/New_York")
@@ -96,16 +117,28 @@ class ResetScheduler:
 
         logger.info("Reset Scheduler initialized")
 
+    def _now(self, tz) -> datetime:
+        """Current time in ``tz`` from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.now(tz)
+        return datetime.now(tz)
+
     async def start(self) -> None:
         """
         Start the reset scheduler.
 
-        - Starts background task for checking reset times
+        - Registers the job that runs at the next pending reset
         """
         logger.info("Starting Reset Scheduler")
 
         self.running = True
-        self._background_task = asyncio.create_task(self._reset_loop())
+        if self._job is None:
+            if self.scheduler is None:
+                self.scheduler = Scheduler()
+            self.scheduler.start()
+            self._job = self.scheduler.call_later(
+                self.JOB_NAME, self._seconds_until_next(), self._on_deadline
+            )
 
         logger.success("Reset Scheduler started")
 
@@ -113,17 +146,16 @@ class ResetScheduler:
         """
         Stop the reset scheduler.
 
-        - Stops background task
+        - Cancels the reset check job
         """
         logger.info("Stopping Reset Scheduler")
 
         self.running = False
-        if self._background_task:
-            self._background_task.cancel()
-            try:
-                await self._background_task
-            except asyncio.CancelledError:
-                pass
+        if self._job:
+            self._job.cancel()
+            self._job = None
+        if self._owns_scheduler and self.scheduler:
+            await self.scheduler.stop()
 
         logger.success("Reset Scheduler stopped")
 
@@ -144,8 +176,10 @@ class ResetScheduler:
         """
         self.daily_schedules[account_id] = {
             "reset_time": reset_time,
-            "last_reset": None
+            "last_reset": None,
+            "next_reset_us": self._next_reset_us(reset_time),
         }
+        self._arm()
 
         logger.info(f"Daily reset scheduled for account {account_id} at {reset_time} ET")
 
@@ -169,8 +203,10 @@ class ResetScheduler:
         self.weekly_schedules[account_id] = {
             "day": day,
             "reset_time": reset_time,
-            "last_reset": None
+            "last_reset": None,
+            "next_reset_us": self._next_reset_us(reset_time, day),
         }
+        self._arm()
 
         logger.info(
             f"Weekly reset scheduled for account {account_id} on {day} at {reset_time} ET"
@@ -216,67 +252,20 @@ class ResetScheduler:
             Next reset datetime (UTC), or None if not scheduled
         """
         if reset_type == "daily":
-            if account_id not in self.daily_schedules:
-                return None
-
-            schedule = self.daily_schedules[account_id]
-            reset_time_str = schedule["reset_time"]
-
+            schedule = self.daily_schedules.get(account_id)
+            weekday = None
         elif reset_type == "weekly":
-            if account_id not in self.weekly_schedules:
-                return None
-
-            schedule = self.weekly_schedules[account_id]
-            reset_time_str = schedule["reset_time"]
-
+            schedule = self.weekly_schedules.get(account_id)
+            weekday = schedule["day"] if schedule else None
         else:
             return None
 
-        # Parse reset time
-        hour, minute = map(int, reset_time_str.split(":"))
-
-        # Get current time in ET
-        now_et = datetime.now(self.et_tz)
-
-        # Calculate next reset time in ET
-        if reset_type == "daily":
-            # Daily reset - today if not yet passed, tomorrow otherwise
-            next_reset_et = now_et.replace(hour=hour, minute=minute, second=0, microsecond=0)
-
-            if now_et >= next_reset_et:
-                # Time already passed today, schedule for tomorrow
-                next_reset_et += timedelta(days=1)
-
-        else:  # weekly
-            # Weekly reset - next occurrence of specified day
-            schedule = self.weekly_schedules[account_id]
-            target_day = schedule["day"]
-
-            # Map day name to weekday number (Monday=0, Sunday=6)
-            days = {
-                "Monday": 0, "Tuesday": 1, "Wednesday": 2, "Thursday": 3,
-                "Friday": 4, "Saturday": 5, "Sunday": 6
-            }
-            target_weekday = days[target_day]
-
-            # Calculate next occurrence
-            current_weekday = now_et.weekday()
-            days_until = (target_weekday - current_weekday) % 7
-
-            if days_until == 0:
-                # It's the target day - check if time passed
-                reset_time_today = now_et.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                if now_et >= reset_time_today:
-                    # Time passed, next week
-                    days_until = 7
-
-            next_reset_et = now_et.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            next_reset_et += timedelta(days=days_until)
-
-        # Convert to UTC
-        next_reset_utc = next_reset_et.astimezone(timezone.utc)
+        if schedule is None:
+            return None
 
-        return next_reset_utc
+        return self.calendar.next_reset(
+            self._now(timezone.utc), schedule["reset_time"], weekday
+        )
 
     def trigger_reset_manually(
         self,
@@ -291,7 +280,7 @@ class ResetScheduler:
             reset_type: "daily" or "weekly"
         """
         # Check if already reset today
-        today = datetime.now(timezone.utc).date().isoformat()
+        today = self._now(timezone.utc).date().isoformat()
         if account_id not in self._resets_triggered_today:
             self._resets_triggered_today[account_id] = set()
 
@@ -341,23 +330,63 @@ class ResetScheduler:
         """
         Check if any resets should trigger now.
 
-        Called by background task every minute.
+        Called by the scheduler job at the next pending reset. A schedule
+        whose reset has passed is triggered once and moved to its next
+        reset.
         """
-        now = datetime.now(timezone.utc)
+        now_us = epoch_us(self._now(timezone.utc))
 
         # Check daily resets
         for account_id, schedule in list(self.daily_schedules.items()):
-            next_reset = self.get_next_reset_time(account_id, "daily")
-            if next_reset and now >= next_reset:
+            if now_us >= schedule["next_reset_us"]:
                 logger.info(f"Triggering daily reset for account {account_id}")
                 self.trigger_reset_manually(account_id, "daily")
+                schedule["next_reset_us"] = self._next_reset_us(schedule["reset_time"], after_us=now_us)
 
         # Check weekly resets
         for account_id, schedule in list(self.weekly_schedules.items()):
-            next_reset = self.get_next_reset_time(account_id, "weekly")
-            if next_reset and now >= next_reset:
+            if now_us >= schedule["next_reset_us"]:
                 logger.info(f"Triggering weekly reset for account {account_id}")
                 self.trigger_reset_manually(account_id, "weekly")
+                schedule["next_reset_us"] = self._next_reset_us(
+                    schedule["reset_time"], schedule["day"], after_us=now_us
+                )
+
+    def _next_reset_us(
+        self,
+        reset_time: str,
+        day: Optional[str] = None,
+        after_us: Optional[int] = None,
+    ) -> int:
+        """Next reset instant (epoch µs) after ``after_us`` (default: now)."""
+        if after_us is None:
+            after_us = epoch_us(self._now(timezone.utc))
+        weekday = WEEKDAYS[day] if day is not None else None
+        return self.calendar.next_reset_us(after_us, reset_time, weekday)
+
+    def _seconds_until_next(self) -> Optional[float]:
+        """Delay of the reset job (capped at MAX_SLEEP, None if nothing is scheduled)."""
+        pending = [
+            schedule["next_reset_us"]
+            for schedules in (self.daily_schedules, self.weekly_schedules)
+            for schedule in schedules.values()
+        ]
+        if not pending:
+            return None
+        delay = (min(pending) - epoch_us(self._now(timezone.utc))) / 1_000_000
+        return min(max(delay, 0.0), self.MAX_SLEEP)
+
+    def _arm(self) -> None:
+        """Point the reset job at the earliest pending reset."""
+        if self._job is not None and not self._job.cancelled():
+            self._job.reschedule(self._seconds_until_next())
+
+    def _on_deadline(self) -> None:
+        """Reset job - triggers due resets, then re-arms for the next one."""
+        try:
+            self.check_reset_time()
+        finally:
+            self._arm()
 
     def _execute_reset(
         self,
@@ -395,16 +424,16 @@ class ResetScheduler:
                 logger.error(f"Error clearing lockout for account {account_id}: {e}", exc_info=True)
 
         # 3. Log reset to database
-        now = datetime.now(timezone.utc)
+        now = self._now(timezone.utc)
         try:
-            self.database.execute_write(
+            self.database.submit_write(
                 """
-                INSERT INTO reset_log (account_id, reset_type, reset_time, triggered_at)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO reset_log (account_id, reset_type, reset_time, triggered_at, triggered_at_us)
+                VALUES (?, ?, ?, ?, ?)
                 """,
-                (account_id, reset_type, now.isoformat(), now.isoformat())
+                (account_id, reset_type, now.isoformat(), now.isoformat(), epoch_us(now))
             )
-            logger.debug(f"Reset logged to database for account {account_id}")
+            logger.debug(f"Reset log queued for account {account_id}")
         except Exception as e:
             logger.error(f"Error logging reset to database for account {account_id}: {e}", exc_info=True)
 
@@ -419,27 +448,3 @@ class ResetScheduler:
         # This will be populated when schedules are created
         # For now, just log that we're ready to load
         logger.debug("Reset scheduler ready to load last reset times from database")
-
-    async def _reset_loop(self) -> None:
-        """
-        Background task - runs every 1 second (for testing) or 60 seconds (production).
-
-        Checks for reset times and triggers resets automatically.
-        """
-        logger.debug("Reset loop started")
-
-        # Use 1-second interval for testing (will be 60 seconds in production)
-        check_interval = 1
-
-        while self.running:
-            try:
-                self.check_reset_time()
-                await asyncio.sleep(check_interval)
-            except asyncio.CancelledError:
-                logger.debug("Reset loop cancelled")
-                break
-            except Exception as e:
-                logger.error(f"Error in reset loop: {e}", exc_info=True)
-                await asyncio.sleep(check_interval)
-
-        logger.debug("Reset loop stopped")
@@ -6,25 +6,38 @@ Manages timer infrastructure with callbacks for automatic expiry.
 
 Key Features:
 - In-memory timer storage (no DB persistence)
-- Background task checking every 1 second
+- Min-heap of deadlines: a one-shot scheduler job is kept armed for the
+  earliest one (sub-second precision) and moved when an earlier timer
+  starts; with no timers pending the manager causes no wakeups at all
+- O(log n) start/reschedule, O(1) cancel (stale heap entries are skipped
+  and periodically compacted)
 - Callback execution (sync or async)
 - Automatic cleanup after expiry
 - Error handling with proper logging
+- Injectable clock (a VirtualClock can be advanced to fire timers in order)
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, Optional
+import heapq
+import itertools
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
 
 from loguru import logger
 
+from risk_manager.core.clock import Clock
+from risk_manager.core.scheduler import Job, Scheduler
+
 
 class TimerManager:
     """
     Manages countdown timers with automatic callback execution.
 
     Timers are in-memory only and do not persist across restarts.
-    Background task runs every 1 second to check for expired timers.
+    A scheduler job runs at the next deadline (at most MAX_SLEEP seconds
+    away, so clock adjustments are picked up) and fires expired timers in
+    deadline order.
 
     Example:
         ```python
@@ -48,14 +61,38 @@ class TimerManager:
         ```
     """
 
-    def __init__(self):
-        """Initialize the timer manager."""
-        self.timers: Dict[str, Dict[str, Any]] = {}
+    MAX_SLEEP = 5.0  # Upper bound on the delay of the deadline job (seconds)
+    JOB_NAME = "timer_manager"
+
+    def __init__(self, clock: Clock | None = None, scheduler: Scheduler | None = None):
+        """
+        Initialize the timer manager.
+
+        Args:
+            clock: Optional clock (defaults to the system clock)
+            scheduler: Optional shared scheduler (a private one is
+                started with the manager if omitted)
+        """
+        self.clock = clock
+        self.timers: dict[str, dict[str, Any]] = {}
         self.running = False
-        self._background_task: Optional[asyncio.Task] = None
+        self.scheduler = scheduler
+        self._owns_scheduler = scheduler is None
+        self._job: Job | None = None
+
+        # (expires_at, seq, name, timer) - an entry is stale once
+        # self.timers[name] is no longer that timer (cancelled/re-armed)
+        self._heap: list[tuple[datetime, int, str, dict[str, Any]]] = []
+        self._seq = itertools.count()
 
         logger.info("TimerManager initialized")
 
+    def _now(self) -> datetime:
+        """Current naive local time from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.now()
+        return datetime.now()
+
     async def start(self) -> None:
         """Start the timer manager and background task."""
         if self.running:
@@ -73,29 +110,29 @@ class TimerManager:
 
         self.running = False
 
-        # Cancel background task
-        if self._background_task:
-            self._background_task.cancel()
-            try:
-                await self._background_task
-            except asyncio.CancelledError:
-                pass
-            self._background_task = None
+        # Cancel the deadline job
+        if self._job:
+            self._job.cancel()
+            self._job = None
+        if self._owns_scheduler and self.scheduler:
+            await self.scheduler.stop()
 
         logger.info("TimerManager stopped")
 
     async def start_timer(
         self,
         name: str,
-        duration: int,
+        duration: float,
         callback: Callable[[], Any]
     ) -> None:
         """
         Start a countdown timer with automatic callback execution.
 
+        Starting a timer under an existing name reschedules it.
+
         Args:
             name: Unique timer name/identifier
-            duration: Timer duration in seconds (must be >= 0)
+            duration: Timer duration in seconds, fractions allowed (must be >= 0)
             callback: Function to call when timer expires (sync or async)
 
         Raises:
@@ -109,15 +146,18 @@ class TimerManager:
             raise ValueError("Timer callback cannot be None")
 
         # Calculate expiry time
-        expires_at = datetime.now() + timedelta(seconds=duration)
+        now = self._now()
+        expires_at = now + timedelta(seconds=duration)
 
         # Store timer
-        self.timers[name] = {
+        timer = {
             "expires_at": expires_at,
             "callback": callback,
             "duration": duration,
-            "created_at": datetime.now()
+            "created_at": now
         }
+        self.timers[name] = timer
+        self._push(name, timer)
 
         logger.info(
             f"Timer started: {name} (duration={duration}s, expires={expires_at.strftime('%H:%M:%S')})"
@@ -141,7 +181,7 @@ class TimerManager:
         if not timer:
             return 0
 
-        now = datetime.now()
+        now = self._now()
         remaining = (timer["expires_at"] - now).total_seconds()
 
         return max(0, int(remaining))
@@ -157,7 +197,8 @@ class TimerManager:
             Idempotent - no error if timer doesn't exist
         """
         if name in self.timers:
-            self.timers.pop(name)
+            self.timers.pop(name)  # Its heap entry goes stale
+            self._compact_heap()
             logger.info(f"Timer cancelled: {name}")
         else:
             logger.debug(f"Timer cancel requested but not found: {name}")
@@ -175,53 +216,140 @@ class TimerManager:
         return name in self.timers
 
     async def start_background_task(self) -> None:
-        """Start the background task that checks timers."""
-        if self._background_task:
+        """Register the deadline job with the scheduler."""
+        if self._job:
             logger.warning("Background task already running")
             return
 
-        self._background_task = asyncio.create_task(self._timer_loop())
+        if self.scheduler is None:
+            self.scheduler = Scheduler()
+        self.scheduler.start()
+        self._job = self.scheduler.call_later(
+            self.JOB_NAME, self._seconds_until_next(), self._on_deadline
+        )
         logger.debug("Background task started")
 
-    async def check_timers(self) -> None:
+    def _push(self, name: str, timer: dict[str, Any]) -> None:
+        """Schedule a timer's deadline and move the job if it is the earliest."""
+        self._compact_heap()  # Re-arming a name leaves its old entry stale
+        entry = (timer["expires_at"], next(self._seq), name, timer)
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._arm()
+
+    def _is_live(self, entry: tuple[datetime, int, str, dict[str, Any]]) -> bool:
+        """True if a heap entry still belongs to a pending timer."""
+        return self.timers.get(entry[2]) is entry[3]
+
+    def _compact_heap(self) -> None:
+        """Drop stale entries once they outnumber live timers."""
+        if len(self._heap) > 2 * len(self.timers) + 64:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+
+    def next_expiry(self) -> datetime | None:
         """
-        Check for expired timers and execute their callbacks.
+        Get the earliest pending expiry.
 
-        This method is called by the background task every 1 second.
-        Can also be called manually for testing.
+        Returns:
+            Expiry time (naive local, like expires_at), or None if no timers
         """
-        now = datetime.now()
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
 
-        # Find expired timers
-        expired = [
-            name for name, timer in self.timers.items()
-            if now >= timer["expires_at"]
-        ]
+    async def check_timers(self) -> int:
+        """
+        Check for expired timers and execute their callbacks.
 
-        # Execute callbacks for expired timers
-        for name in expired:
-            await self._execute_callback(name)
+        Called by the background task at each deadline. Can also be called
+        manually for testing.
 
-    async def _timer_loop(self) -> None:
+        Callbacks run in expiry order (timers due at the same time in the
+        order they were started). Timers started by those callbacks are
+        left for the next check.
+
+        Returns:
+            Number of timers fired
         """
-        Background task - runs every 1 second.
+        now = self._now()
+
+        # Pop everything due, earliest first
+        expired = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                expired.append(entry)
+
+        # Execute callbacks (skipping timers an earlier callback cancelled)
+        fired = 0
+        for _, _, name, timer in expired:
+            if self.timers.get(name) is timer:
+                await self._execute_callback(name)
+                fired += 1
+        return fired
+
+    async def advance_to(self, moment: datetime) -> int:
+        """
+        Move a virtual clock forward to ``moment``, firing timers on the way.
+
+        The clock stops at each expiry before its callback runs, so callbacks
+        see their own expiry time, fire in order, and timers they start are
+        fired too if they fall before ``moment``. This is how simulated
+        sessions (replay, soak tests) run hours of timers in milliseconds.
+
+        Args:
+            moment: Target time (aware; naive values are taken as UTC,
+                as in VirtualClock.set)
+
+        Returns:
+            Number of timers fired
 
-        Checks for expired timers and executes their callbacks.
+        Raises:
+            RuntimeError: If the clock cannot be moved (no VirtualClock)
         """
-        logger.debug("Timer loop started")
-
-        while self.running:
-            try:
-                await self.check_timers()
-                await asyncio.sleep(1)  # 1-second intervals
-            except asyncio.CancelledError:
-                logger.debug("Timer loop cancelled")
+        if not hasattr(self.clock, "set"):
+            raise RuntimeError("advance_to() requires a VirtualClock")
+
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=UTC)
+
+        fired = 0
+        while True:
+            expiry = self.next_expiry()
+            # Expiries are naive local time
+            if expiry is None or expiry.astimezone(UTC) > moment:
                 break
-            except Exception as e:
-                logger.error(f"Error in timer loop: {e}", exc_info=True)
-                await asyncio.sleep(1)  # Continue after error
+            self.clock.set(expiry.astimezone(UTC))
+            fired += await self.check_timers()
+            await asyncio.sleep(0)  # Let tasks spawned by callbacks run
+
+        self.clock.set(moment)
+        return fired
+
+    def _seconds_until_next(self) -> float | None:
+        """Delay of the deadline job (capped at MAX_SLEEP, None if no timers)."""
+        expiry = self.next_expiry()
+        if expiry is None:
+            return None
+        delay = (expiry - self._now()).total_seconds()
+        return min(max(delay, 0.0), self.MAX_SLEEP)
+
+    def _arm(self) -> None:
+        """Point the deadline job at the earliest pending expiry."""
+        if self._job is not None and not self._job.cancelled():
+            self._job.reschedule(self._seconds_until_next())
+
+    async def _on_deadline(self) -> None:
+        """
+        Deadline job - fires expired timers, then re-arms for the next one.
 
-        logger.debug("Timer loop stopped")
+        Timers started or cancelled meanwhile move the job via _push().
+        """
+        try:
+            await self.check_timers()
+        finally:
+            self._arm()
 
     async def _execute_callback(self, name: str) -> None:
         """
@@ -252,11 +380,13 @@ class TimerManager:
             )
 
         finally:
-            # Always remove timer after execution (success or failure)
-            self.timers.pop(name, None)
+            # Always remove timer after execution (success or failure),
+            # unless the callback re-armed a timer under the same name
+            if self.timers.get(name) is timer:
+                self.timers.pop(name)
             logger.info(f"Timer expired and removed: {name}")
 
-    def get_all_timers(self) -> Dict[str, Dict[str, Any]]:
+    def get_all_timers(self) -> dict[str, dict[str, Any]]:
         """
         Get all active timers (for debugging/monitoring).
 
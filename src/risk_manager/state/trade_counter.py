@@ -0,0 +1,239 @@
+"""
+Trade Counter - In-Memory Trade Frequency Windows
+
+Counts trades per account in rolling windows (last minute, last hour) and
+in the current session, without touching SQLite on the evaluation path.
+
+Key Features:
+- One deque of trade times per (account, window), pruned from the left,
+  so counts are O(1) amortized
+- Session count keyed by the trading day, which rolls over at the daily
+  reset (same rule as Database.get_session_trade_count)
+- Duplicate trade IDs within the session are counted once
+- Hydrated from the ``trades`` table at startup; new trades are queued
+  for the database writer, which stays the durable record
+
+Example:
+    ```python
+    counter = TradeCounter(database=db)
+    counter.hydrate()
+
+    counter.record("123", trade_id="T1", symbol="MNQ")
+    counter.count("123", window=60)    # 1
+    counter.session_count("123")       # 1
+    ```
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from loguru import logger
+
+from risk_manager.core.clock import Clock
+from risk_manager.state.database import Database, epoch_us, trading_day
+
+
+class TradeCounter:
+    """
+    Per-account trade counts for rolling windows and the current session.
+
+    Windows are fixed at construction; counting a window that isn't
+    tracked raises KeyError rather than silently returning a wrong value.
+    """
+
+    DEFAULT_WINDOWS = (60, 3600)  # per_minute, per_hour
+
+    def __init__(
+        self,
+        database: Database | None = None,
+        clock: Clock | None = None,
+        windows: Iterable[int] = DEFAULT_WINDOWS,
+    ):
+        """
+        Initialize trade counter.
+
+        Args:
+            database: Database for hydration and persistence (optional)
+            clock: Optional clock (defaults to the system clock)
+            windows: Rolling window lengths in seconds
+        """
+        self.database = database
+        self.clock = clock
+        self.windows = tuple(sorted(set(windows)))
+
+        # {account_id: {window: deque[epoch seconds]}}
+        self._window_times: dict[str, dict[int, deque]] = {}
+
+        # Current session (trading day) and its per-account counts / trade IDs
+        self._session_day: str | None = None
+        self._session_counts: dict[str, int] = {}
+        self._session_trade_ids: dict[str, set] = {}
+
+        logger.info(f"TradeCounter initialized (windows={self.windows})")
+
+    def _now(self) -> datetime:
+        """Current UTC time from the injected clock, or the system clock."""
+        if self.clock is not None:
+            return self.clock.now(UTC)
+        return datetime.now(UTC)
+
+    def _trading_day(self, moment: datetime) -> str:
+        """Trading day of a moment, using the database's reset if available."""
+        if self.database is not None:
+            return self.database.trading_day(moment)
+        return trading_day(moment)
+
+    def _roll_session(self, today: str) -> None:
+        """Start a new session when the trading day changes."""
+        if self._session_day != today:
+            self._session_day = today
+            self._session_counts.clear()
+            self._session_trade_ids.clear()
+
+    def _add(self, account_id: str, trade_id: Any, at: datetime) -> bool:
+        """Count one trade in memory. Returns False for a duplicate trade ID."""
+        self._roll_session(self._trading_day(self._now()))
+
+        if trade_id is not None:
+            trade_id = str(trade_id)  # Events carry ints, the trades table TEXT
+            seen = self._session_trade_ids.setdefault(account_id, set())
+            if trade_id in seen:
+                return False
+            seen.add(trade_id)
+
+        epoch = at.timestamp()
+        windows = self._window_times.get(account_id)
+        if windows is None:
+            windows = self._window_times[account_id] = {w: deque() for w in self.windows}
+        for times in windows.values():
+            times.append(epoch)
+
+        if self._trading_day(at) == self._session_day:
+            self._session_counts[account_id] = self._session_counts.get(account_id, 0) + 1
+        return True
+
+    def record(
+        self,
+        account_id: Any,
+        trade_id: Any = None,
+        symbol: str = "",
+        side: str = "",
+        quantity: int = 0,
+        price: float = 0.0,
+        realized_pnl: float | None = None,
+    ) -> bool:
+        """
+        Record a trade executed now.
+
+        Counts it in memory and queues it for the ``trades`` table.
+
+        Args:
+            account_id: Account identifier
+            trade_id: Broker trade ID (used to drop duplicate deliveries)
+            symbol: Trading symbol
+            side: Trade side
+            quantity: Number of contracts
+            price: Execution price
+            realized_pnl: Realized P&L (optional)
+
+        Returns:
+            True if counted, False if the trade ID was already recorded
+        """
+        account_id = str(account_id)
+        now = self._now()
+        if not self._add(account_id, trade_id, now):
+            return False
+
+        if self.database is not None:
+            self.database.submit_trade(
+                account_id,
+                str(trade_id) if trade_id is not None else f"local-{now.timestamp():.6f}",
+                symbol or "",
+                str(side or ""),
+                int(quantity or 0),
+                float(price or 0.0),
+                realized_pnl,
+                now,
+            )
+        return True
+
+    def count(self, account_id: Any, window: int) -> int:
+        """
+        Get number of trades in the last ``window`` seconds.
+
+        Args:
+            account_id: Account identifier
+            window: One of the tracked window lengths (seconds)
+
+        Returns:
+            Number of trades in the window
+        """
+        if window not in self.windows:
+            raise KeyError(f"Window {window}s is not tracked (tracked: {self.windows})")
+
+        windows = self._window_times.get(str(account_id))
+        if windows is None:
+            return 0
+
+        times = windows[window]
+        cutoff = self._now().timestamp() - window
+        while times and times[0] < cutoff:
+            times.popleft()
+        return len(times)
+
+    def session_count(self, account_id: Any) -> int:
+        """
+        Get number of trades in the current session (trading day).
+
+        Args:
+            account_id: Account identifier
+
+        Returns:
+            Number of trades this session
+        """
+        self._roll_session(self._trading_day(self._now()))
+        return self._session_counts.get(str(account_id), 0)
+
+    def hydrate(self) -> int:
+        """
+        Load recent trades from the database.
+
+        Loads everything inside the longest window or the current session.
+
+        Returns:
+            Number of trades loaded
+        """
+        if self.database is None:
+            return 0
+
+        now = self._now()
+        window_start = now - timedelta(seconds=max(self.windows, default=0))
+
+        rows = self.database.execute(
+            """
+            SELECT account_id, trade_id, timestamp
+            FROM trades
+            WHERE ts_us >= ? OR trading_day = ?
+            """,
+            (epoch_us(window_start), self._trading_day(now)),
+        )
+
+        trades = []
+        for row in rows:
+            try:
+                at = datetime.fromisoformat(row["timestamp"])
+            except (TypeError, ValueError):
+                logger.warning(f"Skipping trade with bad timestamp: {row['timestamp']!r}")
+                continue
+            if at.tzinfo is None:
+                at = at.replace(tzinfo=UTC)
+            if at <= now:
+                trades.append((at, row["account_id"], row["trade_id"]))
+
+        trades.sort(key=lambda trade: trade[0])
+        loaded = sum(self._add(account_id, trade_id, at) for at, account_id, trade_id in trades)
+
+        logger.info(f"TradeCounter hydrated with {loaded} trade(s)")
+        return loaded
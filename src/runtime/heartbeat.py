@@ -2,7 +2,8 @@
 Background heartbeat task for system health monitoring.
 
 Emits periodic heartbeat messages to logs for easy filtering and monitoring.
-Starts automatically with the engine and runs in the background.
+Starts automatically with the engine and runs as a job on the runtime
+scheduler (a private one unless a shared scheduler is passed in).
 
 Features:
 - Emits "⏰ HEARTBEAT" every 1 second
@@ -14,11 +15,12 @@ Author: Risk Manager Team
 Date: 2025-10-23
 """
 
-import asyncio
 import logging
 from datetime import UTC, datetime
 from typing import Optional
 
+from risk_manager.core.scheduler import Job, Scheduler
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,88 +32,59 @@ class HeartbeatTask:
     for health monitoring and log analysis.
     """
 
-    def __init__(self, interval_seconds: float = 1.0):
+    def __init__(self, interval_seconds: float = 1.0, scheduler: Optional[Scheduler] = None):
         """
         Initialize heartbeat task.
 
         Args:
             interval_seconds: Interval between heartbeats (default: 1.0)
+            scheduler: Optional shared scheduler (a private one is started
+                with the heartbeat if omitted)
         """
         self.interval = interval_seconds
-        self._task: Optional[asyncio.Task] = None
+        self.scheduler = scheduler
+        self._owns_scheduler = scheduler is None
+        self._job: Optional[Job] = None
         self._running = False
         self._heartbeat_count = 0
         self._start_time: Optional[datetime] = None
 
-    async def _heartbeat_loop(self) -> None:
-        """Internal heartbeat loop."""
-        self._start_time = datetime.now(UTC)
+    def _beat(self) -> None:
+        """Scheduler job - emits one heartbeat."""
+        self._heartbeat_count += 1
+        current_time = datetime.now(UTC)
+
+        # Emit heartbeat with emoji for easy filtering
         logger.info(
-            "Heartbeat task started",
+            "⏰ HEARTBEAT",
             extra={
-                "interval_seconds": self.interval,
-                "start_time": self._start_time.isoformat(),
+                "heartbeat_count": self._heartbeat_count,
+                "uptime_seconds": self.uptime_seconds,
+                "timestamp": current_time.isoformat(),
             },
         )
 
-        try:
-            while self._running:
-                self._heartbeat_count += 1
-                current_time = datetime.now(UTC)
-
-                # Calculate uptime
-                uptime_seconds = (
-                    (current_time - self._start_time).total_seconds()
-                    if self._start_time
-                    else 0
-                )
-
-                # Emit heartbeat with emoji for easy filtering
-                logger.info(
-                    "⏰ HEARTBEAT",
-                    extra={
-                        "heartbeat_count": self._heartbeat_count,
-                        "uptime_seconds": uptime_seconds,
-                        "timestamp": current_time.isoformat(),
-                    },
-                )
-
-                # Wait for next interval
-                await asyncio.sleep(self.interval)
-
-        except asyncio.CancelledError:
-            logger.info(
-                "Heartbeat task cancelled",
-                extra={
-                    "total_heartbeats": self._heartbeat_count,
-                    "final_uptime": uptime_seconds if self._start_time else 0,
-                },
-            )
-            raise
-        except Exception as e:
-            logger.exception(
-                "Heartbeat task error",
-                extra={
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "heartbeat_count": self._heartbeat_count,
-                },
-            )
-            raise
-
     def start(self) -> None:
-        """Start the heartbeat task."""
+        """Start the heartbeat job (must be called from a running event loop)."""
         if self._running:
             logger.warning("Heartbeat task already running")
             return
 
         self._running = True
         self._heartbeat_count = 0
-        self._task = asyncio.create_task(self._heartbeat_loop())
+        self._start_time = datetime.now(UTC)
+
+        if self.scheduler is None:
+            self.scheduler = Scheduler()
+        self.scheduler.start()
+        self._job = self.scheduler.every("heartbeat", self.interval, self._beat, first_delay=0)
 
         logger.info(
-            "Heartbeat task initialized",
-            extra={"interval_seconds": self.interval},
+            "Heartbeat task started",
+            extra={
+                "interval_seconds": self.interval,
+                "start_time": self._start_time.isoformat(),
+            },
         )
 
     async def stop(self) -> None:
@@ -127,12 +100,11 @@ class HeartbeatTask:
 
         self._running = False
 
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        if self._job:
+            self._job.cancel()
+            self._job = None
+        if self._owns_scheduler and self.scheduler:
+            await self.scheduler.stop()
 
         logger.info(
             "Heartbeat task stopped",
@@ -161,12 +133,15 @@ class HeartbeatTask:
 _global_heartbeat: Optional[HeartbeatTask] = None
 
 
-def start_global_heartbeat(interval_seconds: float = 1.0) -> HeartbeatTask:
+def start_global_heartbeat(
+    interval_seconds: float = 1.0, scheduler: Optional[Scheduler] = None
+) -> HeartbeatTask:
     """
     Start global heartbeat task.
 
     Args:
         interval_seconds: Heartbeat interval
+        scheduler: Optional shared scheduler
 
     Returns:
         HeartbeatTask instance
@@ -177,7 +152,7 @@ def start_global_heartbeat(interval_seconds: float = 1.0) -> HeartbeatTask:
         logger.warning("Global heartbeat already running")
         return _global_heartbeat
 
-    _global_heartbeat = HeartbeatTask(interval_seconds)
+    _global_heartbeat = HeartbeatTask(interval_seconds, scheduler=scheduler)
     _global_heartbeat.start()
 
     return _global_heartbeat
@@ -618,11 +618,15 @@ class TestMultiRuleInteractionsE2E:
         rule2.evaluate = tracked_evaluate2
 
         await risk_system.engine.evaluate_rules(event)
+
+        # DailyLossRule only consumes P&L events, so route one to it as well
+        await risk_system.engine.evaluate_rules(
+            RiskEvent(event_type=EventType.PNL_UPDATED, data={"realized_pnl": -60.0})
+        )
         await asyncio.sleep(0.1)
 
-        # Verify both rules evaluated
-        assert "MaxPositionRule" in evaluation_order
-        assert "DailyLossRule" in evaluation_order
+        # Verify both rules evaluated, each on the event type it consumes
+        assert evaluation_order == ["MaxPositionRule", "DailyLossRule"]
 
         # Cleanup
         risk_system.lockout_manager.clear_lockout(account_id)
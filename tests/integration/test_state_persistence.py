@@ -345,6 +345,7 @@ class TestStatePersistence:
         # Write from db1
         pnl_tracker1 = PnLTracker(db=db1)
         pnl_tracker1.add_trade_pnl("ACC-001", -50.00)
+        db1.flush()  # Writes are applied by db1's writer thread
 
         # Read from db2 (should see the change)
         pnl_tracker2 = PnLTracker(db=db2)
@@ -353,9 +354,11 @@ class TestStatePersistence:
 
         # Write from db2
         pnl_tracker2.add_trade_pnl("ACC-001", -25.00)
+        db2.flush()
 
-        # Read from db1 (should see the update)
-        pnl = pnl_tracker1.get_daily_pnl("ACC-001")
+        # Read from db1 (should see the update). A tracker's ledger is
+        # authoritative for its own process, so read through a fresh one.
+        pnl = PnLTracker(db=db1).get_daily_pnl("ACC-001")
         assert pnl == -75.00, "Updates should be visible across connections"
 
         # Cleanup
@@ -356,8 +356,8 @@ class TestDeduplication:
         entity_id = "12345"
 
         # Set very short TTL for testing
-        original_ttl = trading_integration._event_cache_ttl
-        trading_integration._event_cache_ttl = 0.1  # 100ms
+        original_ttl = trading_integration._event_dedup.ttl
+        trading_integration._event_dedup.ttl = 0.1  # 100ms
 
         # First call - not a duplicate
         is_dup_1 = trading_integration._is_duplicate_event(event_type, entity_id)
@@ -371,7 +371,7 @@ class TestDeduplication:
         assert is_dup_2 is False, "Event should not be duplicate after TTL expires"
 
         # Restore original TTL
-        trading_integration._event_cache_ttl = original_ttl
+        trading_integration._event_dedup.ttl = original_ttl
 
 
 # ============================================================================
@@ -486,8 +486,7 @@ class TestInitialization:
         assert isinstance(trading_integration._protective_cache._active_take_profits, dict)
         assert len(trading_integration._protective_cache._active_take_profits) == 0
 
-        assert isinstance(trading_integration._event_cache, dict)
-        assert len(trading_integration._event_cache) == 0
+        assert len(trading_integration._event_dedup) == 0
 
         # Position tracking is now consolidated in pnl_calculator
         assert trading_integration.pnl_calculator.get_position_count() == 0
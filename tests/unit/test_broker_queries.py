@@ -0,0 +1,192 @@
+"""
+Unit tests for BrokerQueryCache module.
+
+Tests single-flight coalescing, TTL caching, invalidation, error handling
+and metrics of the shared broker query layer.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from risk_manager.core.clock import VirtualClock
+from risk_manager.integrations.sdk.broker_queries import BrokerQueryCache
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def clock():
+    """Create a virtual clock."""
+    return VirtualClock(datetime(2025, 1, 17, 14, 0, tzinfo=timezone.utc))
+
+
+@pytest.fixture
+def queries(clock):
+    """Create BrokerQueryCache with a 250ms TTL on a virtual clock."""
+    return BrokerQueryCache(ttl=0.25, clock=clock)
+
+
+def make_instrument(delay: float = 0.0):
+    """Create a mock instrument whose queries take `delay` seconds."""
+    instrument = Mock()
+
+    async def get_position_orders(contract_id):
+        await asyncio.sleep(delay)
+        return [f"order-{contract_id}"]
+
+    async def get_all_positions():
+        await asyncio.sleep(delay)
+        return ["position"]
+
+    instrument.orders.get_position_orders = AsyncMock(side_effect=get_position_orders)
+    instrument.positions.get_all_positions = AsyncMock(side_effect=get_all_positions)
+    return instrument
+
+
+# ============================================================================
+# Test: Single Flight
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_one_call(queries):
+    """Test that concurrent identical queries are collapsed into one call."""
+    instrument = make_instrument(delay=0.01)
+
+    results = await asyncio.gather(*[
+        queries.get_position_orders("MNQ", instrument, "CON.F.US.MNQ.Z25") for _ in range(5)
+    ])
+
+    assert results == [["order-CON.F.US.MNQ.Z25"]] * 5
+    assert instrument.orders.get_position_orders.await_count == 1
+    stats = queries.get_stats()
+    assert (stats["misses"], stats["coalesced"]) == (1, 4)
+
+
+@pytest.mark.asyncio
+async def test_different_queries_are_not_collapsed(queries):
+    """Test that different contracts get their own calls."""
+    instrument = make_instrument(delay=0.01)
+
+    await asyncio.gather(
+        queries.get_position_orders("MNQ", instrument, "CON.F.US.MNQ.Z25"),
+        queries.get_position_orders("MNQ", instrument, "CON.F.US.MNQ.H26"),
+    )
+
+    assert instrument.orders.get_position_orders.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_account_wide_queries_shared_across_instruments(queries):
+    """Test that account-wide queries through different instruments share one call."""
+    mnq, es = make_instrument(delay=0.01), make_instrument(delay=0.01)
+    positions = [Mock(contractId="CON.F.US.MNQ.Z25"), Mock(contractId="CON.F.US.ES.Z25")]
+    mnq.positions.get_all_positions = AsyncMock(return_value=positions)
+
+    everything, es_only = await asyncio.gather(
+        queries.get_all_positions(mnq),
+        queries.get_all_positions(es, "CON.F.US.ES.Z25"),
+    )
+
+    assert everything == positions
+    assert es_only == [positions[1]]
+    assert mnq.positions.get_all_positions.await_count == 1
+    assert es.positions.get_all_positions.await_count == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_and_are_not_cached(queries):
+    """Test that a failed call fails all waiters and is retried next time."""
+    calls = 0
+
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        if calls == 1:
+            raise RuntimeError("rate limited")
+        return "ok"
+
+    results = await asyncio.gather(
+        queries.query(("orders", "x"), flaky),
+        queries.query(("orders", "x"), flaky),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert await queries.query(("orders", "x"), flaky) == "ok"
+    assert queries.get_stats()["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_waiters(queries):
+    """Test that cancelling the caller that started a fetch leaves it running for the others."""
+    instrument = make_instrument(delay=0.01)
+
+    first = asyncio.create_task(queries.get_position_orders("MNQ", instrument, "CON.F.US.MNQ.Z25"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(queries.get_position_orders("MNQ", instrument, "CON.F.US.MNQ.Z25"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == ["order-CON.F.US.MNQ.Z25"]
+    assert first.cancelled()
+    assert instrument.orders.get_position_orders.await_count == 1
+
+
+# ============================================================================
+# Test: TTL Cache
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_results_expire_after_ttl(queries, clock):
+    """Test that a result is reused within the TTL and refetched after it."""
+    instrument = make_instrument()
+
+    await queries.get_all_positions(instrument)
+    clock.advance(0.2)
+    await queries.get_all_positions(instrument)
+    assert instrument.positions.get_all_positions.await_count == 1
+    assert queries.get_stats()["hits"] == 1
+
+    clock.advance(0.1)
+    await queries.get_all_positions(instrument)
+    assert instrument.positions.get_all_positions.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_by_kind(queries):
+    """Test that invalidation only drops the given kind of query."""
+    instrument = make_instrument()
+    await queries.get_all_positions(instrument)
+    await queries.get_position_orders("MNQ", instrument, "CON.F.US.MNQ.Z25")
+
+    queries.invalidate(BrokerQueryCache.ORDERS)
+    await queries.get_all_positions(instrument)
+    await queries.get_position_orders("MNQ", instrument, "CON.F.US.MNQ.Z25")
+
+    assert instrument.positions.get_all_positions.await_count == 1
+    assert instrument.orders.get_position_orders.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_result_fetched_across_invalidation_is_not_cached(queries):
+    """Test that a call in flight during invalidation does not repopulate the cache."""
+    instrument = make_instrument(delay=0.01)
+
+    pending = asyncio.create_task(queries.get_all_positions(instrument))
+    await asyncio.sleep(0)
+    queries.invalidate(BrokerQueryCache.POSITIONS)
+    await pending
+    await queries.get_all_positions(instrument)
+
+    assert instrument.positions.get_all_positions.await_count == 2
+
+
+def test_negative_ttl_rejected():
+    """Test that a negative TTL is rejected."""
+    with pytest.raises(ValueError):
+        BrokerQueryCache(ttl=-1)
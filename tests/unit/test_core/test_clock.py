@@ -0,0 +1,206 @@
+"""
+Unit tests for clock injection.
+
+Every time-dependent component takes an optional clock. These tests drive
+them with a VirtualClock: timers fire in expiry order as simulated time
+advances, and lockouts, resets, trade windows, session checks and the
+daily reset math all read the injected time instead of the wall clock.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from risk_manager.core.clock import Clock, SystemClock, VirtualClock
+from risk_manager.core.events import EventType, RiskEvent
+from risk_manager.rules.daily_realized_loss import DailyRealizedLossRule
+from risk_manager.rules.session_block_outside import SessionBlockOutsideRule
+from risk_manager.state.database import Database
+from risk_manager.state.lockout_manager import LockoutManager
+from risk_manager.state.pnl_tracker import PnLTracker
+from risk_manager.state.reset_scheduler import ResetScheduler
+from risk_manager.state.timer_manager import TimerManager
+
+ET = ZoneInfo("America/New_York")
+
+# Friday 2025-01-17 09:30 ET
+SESSION_OPEN = datetime(2025, 1, 17, 9, 30, tzinfo=ET)
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock(SESSION_OPEN)
+
+
+@pytest.fixture
+def db(clock, tmp_path):
+    database = Database(tmp_path / "clock.db", clock=clock)
+    yield database
+    database.close()
+
+
+def test_incomplete_clock_cannot_be_constructed():
+    class NowOnly(Clock):
+        def now(self, tz=None):
+            return datetime.now(tz)
+
+    with pytest.raises(TypeError):
+        NowOnly()
+
+
+# ============================================================================
+# Test: TimerManager
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestTimerManagerClock:
+    """Test timers on a virtual clock."""
+
+    async def test_expiry_follows_injected_clock(self, clock):
+        timers = TimerManager(clock=clock)
+        await timers.start_timer("cooldown", duration=60, callback=lambda: None)
+
+        assert timers.get_remaining_time("cooldown") == 60
+        clock.advance(45)
+        assert timers.get_remaining_time("cooldown") == 15
+
+    async def test_check_timers_fires_in_expiry_order(self, clock):
+        timers = TimerManager(clock=clock)
+        fired = []
+        for name, duration in [("late", 30), ("early", 10), ("middle", 20)]:
+            await timers.start_timer(name, duration=duration, callback=lambda n=name: fired.append(n))
+
+        clock.advance(60)
+        await timers.check_timers()
+
+        assert fired == ["early", "middle", "late"]
+
+    async def test_advance_to_runs_each_callback_at_its_expiry(self, clock):
+        timers = TimerManager(clock=clock)
+        fired_at = []
+
+        async def chain():
+            fired_at.append(clock.now(timezone.utc))
+            if len(fired_at) < 3:
+                await timers.start_timer("chain", duration=600, callback=chain)
+
+        await timers.start_timer("chain", duration=600, callback=chain)
+        fired = await timers.advance_to(SESSION_OPEN + timedelta(hours=1))
+
+        start = SESSION_OPEN.astimezone(timezone.utc)
+        assert fired == 3
+        assert fired_at == [start + timedelta(minutes=m) for m in (10, 20, 30)]
+        assert clock.now(timezone.utc) == start + timedelta(hours=1)
+
+    async def test_advance_to_requires_virtual_clock(self):
+        with pytest.raises(RuntimeError):
+            await TimerManager(clock=SystemClock()).advance_to(datetime.now(timezone.utc))
+
+
+# ============================================================================
+# Test: State components
+# ============================================================================
+
+class TestStateClock:
+    """Test lockouts, resets and trade windows on a virtual clock."""
+
+    def test_lockout_expires_on_virtual_time(self, db, clock):
+        lockouts = LockoutManager(database=db, clock=clock)
+        lockouts.set_lockout(123, "Daily loss limit", until=SESSION_OPEN + timedelta(hours=1))
+
+        clock.advance(3599)
+        assert lockouts.is_locked_out(123) is True
+        assert lockouts.get_lockout_info(123)["remaining_seconds"] == 1
+
+        clock.advance(1)
+        assert lockouts.is_locked_out(123) is False
+
+    def test_next_reset_time_reads_clock(self, db, clock):
+        scheduler = ResetScheduler(database=db, clock=clock)
+        scheduler.schedule_daily_reset("123", reset_time="17:00")
+
+        assert scheduler.get_next_reset_time("123", "daily") == datetime(
+            2025, 1, 17, 17, 0, tzinfo=ET
+        ).astimezone(timezone.utc)
+
+    def test_trade_window_reads_clock(self, db, clock):
+        db.add_trade("123", "T1", "ES", "buy", 1, 5000.0)
+        clock.advance(30)
+        db.add_trade("123", "T2", "ES", "sell", 1, 5001.0)
+
+        assert db.get_trade_count("123", window=60) == 2
+        clock.advance(45)
+        assert db.get_trade_count("123", window=60) == 1
+
+    def test_pnl_day_follows_clock(self, db, clock):
+        tracker = PnLTracker(db, clock=clock)
+        tracker.add_trade_pnl("123", -150.0)
+
+        clock.advance(24 * 3600)
+        assert tracker.get_daily_pnl("123") == 0.0
+        assert tracker.get_daily_pnl("123", clock.now().date() - timedelta(days=1)) == -150.0
+
+
+# ============================================================================
+# Test: Rules
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestRuleClock:
+    """Test rule time checks on a virtual clock."""
+
+    async def test_session_check_reads_clock(self, clock):
+        lockouts = Mock()
+        lockouts.is_locked_out = Mock(return_value=False)
+        rule = SessionBlockOutsideRule(
+            config={"global_session": {"start": "09:30", "end": "16:00"}},
+            lockout_manager=lockouts,
+            clock=clock,
+        )
+        event = RiskEvent(event_type=EventType.POSITION_OPENED, data={"account_id": 123})
+
+        assert await rule.evaluate(event, Mock()) is None
+        clock.advance(7 * 3600)  # 16:30 ET
+        assert await rule.evaluate(event, Mock()) is not None
+
+    async def test_daily_reset_math_reads_clock(self, db, clock):
+        rule = DailyRealizedLossRule(
+            limit=-500.0,
+            pnl_tracker=Mock(),
+            lockout_manager=Mock(),
+            clock=clock,
+        )
+        clock.set(datetime(2025, 1, 17, 18, 0, tzinfo=ET))
+
+        assert rule._calculate_next_reset_time() == datetime(
+            2025, 1, 18, 17, 0, tzinfo=ET
+        ).astimezone(timezone.utc)
+
+
+# ============================================================================
+# Test: Soak
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_eight_hour_session_soak(clock, db):
+    """A cooldown every 20 minutes for 8 hours, advanced in 1-second steps."""
+    timers = TimerManager(clock=clock)
+    lockouts = LockoutManager(database=db, timer_manager=timers, clock=clock)
+    started = time.perf_counter()
+
+    cooldowns = 0
+    locked_seconds = 0
+    for second in range(8 * 3600):
+        if second % 1200 == 0:
+            await lockouts.set_cooldown(123, "Loss cooldown", duration_seconds=900)
+            cooldowns += 1
+        locked_seconds += lockouts.is_locked_out(123)
+        await timers.advance_to(SESSION_OPEN + timedelta(seconds=second + 1))
+
+    assert cooldowns == 24
+    assert locked_seconds == 24 * 900  # Every cooldown lasted exactly 15 minutes
+    assert timers.get_timer_count() == 0
+    assert time.perf_counter() - started < 30
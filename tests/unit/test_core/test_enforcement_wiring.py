@@ -2,6 +2,8 @@
 Test that RiskEngine is properly wired to TradingIntegration for enforcement.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -41,6 +43,27 @@ class TestEnforcementWiring:
         # Verify it called the trading integration
         mock_trading.flatten_all.assert_called_once()
 
+    async def test_flatten_all_survives_caller_cancellation(self):
+        """Test that cancelling the caller does not cancel a flatten in progress."""
+        config = RiskConfig(project_x_api_key="test", project_x_username="user")
+        event_bus = EventBus()
+        mock_trading = AsyncMock()
+        flattened = asyncio.Event()
+
+        async def slow_flatten():
+            await asyncio.sleep(0.02)
+            flattened.set()
+
+        mock_trading.flatten_all = slow_flatten
+        engine = RiskEngine(config, event_bus, trading_integration=mock_trading)
+
+        caller = asyncio.create_task(engine.flatten_all_positions())
+        await asyncio.sleep(0.005)
+        caller.cancel()
+
+        await asyncio.wait_for(flattened.wait(), 1.0)
+        assert caller.cancelled()
+
     async def test_flatten_all_without_trading_integration(self):
         """Test that flatten_all_positions() doesn't crash without trading_integration."""
         config = RiskConfig(project_x_api_key="test", project_x_username="user")
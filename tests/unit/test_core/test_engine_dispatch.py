@@ -0,0 +1,113 @@
+"""
+Test RiskEngine event-type routing.
+
+Rules declare the EventTypes they consume; the engine only invokes a rule
+for events in that set.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from risk_manager.core.config import RiskConfig
+from risk_manager.core.engine import RiskEngine
+from risk_manager.core.events import EventBus, EventType, RiskEvent
+from risk_manager.rules import (
+    DailyUnrealizedLossRule,
+    MaxUnrealizedProfitRule,
+    TradeFrequencyLimitRule,
+)
+from risk_manager.rules.base import RiskRule
+
+
+class CountingRule(RiskRule):
+    """Rule that records every event it is asked to evaluate."""
+
+    def __init__(self, event_types=None):
+        super().__init__()
+        if event_types is not None:
+            self.event_types = frozenset(event_types)
+        self.seen: list[EventType] = []
+
+    async def evaluate(self, event, engine):
+        self.seen.append(event.event_type)
+        return None
+
+
+@pytest.fixture
+def engine():
+    config = RiskConfig(project_x_api_key="test", project_x_username="user")
+    return RiskEngine(config, EventBus())
+
+
+@pytest.mark.asyncio
+class TestEngineDispatch:
+    """Test the EventType → rules dispatch table."""
+
+    async def test_rule_only_receives_declared_events(self, engine):
+        rule = CountingRule({EventType.POSITION_CLOSED})
+        engine.add_rule(rule)
+
+        await engine.evaluate_rules(RiskEvent(event_type=EventType.MARKET_DATA_UPDATED))
+        await engine.evaluate_rules(RiskEvent(event_type=EventType.POSITION_CLOSED))
+
+        assert rule.seen == [EventType.POSITION_CLOSED]
+
+    async def test_rule_without_declaration_receives_all_events(self, engine):
+        rule = CountingRule()
+        engine.add_rule(rule)
+
+        await engine.evaluate_rules(RiskEvent(event_type=EventType.MARKET_DATA_UPDATED))
+        await engine.evaluate_rules(RiskEvent(event_type=EventType.POSITION_CLOSED))
+
+        assert rule.seen == [EventType.MARKET_DATA_UPDATED, EventType.POSITION_CLOSED]
+
+    async def test_dispatch_preserves_registration_order(self, engine):
+        first = CountingRule({EventType.POSITION_OPENED})
+        wildcard = CountingRule()
+        last = CountingRule({EventType.POSITION_OPENED})
+        for rule in (first, wildcard, last):
+            engine.add_rule(rule)
+
+        assert engine.get_rules_for_event(EventType.POSITION_OPENED) == [first, wildcard, last]
+        assert engine.get_rules_for_event(EventType.ORDER_FILLED) == [wildcard]
+
+    async def test_add_rule_invalidates_table(self, engine):
+        first = CountingRule({EventType.TRADE_EXECUTED})
+        engine.add_rule(first)
+        assert engine.get_rules_for_event(EventType.TRADE_EXECUTED) == [first]
+
+        second = CountingRule({EventType.TRADE_EXECUTED})
+        engine.add_rule(second)
+        assert engine.get_rules_for_event(EventType.TRADE_EXECUTED) == [first, second]
+
+    async def test_mock_rule_treated_as_wildcard(self, engine):
+        mock_rule = MagicMock()
+        engine.add_rule(mock_rule)
+
+        assert engine.get_rules_for_event(EventType.SDK_CONNECTED) == [mock_rule]
+
+    async def test_quote_events_reach_only_unrealized_rules(self, engine):
+        tick_values = {"MNQ": 5.0}
+        tick_sizes = {"MNQ": 0.25}
+        unrealized_loss = DailyUnrealizedLossRule(
+            loss_limit=-300.0, tick_values=tick_values, tick_sizes=tick_sizes
+        )
+        unrealized_profit = MaxUnrealizedProfitRule(
+            target=500.0, tick_values=tick_values, tick_sizes=tick_sizes
+        )
+        frequency = TradeFrequencyLimitRule(
+            limits={"per_minute": 3},
+            cooldown_on_breach={},
+            timer_manager=MagicMock(),
+            db=MagicMock(),
+        )
+        for rule in (unrealized_loss, unrealized_profit, frequency):
+            engine.add_rule(rule)
+
+        assert engine.get_rules_for_event(EventType.UNREALIZED_PNL_UPDATE) == [
+            unrealized_loss,
+            unrealized_profit,
+        ]
+        assert engine.get_rules_for_event(EventType.MARKET_DATA_UPDATED) == []
+        assert engine.get_rules_for_event(EventType.TRADE_EXECUTED) == [frequency]
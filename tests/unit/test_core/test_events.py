@@ -4,8 +4,18 @@ Unit Tests for Event System
 Tests the event bus and event types used throughout the system.
 """
 
+import asyncio
+from datetime import datetime
+
 import pytest
-from risk_manager.core.events import EventBus, RiskEvent, EventType
+from risk_manager.config.models import EventsConfig
+from risk_manager.core.events import (
+    BackpressurePolicy,
+    EventBus,
+    EventPriority,
+    EventType,
+    RiskEvent,
+)
 
 
 class TestEventBus:
@@ -88,6 +98,77 @@ class TestRiskEvent:
 
         assert event.timestamp is not None
 
+    def test_typed_fields_read_from_data(self):
+        """Test that typed fields are populated from a data dict."""
+        event = RiskEvent(
+            event_type=EventType.POSITION_OPENED,
+            data={"account_id": 123, "symbol": "MNQ", "contract_id": "CON.F.US.MNQ.Z25", "size": 2},
+        )
+
+        assert event.account_id == 123
+        assert event.symbol == "MNQ"
+        assert event.contract_id == "CON.F.US.MNQ.Z25"
+        assert event.size == 2
+        assert event.price is None
+
+    def test_typed_fields_exposed_through_data_shim(self):
+        """Test that keyword-only typed fields appear in event.data on demand."""
+        event = RiskEvent(
+            event_type=EventType.UNREALIZED_PNL_UPDATE,
+            account_id=123,
+            contract_id="CON.F.US.MNQ.Z25",
+            symbol="MNQ",
+            data={"unrealized_pnl": -50.0},
+        )
+
+        assert event.data == {
+            "unrealized_pnl": -50.0,
+            "account_id": 123,
+            "symbol": "MNQ",
+            "contract_id": "CON.F.US.MNQ.Z25",
+            "contractId": "CON.F.US.MNQ.Z25",
+        }
+
+    def test_data_assignment_refreshes_typed_fields(self):
+        """Test that replacing data re-derives the typed fields."""
+        event = RiskEvent(event_type=EventType.POSITION_UPDATED, symbol="ES")
+        event.data = {"symbol": "MNQ"}
+
+        assert event.symbol == "MNQ"
+
+    def test_timestamp_is_lazy_and_monotonic(self):
+        """Test that wall-clock time and ISO string derive from ts_ns."""
+        first = RiskEvent(event_type=EventType.MARKET_DATA_UPDATED)
+        second = RiskEvent(event_type=EventType.MARKET_DATA_UPDATED)
+
+        assert second.ts_ns >= first.ts_ns
+        assert abs((datetime.now() - first.timestamp).total_seconds()) < 5
+        assert first.to_dict()["timestamp"] == first.timestamp.isoformat()
+
+    def test_wall_time_sampled_per_event(self, monkeypatch):
+        """Test that wall time follows the system clock, not a fixed offset."""
+        monkeypatch.setattr("time.time_ns", lambda: 1_800_000_000 * 1_000_000_000)
+        event = RiskEvent(event_type=EventType.MARKET_DATA_UPDATED)
+
+        assert event.wall_ns == 1_800_000_000 * 1_000_000_000
+        assert event.timestamp == datetime.fromtimestamp(1_800_000_000)
+
+    def test_round_trip_dict(self):
+        """Test to_dict/from_dict preserve payload and timestamp."""
+        event = RiskEvent(event_type=EventType.TRADE_EXECUTED, symbol="MNQ", price=21000.25)
+
+        restored = RiskEvent.from_dict(event.to_dict())
+
+        assert restored == event
+        assert restored.price == 21000.25
+
+    def test_events_are_slotted(self):
+        """Test that events reject ad-hoc attributes (no per-instance dict)."""
+        event = RiskEvent(event_type=EventType.TRADE_EXECUTED)
+
+        with pytest.raises(AttributeError):
+            event.unexpected = True
+
 
 class TestEventType:
     """Tests for EventType enum."""
@@ -104,3 +185,276 @@ class TestEventType:
 
         for event_type in required_types:
             assert event_type is not None
+
+
+class TestQueuedEventBus:
+    """Tests for the queued EventBus priority lanes."""
+
+    async def test_critical_events_dispatched_before_market_data(self):
+        """Queued quotes never delay a fill published after them."""
+        bus = EventBus(queued=True)
+        order = []
+
+        async def handler(event):
+            order.append(event.event_type)
+
+        bus.subscribe(EventType.MARKET_DATA_UPDATED, handler)
+        bus.subscribe(EventType.ORDER_FILLED, handler)
+
+        for i in range(5):
+            await bus.publish(RiskEvent(
+                event_type=EventType.MARKET_DATA_UPDATED,
+                data={"symbol": f"SYM{i}", "price": 100.0},
+            ))
+        await bus.publish(RiskEvent(event_type=EventType.ORDER_FILLED, data={}))
+
+        await bus.start()
+        await bus.drain()
+        await bus.stop()
+
+        assert order[0] == EventType.ORDER_FILLED
+        assert order.count(EventType.MARKET_DATA_UPDATED) == 5
+
+    async def test_market_data_conflates_per_symbol(self):
+        """Only the latest queued quote per symbol is delivered."""
+        bus = EventBus(queued=True)
+        prices = []
+
+        bus.subscribe(EventType.MARKET_DATA_UPDATED, lambda e: prices.append(e.data["price"]))
+
+        for price in (100.0, 101.0, 102.0):
+            await bus.publish(RiskEvent(
+                event_type=EventType.MARKET_DATA_UPDATED,
+                data={"symbol": "MNQ", "price": price},
+            ))
+
+        await bus.start()
+        await bus.stop()
+
+        assert prices == [102.0]
+        stats = bus.get_lane_stats()["market_data"]
+        assert stats["conflated"] == 2
+        assert stats["dispatched"] == 1
+
+    async def test_drop_oldest_when_lane_full(self):
+        bus = EventBus(queued=True, max_queue_size=2)
+        received = []
+        bus.subscribe(EventType.ORDER_CANCELLED, lambda e: received.append(e.data["n"]))
+
+        for n in range(4):
+            await bus.publish(RiskEvent(event_type=EventType.ORDER_CANCELLED, data={"n": n}))
+
+        stats = bus.get_lane_stats()["normal"]
+        assert stats["depth"] == 2
+        assert stats["dropped"] == 2
+        assert stats["high_water"] == 2
+
+        await bus.start()
+        await bus.stop()
+        assert received == [2, 3]
+
+    async def test_critical_lane_never_drops(self):
+        """A full critical lane grows (and counts the overflow) instead of dropping."""
+        bus = EventBus(queued=True, max_queue_size=2, backpressure=BackpressurePolicy.BLOCK)
+        received = []
+        bus.subscribe(EventType.ORDER_FILLED, lambda e: received.append(e.data["n"]))
+
+        for n in range(4):
+            await asyncio.wait_for(
+                bus.publish(RiskEvent(event_type=EventType.ORDER_FILLED, data={"n": n})), 1.0
+            )
+
+        stats = bus.get_lane_stats()["critical"]
+        assert stats["depth"] == 4
+        assert (stats["dropped"], stats["overflowed"]) == (0, 2)
+
+        await bus.start()
+        await bus.stop()
+        assert received == [0, 1, 2, 3]
+
+    async def test_drop_newest_when_lane_full(self):
+        bus = EventBus(queued=True, max_queue_size=2, backpressure="drop_newest")
+        received = []
+        bus.subscribe(EventType.ORDER_CANCELLED, lambda e: received.append(e.data["n"]))
+
+        for n in range(4):
+            await bus.publish(RiskEvent(event_type=EventType.ORDER_CANCELLED, data={"n": n}))
+
+        await bus.start()
+        await bus.stop()
+        assert received == [0, 1]
+
+    async def test_block_waits_for_space(self):
+        bus = EventBus(queued=True, max_queue_size=1, backpressure=BackpressurePolicy.BLOCK)
+        received = []
+        bus.subscribe(EventType.ORDER_CANCELLED, lambda e: received.append(e.data["n"]))
+
+        await bus.publish(RiskEvent(event_type=EventType.ORDER_CANCELLED, data={"n": 0}))
+        blocked = asyncio.create_task(
+            bus.publish(RiskEvent(event_type=EventType.ORDER_CANCELLED, data={"n": 1}))
+        )
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        await bus.start()
+        await blocked
+        await bus.stop()
+        assert received == [0, 1]
+        assert bus.get_lane_stats()["normal"]["dropped"] == 0
+
+    async def test_handler_can_publish_from_dispatcher(self):
+        """Events published by handlers are queued and dispatched too."""
+        bus = EventBus(queued=True)
+        seen = []
+
+        async def on_fill(event):
+            seen.append(event.event_type)
+            await bus.publish(RiskEvent(event_type=EventType.RULE_VIOLATED, data={}))
+
+        bus.subscribe(EventType.ORDER_FILLED, on_fill)
+        bus.subscribe(EventType.RULE_VIOLATED, lambda e: seen.append(e.event_type))
+
+        await bus.start()
+        await bus.publish(RiskEvent(event_type=EventType.ORDER_FILLED, data={}))
+        await bus.drain()
+        await bus.stop()
+
+        assert seen == [EventType.ORDER_FILLED, EventType.RULE_VIOLATED]
+
+    def test_from_config_reads_priorities(self):
+        config = EventsConfig(
+            orders={"priority_map": {"CANCELLED": "critical", "PLACED": "normal"}},
+            trades={"priority": "normal"},
+            processing={"max_queue_size": 50, "backpressure_strategy": "drop_newest"},
+        )
+
+        bus = EventBus.from_config(config)
+
+        assert bus.queued is True
+        assert bus.get_priority(EventType.ORDER_CANCELLED) == EventPriority.CRITICAL
+        assert bus.get_priority(EventType.ORDER_PLACED) == EventPriority.NORMAL
+        assert bus.get_priority(EventType.TRADE_EXECUTED) == EventPriority.NORMAL
+        assert bus.get_priority(EventType.POSITION_CLOSED) == EventPriority.CRITICAL
+        assert bus.get_priority(EventType.MARKET_DATA_UPDATED) == EventPriority.MARKET_DATA
+        assert bus.get_lane_stats()["critical"]["capacity"] == 50
+
+
+class TestConcurrentEventBus:
+    """Test concurrent handler fan-out and per-handler timeouts."""
+
+    async def test_slow_handler_does_not_delay_others(self):
+        bus = EventBus(concurrent=True)
+        order = []
+        release = asyncio.Event()
+
+        async def slow(event):
+            await release.wait()
+            order.append("slow")
+
+        async def fast(event):
+            order.append("fast")
+            release.set()
+
+        bus.subscribe(EventType.ORDER_FILLED, slow)
+        bus.subscribe(EventType.ORDER_FILLED, fast)
+
+        await asyncio.wait_for(bus.publish(RiskEvent(event_type=EventType.ORDER_FILLED)), 1.0)
+
+        assert order == ["fast", "slow"]
+
+    async def test_handler_timeout_cancels_and_counts(self):
+        bus = EventBus(concurrent=True, handler_timeout=0.01)
+        seen = []
+
+        async def hangs(event):
+            await asyncio.sleep(10)
+
+        async def quick(event):
+            seen.append(event.event_type)
+
+        bus.subscribe(EventType.ORDER_FILLED, hangs)
+        bus.subscribe(EventType.ORDER_FILLED, quick)
+
+        await asyncio.wait_for(bus.publish(RiskEvent(event_type=EventType.ORDER_FILLED)), 1.0)
+
+        stats = bus.get_handler_stats()
+        assert seen == [EventType.ORDER_FILLED]
+        assert stats[hangs.__qualname__]["timeouts"] == 1
+        assert stats[quick.__qualname__]["timeouts"] == 0
+
+    async def test_handler_timeout_ignored_in_sequential_mode(self):
+        bus = EventBus(handler_timeout=0.01)
+        finished = []
+
+        async def enforces(event):
+            await asyncio.sleep(0.05)  # e.g. a slow flatten
+            finished.append(event.event_type)
+
+        bus.subscribe(EventType.ORDER_FILLED, enforces)
+
+        await asyncio.wait_for(bus.publish(RiskEvent(event_type=EventType.ORDER_FILLED)), 1.0)
+
+        assert finished == [EventType.ORDER_FILLED]
+        assert bus.get_handler_stats()[enforces.__qualname__]["timeouts"] == 0
+
+    async def test_failing_handler_does_not_cancel_siblings(self):
+        bus = EventBus(concurrent=True)
+        seen = []
+
+        async def boom(event):
+            raise RuntimeError("boom")
+
+        async def after(event):
+            await asyncio.sleep(0)
+            seen.append("after")
+
+        bus.subscribe(EventType.ORDER_FILLED, boom)
+        bus.subscribe(EventType.ORDER_FILLED, after)
+
+        await bus.publish(RiskEvent(event_type=EventType.ORDER_FILLED))
+
+        assert seen == ["after"]
+        assert bus.get_handler_stats()[boom.__qualname__]["errors"] == 1
+
+    async def test_latency_counters_and_sync_handlers(self):
+        bus = EventBus(concurrent=True, slow_handler_threshold=0.0)
+        seen = []
+
+        def sync_handler(event):
+            seen.append("sync")
+
+        bus.subscribe(EventType.POSITION_CLOSED, sync_handler)
+        await bus.publish(RiskEvent(event_type=EventType.POSITION_CLOSED))
+        await bus.publish(RiskEvent(event_type=EventType.POSITION_CLOSED))
+
+        stats = bus.get_handler_stats()[sync_handler.__qualname__]
+        assert seen == ["sync", "sync"]
+        assert stats["calls"] == 2
+        assert stats["slow"] == 2
+        assert stats["max_ms"] >= stats["avg_ms"] >= 0.0
+
+    async def test_unsubscribe_uses_cached_subscription(self):
+        bus = EventBus()
+        seen = []
+
+        async def handler(event):
+            seen.append(event)
+
+        bus.subscribe(EventType.ORDER_FILLED, handler)
+        bus.unsubscribe(EventType.ORDER_FILLED, handler)
+        await bus.publish(RiskEvent(event_type=EventType.ORDER_FILLED))
+
+        assert seen == []
+        with pytest.raises(ValueError):
+            bus.unsubscribe(EventType.ORDER_FILLED, handler)
+
+    def test_from_config_reads_handler_settings(self):
+        config = EventsConfig(
+            processing={"concurrent_handlers": True, "handler_timeout_ms": 250, "processing_timeout_ms": 40},
+        )
+
+        bus = EventBus.from_config(config)
+
+        assert bus.concurrent is True
+        assert bus.handler_timeout == 0.25
+        assert bus.slow_handler_threshold == 0.04
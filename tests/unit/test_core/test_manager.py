@@ -199,6 +199,7 @@ class TestRiskManagerCreate:
         with patch('risk_manager.core.manager.ConfigLoader') as mock_loader_class:
             mock_loader = Mock()
             mock_loader.load_risk_config = Mock(return_value=mock_config)
+            mock_loader.load_events_config = Mock(return_value=None)
             mock_loader_class.return_value = mock_loader
 
             with patch.object(RiskManager, '_init_trading_integration', new_callable=AsyncMock):
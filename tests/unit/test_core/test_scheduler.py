@@ -0,0 +1,313 @@
+"""
+Unit tests for the runtime Scheduler.
+
+Covers periodic and one-shot jobs, rescheduling and cancellation,
+coalescing of missed periods, skip-if-running, jitter, error handling,
+per-job metrics, the wakeup count of an idle or batched scheduler, and
+manual schedulers driven on a virtual clock.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from risk_manager.core.clock import VirtualClock
+from risk_manager.core.scheduler import Scheduler
+
+
+@pytest.fixture
+async def scheduler():
+    scheduler = Scheduler()
+    scheduler.start()
+    yield scheduler
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+class TestPeriodicJobs:
+    """Test jobs registered with every()."""
+
+    async def test_runs_every_interval(self, scheduler):
+        runs = []
+        scheduler.every("tick", 0.05, lambda: runs.append(time.monotonic()))
+
+        await asyncio.sleep(0.28)
+
+        assert 4 <= len(runs) <= 6
+        assert runs[0] - (runs[-1] - 0.05 * (len(runs) - 1)) == pytest.approx(0, abs=0.03)
+
+    async def test_first_delay_zero_runs_immediately(self, scheduler):
+        runs = []
+        scheduler.every("status", 10.0, lambda: runs.append(1), first_delay=0)
+
+        await asyncio.sleep(0.02)
+
+        assert runs == [1]
+
+    async def test_async_job(self, scheduler):
+        runs = []
+
+        async def poll():
+            await asyncio.sleep(0)
+            runs.append(1)
+
+        job = scheduler.every("poll", 0.05, poll, first_delay=0)
+        await asyncio.sleep(0.12)
+
+        assert len(runs) >= 2
+        assert job.runs == len(runs)
+
+    async def test_missed_periods_are_coalesced(self, scheduler):
+        runs = []
+
+        def slow():
+            runs.append(1)
+            if len(runs) == 1:
+                time.sleep(0.25)  # Blocks the loop for 5 periods
+
+        job = scheduler.every("slow", 0.05, slow, first_delay=0)
+        await asyncio.sleep(0.32)
+
+        assert job.coalesced >= 3
+        assert len(runs) <= 4  # No burst of catch-up runs
+
+    async def test_skip_if_running(self, scheduler):
+        active = 0
+        overlaps = 0
+
+        async def slow():
+            nonlocal active, overlaps
+            active += 1
+            overlaps = max(overlaps, active)
+            await asyncio.sleep(0.12)
+            active -= 1
+
+        job = scheduler.every("slow", 0.05, slow, first_delay=0)
+        await asyncio.sleep(0.3)
+
+        assert overlaps == 1
+        assert job.skipped >= 2
+
+    async def test_overlapping_runs_allowed_when_not_skipping(self, scheduler):
+        active = 0
+        overlaps = 0
+
+        async def slow():
+            nonlocal active, overlaps
+            active += 1
+            overlaps = max(overlaps, active)
+            await asyncio.sleep(0.12)
+            active -= 1
+
+        scheduler.every("slow", 0.05, slow, first_delay=0, skip_if_running=False)
+        await asyncio.sleep(0.2)
+
+        assert overlaps >= 2
+
+    async def test_jitter_stays_within_bounds(self, scheduler):
+        runs = []
+        scheduler.every("jittered", 0.05, lambda: runs.append(time.monotonic()), jitter=0.02)
+        started = time.monotonic()
+
+        await asyncio.sleep(0.3)
+
+        gaps = [b - a for a, b in zip([started] + runs[:-1], runs, strict=True)]
+        assert len(runs) >= 4
+        assert all(0.02 < gap < 0.09 for gap in gaps)
+
+    async def test_errors_are_counted_and_job_keeps_running(self, scheduler):
+        def broken():
+            raise RuntimeError("boom")
+
+        job = scheduler.every("broken", 0.03, broken, first_delay=0)
+        await asyncio.sleep(0.1)
+
+        assert job.errors >= 3
+        assert job.runs == job.errors
+        assert not job.done()
+
+
+@pytest.mark.asyncio
+class TestOneShotJobs:
+    """Test jobs registered with call_later()."""
+
+    async def test_fires_once_and_unregisters(self, scheduler):
+        runs = []
+        job = scheduler.call_later("once", 0.05, lambda: runs.append(1))
+
+        await asyncio.sleep(0.15)
+
+        assert runs == [1]
+        assert job.done()
+        assert scheduler.get_job("once") is None
+
+    async def test_dormant_job_waits_for_reschedule(self, scheduler):
+        runs = []
+        job = scheduler.call_later("deadline", None, lambda: runs.append(1))
+
+        await asyncio.sleep(0.05)
+        assert runs == []
+
+        job.reschedule(0.02)
+        await asyncio.sleep(0.05)
+        assert runs == [1]
+
+    async def test_reschedule_from_inside_run(self, scheduler):
+        runs = []
+
+        def rearm():
+            runs.append(1)
+            if len(runs) < 3:
+                job.reschedule(0.02)
+
+        job = scheduler.call_later("rearm", 0, rearm)
+        await asyncio.sleep(0.15)
+
+        assert runs == [1, 1, 1]
+        assert job.done()
+
+    async def test_earlier_reschedule_wakes_loop(self, scheduler):
+        loop = asyncio.get_running_loop()
+        fired = loop.create_future()
+        job = scheduler.call_later("deadline", 60, lambda: fired.set_result(loop.time()))
+
+        await asyncio.sleep(0.02)
+        started = loop.time()
+        job.reschedule(0.05)
+
+        assert await asyncio.wait_for(fired, timeout=1) - started < 0.08
+
+    async def test_cancel(self, scheduler):
+        runs = []
+        job = scheduler.call_later("cancelled", 0.05, lambda: runs.append(1))
+
+        job.cancel()
+        await asyncio.sleep(0.1)
+
+        assert runs == []
+        assert job.cancelled() and job.done()
+        with pytest.raises(RuntimeError):
+            job.reschedule(0.01)
+
+    async def test_cancel_stops_run_in_flight(self, scheduler):
+        finished = []
+
+        async def slow():
+            await asyncio.sleep(1)
+            finished.append(1)
+
+        job = scheduler.call_later("slow", 0, slow)
+        await asyncio.sleep(0.02)
+        assert job.running
+
+        job.cancel()
+        await asyncio.sleep(0.02)
+
+        assert not job.running
+        assert finished == []
+
+
+@pytest.mark.asyncio
+class TestRegistry:
+    """Test job names, stats and scheduler lifecycle."""
+
+    async def test_duplicate_name_rejected(self, scheduler):
+        scheduler.every("tick", 1.0, lambda: None)
+
+        with pytest.raises(ValueError):
+            scheduler.every("tick", 1.0, lambda: None)
+
+    async def test_name_reusable_after_cancel(self, scheduler):
+        scheduler.every("tick", 1.0, lambda: None).cancel()
+
+        job = scheduler.every("tick", 1.0, lambda: None)
+        assert scheduler.get_job("tick") is job
+
+    async def test_invalid_interval(self, scheduler):
+        with pytest.raises(ValueError):
+            scheduler.every("tick", 0, lambda: None)
+        with pytest.raises(ValueError):
+            scheduler.every("tick", 1.0, lambda: None, jitter=-1)
+
+    async def test_stats(self, scheduler):
+        scheduler.every("tick", 0.02, lambda: time.sleep(0.005), first_delay=0)
+        await asyncio.sleep(0.07)
+
+        stats = scheduler.get_stats()
+        tick = stats["per_job"]["tick"]
+
+        assert stats["running"] is True
+        assert stats["jobs"] == 1
+        assert tick["runs"] >= 3
+        assert tick["avg_runtime_ms"] >= 5
+        assert tick["max_runtime_ms"] >= tick["avg_runtime_ms"]
+        assert 0 <= tick["next_run_in"] <= 0.02
+
+    async def test_idle_scheduler_does_not_wake(self, scheduler):
+        await asyncio.sleep(0.2)
+
+        assert scheduler.get_stats()["wakeups"] == 0
+
+    async def test_jobs_due_together_share_a_wakeup(self, scheduler):
+        for i in range(10):
+            scheduler.every(f"job{i}", 0.1, lambda: None, first_delay=0.05 + i * 0.001)
+
+        await asyncio.sleep(0.08)
+
+        assert all(job.runs == 1 for job in scheduler.jobs.values())
+        assert scheduler.wakeups <= 2
+
+    async def test_jobs_registered_before_start(self):
+        scheduler = Scheduler()
+        runs = []
+        scheduler.every("tick", 1.0, lambda: runs.append(1), first_delay=0)
+
+        scheduler.start()
+        await asyncio.sleep(0.02)
+        await scheduler.stop()
+
+        assert runs == [1]
+        assert not scheduler.running
+
+    async def test_stop_cancels_runs_in_flight(self):
+        scheduler = Scheduler()
+        scheduler.start()
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+
+        scheduler.every("slow", 5.0, slow, first_delay=0)
+        await asyncio.sleep(0.02)
+        await scheduler.stop()
+
+        assert cancelled == [1]
+
+
+@pytest.mark.asyncio
+class TestManualScheduler:
+    """Test a scheduler driven by advance_to() on a virtual clock."""
+
+    async def test_jobs_run_at_their_due_times(self):
+        clock = VirtualClock()
+        scheduler = Scheduler(clock=clock, manual=True)
+        scheduler.start()
+        runs = []
+
+        async def once():
+            await asyncio.sleep(0)
+            runs.append(("once", clock.monotonic()))
+
+        scheduler.every("tick", 60.0, lambda: runs.append(("tick", clock.monotonic())))
+        scheduler.call_later("once", 90.0, once)
+        await scheduler.advance_to(150.0)
+
+        assert not scheduler.running
+        assert runs == [("tick", 60.0), ("once", 90.0), ("tick", 120.0)]
+        assert clock.monotonic() == 150.0
+        assert scheduler.get_job("tick").stats()["next_run_in"] == pytest.approx(30.0)
@@ -0,0 +1,172 @@
+"""
+Unit tests for the TradingCalendar.
+
+Covers daily and weekly reset instants across DST changes, session
+boundaries with allowed weekdays, holidays and early closes, standard-time
+calendars, window rebuilds for far-away moments and building the calendar
+from timers_config.
+"""
+
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from risk_manager.config.models import TimersConfig
+from risk_manager.core.clock import VirtualClock
+from risk_manager.core.trading_calendar import TradingCalendar
+
+ET = ZoneInfo("America/New_York")
+
+
+def et(*args):
+    return datetime(*args, tzinfo=ET)
+
+
+@pytest.fixture
+def calendar():
+    return TradingCalendar(
+        holidays=["2025-07-04"],
+        early_closes={"2025-07-03": "13:00"},
+    )
+
+
+class TestResets:
+    """Test daily and weekly reset instants."""
+
+    def test_next_daily_reset(self, calendar):
+        assert calendar.next_reset(et(2025, 1, 17, 14, 0)) == et(2025, 1, 17, 17, 0)
+        assert calendar.next_reset(et(2025, 1, 17, 18, 0)) == et(2025, 1, 18, 17, 0)
+
+    def test_reset_exactly_now_counts_as_passed(self, calendar):
+        assert calendar.next_reset(et(2025, 1, 17, 17, 0)) == et(2025, 1, 18, 17, 0)
+
+    def test_returns_utc(self, calendar):
+        assert calendar.next_reset(et(2025, 1, 17, 14, 0)).tzinfo == timezone.utc
+
+    def test_follows_dst(self, calendar):
+        # Clocks spring forward on 2025-03-09: 22:00 UTC becomes 21:00 UTC
+        assert calendar.next_reset(et(2025, 3, 8, 18, 0)) == datetime(2025, 3, 9, 21, 0, tzinfo=timezone.utc)
+        assert calendar.next_reset(et(2025, 3, 7, 18, 0)) == datetime(2025, 3, 8, 22, 0, tzinfo=timezone.utc)
+
+    def test_standard_time_without_dst_adjustment(self):
+        calendar = TradingCalendar(auto_adjust_dst=False)
+
+        assert calendar.next_reset(et(2025, 7, 1, 12, 0)) == datetime(2025, 7, 1, 22, 0, tzinfo=timezone.utc)
+
+    def test_weekly_reset(self, calendar):
+        # Friday -> Monday, by index or name
+        assert calendar.next_reset(et(2025, 1, 17, 14, 0), weekday=0) == et(2025, 1, 20, 17, 0)
+        assert calendar.next_reset(et(2025, 1, 17, 14, 0), weekday="Monday") == et(2025, 1, 20, 17, 0)
+
+    def test_custom_reset_time(self, calendar):
+        assert calendar.next_reset(et(2025, 1, 17, 1, 0), reset_time="00:30") == et(2025, 1, 18, 0, 30)
+
+    def test_window_rebuilds_for_far_moments(self, calendar):
+        assert calendar.next_reset(et(2025, 1, 17, 18, 0)) == et(2025, 1, 18, 17, 0)
+        assert calendar.next_reset(et(2030, 6, 3, 18, 0)) == et(2030, 6, 4, 17, 0)
+        assert calendar.next_reset(et(2020, 2, 3, 9, 0)) == et(2020, 2, 3, 17, 0)
+
+    def test_defaults_to_clock(self):
+        clock = VirtualClock(et(2025, 1, 17, 18, 0))
+        calendar = TradingCalendar(clock=clock)
+
+        assert calendar.next_reset() == et(2025, 1, 18, 17, 0)
+        clock.advance(86400)
+        assert calendar.next_reset() == et(2025, 1, 19, 17, 0)
+
+
+class TestSessions:
+    """Test session boundaries."""
+
+    @pytest.mark.parametrize(
+        "moment,expected",
+        [
+            (et(2025, 7, 2, 9, 29), False),
+            (et(2025, 7, 2, 9, 30), True),
+            (et(2025, 7, 2, 15, 59), True),
+            (et(2025, 7, 2, 16, 0), False),  # End is exclusive
+            (et(2025, 7, 3, 12, 59), True),
+            (et(2025, 7, 3, 13, 0), False),  # Early close
+            (et(2025, 7, 4, 11, 0), False),  # Holiday
+            (et(2025, 7, 5, 11, 0), False),  # Saturday
+        ],
+    )
+    def test_is_session_open(self, calendar, moment, expected):
+        assert calendar.is_session_open(moment) is expected
+
+    def test_next_session_open_skips_holiday_and_weekend(self, calendar):
+        assert calendar.next_session_open(et(2025, 7, 3, 12, 0)) == et(2025, 7, 7, 9, 30)
+
+    def test_next_session_open_same_day(self, calendar):
+        assert calendar.next_session_open(et(2025, 7, 2, 7, 0)) == et(2025, 7, 2, 9, 30)
+
+    def test_session_bounds(self, calendar):
+        assert calendar.session_bounds(et(2025, 7, 3, 10, 0)) == (et(2025, 7, 3, 9, 30), et(2025, 7, 3, 13, 0))
+        assert calendar.session_bounds(et(2025, 7, 3, 14, 0)) is None
+
+    def test_all_days_allowed(self):
+        calendar = TradingCalendar(allowed_days=range(7))
+
+        assert calendar.is_session_open(et(2025, 7, 5, 11, 0))
+
+    def test_no_trading_days(self):
+        assert TradingCalendar(allowed_days=[]).next_session_open(et(2025, 7, 2, 7, 0)) is None
+
+    def test_session_in_other_timezone(self):
+        calendar = TradingCalendar(session_start="08:30", session_end="15:00", session_timezone="America/Chicago")
+
+        assert calendar.is_session_open(et(2025, 7, 2, 9, 30))
+        assert not calendar.is_session_open(et(2025, 7, 2, 16, 0))
+
+    def test_end_before_start_rejected(self):
+        with pytest.raises(ValueError):
+            TradingCalendar(session_start="16:00", session_end="09:30")
+
+    def test_next_boundary(self, calendar):
+        assert calendar.next_boundary(et(2025, 7, 3, 12, 0)) == et(2025, 7, 3, 13, 0)
+        assert calendar.next_boundary(et(2025, 7, 3, 14, 0)) == et(2025, 7, 3, 17, 0)
+        assert calendar.next_boundary(et(2025, 7, 2, 7, 0)) == et(2025, 7, 2, 9, 30)
+
+
+class TestFromConfig:
+    """Test building the calendar from timers_config."""
+
+    def make_config(self, **overrides):
+        values = {
+            "daily_reset": {"time": "17:00", "timezone": "America/New_York"},
+            "lockout_durations": {},
+            "session_hours": {"start": "09:30", "end": "16:00", "timezone": "America/New_York"},
+            "holidays": {
+                "enabled": True,
+                "dates": {2025: ["2025-12-25"]},
+                "early_close": [{"date": "2025-12-24", "close_time": "13:00"}],
+            },
+        }
+        values.update(overrides)
+        return TimersConfig(**values)
+
+    def test_holidays_and_early_closes(self):
+        calendar = TradingCalendar.from_config(self.make_config())
+
+        assert not calendar.is_session_open(et(2025, 12, 24, 14, 0))
+        assert not calendar.is_session_open(et(2025, 12, 25, 11, 0))
+        assert calendar.next_session_open(et(2025, 12, 24, 14, 0)) == et(2025, 12, 26, 9, 30)
+
+    def test_holidays_can_be_ignored(self):
+        calendar = TradingCalendar.from_config(self.make_config(), holidays=False)
+
+        assert calendar.is_session_open(et(2025, 12, 25, 11, 0))
+
+    def test_reset_time_from_config(self):
+        config = self.make_config(daily_reset={"time": "16:00", "timezone": "America/New_York"})
+
+        assert TradingCalendar.from_config(config).next_reset(et(2025, 1, 17, 14, 0)) == et(2025, 1, 17, 16, 0)
+
+    def test_sweep_over_a_week(self):
+        calendar = TradingCalendar.from_config(self.make_config())
+        start = et(2025, 1, 6, 0, 0)
+
+        opens = {calendar.next_session_open(start + timedelta(minutes=m)) for m in range(0, 7 * 1440, 7)}
+
+        assert len(opens) == 6  # Mon..Fri opens plus the following Monday
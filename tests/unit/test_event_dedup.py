@@ -0,0 +1,80 @@
+"""
+Unit tests for EventDeduplicator module.
+
+Tests that per-instrument copies of SDK events are dropped within the TTL,
+that identities expire in order, and that genuine updates are kept.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from risk_manager.core.clock import VirtualClock
+from risk_manager.integrations.sdk.event_dedup import EventDeduplicator
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def clock():
+    """Create a virtual clock."""
+    return VirtualClock(datetime(2025, 1, 17, 14, 0, tzinfo=timezone.utc))
+
+
+@pytest.fixture
+def dedup(clock):
+    """Create EventDeduplicator with a 5s TTL on a virtual clock."""
+    return EventDeduplicator(ttl=5.0, clock=clock)
+
+
+# ============================================================================
+# Test: Deduplication
+# ============================================================================
+
+def test_copies_are_duplicates(dedup):
+    """Test that the 2nd and 3rd copy of an event are dropped."""
+    results = [dedup.is_duplicate("order_filled", 12345) for _ in range(3)]
+
+    assert results == [False, True, True]
+    stats = dedup.get_stats()
+    assert (stats["unique"], stats["duplicates"]) == (1, 2)
+
+
+def test_identity_distinguishes_updates(dedup):
+    """Test that a genuine update (different state) is not dropped."""
+    assert not dedup.is_duplicate("position_updated", ("CON.F.US.MNQ.Z25", 1, 1, 21500.00))
+    assert not dedup.is_duplicate("position_updated", ("CON.F.US.MNQ.Z25", 1, 2, 21510.00))
+    assert not dedup.is_duplicate("position_opened", ("CON.F.US.MNQ.Z25", 1, 2, 21510.00))
+    assert dedup.is_duplicate("position_updated", ("CON.F.US.MNQ.Z25", 1, 2, 21510.00))
+
+
+# ============================================================================
+# Test: Expiry
+# ============================================================================
+
+def test_identities_expire_oldest_first(dedup, clock):
+    """Test that expired identities are dropped and newer ones are kept."""
+    dedup.is_duplicate("order_placed", 1)
+    clock.advance(3)
+    dedup.is_duplicate("order_placed", 2)
+    clock.advance(2.5)
+
+    assert not dedup.is_duplicate("order_placed", 1)  # Expired, seen again
+    assert dedup.is_duplicate("order_placed", 2)
+    assert len(dedup) == 2
+
+
+def test_tracking_is_bounded_by_ttl(dedup, clock):
+    """Test that only identities from the last TTL are kept."""
+    for order_id in range(100):
+        dedup.is_duplicate("order_placed", order_id)
+        clock.advance(1)
+
+    assert len(dedup) == 6
+
+
+def test_negative_ttl_rejected():
+    """Test that a negative TTL is rejected."""
+    with pytest.raises(ValueError):
+        EventDeduplicator(ttl=-1)
@@ -23,6 +23,7 @@ def mock_pnl_calculator():
     calc.update_quote = Mock()
     calc.get_positions_by_symbol = Mock(return_value=[])
     calc.has_significant_pnl_change = Mock(return_value=False)
+    calc.check_pnl_triggers = Mock(return_value=[])
     calc.calculate_unrealized_pnl = Mock(return_value=0.0)
     calc.calculate_total_unrealized_pnl = Mock(return_value=0.0)
     return calc
@@ -70,7 +71,7 @@ def test_initialization(handler, mock_pnl_calculator, event_bus):
     assert handler._client is None
     assert handler._suite is None
     assert handler._running is False
-    assert handler._status_bar_task is None
+    assert handler._status_bar_job is None
 
 
 def test_set_client(handler):
@@ -207,6 +208,29 @@ async def test_handle_quote_update_publishes_pnl_update_on_significant_change(
     assert event.data['unrealized_pnl'] == 150.00
 
 
+@pytest.mark.asyncio
+async def test_handle_quote_update_publishes_pnl_update_on_trigger(
+    handler, event_bus, mock_pnl_calculator, mock_quote_event
+):
+    """Test that a breached rule limit bypasses the $10 throttle."""
+    mock_pnl_calculator.get_positions_by_symbol.return_value = ["CON.F.US.MNQ.Z25"]
+    mock_pnl_calculator.check_pnl_triggers.return_value = ["CON.F.US.MNQ.Z25"]
+    mock_pnl_calculator.calculate_unrealized_pnl.return_value = 504.00
+
+    events_received = []
+
+    async def capture_event(event):
+        events_received.append(event)
+
+    event_bus.subscribe(EventType.UNREALIZED_PNL_UPDATE, capture_event)
+
+    await handler.handle_quote_update(mock_quote_event)
+
+    mock_pnl_calculator.check_pnl_triggers.assert_called_once_with("MNQ")
+    assert len(events_received) == 1
+    assert events_received[0].data['unrealized_pnl'] == 504.00
+
+
 # ============================================================================
 # Test: Other Market Data Handlers
 # ============================================================================
@@ -258,8 +282,8 @@ async def test_start_status_bar_creates_task(handler):
     await handler.start_status_bar()
 
     # Task should be created
-    assert handler._status_bar_task is not None
-    assert not handler._status_bar_task.done()
+    assert handler._status_bar_job is not None
+    assert not handler._status_bar_job.done()
     assert handler._running is True
 
     # Cleanup
@@ -278,7 +302,7 @@ async def test_stop_status_bar_cancels_task(handler):
 
     # Task should be cancelled
     assert handler._running is False
-    assert handler._status_bar_task.done()
+    assert handler._status_bar_job.done()
 
 
 @pytest.mark.asyncio
@@ -290,7 +314,7 @@ async def test_start_status_bar_twice_warns(handler):
     await handler.start_status_bar()
 
     # Still only one task
-    assert handler._status_bar_task is not None
+    assert handler._status_bar_job is not None
 
     # Cleanup
     await handler.stop_status_bar()
@@ -0,0 +1,206 @@
+"""
+Unit tests for OrderMirror module.
+
+Tests event-driven order/position tracking, reconciliation from order
+polling snapshots, and protective-order lookups served from the mirror.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from risk_manager.integrations.sdk.order_mirror import OrderMirror
+from risk_manager.integrations.sdk.order_polling import OrderPollingService
+from risk_manager.integrations.sdk.protective_orders import ProtectiveOrderCache
+
+CONTRACT = "CON.F.US.MNQ.Z25"
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def make_order(order_id, order_type=4, stop_price=21450.00, limit_price=None, contract_id=CONTRACT):
+    """Create a mock working order (STOP by default)."""
+    order = Mock()
+    order.id = order_id
+    order.contractId = contract_id
+    order.type = order_type
+    order.type_str = "STOP" if order_type == 4 else "LIMIT"
+    order.side = 1  # SELL
+    order.size = 1
+    order.stopPrice = stop_price
+    order.limitPrice = limit_price
+    return order
+
+
+def make_position(avg_price=21500.00, pos_type=1, size=1, contract_id=CONTRACT):
+    """Create a mock broker position."""
+    position = Mock()
+    position.contractId = contract_id
+    position.avgPrice = avg_price
+    position.type = pos_type
+    position.size = size
+    return position
+
+
+def make_suite(orders, positions):
+    """Create a mock suite whose instrument returns the given snapshot."""
+    instrument = Mock()
+    instrument.orders.search_open_orders = AsyncMock(return_value=orders)
+    instrument.positions.get_all_positions = AsyncMock(return_value=positions)
+    return {"MNQ": instrument, "ES": instrument}
+
+
+@pytest.fixture
+def mirror():
+    """Create OrderMirror instance."""
+    return OrderMirror()
+
+
+# ============================================================================
+# Test: Event Updates
+# ============================================================================
+
+def test_upsert_and_remove_order(mirror):
+    """Test that orders are indexed by id and contract."""
+    mirror.upsert_order(make_order(1))
+    mirror.upsert_order(make_order(2, contract_id="CON.F.US.EP.Z25"))
+
+    assert [o.id for o in mirror.get_orders(CONTRACT)] == [1]
+
+    mirror.remove_order(1)
+    mirror.remove_order(1)  # Idempotent
+
+    assert mirror.get_orders(CONTRACT) == []
+    assert mirror.get_order(2) is not None
+
+
+def test_modified_order_replaces_previous(mirror):
+    """Test that a modified order replaces the mirrored one."""
+    mirror.upsert_order(make_order(1, stop_price=21450.00))
+    mirror.upsert_order(make_order(1, stop_price=21475.00))
+
+    orders = mirror.get_orders(CONTRACT)
+    assert len(orders) == 1
+    assert orders[0].stopPrice == 21475.00
+
+
+def test_flat_position_is_removed(mirror):
+    """Test that positions are tracked until flat."""
+    mirror.update_position(CONTRACT, 21500.00, 1, 2)
+    assert mirror.get_position(CONTRACT) == {"avg_price": 21500.00, "type": 1, "size": 2}
+
+    mirror.update_position(CONTRACT, 21500.00, 0, 0)
+    assert mirror.get_position(CONTRACT) is None
+
+
+# ============================================================================
+# Test: Reconciliation
+# ============================================================================
+
+def polling_for(mirror, suite=None):
+    """Create an OrderPollingService that feeds its snapshots into the mirror."""
+    service = OrderPollingService()
+    service.set_mirror(mirror)
+    if suite is not None:
+        service.set_suite(suite)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_poll_snapshot_syncs_mirror_once(mirror):
+    """Test that one poll loads orders and positions with one call each."""
+    suite = make_suite([make_order(1)], [make_position()])
+
+    await polling_for(mirror, suite)._poll_orders()
+
+    assert mirror.synced
+    assert [o.id for o in mirror.get_orders(CONTRACT)] == [1]
+    assert mirror.get_position(CONTRACT)["avg_price"] == 21500.00
+    assert suite["MNQ"].orders.search_open_orders.await_count == 1
+    assert suite["MNQ"].positions.get_all_positions.await_count == 1
+
+
+def test_reconcile_repairs_drift(mirror):
+    """Test that missed events are corrected from the snapshot."""
+    mirror.upsert_order(make_order(1))  # Cancelled without an event
+    mirror.update_position("CON.F.US.EP.Z25", 6000.00, 1, 1)  # Closed without an event
+
+    assert mirror.reconcile_from([make_order(2)], []) == 3
+
+    assert [o.id for o in mirror.get_orders(CONTRACT)] == [2]
+    assert mirror.get_position("CON.F.US.EP.Z25") is None
+    assert mirror.get_stats()["drift_corrections"] == 3
+
+
+@pytest.mark.asyncio
+async def test_events_during_snapshot_win(mirror):
+    """Test that an event arriving mid-fetch is not overwritten by the older snapshot."""
+    suite = make_suite([make_order(1)], [])
+
+    async def slow_search():
+        await asyncio.sleep(0.01)
+        return [make_order(1)]
+
+    suite["MNQ"].orders.search_open_orders = slow_search
+
+    poll = asyncio.create_task(polling_for(mirror, suite)._poll_orders())
+    await asyncio.sleep(0)
+    mirror.remove_order(1)  # Filled while the snapshot was in flight
+    mirror.upsert_order(make_order(3))  # Placed while the snapshot was in flight
+    await poll
+
+    assert [o.id for o in mirror.get_orders(CONTRACT)] == [3]
+
+
+@pytest.mark.asyncio
+async def test_poll_without_suite_leaves_mirror_unsynced(mirror):
+    """Test that the mirror waits for the first snapshot."""
+    await polling_for(mirror)._poll_orders()
+    assert not mirror.synced
+
+
+@pytest.mark.asyncio
+async def test_failed_snapshot_keeps_mirror(mirror):
+    """Test that a failed snapshot leaves the mirror unchanged."""
+    mirror.upsert_order(make_order(1))
+    suite = make_suite([], [])
+    suite["MNQ"].orders.search_open_orders = AsyncMock(side_effect=RuntimeError("timeout"))
+
+    await polling_for(mirror, suite)._poll_orders()
+
+    assert not mirror.synced
+    assert [o.id for o in mirror.get_orders(CONTRACT)] == [1]
+    assert mirror._touched_orders is None  # Event tracking ended with the poll
+
+
+# ============================================================================
+# Test: Protective Order Lookups
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_protective_lookups_read_from_synced_mirror(mirror):
+    """Test that stop/target lookups use the mirror instead of the broker."""
+    orders = [make_order(1), make_order(2, order_type=1, stop_price=None, limit_price=21600.00)]
+    positions = [make_position()]
+    suite = make_suite(orders, positions)
+    mirror.reconcile_from(orders, positions)
+
+    cache = ProtectiveOrderCache()
+    cache.set_suite(suite)
+    cache.set_helpers(lambda cid: "MNQ", lambda side: "SELL")
+    cache.set_mirror(mirror)
+
+    stop = await cache.get_stop_loss(CONTRACT)
+    target = await cache.get_take_profit(CONTRACT)
+
+    assert stop["stop_price"] == 21450.00
+    assert target["take_profit_price"] == 21600.00
+    suite["MNQ"].orders.get_position_orders.assert_not_called()
+    suite["MNQ"].orders.search_open_orders.assert_not_called()
+
+    # A cancelled stop disappears without any query
+    mirror.remove_order(1)
+    assert await cache.get_stop_loss(CONTRACT) is None
@@ -8,6 +8,7 @@ import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, MagicMock
 
+from risk_manager.integrations.sdk.broker_queries import BrokerQueryCache
 from risk_manager.integrations.sdk.order_polling import OrderPollingService
 
 
@@ -21,6 +22,12 @@ def service():
     return OrderPollingService()
 
 
+@pytest.fixture
+def uncached_service():
+    """Create OrderPollingService whose broker queries are never reused."""
+    return OrderPollingService(broker_queries=BrokerQueryCache(ttl=0))
+
+
 @pytest.fixture
 def mock_protective_cache():
     """Create mock protective order cache."""
@@ -47,7 +54,7 @@ def test_initialization(service):
     assert service._extract_symbol_fn is None
     assert service._get_side_name_fn is None
     assert service._running is False
-    assert service._poll_task is None
+    assert service._poll_job is None
     assert isinstance(service._known_orders, set)
     assert len(service._known_orders) == 0
 
@@ -126,8 +133,8 @@ async def test_start_polling_creates_task(service):
     await service.start_polling()
 
     # Task should be created
-    assert service._poll_task is not None
-    assert not service._poll_task.done()
+    assert service._poll_job is not None
+    assert not service._poll_job.done()
     assert service._running is True
 
     # Cleanup
@@ -146,7 +153,7 @@ async def test_stop_polling_cancels_task(service):
 
     # Task should be cancelled
     assert service._running is False
-    assert service._poll_task.done()
+    assert service._poll_job.done()
 
 
 @pytest.mark.asyncio
@@ -158,7 +165,7 @@ async def test_start_polling_twice_warns(service):
     await service.start_polling()
 
     # Still only one task
-    assert service._poll_task is not None
+    assert service._poll_job is not None
 
     # Cleanup
     await service.stop_polling()
@@ -188,7 +195,7 @@ async def test_polling_discovers_new_orders(service, mock_protective_cache):
 
     # Create mock instrument
     mock_orders_manager = Mock()
-    mock_orders_manager.get_position_orders = AsyncMock(return_value=[mock_order])
+    mock_orders_manager.search_open_orders = AsyncMock(return_value=[mock_order])
 
     mock_positions_manager = Mock()
     mock_positions_manager.get_all_positions = AsyncMock(return_value=[mock_position])
@@ -210,8 +217,8 @@ async def test_polling_discovers_new_orders(service, mock_protective_cache):
     # Start polling
     await service.start_polling()
 
-    # Wait for one poll cycle (5s + margin)
-    await asyncio.sleep(5.5)
+    # Wait for the first poll (runs right away)
+    await asyncio.sleep(0.5)
 
     # Stop polling
     await service.stop_polling()
@@ -240,7 +247,7 @@ async def test_polling_skips_duplicate_orders(service):
     service.mark_order_seen(12345)
 
     mock_orders_manager = Mock()
-    mock_orders_manager.get_position_orders = AsyncMock(return_value=[mock_order])
+    mock_orders_manager.search_open_orders = AsyncMock(return_value=[mock_order])
 
     mock_positions_manager = Mock()
     mock_positions_manager.get_all_positions = AsyncMock(return_value=[mock_position])
@@ -256,14 +263,14 @@ async def test_polling_skips_duplicate_orders(service):
     # Start polling
     await service.start_polling()
 
-    # Wait for one poll cycle
-    await asyncio.sleep(5.5)
+    # Wait for the first poll (runs right away)
+    await asyncio.sleep(0.5)
 
     # Stop polling
     await service.stop_polling()
 
-    # get_position_orders should have been called, but order skipped (already known)
-    mock_orders_manager.get_position_orders.assert_called()
+    # One bulk query per poll, but order skipped (already known)
+    mock_orders_manager.search_open_orders.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -284,8 +291,8 @@ async def test_polling_handles_errors_gracefully(service):
     # Start polling
     await service.start_polling()
 
-    # Wait for one poll cycle
-    await asyncio.sleep(5.5)
+    # Wait for the first poll (runs right away)
+    await asyncio.sleep(0.5)
 
     # Should still be running despite error
     assert service._running is True
@@ -312,6 +319,126 @@ async def test_polling_waits_for_suite(service):
     await service.stop_polling()
 
 
+# ============================================================================
+# Test: Snapshot Diffs
+# ============================================================================
+
+def make_order(order_id, order_type=4, stop_price=21450.00, contract_id="CON.F.US.MNQ.Z25"):
+    """Create a mock working order (STOP by default)."""
+    order = Mock()
+    order.id = order_id
+    order.contractId = contract_id
+    order.type = order_type
+    order.type_str = "STOP" if order_type == 4 else "LIMIT"
+    order.side = 1
+    order.size = 1
+    order.stopPrice = stop_price
+    order.limitPrice = None
+    order.status = "Working"
+    return order
+
+
+def make_position(pos_type=1, size=1, contract_id="CON.F.US.MNQ.Z25"):
+    """Create a mock broker position."""
+    position = Mock()
+    position.contractId = contract_id
+    position.type = pos_type
+    position.size = size
+    return position
+
+
+def make_suite(orders, positions):
+    """Create a mock suite serving account-wide order/position snapshots."""
+    instrument = Mock()
+    instrument.orders.search_open_orders = AsyncMock(return_value=orders)
+    instrument.positions.get_all_positions = AsyncMock(return_value=positions)
+    return {"MNQ": instrument, "ES": instrument}
+
+
+@pytest.mark.asyncio
+async def test_poll_uses_one_bulk_query(service):
+    """Test that a poll issues one order and one position query for the account."""
+    suite = make_suite([make_order(1), make_order(2, contract_id="CON.F.US.EP.Z25")], [make_position()])
+    service.set_suite(suite)
+
+    await service._poll_orders()
+
+    assert suite["MNQ"].orders.search_open_orders.await_count == 1
+    assert suite["MNQ"].positions.get_all_positions.await_count == 1
+    suite["MNQ"].orders.get_position_orders.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_poll_emits_added_changed_removed(uncached_service, mock_protective_cache):
+    """Test that consecutive snapshots are diffed and only changes are processed."""
+    diffs = []
+    uncached_service.add_listener(lambda added, changed, removed: diffs.append(
+        ([o.id for o in added], [o.id for o in changed], [o.id for o in removed])
+    ))
+    uncached_service.set_protective_cache(mock_protective_cache)
+    stop, target = make_order(1), make_order(2, order_type=1, stop_price=None)
+
+    uncached_service.set_suite(make_suite([stop, target], []))
+    await uncached_service._poll_orders()
+    await uncached_service._poll_orders()  # Unchanged: no diff
+
+    uncached_service.set_suite(make_suite([make_order(1, stop_price=21475.00), make_order(3)], []))
+    await uncached_service._poll_orders()
+
+    assert diffs == [([1, 2], [], []), ([3], [1], [2])]
+    assert mock_protective_cache.update_from_order_placed.call_count == 4
+    mock_protective_cache.remove_order.assert_called_once_with("CON.F.US.MNQ.Z25", 2)
+    assert uncached_service.get_stats()["orders_removed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_known_orders_pruned_to_working_orders(service):
+    """Test that orders which stopped working are forgotten."""
+    for order_id in (1, 2, 3):
+        service.mark_order_seen(order_id)
+    service.set_suite(make_suite([make_order(2)], []))
+
+    await service._poll_orders()
+
+    assert service._known_orders == {2}
+
+
+@pytest.mark.asyncio
+async def test_interval_adapts_to_protection(uncached_service):
+    """Test fast polling for unprotected positions and slow polling when flat."""
+    uncached_service.set_suite(make_suite([], []))
+    await uncached_service._poll_orders()
+    assert uncached_service.interval == OrderPollingService.SLOW_INTERVAL
+
+    uncached_service.set_suite(make_suite([make_order(1, order_type=1, stop_price=None)], [make_position()]))
+    await uncached_service._poll_orders()
+    assert uncached_service.interval == OrderPollingService.FAST_INTERVAL
+
+    uncached_service.set_suite(make_suite([make_order(2)], [make_position()]))
+    await uncached_service._poll_orders()
+    assert uncached_service.interval == OrderPollingService.POLL_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_position_open_cuts_slow_wait_short(uncached_service):
+    """Test that poll_soon() polls within FAST_INTERVAL while the account was flat."""
+    suite = make_suite([], [])
+    uncached_service.set_suite(suite)
+
+    await uncached_service.start_polling()
+    await asyncio.sleep(0.05)  # First poll runs right away
+    assert uncached_service.interval == OrderPollingService.SLOW_INTERVAL
+
+    # Position opened without a stop
+    suite["MNQ"].positions.get_all_positions.return_value = [make_position()]
+    uncached_service.poll_soon()
+    await asyncio.sleep(OrderPollingService.FAST_INTERVAL + 0.2)
+    await uncached_service.stop_polling()
+
+    assert suite["MNQ"].orders.search_open_orders.await_count == 2
+    assert uncached_service.interval == OrderPollingService.FAST_INTERVAL
+
+
 # ============================================================================
 # Summary
 # ============================================================================
@@ -161,6 +161,22 @@ def test_remove_take_profit(cache):
     assert contract_id not in cache._active_take_profits
 
 
+def test_remove_order_matches_order_id(cache, mock_order_stop_loss):
+    """Test that remove_order only drops entries of the given order."""
+    contract_id = mock_order_stop_loss.contractId
+
+    cache.update_from_order_placed(mock_order_stop_loss)
+    cache._active_take_profits[contract_id] = {"order_id": 789}
+
+    # A different (stale) order id leaves the cache alone
+    cache.remove_order(contract_id, 11111)
+    assert contract_id in cache._active_stop_losses
+
+    cache.remove_order(contract_id, mock_order_stop_loss.id)
+    assert contract_id not in cache._active_stop_losses
+    assert contract_id in cache._active_take_profits
+
+
 def test_invalidate_clears_both_caches(cache, mock_order_stop_loss):
     """Test that invalidate() clears both stop loss and take profit caches."""
     contract_id = mock_order_stop_loss.contractId
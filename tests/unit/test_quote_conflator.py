@@ -0,0 +1,241 @@
+"""
+Unit tests for QuoteConflator module.
+
+Tests latest-value-wins conflation, flush triggers, and the MarketDataHandler
+threshold-crossing fast path.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from risk_manager.config.models import QuoteEventsConfig
+from risk_manager.core.events import EventBus, EventType
+from risk_manager.integrations.sdk.market_data import MarketDataHandler
+from risk_manager.integrations.sdk.quote_conflator import ConflatedQuote, QuoteConflator
+from risk_manager.integrations.unrealized_pnl import UnrealizedPnLCalculator
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def flushed():
+    """Collect quotes handed to the flush callback."""
+    return []
+
+
+@pytest.fixture
+def conflator(flushed):
+    """Create conflator with a long interval so only explicit flushes fire."""
+    async def collect(quote: ConflatedQuote):
+        flushed.append(quote)
+
+    return QuoteConflator(flush_callback=collect, flush_interval_ms=60_000, buffer_size=100)
+
+
+def make_quote_event(symbol: str, price: float):
+    """Create mock SDK quote event."""
+    event = Mock()
+    event.data = {
+        'symbol': f'F.US.{symbol}',
+        'bid': price - 0.25,
+        'ask': price + 0.25,
+        'last_price': price,
+        'timestamp': None,
+    }
+    return event
+
+
+# ============================================================================
+# Test: Conflation
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_latest_value_wins(conflator, flushed):
+    """Multiple quotes for one symbol collapse to the most recent."""
+    for price in (100.0, 101.0, 102.0):
+        await conflator.submit("MNQ", price, price, price, price)
+
+    assert conflator.pending_count == 1
+    assert await conflator.flush() == 1
+
+    assert len(flushed) == 1
+    assert flushed[0].price == 102.0
+    assert flushed[0].updates == 3
+
+
+@pytest.mark.asyncio
+async def test_symbols_conflated_independently(conflator, flushed):
+    """Each symbol keeps its own latest quote."""
+    await conflator.submit("MNQ", 1.0, 1.0, 1.0, 1.0)
+    await conflator.submit("ES", 2.0, 2.0, 2.0, 2.0)
+    await conflator.submit("MNQ", 3.0, 3.0, 3.0, 3.0)
+
+    await conflator.flush()
+
+    assert {q.symbol: q.price for q in flushed} == {"MNQ": 3.0, "ES": 2.0}
+
+
+@pytest.mark.asyncio
+async def test_urgent_quote_flushes_only_its_symbol(conflator, flushed):
+    """Urgent quotes bypass the interval without flushing other symbols."""
+    await conflator.submit("ES", 2.0, 2.0, 2.0, 2.0)
+    await conflator.submit("MNQ", 1.0, 1.0, 1.0, 1.0, urgent=True)
+
+    assert [q.symbol for q in flushed] == ["MNQ"]
+    assert flushed[0].urgent is True
+    assert conflator.pending_count == 1
+
+
+@pytest.mark.asyncio
+async def test_buffer_size_forces_flush(flushed):
+    """Reaching buffer_size updates flushes without waiting for the interval."""
+    async def collect(quote):
+        flushed.append(quote)
+
+    conflator = QuoteConflator(flush_callback=collect, flush_interval_ms=60_000, buffer_size=3)
+    await conflator.submit("MNQ", 1.0, 1.0, 1.0, 1.0)
+    await conflator.submit("MNQ", 2.0, 2.0, 2.0, 2.0)
+    assert flushed == []
+
+    await conflator.submit("MNQ", 3.0, 3.0, 3.0, 3.0)
+
+    assert [q.price for q in flushed] == [3.0]
+    stats = conflator.get_stats()
+    assert stats["received"] == 3
+    assert stats["flushed"] == 1
+    assert stats["conflated"] == 2
+    assert stats["full_flushes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_interval_flush_and_stop(flushed):
+    """Background task flushes on the interval; stop flushes the remainder."""
+    async def collect(quote):
+        flushed.append(quote)
+
+    conflator = QuoteConflator(flush_callback=collect, flush_interval_ms=10, buffer_size=100)
+    await conflator.start()
+    await conflator.submit("MNQ", 1.0, 1.0, 1.0, 1.0)
+    await asyncio.sleep(0.05)
+    assert [q.price for q in flushed] == [1.0]
+
+    await conflator.submit("MNQ", 2.0, 2.0, 2.0, 2.0)
+    await conflator.stop()
+    assert [q.price for q in flushed] == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_callback_error_is_isolated(conflator):
+    """A failing callback does not break subsequent flushes."""
+    calls = []
+
+    async def boom(quote):
+        calls.append(quote.symbol)
+        raise RuntimeError("boom")
+
+    conflator._flush_callback = boom
+    await conflator.submit("MNQ", 1.0, 1.0, 1.0, 1.0)
+    await conflator.submit("ES", 1.0, 1.0, 1.0, 1.0)
+
+    assert await conflator.flush() == 2
+    assert calls == ["MNQ", "ES"]
+
+
+# ============================================================================
+# Test: MarketDataHandler integration
+# ============================================================================
+
+@pytest.fixture
+def conflating_handler():
+    """Handler with conflation on and a -100 loss threshold."""
+    calculator = UnrealizedPnLCalculator()
+    calculator.update_position("CON.F.US.MNQ.Z25", {
+        'price': 20000.0, 'size': 1, 'side': 'long', 'symbol': 'MNQ',
+    })
+    calculator.set_pnl_limits(loss_limit=-100.0)
+    bus = EventBus()
+    handler = MarketDataHandler(
+        pnl_calculator=calculator,
+        event_bus=bus,
+        instruments=["MNQ"],
+        quote_config=QuoteEventsConfig(
+            buffer_size=100, buffer_flush_interval_ms=60_000, update_interval_ms=1000
+        ),
+    )
+    return handler, calculator, bus
+
+
+@pytest.mark.asyncio
+async def test_handler_without_config_does_not_conflate():
+    """Default handler keeps processing every quote immediately."""
+    handler = MarketDataHandler(pnl_calculator=Mock(), event_bus=EventBus(), instruments=["MNQ"])
+    assert handler._conflator is None
+    assert handler.get_conflation_stats() is None
+
+
+@pytest.mark.asyncio
+async def test_first_quote_for_position_is_urgent(conflating_handler):
+    """A position with no processed price gets its first quote immediately."""
+    handler, calculator, _ = conflating_handler
+
+    await handler.handle_quote_update(make_quote_event("MNQ", 20000.0))
+
+    assert handler.get_conflation_stats()["urgent_flushes"] == 1
+    assert float(calculator.calculate_unrealized_pnl("CON.F.US.MNQ.Z25")) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_quotes_inside_threshold_are_buffered(conflating_handler):
+    """Small moves are held until the next flush."""
+    handler, calculator, _ = conflating_handler
+    await handler.handle_quote_update(make_quote_event("MNQ", 20000.0))
+
+    # MNQ: $0.50 per 0.25 tick → -$10 and -$20
+    await handler.handle_quote_update(make_quote_event("MNQ", 19995.0))
+    await handler.handle_quote_update(make_quote_event("MNQ", 19990.0))
+
+    assert float(calculator.calculate_unrealized_pnl("CON.F.US.MNQ.Z25")) == 0.0
+
+    await handler._conflator.flush()
+    assert float(calculator.calculate_unrealized_pnl("CON.F.US.MNQ.Z25")) == -20.0
+
+
+@pytest.mark.asyncio
+async def test_threshold_crossing_publishes_immediately(conflating_handler):
+    """Crossing the loss limit bypasses the buffer and reaches the bus."""
+    handler, calculator, bus = conflating_handler
+    received = []
+
+    async def on_pnl(event):
+        received.append(event.data['unrealized_pnl'])
+
+    bus.subscribe(EventType.UNREALIZED_PNL_UPDATE, on_pnl)
+    await handler.handle_quote_update(make_quote_event("MNQ", 20000.0))
+
+    # -$110 crosses the -$100 threshold
+    await handler.handle_quote_update(make_quote_event("MNQ", 19945.0))
+
+    assert received == [-110.0]
+    assert handler._conflator.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_market_data_updates_throttled_per_symbol(conflating_handler):
+    """MARKET_DATA_UPDATED is published at most once per update interval."""
+    handler, _, bus = conflating_handler
+    published = []
+
+    async def on_market_data(event):
+        published.append(event.data['price'])
+
+    bus.subscribe(EventType.MARKET_DATA_UPDATED, on_market_data)
+
+    for price in (21000.0, 21001.0):
+        await handler.process_quote(ConflatedQuote(
+            symbol="ES", bid=price, ask=price, last=price, price=price
+        ))
+
+    assert published == [21000.0]
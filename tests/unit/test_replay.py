@@ -0,0 +1,236 @@
+"""
+Unit tests for the replay package.
+
+Tests the virtual clock, SignalR payload translation, and end-to-end replay
+of recorded sessions through the production rule set - including cooldown
+expiry, hard lockouts and daily resets on the virtual timeline.
+"""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from risk_manager.config.loader import ConfigLoader
+from risk_manager.core.clock import VirtualClock
+from risk_manager.core.events import EventType, RiskEvent
+from risk_manager.replay import ReplayEngine, SignalRTranslator
+from risk_manager.replay.sources import event_time
+from risk_manager.state.event_journal import EventJournal
+
+CONFIG_DIR = Path(__file__).resolve().parents[2] / "config"
+
+ES = "CON.F.US.ES.H25"
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def ts(day: int, hour: int, minute: int = 0) -> str:
+    return datetime(2025, 1, day, hour, minute, tzinfo=timezone.utc).isoformat()
+
+
+def es_round_trip(open_at: str, close_at: str, entry: float, exit_price: float):
+    """Open 1 ES long, fill the exit, close. $50 per point."""
+    return [
+        ("position", {"accountId": 123, "contractId": ES, "type": 1, "size": 1,
+                      "averagePrice": entry, "updatedAt": open_at}),
+        ("order", {"id": 1, "accountId": 123, "contractId": ES, "type": 1, "side": 1,
+                   "size": 1, "fillPrice": exit_price, "state": 3, "updatedAt": close_at}),
+        ("position", {"accountId": 123, "contractId": ES, "type": 1, "size": 0,
+                      "averagePrice": entry, "updatedAt": close_at}),
+    ]
+
+
+def translate(messages, account_id=None):
+    return list(SignalRTranslator(account_id=account_id).translate_all(messages))
+
+
+@pytest.fixture
+def replay_configs():
+    """Repo risk/timers config with every rule disabled."""
+    loader = ConfigLoader(config_dir=CONFIG_DIR, env_file=None)
+    config = loader.load_risk_config()
+    timers_config = loader.load_timers_config()
+    for name in type(config.rules).model_fields:
+        getattr(config.rules, name).enabled = False
+    return config, timers_config
+
+
+# ============================================================================
+# Test: VirtualClock
+# ============================================================================
+
+class TestVirtualClock:
+    """Test the manually driven clock."""
+
+    def test_now_follows_set_and_advance(self):
+        clock = VirtualClock(datetime(2025, 1, 17, 14, 30, tzinfo=timezone.utc))
+        clock.advance(90)
+
+        assert clock.now(timezone.utc) == datetime(2025, 1, 17, 14, 31, 30, tzinfo=timezone.utc)
+        assert clock.monotonic() == 90.0
+
+    def test_naive_now_is_local_time(self):
+        start = datetime(2025, 1, 17, 14, 30, tzinfo=timezone.utc)
+        clock = VirtualClock(start)
+
+        assert clock.now().tzinfo is None
+        assert clock.now() == start.astimezone().replace(tzinfo=None)
+
+    def test_never_moves_backwards(self):
+        start = datetime(2025, 1, 17, 14, 30, tzinfo=timezone.utc)
+        clock = VirtualClock(start)
+
+        assert clock.set(start - timedelta(minutes=5)) is False
+        assert clock.now(timezone.utc) == start
+
+
+# ============================================================================
+# Test: SignalR translation
+# ============================================================================
+
+class TestSignalRTranslator:
+    """Test gateway payloads → risk events."""
+
+    def test_position_lifecycle_and_realized_pnl(self):
+        events = translate(es_round_trip(ts(17, 14), ts(17, 14, 5), 5000.0, 4997.0))
+
+        assert [e.event_type for e in events] == [
+            EventType.POSITION_OPENED,
+            EventType.ORDER_FILLED,
+            EventType.POSITION_CLOSED,
+        ]
+        closed = events[-1]
+        assert closed.account_id == 123
+        assert closed.symbol == "ES"
+        assert closed.contract_id == ES
+        assert closed.data["profitAndLoss"] == -150.0  # 3 points x $50, exit from the fill
+        assert event_time(closed) == datetime(2025, 1, 17, 14, 5, tzinfo=timezone.utc)
+
+    def test_size_change_is_update(self):
+        opened, scaled = translate([
+            ("position", {"accountId": 123, "contractId": ES, "type": 1, "size": 1,
+                          "averagePrice": 5000.0, "updatedAt": ts(17, 14)}),
+            ("position", {"accountId": 123, "contractId": ES, "type": 1, "size": 2,
+                          "averagePrice": 5000.0, "updatedAt": ts(17, 14, 1)}),
+        ])
+
+        assert opened.event_type == EventType.POSITION_OPENED
+        assert scaled.event_type == EventType.POSITION_UPDATED
+        assert scaled.size == 2
+
+    def test_quote_publishes_pnl_before_market_data(self):
+        events = translate([
+            ("position", {"accountId": 123, "contractId": ES, "type": 1, "size": 1,
+                          "averagePrice": 5000.0, "updatedAt": ts(17, 14)}),
+            ("quote", {"contractId": ES, "bid": 4990.0, "ask": 4990.5, "last": 4990.0,
+                       "timestamp": ts(17, 14, 1)}),
+        ])
+
+        assert [e.event_type for e in events[1:]] == [
+            EventType.UNREALIZED_PNL_UPDATE,
+            EventType.MARKET_DATA_UPDATED,
+        ]
+        assert events[1].data["unrealized_pnl"] == -500.0
+        assert events[1].account_id == 123  # Quotes carry the session's account
+
+    def test_unknown_order_state_ignored(self):
+        assert translate([("order", {"id": 1, "contractId": ES, "state": 5})]) == []
+
+
+# ============================================================================
+# Test: Replay
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestReplayEngine:
+    """Test end-to-end replay on the virtual clock."""
+
+    async def test_cooldown_expires_on_recorded_timeline(self, replay_configs):
+        config, timers_config = replay_configs  # cooldown_after_loss: 15m
+        config.rules.cooldown_after_loss.enabled = True
+        config.rules.cooldown_after_loss.loss_threshold = -100.0
+
+        messages = (
+            es_round_trip(ts(17, 14, 0), ts(17, 14, 1), 5000.0, 4997.0)     # cooldown until 14:16
+            + es_round_trip(ts(17, 14, 5), ts(17, 14, 10), 5000.0, 4997.0)  # inside cooldown
+            + es_round_trip(ts(17, 14, 20), ts(17, 14, 25), 5000.0, 4997.0) # after expiry
+        )
+        result = await ReplayEngine(config, timers_config).run(translate(messages))
+
+        assert [v.timestamp for v in result.violations] == [
+            datetime(2025, 1, 17, 14, 1, tzinfo=timezone.utc),
+            datetime(2025, 1, 17, 14, 25, tzinfo=timezone.utc),
+        ]
+        assert result.violations_by_rule() == {"CooldownAfterLossRule": 2}
+        assert result.enforcement_by_action() == {"flatten_all": 2}
+
+    async def test_daily_loss_lockout_and_reset(self, replay_configs):
+        config, timers_config = replay_configs
+        config.rules.daily_realized_loss.enabled = True
+        config.rules.daily_realized_loss.limit = -100.0
+
+        messages = (
+            es_round_trip(ts(16, 15, 0), ts(16, 15, 5), 5000.0, 4997.0)   # -150: lockout
+            + es_round_trip(ts(16, 16, 0), ts(16, 16, 5), 5000.0, 4997.0) # locked until reset
+            + es_round_trip(ts(17, 15, 0), ts(17, 15, 5), 5000.0, 4997.0) # new trading day
+        )
+        result = await ReplayEngine(config, timers_config).run(translate(messages))
+
+        assert [v.timestamp.day for v in result.violations] == [16, 17]
+        assert [v.violation["daily_loss"] for v in result.violations] == [-150.0, -150.0]
+        assert [call.action for call in result.broker_calls] == ["flatten_all", "flatten_all"]
+
+    async def test_replay_is_deterministic(self, replay_configs):
+        config, timers_config = replay_configs
+        config.rules.daily_realized_loss.enabled = True
+        config.rules.daily_realized_loss.limit = -100.0
+        messages = es_round_trip(ts(17, 15), ts(17, 15, 5), 5000.0, 4990.0)
+
+        engine = ReplayEngine(config, timers_config)
+        first = await engine.run(translate(messages))
+        second = await engine.run(translate(messages))
+
+        assert first.events == second.events == 3
+        assert [(v.timestamp, v.rule) for v in first.violations] == [
+            (v.timestamp, v.rule) for v in second.violations
+        ]
+
+    async def test_journal_replay_skips_engine_events(self, replay_configs, tmp_path):
+        config, timers_config = replay_configs
+        config.rules.daily_realized_loss.enabled = True
+        config.rules.daily_realized_loss.limit = -100.0
+
+        journal = EventJournal(tmp_path / "journal")
+        journal.start()
+        for event in translate(es_round_trip(ts(17, 15), ts(17, 15, 5), 5000.0, 4997.0)):
+            journal.append(event)
+        journal.append(RiskEvent(event_type=EventType.RULE_VIOLATED, data={"rule": "Live"}))
+        journal.close()
+
+        result = await ReplayEngine(config, timers_config).run_journal(tmp_path / "journal")
+
+        assert result.events == 3
+        assert result.violations_by_rule() == {"DailyRealizedLossRule": 1}
+        assert result.events_per_second > 0
+
+    async def test_wall_clock_untouched(self, replay_configs):
+        import risk_manager.state.pnl_tracker as pnl_tracker
+        import risk_manager.state.timer_manager as timer_manager
+
+        config, timers_config = replay_configs
+        await ReplayEngine(config, timers_config).run(
+            translate(es_round_trip(ts(17, 15), ts(17, 15, 5), 5000.0, 4997.0))
+        )
+
+        assert timer_manager.datetime is datetime
+        assert pnl_tracker.date.today() == datetime.now().date()
+
+    async def test_empty_input(self, replay_configs):
+        config, timers_config = replay_configs
+        result = await ReplayEngine(config, timers_config).run([])
+
+        assert result.events == 0
+        assert result.violations == []
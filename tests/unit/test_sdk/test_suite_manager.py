@@ -37,7 +37,7 @@ class TestSuiteManagerInitialization:
         assert manager.event_bus is mock_event_bus
         assert len(manager.suites) == 0
         assert manager.running is False
-        assert manager._health_check_task is None
+        assert manager._health_check_job is None
 
     def test_initialization_logs_success(self, caplog):
         """
@@ -288,8 +288,8 @@ class TestSuiteManagerLifecycle:
         await manager.start()
 
         assert manager.running is True
-        assert manager._health_check_task is not None
-        assert not manager._health_check_task.done()
+        assert manager._health_check_job is not None
+        assert not manager._health_check_job.done()
 
         # Cleanup
         await manager.stop()
@@ -318,14 +318,14 @@ class TestSuiteManagerLifecycle:
         mock_suite_2.disconnect.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_stop_cancels_health_check_task(self, manager):
+    async def test_stop_cancels_health_check_job(self, manager):
         """
         GIVEN: Running manager with health check task
         WHEN: stop is called
         THEN: Health check task is cancelled
         """
         await manager.start()
-        health_task = manager._health_check_task
+        health_task = manager._health_check_job
 
         await manager.stop()
 
@@ -394,16 +394,16 @@ class TestHealthCheckLoop:
         await manager.start()
 
         # Cancel the health check task
-        manager._health_check_task.cancel()
+        manager._health_check_job.cancel()
 
         # Wait a bit
         await asyncio.sleep(0.1)
 
         # Should handle CancelledError gracefully
-        assert manager._health_check_task.cancelled() or manager._health_check_task.done()
+        assert manager._health_check_job.cancelled() or manager._health_check_job.done()
 
         # Cleanup
-        manager.running = False
+        await manager.stop()
 
 
 class TestGetHealthStatus:
@@ -603,10 +603,10 @@ class TestEdgeCases:
         THEN: Should handle gracefully
         """
         await manager.start()
-        first_task = manager._health_check_task
+        first_task = manager._health_check_job
 
         await manager.start()
-        second_task = manager._health_check_task
+        second_task = manager._health_check_job
 
         # Should still be running
         assert manager.running is True
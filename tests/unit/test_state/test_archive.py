@@ -0,0 +1,227 @@
+"""
+Tests for TradeArchive and TradeAnalytics
+
+Tests compaction of closed trading days into per-account monthly Parquet
+files (cutoff at the daily reset, idempotent re-runs, rows removed from
+SQLite) and the analytics queries that combine the archive with the live
+database: P&L curve, per-symbol stats, violation frequency and recent rows.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import polars as pl
+import pytest
+
+from risk_manager.core.clock import VirtualClock
+from risk_manager.core.scheduler import Scheduler
+from risk_manager.state.analytics import TradeAnalytics
+from risk_manager.state.archive import TradeArchive, archive_files
+from risk_manager.state.database import Database
+from risk_manager.state.lockout_manager import LockoutManager
+from risk_manager.state.pnl_tracker import PnLTracker
+
+# Friday 2025-01-31 15:00 UTC = 10:00 ET, trading day 2025-01-31
+NOW = datetime(2025, 1, 31, 15, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock(NOW)
+
+
+@pytest.fixture
+def db(tmp_path, clock):
+    database = Database(tmp_path / "state.db", clock=clock)
+    yield database
+    database.close()
+
+
+def add_trades(db, account_id, days, per_day=2, symbol="MNQ"):
+    """Add ``per_day`` trades at 15:00 UTC on each of the last ``days`` days."""
+    for day in range(days):
+        for i in range(per_day):
+            at = NOW - timedelta(days=day, minutes=i)
+            db.add_trade(
+                account_id, f"{symbol}-{day}-{i}", symbol, "buy", 1, 21000.0,
+                realized_pnl=25.0 if i % 2 == 0 else -10.0, timestamp=at,
+            )
+
+
+class TestCompaction:
+    """Test moving closed trading days into Parquet."""
+
+    def test_cutoff_is_start_of_retained_trading_day(self, db, clock):
+        # retain_days=1 keeps 2025-01-30, which starts at 17:00 ET on the 29th
+        assert TradeArchive(db, "unused", clock=clock).cutoff() == datetime(
+            2025, 1, 29, 22, 0, tzinfo=timezone.utc
+        )
+        assert TradeArchive(db, "unused", clock=clock, retain_days=0).cutoff() == datetime(
+            2025, 1, 30, 22, 0, tzinfo=timezone.utc
+        )
+
+    def test_moves_closed_days_only(self, db, clock, tmp_path):
+        add_trades(db, "ACC-1", days=10)
+        archive = TradeArchive(db, tmp_path / "archive", clock=clock)
+
+        archived = archive.compact()
+
+        assert archived["trades"] == 16  # 8 closed days x 2
+        assert db.execute_one("SELECT COUNT(*) FROM trades")[0] == 4
+        assert [path.name for path in archive_files(tmp_path / "archive", "trades")] == ["2025-01.parquet"]
+        assert pl.read_parquet(archive_files(tmp_path / "archive", "trades")[0]).height == 16
+
+    def test_partitions_by_account_and_month(self, db, clock, tmp_path):
+        add_trades(db, "ACC-1", days=40)
+        add_trades(db, "ACC/2", days=3)
+        add_trades(db, "ACC_2", days=3)
+
+        TradeArchive(db, tmp_path / "archive", clock=clock).compact(["trades"])
+
+        files = archive_files(tmp_path / "archive", "trades")
+        assert sorted(str(path.relative_to(tmp_path / "archive")) for path in files) == [
+            "trades/ACC%2F2/2025-01.parquet",
+            "trades/ACC-1/2024-12.parquet",
+            "trades/ACC-1/2025-01.parquet",
+            "trades/ACC_2/2025-01.parquet",
+        ]
+        assert len(archive_files(tmp_path / "archive", "trades", account_id="ACC/2")) == 1
+
+    def test_rerun_merges_without_duplicates(self, db, clock, tmp_path):
+        add_trades(db, "ACC-1", days=5)
+        archive = TradeArchive(db, tmp_path / "archive", clock=clock)
+        archive.compact()
+
+        # Next day: one more closed day joins the same month file
+        clock.advance(86400)
+        assert archive.compact()["trades"] == 2
+        assert archive.compact()["trades"] == 0
+
+        merged = pl.read_parquet(archive_files(tmp_path / "archive", "trades")[0])
+        assert merged.height == 8
+        assert merged["trade_id"].n_unique() == 8
+        assert merged["ts_us"].is_sorted()
+
+    def test_small_batches(self, db, clock, tmp_path):
+        add_trades(db, "ACC-1", days=10)
+
+        archived = TradeArchive(db, tmp_path / "archive", clock=clock, batch_size=3).compact()
+
+        assert archived["trades"] == 16
+        assert TradeAnalytics(db, tmp_path / "archive", clock=clock).scan("trades").collect().height == 20
+
+    async def test_daily_job_runs_after_reset(self, db, clock, tmp_path):
+        add_trades(db, "ACC-1", days=10)
+        scheduler = Scheduler(clock=clock, manual=True)
+        TradeArchive(db, tmp_path / "archive", clock=clock, scheduler=scheduler)
+
+        # Reset at 17:00 ET = 22:00 UTC, 7h after NOW
+        await scheduler.advance_to(7 * 3600)
+        assert db.execute_one("SELECT COUNT(*) FROM trades")[0] == 20
+
+        await scheduler.advance_to(7 * 3600 + TradeArchive.COMPACTION_DELAY)
+        assert db.execute_one("SELECT COUNT(*) FROM trades")[0] == 2
+        job = scheduler.get_job(TradeArchive.JOB_NAME)
+        assert job.stats()["next_run_in"] == pytest.approx(86400)
+
+    def test_unknown_table_rejected(self, db, clock, tmp_path):
+        with pytest.raises(ValueError):
+            TradeArchive(db, tmp_path / "archive", clock=clock).compact(["daily_pnl"])
+
+
+class TestAnalytics:
+    """Test analytics over the archive plus live rows."""
+
+    def test_symbol_stats_span_archive_and_live(self, db, clock, tmp_path):
+        add_trades(db, "ACC-1", days=10, symbol="MNQ")
+        add_trades(db, "ACC-1", days=1, symbol="ES")
+        TradeArchive(db, tmp_path / "archive", clock=clock).compact()
+
+        stats = TradeAnalytics(db, tmp_path / "archive", clock=clock).symbol_stats(weeks=4)
+
+        mnq = stats.filter(pl.col("symbol") == "MNQ").row(0, named=True)
+        assert stats["symbol"].to_list() == ["MNQ", "ES"]
+        assert mnq["trades"] == 20
+        assert mnq["realized_pnl"] == pytest.approx(150.0)
+        assert mnq["win_rate"] == pytest.approx(0.5)
+
+    def test_symbol_stats_look_back(self, db, clock, tmp_path):
+        add_trades(db, "ACC-1", days=20)
+        TradeArchive(db, tmp_path / "archive", clock=clock).compact()
+
+        stats = TradeAnalytics(db, tmp_path / "archive", clock=clock).symbol_stats(weeks=1)
+
+        # Today plus 7 days back, minus day 7's 14:59 trade
+        assert stats["trades"].to_list() == [15]
+
+    def test_pnl_curve(self, db, clock, tmp_path):
+        tracker = PnLTracker(db, clock=clock)
+        for day, pnl in enumerate([100.0, -300.0, 50.0]):
+            tracker.add_trade_pnl("ACC-1", pnl, trade_date=(NOW - timedelta(days=2 - day)).date())
+
+        curve = TradeAnalytics(db, tmp_path / "archive", clock=clock).pnl_curve("ACC-1", weeks=1)
+
+        assert curve["cumulative_pnl"].to_list() == [100.0, -200.0, -150.0]
+        assert curve["drawdown"].to_list() == [0.0, -300.0, -250.0]
+
+    async def test_violation_frequency(self, db, clock, tmp_path):
+        # Lockouts on each of the last 6 days; the clock only moves forward
+        past = VirtualClock(NOW - timedelta(days=5))
+        lockouts = LockoutManager(database=db, clock=past)
+        for _ in range(6):
+            await lockouts.set_cooldown(123, "Trade frequency", duration_seconds=60)
+            past.advance(86400)
+        lockouts.set_lockout(456, "Daily loss", until=NOW + timedelta(hours=2))
+        db.flush()
+
+        assert TradeArchive(db, tmp_path / "archive", clock=clock).compact()["lockout_log"] == 4
+
+        frequency = TradeAnalytics(db, tmp_path / "archive", clock=clock).violation_frequency(weeks=1)
+
+        assert frequency["rule_id"].to_list() == ["COOLDOWN", "MANUAL"]
+        assert frequency["violations"].to_list() == [6, 1]
+        assert frequency["per_day"][0] == pytest.approx(6 / 7)
+
+    def test_recent_trades_newest_first(self, db, clock, tmp_path):
+        add_trades(db, "ACC-1", days=5)
+        TradeArchive(db, tmp_path / "archive", clock=clock, retain_days=0).compact()
+
+        recent = TradeAnalytics(db, tmp_path / "archive", clock=clock).recent_trades(limit=3)
+
+        assert recent["trade_id"].to_list() == ["MNQ-0-0", "MNQ-0-1", "MNQ-1-0"]
+
+    def test_empty_archive(self, db, clock, tmp_path):
+        analytics = TradeAnalytics(db, tmp_path / "missing", clock=clock)
+
+        assert analytics.symbol_stats().is_empty()
+        assert analytics.violation_frequency().is_empty()
+        assert analytics.pnl_curve().is_empty()
+
+
+@pytest.mark.slow
+class TestBenchmark:
+    """Analytics latency over a multi-month archive."""
+
+    def test_symbol_stats_latency(self, db, clock, tmp_path):
+        symbols = ["MNQ", "ES", "NQ", "MES"]
+        with db.connection() as conn:
+            conn.executemany(
+                "INSERT INTO trades (account_id, trade_id, symbol, side, quantity, price, "
+                "realized_pnl, timestamp, created_at) VALUES (?, ?, ?, 'buy', 1, 1.0, ?, ?, ?)",
+                [
+                    (f"ACC-{i % 5}", f"T{i}", symbols[i % 4], (i % 7) - 3.0, ts, ts)
+                    for i in range(50_000)
+                    for ts in [(NOW - timedelta(minutes=3 * i)).isoformat()]
+                ],
+            )
+            conn.commit()
+        TradeArchive(db, tmp_path / "archive", clock=clock).compact()
+        analytics = TradeAnalytics(db, tmp_path / "archive", clock=clock)
+
+        started = time.perf_counter()
+        stats = analytics.symbol_stats(weeks=12)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        print(f"\nsymbol_stats over {stats['trades'].sum()} trades: {elapsed_ms:.1f}ms")
+        assert stats["trades"].sum() > 0
+        assert elapsed_ms < 1000
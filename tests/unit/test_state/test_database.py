@@ -0,0 +1,343 @@
+"""
+Tests for Database
+
+Tests the long-lived connections of file-backed databases: WAL pragmas,
+writer/reader reuse, visibility of committed writes, rollback of
+uncommitted ones, and a per-call latency benchmark against the old
+connection-per-call behaviour. Also covers the write-behind queue: group
+commits, read-your-writes, flush barriers and stalled-disk behaviour, and
+the schema v2 migration (epoch columns, trading_day, covering indexes).
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from risk_manager.core.clock import VirtualClock
+from risk_manager.state.database import Database, epoch_us, trading_day
+from risk_manager.state.lockout_manager import LockoutManager
+from risk_manager.state.pnl_tracker import PnLTracker
+
+RESET_LOG_INSERT = (
+    "INSERT INTO reset_log (account_id, reset_type, reset_time, triggered_at) "
+    "VALUES (?, 'daily', ?, 'x')"
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(tmp_path / "state.db")
+    yield database
+    database.close()
+
+
+class TestConnectionReuse:
+    """Test that file-backed databases keep their connections open."""
+
+    def test_wal_and_pragmas_applied(self, db):
+        assert db.execute_one("PRAGMA journal_mode")[0] == "wal"
+        assert db.execute_one("PRAGMA synchronous")[0] == 1  # NORMAL
+        assert db.execute_one("PRAGMA cache_size")[0] == -Database.CACHE_SIZE_KIB
+
+    def test_writer_connection_is_reused(self, db):
+        with db.connection() as first:
+            pass
+        db.execute_write("DELETE FROM trades")
+        with db.connection() as second:
+            pass
+
+        assert first is second
+
+    def test_reader_pool_is_reused(self, db):
+        for _ in range(20):
+            db.execute("SELECT 1")
+            db.execute_one("SELECT 1")
+
+        assert len(db._readers) == 1
+
+    def test_reader_pool_is_bounded(self, tmp_path):
+        db = Database(tmp_path / "bounded.db", reader_pool_size=2)
+        barrier = threading.Barrier(4)
+        errors = []
+
+        def read():
+            try:
+                barrier.wait()
+                for _ in range(50):
+                    db.execute("SELECT COUNT(*) FROM trades")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(db._readers) <= 2
+        db.close()
+
+
+class TestConsistency:
+    """Test that pooled readers see exactly the committed state."""
+
+    def test_reads_see_committed_writes(self, db):
+        tracker = PnLTracker(db)
+        tracker.add_trade_pnl("ACC-1", -100.0)
+        tracker.add_trade_pnl("ACC-1", -50.0)
+
+        assert tracker.get_daily_pnl("ACC-1") == -150.0
+        assert tracker.get_trade_count("ACC-1") == 2
+
+    def test_uncommitted_writes_are_rolled_back(self, db):
+        with db.connection() as conn:
+            conn.execute(
+                "INSERT INTO reset_log (account_id, reset_type, reset_time, triggered_at) "
+                "VALUES ('ACC-1', 'daily', '17:00', 'x')"
+            )
+
+        assert db.execute_one("SELECT COUNT(*) FROM reset_log")[0] == 0
+
+    def test_reopens_after_close(self, db):
+        db.execute_write(
+            "INSERT INTO reset_log (account_id, reset_type, reset_time, triggered_at) "
+            "VALUES ('ACC-1', 'daily', '17:00', 'x')"
+        )
+        db.close()
+
+        assert db.execute_one("SELECT COUNT(*) FROM reset_log")[0] == 1
+
+    def test_second_instance_sees_writes(self, db, tmp_path):
+        db.add_trade("ACC-1", "T1", "MNQ", "buy", 1, 21000.0)
+
+        other = Database(tmp_path / "state.db")
+        assert other.get_trade_count("ACC-1", window=60) == 1
+        other.close()
+
+
+class TestWriteBehind:
+    """Test writes queued for the writer thread."""
+
+    def test_flush_applies_submitted_writes(self, db):
+        for i in range(100):
+            db.submit_write(RESET_LOG_INSERT, ("ACC-1", f"t{i}"))
+
+        assert db.flush(timeout=5) is True
+        stats = db.get_write_stats()
+        assert stats["applied"] == 100
+        assert stats["pending"] == 0
+        assert stats["commits"] < 100  # Grouped into fewer transactions
+        with sqlite3.connect(db.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM reset_log").fetchone()[0] == 100
+
+    def test_reads_wait_for_earlier_writes(self, db):
+        for i in range(50):
+            db.submit_write(RESET_LOG_INSERT, ("ACC-1", f"t{i}"))
+
+        assert db.execute_one("SELECT COUNT(*) FROM reset_log")[0] == 50
+
+    def test_failed_statement_does_not_drop_batch(self, db):
+        db.submit_write(RESET_LOG_INSERT, ("ACC-1", "t1"))
+        db.submit_write(RESET_LOG_INSERT, ("ACC-1", "t1"))  # UNIQUE violation
+        db.submit_write(RESET_LOG_INSERT, ("ACC-1", "t2"))
+        db.flush(timeout=5)
+
+        assert db.execute_one("SELECT COUNT(*) FROM reset_log")[0] == 2
+        assert db.get_write_stats()["write_errors"] == 1
+
+    def test_flush_returns_when_connection_cannot_open(self, db, monkeypatch):
+        def fail():
+            raise sqlite3.OperationalError("unable to open database file")
+
+        db._writer_conn.close()
+        db._writer_conn = None
+        monkeypatch.setattr(db, "_open_connection", fail)
+        db.submit_write(RESET_LOG_INSERT, ("ACC-1", "t1"))
+        db.submit_write(RESET_LOG_INSERT, ("ACC-1", "t2"))
+
+        assert db.flush(timeout=5) is True
+        stats = db.get_write_stats()
+        assert stats["pending"] == 0
+        assert stats["write_errors"] == 2
+
+        # The writer survived and reconnects once the disk is back
+        monkeypatch.undo()
+        db.submit_write(RESET_LOG_INSERT, ("ACC-1", "t3"))
+        assert db.flush(timeout=5) is True
+        assert db.execute_one("SELECT COUNT(*) FROM reset_log")[0] == 1
+
+    def test_close_applies_pending_writes(self, tmp_path):
+        db = Database(tmp_path / "close.db")
+        for i in range(20):
+            db.submit_write(RESET_LOG_INSERT, ("ACC-1", f"t{i}"))
+        db.close()
+
+        with sqlite3.connect(tmp_path / "close.db") as conn:
+            assert conn.execute("SELECT COUNT(*) FROM reset_log").fetchone()[0] == 20
+
+    async def test_event_loop_runs_while_disk_stalls(self, db):
+        lockouts = LockoutManager(database=db)
+
+        # Stall the writer: it needs the write lock to commit
+        db._write_lock.acquire()
+        try:
+            started = time.perf_counter()
+            await lockouts.set_cooldown(123, "Loss cooldown", duration_seconds=60)
+            lockouts.set_lockout(456, "Daily loss", until=lockouts._now().replace(year=2099))
+            await asyncio.sleep(0.05)
+            elapsed = time.perf_counter() - started
+
+            assert lockouts.is_locked_out(123) is True
+            assert lockouts.is_locked_out(456) is True
+            assert elapsed < 0.5
+            assert db.flush(timeout=0.05) is False
+        finally:
+            db._write_lock.release()
+
+        assert db.flush(timeout=5) is True
+        assert db.execute_one("SELECT COUNT(*) FROM lockouts WHERE active = 1")[0] == 2
+
+
+def _create_v1_database(path, trades):
+    """Build a database as schema v1 left it, holding ``trades``."""
+    db = Database(path)
+    db.close()
+    with sqlite3.connect(path) as conn:
+        conn.execute("DROP TABLE trades")
+        conn.execute("""
+            CREATE TABLE trades (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                account_id TEXT NOT NULL, trade_id TEXT NOT NULL UNIQUE,
+                symbol TEXT NOT NULL, side TEXT NOT NULL, quantity INTEGER NOT NULL,
+                price REAL NOT NULL, realized_pnl REAL, timestamp TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO trades (account_id, trade_id, symbol, side, quantity, price, "
+            "timestamp, created_at) VALUES ('ACC-1', ?, 'MNQ', 'buy', 1, 1.0, ?, ?)",
+            [(f"T{i}", ts, ts) for i, ts in enumerate(trades)],
+        )
+        conn.execute("DELETE FROM schema_version WHERE version > 1")
+
+
+class TestSchemaV2:
+    """Test epoch-microsecond columns, trading_day and the v1 -> v2 migration."""
+
+    def test_epoch_us(self):
+        moment = datetime(2025, 1, 17, 14, 30, 0, 123456, tzinfo=timezone.utc)
+
+        assert epoch_us(moment) == 1737124200123456
+        assert epoch_us(moment.isoformat()) == 1737124200123456
+        assert epoch_us(moment.replace(tzinfo=None)) == 1737124200123456
+
+    def test_trading_day_rolls_at_reset(self):
+        # January: 17:00 ET = 22:00 UTC; July (EDT): 17:00 ET = 21:00 UTC
+        assert trading_day(datetime(2025, 1, 17, 21, 59, tzinfo=timezone.utc)) == "2025-01-17"
+        assert trading_day(datetime(2025, 1, 17, 22, 0, tzinfo=timezone.utc)) == "2025-01-18"
+        assert trading_day(datetime(2025, 7, 17, 21, 0, tzinfo=timezone.utc)) == "2025-07-18"
+        assert trading_day("2025-01-17T17:30:00+00:00", "18:00", "Europe/London") == "2025-01-17"
+
+    def test_fresh_database_is_v2(self, db):
+        versions = [row[0] for row in db.execute("SELECT version FROM schema_version")]
+        indexes = {row[0] for row in db.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+        assert versions == [1, 2, 3]
+        assert "idx_trades_account_ts_us" in indexes
+        assert "idx_lockouts_active_expires_covering" in indexes
+        assert "idx_trades_account_timestamp" not in indexes
+
+    def test_add_trade_fills_v2_columns(self, db):
+        at = datetime(2025, 1, 17, 22, 30, tzinfo=timezone.utc)  # 17:30 ET
+        db.add_trade("ACC-1", "T1", "MNQ", "buy", 1, 21000.0, timestamp=at)
+
+        row = db.execute_one("SELECT ts_us, trading_day FROM trades")
+        assert row["ts_us"] == epoch_us(at)
+        assert row["trading_day"] == "2025-01-18"
+
+    def test_raw_insert_filled_by_trigger(self, db):
+        db.execute_write(
+            "INSERT INTO lockouts (account_id, rule_id, reason, locked_at, expires_at, created_at) "
+            "VALUES ('ACC-1', 'R', 'x', '2025-01-17T14:30:00+00:00', "
+            "'2025-01-17T15:30:00.250+00:00', 'x')"
+        )
+
+        row = db.execute_one("SELECT locked_at_us, expires_at_us FROM lockouts")
+        assert row["locked_at_us"] == epoch_us("2025-01-17T14:30:00+00:00")
+        assert row["expires_at_us"] == epoch_us("2025-01-17T15:30:00.250+00:00")
+
+    def test_v1_database_is_migrated_and_backfilled(self, tmp_path, monkeypatch):
+        path = tmp_path / "v1.db"
+        stamps = [f"2025-01-17T{hour:02d}:00:00+00:00" for hour in range(24)]
+        _create_v1_database(path, stamps)
+        monkeypatch.setattr(Database, "BACKFILL_BATCH_SIZE", 5)
+
+        db = Database(path)
+        rows = db.execute("SELECT timestamp, ts_us, trading_day FROM trades ORDER BY id")
+
+        assert db.execute_one("SELECT MAX(version) FROM schema_version")[0] == Database.SCHEMA_VERSION
+        assert [row["ts_us"] for row in rows] == [epoch_us(ts) for ts in stamps]
+        assert [row["trading_day"] for row in rows] == [trading_day(ts) for ts in stamps]
+        db.close()
+
+    def test_session_count_follows_reset(self, tmp_path):
+        clock = VirtualClock(datetime(2025, 1, 17, 23, 0, tzinfo=timezone.utc))  # 18:00 ET
+        db = Database(tmp_path / "session.db", clock=clock)
+        db.add_trade("ACC-1", "T1", "MNQ", "buy", 1, 1.0,
+                     timestamp=datetime(2025, 1, 17, 21, 0, tzinfo=timezone.utc))  # 16:00 ET
+        db.add_trade("ACC-1", "T2", "MNQ", "buy", 1, 1.0,
+                     timestamp=datetime(2025, 1, 17, 22, 30, tzinfo=timezone.utc))  # 17:30 ET
+
+        assert db.get_session_trade_count("ACC-1") == 1
+        assert db.get_trade_count("ACC-1", window=3600) == 1
+        db.close()
+
+
+@pytest.mark.slow
+class TestBenchmark:
+    """Per-call latency of pooled connections vs. a connection per call."""
+
+    CALLS = 300
+
+    @staticmethod
+    def _per_call_connection(db_path, query, params):
+        """The previous behaviour: open, query, close."""
+        conn = sqlite3.connect(str(db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            return conn.execute(query, params).fetchone()
+        finally:
+            conn.close()
+
+    def test_pooled_reads_faster_than_connection_per_call(self, db):
+        query = "SELECT realized_pnl FROM daily_pnl WHERE account_id = ? AND date = ?"
+        params = ("ACC-1", "2025-01-17")
+
+        started = time.perf_counter()
+        for _ in range(self.CALLS):
+            self._per_call_connection(db.db_path, query, params)
+        before_us = (time.perf_counter() - started) / self.CALLS * 1e6
+
+        started = time.perf_counter()
+        for _ in range(self.CALLS):
+            db.execute_one(query, params)
+        after_us = (time.perf_counter() - started) / self.CALLS * 1e6
+
+        print(f"\nexecute_one: {before_us:.1f}us/call per-connection -> {after_us:.1f}us/call pooled")
+        assert after_us < before_us
+
+    def test_pnl_write_latency(self, db):
+        tracker = PnLTracker(db)
+
+        started = time.perf_counter()
+        for _ in range(self.CALLS):
+            tracker.add_trade_pnl("ACC-1", -1.0)
+        per_call_us = (time.perf_counter() - started) / self.CALLS * 1e6
+
+        print(f"\nadd_trade_pnl: {per_call_us:.1f}us/call")
+        assert tracker.get_trade_count("ACC-1") == self.CALLS
@@ -0,0 +1,170 @@
+"""
+Tests for EventJournal
+
+Tests the append-only binary journal: writing off-thread, fsync batching,
+segment rotation, and mmap replay including torn-tail recovery.
+"""
+
+import pytest
+
+from risk_manager.core.events import EventBus, EventType, RiskEvent
+from risk_manager.state.event_journal import (
+    EventJournal,
+    EventJournalReader,
+    list_segments,
+    read_segment,
+)
+
+
+@pytest.fixture
+def journal_dir(tmp_path):
+    """Directory for journal segments."""
+    return tmp_path / "journal"
+
+
+def make_event(i: int) -> RiskEvent:
+    return RiskEvent(
+        event_type=EventType.POSITION_UPDATED,
+        data={"account_id": 123, "symbol": "MNQ", "size": i},
+        source="trading_sdk",
+    )
+
+
+class TestEventJournalWriteRead:
+    """Test round-tripping events through the journal."""
+
+    def test_events_round_trip(self, journal_dir):
+        journal = EventJournal(journal_dir)
+        journal.start()
+        events = [make_event(i) for i in range(5)]
+        for event in events:
+            journal.append(event)
+        journal.close()
+
+        restored = list(EventJournalReader(journal_dir))
+
+        assert [e.data["size"] for e in restored] == [0, 1, 2, 3, 4]
+        assert restored[0].event_type == EventType.POSITION_UPDATED
+        assert restored[0].source == "trading_sdk"
+        assert restored[0].account_id == 123
+        assert restored[0].timestamp == events[0].timestamp
+
+    def test_flush_is_a_durability_barrier(self, journal_dir):
+        journal = EventJournal(journal_dir, fsync_interval=60, fsync_batch_size=1000)
+        journal.start()
+        journal.append(make_event(1))
+
+        assert journal.flush(timeout=5) is True
+        assert journal.get_stats()["written"] == 1
+        assert journal.get_stats()["fsyncs"] == 1
+        assert len(list(EventJournalReader(journal_dir))) == 1
+
+        journal.close()
+
+    def test_fsync_batched_by_count(self, journal_dir):
+        journal = EventJournal(journal_dir, fsync_interval=60, fsync_batch_size=10)
+        journal.start()
+        for i in range(30):
+            journal.append(make_event(i))
+        journal.flush(timeout=5)
+        journal.close()
+
+        assert journal.get_stats()["fsyncs"] == 3
+
+    def test_excluded_event_types_not_recorded(self, journal_dir):
+        journal = EventJournal(journal_dir, exclude_event_types=[EventType.MARKET_DATA_UPDATED])
+        journal.start()
+        journal.append(RiskEvent(event_type=EventType.MARKET_DATA_UPDATED, symbol="MNQ"))
+        journal.append(make_event(1))
+        journal.close()
+
+        assert [e.event_type for e in EventJournalReader(journal_dir)] == [
+            EventType.POSITION_UPDATED
+        ]
+
+    def test_append_leaves_encoding_to_writer(self, journal_dir):
+        journal = EventJournal(journal_dir)
+        journal.start()
+        event = RiskEvent(event_type=EventType.UNREALIZED_PNL_UPDATE, symbol="MNQ", price=21500.0)
+        journal.append(event)
+
+        assert event._data is None  # Lazy data not built on the event loop
+        event.data["late"] = True  # Handler change after the tap
+        journal.close()
+
+        (restored,) = list(EventJournalReader(journal_dir))
+        assert restored.data == {"symbol": "MNQ", "price": 21500.0}
+
+    def test_events_dropped_without_writer(self, journal_dir):
+        journal = EventJournal(journal_dir)
+        journal.append(make_event(0))  # Before start()
+        journal.start()
+        journal.append(make_event(1))
+        journal.close()
+        journal.append(make_event(2))  # After close()
+
+        assert [e.data["size"] for e in EventJournalReader(journal_dir)] == [1]
+        assert journal._queue.empty()
+        assert journal.get_stats()["dropped"] == 2
+
+
+class TestEventJournalSegments:
+    """Test segment rotation and crash recovery."""
+
+    def test_rotation_by_size(self, journal_dir):
+        journal = EventJournal(journal_dir, segment_max_bytes=512)
+        journal.start()
+        for i in range(50):
+            journal.append(make_event(i))
+        journal.close()
+
+        assert len(list_segments(journal_dir)) > 1
+        assert [e.data["size"] for e in EventJournalReader(journal_dir)] == list(range(50))
+
+    def test_restart_opens_new_segment(self, journal_dir):
+        for run in range(2):
+            journal = EventJournal(journal_dir)
+            journal.start()
+            journal.append(make_event(run))
+            journal.close()
+
+        segments = list_segments(journal_dir)
+        assert [s.name for s in segments] == ["events-00000001.rmj", "events-00000002.rmj"]
+        assert [e.data["size"] for e in EventJournalReader(journal_dir)] == [0, 1]
+
+    def test_torn_tail_is_ignored(self, journal_dir):
+        journal = EventJournal(journal_dir)
+        journal.start()
+        for i in range(3):
+            journal.append(make_event(i))
+        journal.close()
+
+        segment = list_segments(journal_dir)[0]
+        data = segment.read_bytes()
+        segment.write_bytes(data[:-5])  # Simulate a crash mid-record
+
+        assert [e.data["size"] for e in read_segment(segment)] == [0, 1]
+
+    def test_empty_directory(self, journal_dir):
+        assert list(EventJournalReader(journal_dir)) == []
+
+
+class TestEventJournalBusTap:
+    """Test recording through an EventBus tap."""
+
+    async def test_tap_records_every_published_event(self, journal_dir):
+        bus = EventBus()
+        journal = EventJournal(journal_dir)
+        journal.start()
+        bus.add_tap(journal.append)
+
+        await bus.publish(make_event(1))
+        await bus.publish(RiskEvent(event_type=EventType.RULE_VIOLATED, data={"rule": "X"}))
+        await bus.publish(RiskEvent(event_type=EventType.ENFORCEMENT_ACTION, data={"action": "flatten"}))
+        journal.close()
+
+        assert [e.event_type for e in EventJournalReader(journal_dir)] == [
+            EventType.POSITION_UPDATED,
+            EventType.RULE_VIOLATED,
+            EventType.ENFORCEMENT_ACTION,
+        ]
@@ -286,7 +286,7 @@ class TestCooldownTimers:
 
 
 # =============================================================================
-# CATEGORY 3: BACKGROUND TASK (3 tests)
+# CATEGORY 3: BACKGROUND TASK (6 tests)
 # =============================================================================
 
 
@@ -294,28 +294,51 @@ class TestBackgroundTask:
     """Test background task for checking expired lockouts."""
 
     @pytest.mark.asyncio
-    async def test_check_expired_lockouts_runs_every_second(self, lockout_manager):
+    async def test_expiry_job_clears_lockout_at_deadline(self, lockout_manager):
         """
-        GIVEN: Background task started
-        WHEN: Multiple seconds pass
-        THEN: check_expired_lockouts() is called repeatedly
+        GIVEN: Background task started and a lockout expiring in 0.2s
+        WHEN: The deadline passes
+        THEN: The lockout is cleared without any is_locked_out() call
         """
         # ARRANGE
-        check_count = 0
+        account_id = 123
+        until = datetime.now(timezone.utc) + timedelta(seconds=0.2)
+
+        # ACT
+        task = asyncio.create_task(lockout_manager.start_background_task())
+        await asyncio.sleep(0)
+        lockout_manager.set_lockout(account_id, "Test", until)
+        await asyncio.sleep(0.4)
+
+        # ASSERT
+        assert account_id not in lockout_manager.lockout_state
+        assert lockout_manager.next_expiry() is None
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
 
-        # Mock the check method
-        original_check = lockout_manager.check_expired_lockouts
+    @pytest.mark.asyncio
+    async def test_expiry_job_idle_without_lockouts(self, lockout_manager):
+        """
+        GIVEN: Background task started with no lockouts
+        WHEN: Time passes
+        THEN: check_expired_lockouts() is never called
+        """
+        # ARRANGE
+        check_count = 0
 
         def mock_check():
             nonlocal check_count
             check_count += 1
-            original_check()
 
         lockout_manager.check_expired_lockouts = mock_check
 
         # ACT
         task = asyncio.create_task(lockout_manager.start_background_task())
-        await asyncio.sleep(2.5)  # Run for 2.5 seconds
+        await asyncio.sleep(0.2)
         task.cancel()
 
         try:
@@ -324,7 +347,44 @@ class TestBackgroundTask:
             pass
 
         # ASSERT
-        assert check_count >= 2  # Should run at least 2 times in 2.5 seconds
+        assert check_count == 0
+
+    def test_expired_lockout_reads_unlocked_before_cleanup(self, lockout_manager):
+        """
+        GIVEN: Lockout whose deadline has passed, expiry job not run yet
+        WHEN: is_locked_out() is called
+        THEN: Account reads as unlocked; the job clears the state later
+        """
+        # ARRANGE
+        account_id = 123
+        until = datetime.now(timezone.utc) - timedelta(seconds=1)
+        lockout_manager.set_lockout(account_id, "Test", until)
+
+        # ACT / ASSERT
+        assert lockout_manager.is_locked_out(account_id) is False
+        assert lockout_manager.get_lockout_info(account_id) is None
+        assert account_id in lockout_manager.lockout_state
+
+        lockout_manager.check_expired_lockouts()
+        assert account_id not in lockout_manager.lockout_state
+
+    def test_expiry_only_touches_due_lockouts(self, lockout_manager):
+        """
+        GIVEN: One expired and one active lockout
+        WHEN: check_expired_lockouts() runs
+        THEN: Only the expired one is cleared; next_expiry() is the active one
+        """
+        # ARRANGE
+        now = datetime.now(timezone.utc)
+        lockout_manager.set_lockout(1, "Expired", now - timedelta(seconds=1))
+        lockout_manager.set_lockout(2, "Active", now + timedelta(hours=1))
+
+        # ACT
+        lockout_manager.check_expired_lockouts()
+
+        # ASSERT
+        assert list(lockout_manager.lockout_state) == [2]
+        assert lockout_manager.next_expiry() == now + timedelta(hours=1)
 
     @pytest.mark.asyncio
     async def test_expired_lockout_auto_cleared(self, lockout_manager):
@@ -211,3 +211,80 @@ class TestPnLTrackerEdgeCases:
         assert all_pnls["ACCOUNT-001"] == -200.0
         assert all_pnls["ACCOUNT-002"] == -300.0
         assert all_pnls["ACCOUNT-003"] == 100.0
+
+
+class TestPnLTrackerLedger:
+    """Test the in-memory ledger and its persistence."""
+
+    def test_reads_do_not_touch_database(self, temp_db):
+        tracker = PnLTracker(temp_db)
+        tracker.add_trade_pnl("ACC-1", -100.0)
+
+        temp_db.execute = None  # Any SQL read would now fail
+        temp_db.execute_one = None
+
+        assert tracker.add_trade_pnl("ACC-1", -50.0) == -150.0
+        assert tracker.get_daily_pnl("ACC-1") == -150.0
+        assert tracker.get_trade_count("ACC-1") == 2
+        assert tracker.get_stats("ACC-1") == {"realized_pnl": -150.0, "trade_count": 2}
+        assert tracker.get_all_daily_pnls() == {"ACC-1": -150.0}
+
+    def test_disk_matches_ledger_after_upserts(self, temp_db):
+        tracker = PnLTracker(temp_db)
+        for pnl in (-100.0, 40.0, -15.0):
+            tracker.add_trade_pnl("ACC-1", pnl)
+        tracker.reset_daily_pnl("ACC-1")
+        tracker.add_trade_pnl("ACC-1", -20.0)
+
+        row = temp_db.execute_one(
+            "SELECT realized_pnl, trade_count FROM daily_pnl WHERE account_id = ? AND date = ?",
+            ("ACC-1", date.today().isoformat()),
+        )
+        assert (row["realized_pnl"], row["trade_count"]) == (-20.0, 1)
+
+    def test_scheduler_reset_clears_ledger(self, temp_db):
+        from risk_manager.state.reset_scheduler import ResetScheduler
+
+        tracker = PnLTracker(temp_db)
+        tracker.add_trade_pnl("123", -400.0)
+        scheduler = ResetScheduler(database=temp_db, pnl_tracker=tracker)
+
+        scheduler.trigger_reset_manually("123", "daily")
+
+        assert tracker.get_daily_pnl("123") == 0.0
+        assert PnLTracker(temp_db).get_daily_pnl("123") == 0.0
+
+    def test_first_fill_after_midnight_stays_in_memory(self, temp_db):
+        from risk_manager.core.clock import VirtualClock
+
+        clock = VirtualClock(datetime(2025, 1, 17, 23, 30))
+        tracker = PnLTracker(temp_db, clock=clock)
+        clock.advance(3600)  # Now 2025-01-18 00:30
+
+        temp_db.execute = None  # Any SQL read would now fail
+
+        assert tracker.add_trade_pnl("ACC-1", -50.0) == -50.0
+        assert tracker.get_daily_pnl("ACC-1", date(2025, 1, 18)) == -50.0
+
+    def test_roll_over_drops_old_days(self, temp_db):
+        from risk_manager.core.clock import VirtualClock
+
+        clock = VirtualClock(datetime(2025, 1, 17, 12, 0))
+        tracker = PnLTracker(temp_db, clock=clock)
+        tracker.add_trade_pnl("ACC-1", -100.0)
+        clock.advance(3 * 86400)
+
+        tracker.roll_over()
+
+        assert sorted(tracker._ledger) == ["2025-01-20", "2025-01-21"]
+        assert tracker.get_daily_pnl("ACC-1", date(2025, 1, 17)) == -100.0  # Reloaded from disk
+
+    def test_scheduler_job_registered(self, temp_db):
+        from risk_manager.core.scheduler import Scheduler
+
+        scheduler = Scheduler()
+        tracker = PnLTracker(temp_db, scheduler=scheduler)
+
+        job = scheduler.get_job(PnLTracker.JOB_NAME)
+        assert job is not None and job.interval == PnLTracker.ROLLOVER_INTERVAL
+        assert tracker._job is job
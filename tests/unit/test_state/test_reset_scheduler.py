@@ -15,6 +15,7 @@ from unittest.mock import Mock, AsyncMock, call, patch
 import asyncio
 from zoneinfo import ZoneInfo
 
+from risk_manager.core.clock import VirtualClock
 from risk_manager.state.database import Database
 from risk_manager.state.reset_scheduler import ResetScheduler
 
@@ -379,39 +380,62 @@ class TestDatabasePersistence:
 
 
 # =============================================================================
-# CATEGORY 5: BACKGROUND TASK (3 tests)
+# CATEGORY 5: BACKGROUND TASK (4 tests)
 # =============================================================================
 
 
 class TestBackgroundTask:
-    """Test background task that checks for reset time every minute."""
+    """Test background task that sleeps until the next reset."""
 
     @pytest.mark.asyncio
-    async def test_background_task_checks_every_minute(self, reset_scheduler):
+    async def test_background_task_fires_at_reset_time(self, temp_db, mock_pnl_tracker):
         """
-        GIVEN: Background task started
-        WHEN: Multiple minutes pass
-        THEN: check_reset_time() is called repeatedly
+        GIVEN: Daily reset scheduled, 0.2s before 5:00 PM ET
+        WHEN: The clock passes the reset time
+        THEN: The job wakes at the reset and triggers it once
+        """
+        # ARRANGE
+        clock = VirtualClock(datetime(2025, 1, 17, 21, 59, 59, 800000, tzinfo=timezone.utc))
+        reset_scheduler = ResetScheduler(database=temp_db, pnl_tracker=mock_pnl_tracker, clock=clock)
+        reset_scheduler.schedule_daily_reset("123", "17:00")
+
+        # ACT
+        await reset_scheduler.start()
+        clock.advance(0.3)
+        await asyncio.sleep(0.4)
+
+        # ASSERT
+        mock_pnl_tracker.reset_daily_pnl.assert_called_once_with("123")
+        assert reset_scheduler.get_next_reset_time("123") == datetime(
+            2025, 1, 18, 22, 0, tzinfo=timezone.utc
+        )
+        assert reset_scheduler._seconds_until_next() == ResetScheduler.MAX_SLEEP
+
+        await reset_scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_background_task_idle_without_schedules(self, reset_scheduler):
+        """
+        GIVEN: Background task started with no resets scheduled
+        WHEN: Time passes
+        THEN: check_reset_time() is never called
         """
         # ARRANGE
         check_count = 0
-        original_check = reset_scheduler.check_reset_time
 
         def mock_check():
             nonlocal check_count
             check_count += 1
-            original_check()
 
         reset_scheduler.check_reset_time = mock_check
 
         # ACT
         await reset_scheduler.start()
-        await asyncio.sleep(2.5)  # Run for 2.5 seconds
+        await asyncio.sleep(0.2)
         await reset_scheduler.stop()
 
         # ASSERT
-        # With 1-second interval for testing, should run at least 2 times
-        assert check_count >= 2
+        assert check_count == 0
 
     @pytest.mark.asyncio
     async def test_reset_triggered_automatically_at_time(self, reset_scheduler, mock_pnl_tracker):
@@ -645,3 +645,92 @@ async def test_start_timer_without_callback_raises_error(timer_manager):
             duration=5,
             callback=None
         )
+
+
+# ============================================================================
+# Category 6: Deadline Scheduling
+# ============================================================================
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_sub_second_timer_fires_at_deadline(timer_manager):
+    """
+    GIVEN: TimerManager is running
+    WHEN: A 0.2s timer is started
+    THEN: Its callback runs within milliseconds of the deadline
+    """
+    loop = asyncio.get_running_loop()
+    fired = loop.create_future()
+    started = loop.time()
+
+    await timer_manager.start_timer(
+        name="grace",
+        duration=0.2,
+        callback=lambda: fired.set_result(loop.time())
+    )
+    late_by = await asyncio.wait_for(fired, timeout=2) - started - 0.2
+
+    assert 0 <= late_by < 0.05, f"Timer fired {late_by * 1000:.1f}ms after its deadline"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_earlier_timer_wakes_sleeping_loop(timer_manager):
+    """
+    GIVEN: The loop is sleeping towards a distant deadline
+    WHEN: A timer with an earlier deadline is started
+    THEN: The earlier timer fires on time, not after the sleep
+    """
+    loop = asyncio.get_running_loop()
+    fired = loop.create_future()
+
+    await timer_manager.start_timer(name="far", duration=60, callback=Mock())
+    await asyncio.sleep(0.05)  # Loop is now waiting
+    started = loop.time()
+    await timer_manager.start_timer(
+        name="near",
+        duration=0.1,
+        callback=lambda: fired.set_result(loop.time())
+    )
+
+    assert await asyncio.wait_for(fired, timeout=2) - started < 0.15
+    assert timer_manager.has_timer("far")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_reschedule_fires_once_at_new_deadline(timer_manager):
+    """
+    GIVEN: A timer that is rescheduled several times under the same name
+    WHEN: The final deadline passes
+    THEN: The callback runs once, and stale heap entries don't fire it early
+    """
+    callback = Mock()
+
+    for _ in range(5):
+        await timer_manager.start_timer(name="position_1", duration=0.3, callback=callback)
+        await asyncio.sleep(0.1)
+
+    callback.assert_not_called()
+    await asyncio.sleep(0.35)
+    callback.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cancelled_timers_do_not_grow_heap():
+    """
+    GIVEN: Many timers started and cancelled
+    WHEN: Cancellation leaves stale heap entries
+    THEN: The heap is compacted and stays proportional to live timers
+    """
+    from risk_manager.state.timer_manager import TimerManager
+
+    manager = TimerManager()
+    for i in range(10_000):
+        await manager.start_timer(name=f"t{i}", duration=60, callback=Mock())
+        manager.cancel_timer(f"t{i}")
+
+    assert manager.get_timer_count() == 0
+    assert len(manager._heap) <= 64 + 1
+    assert manager.next_expiry() is None
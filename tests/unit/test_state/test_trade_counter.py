@@ -0,0 +1,129 @@
+"""
+Tests for TradeCounter
+
+Tests in-memory trade frequency windows: rolling-window expiry on a
+virtual clock, session roll-over, duplicate trade IDs, hydration from the
+trades table, and TradeFrequencyLimitRule counting without SQL.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from risk_manager.core.clock import VirtualClock
+from risk_manager.core.events import EventType, RiskEvent
+from risk_manager.rules.trade_frequency_limit import TradeFrequencyLimitRule
+from risk_manager.state.database import Database
+from risk_manager.state.trade_counter import TradeCounter
+
+START = datetime(2025, 1, 17, 14, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock(START)
+
+
+@pytest.fixture
+def db(tmp_path, clock):
+    database = Database(tmp_path / "trades.db", clock=clock)
+    yield database
+    database.close()
+
+
+class TestWindows:
+    """Test rolling window and session counts."""
+
+    def test_windows_expire_on_clock(self, clock):
+        counter = TradeCounter(clock=clock)
+        counter.record("123", trade_id=1)
+        clock.advance(30)
+        counter.record("123", trade_id=2)
+
+        assert counter.count("123", 60) == 2
+        clock.advance(31)
+        assert counter.count("123", 60) == 1
+        assert counter.count("123", 3600) == 2
+        assert counter.session_count("123") == 2
+
+    def test_session_rolls_at_daily_reset(self, clock):
+        counter = TradeCounter(clock=clock)
+        counter.record("123", trade_id=1)
+
+        clock.set(datetime(2025, 1, 17, 21, 59, 59, tzinfo=timezone.utc))  # 16:59:59 ET
+        assert counter.session_count("123") == 1
+
+        clock.set(datetime(2025, 1, 17, 22, 0, 1, tzinfo=timezone.utc))  # 17:00:01 ET
+        assert counter.session_count("123") == 0
+
+    def test_duplicate_trade_ids_counted_once(self, clock):
+        counter = TradeCounter(clock=clock)
+
+        assert counter.record(123, trade_id=42) is True
+        assert counter.record("123", trade_id="42") is False
+        assert counter.count("123", 60) == 1
+
+    def test_accounts_independent(self, clock):
+        counter = TradeCounter(clock=clock)
+        counter.record("123", trade_id=1)
+
+        assert counter.count("456", 60) == 0
+        assert counter.session_count("456") == 0
+
+    def test_untracked_window_rejected(self, clock):
+        with pytest.raises(KeyError):
+            TradeCounter(clock=clock).count("123", 300)
+
+
+class TestPersistence:
+    """Test hydration from and persistence to the trades table."""
+
+    def test_recorded_trades_reach_database(self, db, clock):
+        counter = TradeCounter(database=db, clock=clock)
+        counter.record("123", trade_id=1, symbol="MNQ", side="buy", quantity=1, price=21000.0)
+        counter.record("123", trade_id=1)  # Duplicate delivery
+
+        assert db.get_trade_count("123", window=60) == 1
+
+    def test_hydrate_restores_counts(self, db, clock):
+        db.add_trade("123", "T1", "MNQ", "buy", 1, 21000.0, timestamp=START - timedelta(minutes=90))
+        db.add_trade("123", "T2", "MNQ", "sell", 1, 21001.0, timestamp=START - timedelta(minutes=30))
+        db.add_trade("123", "T3", "MNQ", "buy", 1, 21002.0, timestamp=START - timedelta(seconds=10))
+
+        counter = TradeCounter(database=db, clock=clock)
+
+        assert counter.hydrate() == 3
+        assert counter.count("123", 60) == 1
+        assert counter.count("123", 3600) == 2
+        assert counter.session_count("123") == 3
+        assert counter.record("123", trade_id="T3") is False
+
+
+@pytest.mark.asyncio
+class TestRuleWithCounter:
+    """Test TradeFrequencyLimitRule reading counts from memory."""
+
+    async def test_breach_without_database_reads(self, clock):
+        db = Mock()
+        rule = TradeFrequencyLimitRule(
+            limits={"per_minute": 3, "per_hour": 10, "per_session": 50},
+            cooldown_on_breach={"per_minute_breach": 60},
+            timer_manager=Mock(start_timer=AsyncMock()),
+            db=db,
+            trade_counter=TradeCounter(clock=clock),
+        )
+
+        violations = []
+        for trade_id in range(4):
+            event = RiskEvent(
+                event_type=EventType.TRADE_EXECUTED,
+                data={"account_id": 123, "trade_id": trade_id, "symbol": "MNQ"},
+            )
+            violations.append(await rule.evaluate(event, Mock()))
+
+        assert violations[:3] == [None, None, None]
+        assert violations[3]["breach_type"] == "per_minute"
+        assert violations[3]["trade_count"] == 4
+        db.get_trade_count.assert_not_called()
+        db.get_session_trade_count.assert_not_called()
@@ -4,10 +4,11 @@ Unit tests for UnrealizedPnLCalculator module.
 Tests position tracking and P&L calculations (both unrealized and realized).
 """
 
-import pytest
 from decimal import Decimal
-from risk_manager.integrations.unrealized_pnl import UnrealizedPnLCalculator
 
+import pytest
+
+from risk_manager.integrations.unrealized_pnl import UnrealizedPnLCalculator
 
 # ============================================================================
 # Fixtures
@@ -390,6 +391,178 @@ def test_clear_all(calculator, mnq_long_position):
     assert calculator.calculate_total_unrealized_pnl() == Decimal('0')
 
 
+# ============================================================================
+# Test: Integer Tick Arithmetic
+# ============================================================================
+
+def test_integer_cents_match_decimal(calculator, mnq_long_position, es_long_position):
+    """Test that the cents variants agree with the Decimal results."""
+    calculator.update_position('CON.F.US.MNQ.Z25', mnq_long_position)
+    calculator.update_position('CON.F.US.ES.Z25', es_long_position)
+    calculator.update_quote('MNQ', 21487.25)  # -51 ticks x $0.50 x 2 = -$51
+    calculator.update_quote('ES', 5210.75)    # +43 ticks x $12.50 x 1 = +$537.50
+
+    assert calculator.calculate_unrealized_pnl_cents('CON.F.US.MNQ.Z25') == -5100
+    assert calculator.calculate_unrealized_pnl('CON.F.US.MNQ.Z25') == Decimal('-51.00')
+    assert calculator.calculate_total_unrealized_pnl_cents() == 48650
+    assert calculator.calculate_total_unrealized_pnl() == Decimal('486.50')
+
+
+def test_float_prices_are_exact(calculator):
+    """Test that binary float noise does not leak into P&L."""
+    calculator.update_position('CON.F.US.RTY.Z25', {
+        'price': 2000.1, 'size': 3, 'side': 'long', 'symbol': 'RTY',
+    })
+    calculator.update_quote('RTY', 2000.1 + 0.2)  # 2000.3000000000002
+
+    # 2 ticks x $5.00 x 3
+    assert calculator.calculate_unrealized_pnl('CON.F.US.RTY.Z25') == Decimal('30.00')
+
+
+def test_off_tick_price_keeps_fractional_ticks(calculator, mnq_long_position):
+    """Test that a price off the tick grid gives the exact fractional P&L."""
+    calculator.update_position('CON.F.US.MNQ.Z25', mnq_long_position)
+
+    # 0.1 points = 0.4 ticks x $0.50 x 2 = $0.40
+    assert calculator.calculate_unrealized_pnl_at('CON.F.US.MNQ.Z25', 21500.1) == Decimal('0.40')
+    # 0.01 points = 0.04 ticks x $0.50 x 2 = $0.04
+    assert calculator.calculate_realized_pnl('CON.F.US.MNQ.Z25', 21500.01) == Decimal('0.04')
+
+
+# ============================================================================
+# Test: Incremental Symbol Aggregates
+# ============================================================================
+
+def _sum_of_positions(calculator):
+    return sum(
+        calculator.calculate_unrealized_pnl(cid) or Decimal('0')
+        for cid in calculator.get_open_positions()
+    )
+
+
+def test_aggregates_follow_position_changes(calculator, mnq_long_position, mnq_short_position):
+    """Test that the running total matches the per-position sum after every change."""
+    calculator.update_quote('MNQ', 21525.00)
+    calculator.update_position('MNQ-1', mnq_long_position)
+    calculator.update_position('MNQ-2', {**mnq_short_position, 'size': 3})
+    calculator.update_position('ES-1', {'price': 5200.00, 'size': 1, 'side': 'long', 'symbol': 'ES'})
+    assert calculator.calculate_total_unrealized_pnl() == _sum_of_positions(calculator)
+
+    # Re-tracking replaces the old contribution
+    calculator.update_position('MNQ-1', {**mnq_long_position, 'price': 21510.00})
+    assert calculator.calculate_total_unrealized_pnl() == _sum_of_positions(calculator)
+
+    calculator.update_quote('ES', 5201.25)
+    calculator.update_quote('MNQ', 21480.50)
+    assert calculator.calculate_total_unrealized_pnl() == _sum_of_positions(calculator)
+
+    calculator.remove_position('MNQ-2')
+    assert calculator.calculate_total_unrealized_pnl() == _sum_of_positions(calculator)
+    assert calculator.calculate_symbol_unrealized_pnl('MNQ') == calculator.calculate_unrealized_pnl('MNQ-1')
+
+
+def test_symbol_unrealized_pnl(calculator, mnq_long_position, mnq_short_position):
+    """Test per-symbol totals with offsetting positions."""
+    calculator.update_position('MNQ-1', mnq_long_position)
+    calculator.update_position('MNQ-2', mnq_short_position)
+    assert calculator.calculate_symbol_unrealized_pnl('MNQ') == Decimal('0')  # No quote yet
+
+    calculator.update_quote('MNQ', 21540.00)
+
+    # Long 2 from 21500 (+$80) and short 2 from 21500 (-$80) net out
+    assert calculator.calculate_symbol_unrealized_pnl('MNQ') == Decimal('0.00')
+    assert calculator.calculate_symbol_unrealized_pnl('ES') == Decimal('0')
+
+
+def test_symbol_index_drops_closed_positions(calculator, mnq_long_position):
+    """Test that removing the last position of a symbol empties its index."""
+    calculator.update_position('MNQ-1', mnq_long_position)
+    calculator.update_quote('MNQ', 21550.00)
+
+    calculator.remove_position('MNQ-1')
+
+    assert calculator.get_positions_by_symbol('MNQ') == {}
+    assert calculator.calculate_total_unrealized_pnl_cents() == 0
+
+
+# ============================================================================
+# Test: Price Triggers
+# ============================================================================
+
+def test_profit_target_triggers_long_and_short(calculator, mnq_long_position, mnq_short_position):
+    """Test that profit targets fire on the first quote at the breach price."""
+    calculator.set_pnl_limits(profit_target=100.0)
+    calculator.update_position('MNQ-L', mnq_long_position)
+    calculator.update_position('MNQ-S', {**mnq_short_position, 'price': 21450.00})
+
+    # Long 2 @ 21500 reaches $100 at 21525.00, short 2 @ 21450 at 21425.00
+    calculator.update_quote('MNQ', 21524.75)
+    assert calculator.check_pnl_triggers('MNQ') == []
+
+    calculator.update_quote('MNQ', 21525.00)
+    assert sorted(calculator.check_pnl_triggers('MNQ')) == ['MNQ-L', 'MNQ-S']
+    assert calculator.check_pnl_triggers('MNQ') == []  # Reported once
+
+    calculator.update_quote('MNQ', 21480.00)  # Back between the levels
+    assert calculator.check_pnl_triggers('MNQ') == []
+    calculator.update_quote('MNQ', 21425.00)
+    assert calculator.calculate_unrealized_pnl('MNQ-S') == Decimal('100.00')
+    assert sorted(calculator.check_pnl_triggers('MNQ')) == ['MNQ-L', 'MNQ-S']
+
+
+def test_loss_limit_triggers_on_total(calculator, mnq_long_position, es_long_position):
+    """Test that the account-wide loss limit fires on the running total."""
+    calculator.set_pnl_limits(loss_limit=-100.0)
+    calculator.update_position('MNQ-1', mnq_long_position)
+    calculator.update_position('ES-1', es_long_position)
+    calculator.update_quote('ES', 5199.00)  # -$50
+
+    calculator.update_quote('MNQ', 21487.75)  # -$49
+    assert calculator.check_pnl_triggers('MNQ') == []
+
+    calculator.update_quote('MNQ', 21487.50)  # -$50, total -$100
+    assert calculator.check_pnl_triggers('MNQ') == ['MNQ-1']
+    assert calculator.check_pnl_triggers('ES') == []  # Still breached, already reported
+
+
+def test_triggers_rearm_on_position_change(calculator, mnq_long_position):
+    """Test that triggers are recomputed when positions change."""
+    calculator.set_pnl_limits(profit_target=100.0)
+    calculator.update_position('MNQ-1', mnq_long_position)
+    calculator.update_quote('MNQ', 21530.00)
+    assert calculator.check_pnl_triggers('MNQ') == ['MNQ-1']
+
+    # Scaling in at a higher entry moves the trigger up
+    calculator.update_position('MNQ-1', {**mnq_long_position, 'price': 21520.00})
+    assert calculator.check_pnl_triggers('MNQ') == []
+    calculator.update_quote('MNQ', 21545.00)
+    assert calculator.check_pnl_triggers('MNQ') == ['MNQ-1']
+
+
+def test_would_trigger_at_matches_check_without_applying(calculator, mnq_long_position):
+    """Test that an incoming price is checked without touching quote or breach state."""
+    calculator.set_pnl_limits(loss_limit=-100.0)
+    calculator.update_position('MNQ-1', mnq_long_position)
+    assert calculator.would_trigger_at('MNQ', 21500.00)  # No price yet
+    calculator.update_quote('MNQ', 21500.00)
+
+    assert not calculator.would_trigger_at('MNQ', 21475.25)  # -$99
+    assert calculator.would_trigger_at('MNQ', 21475.00)  # -$100
+    assert calculator.calculate_unrealized_pnl('MNQ-1') == Decimal('0.00')
+
+    calculator.update_quote('MNQ', 21475.00)
+    assert calculator.check_pnl_triggers('MNQ') == ['MNQ-1']
+    assert not calculator.would_trigger_at('MNQ', 21470.00)  # Already reported
+
+
+def test_no_triggers_without_limits(calculator, mnq_long_position):
+    """Test that nothing fires when no limits are set."""
+    calculator.update_position('MNQ-1', mnq_long_position)
+    calculator.update_quote('MNQ', 30000.00)
+
+    assert calculator.check_pnl_triggers('MNQ') == []
+
+
 # ============================================================================
 # Summary
 # ============================================================================
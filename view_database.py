@@ -8,6 +8,11 @@ Usage:
     python view_database.py pnl          # Show only P&L data
     python view_database.py trades       # Show only trades
     python view_database.py timers       # Show only timers
+    python view_database.py symbols      # Show per-symbol stats
+    python view_database.py violations   # Show violation frequency
+
+P&L, trades, symbols and violations come from TradeAnalytics, so they
+include history already moved to the Parquet archive (data/archive/).
 """
 
 import sqlite3
@@ -15,6 +20,11 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from risk_manager.state.analytics import TradeAnalytics
+from risk_manager.state.database import Database
+
 
 def view_lockouts(cursor):
     """Show active lockouts."""
@@ -86,54 +96,42 @@ def view_all_lockouts(cursor):
     print('=' * 80)
 
 
-def view_pnl(cursor):
-    """Show P&L tracking data."""
+def view_pnl(analytics):
+    """Show the daily P&L curve (last 2 weeks)."""
     print('\nDAILY P&L TRACKING:')
     print('=' * 80)
 
-    cursor.execute('''
-        SELECT account_id, date, realized_pnl, trade_count, updated_at
-        FROM daily_pnl
-        ORDER BY date DESC
-        LIMIT 10
-    ''')
-    rows = cursor.fetchall()
+    rows = analytics.pnl_curve(weeks=2).sort("date", descending=True).rows(named=True)
 
     if not rows:
         print('  No P&L data')
     else:
         for row in rows:
-            pnl = float(row["realized_pnl"])
+            pnl = row["realized_pnl"]
             sign = "+" if pnl >= 0 else ""
             print(f'\n  Account: {row["account_id"]} | Date: {row["date"]}')
             print(f'    Realized P&L: ${sign}{pnl:,.2f}')
+            print(f'    Cumulative:   ${row["cumulative_pnl"]:,.2f} (drawdown ${row["drawdown"]:,.2f})')
             print(f'    Trade Count:  {row["trade_count"]}')
-            print(f'    Last Update:  {row["updated_at"]}')
 
     print(f'\n  Total records: {len(rows)}')
     print('=' * 80)
 
 
-def view_trades(cursor):
-    """Show recent trades."""
+def view_trades(analytics):
+    """Show recent trades (live and archived)."""
     print('\nRECENT TRADES:')
     print('=' * 80)
 
-    cursor.execute('''
-        SELECT id, account_id, symbol, side, quantity, price, realized_pnl, timestamp
-        FROM trades
-        ORDER BY timestamp DESC
-        LIMIT 20
-    ''')
-    rows = cursor.fetchall()
+    rows = analytics.recent_trades(limit=20).rows(named=True)
 
     if not rows:
         print('  No trades in database')
     else:
         for row in rows:
-            pnl = float(row["realized_pnl"]) if row["realized_pnl"] else 0.0
+            pnl = row["realized_pnl"] or 0.0
             sign = "+" if pnl >= 0 else ""
-            print(f'\n  Trade ID: {row["id"]} | {row["symbol"]} {row["side"]} {row["quantity"]} @ ${row["price"]:,.2f}')
+            print(f'\n  Trade ID: {row["trade_id"]} | {row["symbol"]} {row["side"]} {row["quantity"]} @ ${row["price"]:,.2f}')
             print(f'    Account:      {row["account_id"]}')
             print(f'    Realized P&L: ${sign}{pnl:,.2f}')
             print(f'    Timestamp:    {row["timestamp"]}')
@@ -142,6 +140,43 @@ def view_trades(cursor):
     print('=' * 80)
 
 
+def view_symbols(analytics):
+    """Show per-symbol stats (last 4 weeks)."""
+    print('\nSYMBOL STATS (LAST 4 WEEKS):')
+    print('=' * 80)
+
+    rows = analytics.symbol_stats(weeks=4).rows(named=True)
+
+    if not rows:
+        print('  No trades in the last 4 weeks')
+    else:
+        for row in rows:
+            win_rate = f'{row["win_rate"]:.0%}' if row["win_rate"] is not None else 'N/A'
+            print(f'\n  {row["symbol"]}: {row["trades"]} trades, {row["contracts"]} contracts')
+            print(f'    Realized P&L: ${row["realized_pnl"] or 0.0:,.2f}')
+            print(f'    Win Rate:     {win_rate} ({row["wins"]}W / {row["losses"]}L)')
+
+    print('=' * 80)
+
+
+def view_violations(analytics):
+    """Show how often each rule locked accounts out (last 4 weeks)."""
+    print('\nVIOLATION FREQUENCY (LAST 4 WEEKS):')
+    print('=' * 80)
+
+    rows = analytics.violation_frequency(weeks=4).rows(named=True)
+
+    if not rows:
+        print('  No violations in the last 4 weeks')
+    else:
+        for row in rows:
+            print(f'\n  {row["rule_id"]}: {row["violations"]} violations ({row["per_day"]:.2f}/day)')
+            print(f'    Accounts: {row["accounts"]}')
+            print(f'    Last:     {row["last_at"]}')
+
+    print('=' * 80)
+
+
 def view_timers(cursor):
     """Show active timers."""
     print('\nACTIVE TIMERS:')
@@ -195,6 +230,8 @@ def main():
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
+    database = Database(db_path)
+    analytics = TradeAnalytics(database, db_path.parent / 'archive')
 
     print('\n' + '=' * 80)
     print('  RISK MANAGER V34 - DATABASE VIEWER')
@@ -210,23 +247,28 @@ def main():
             view_lockouts(cursor)
             view_all_lockouts(cursor)
         elif view_type == 'pnl':
-            view_pnl(cursor)
+            view_pnl(analytics)
         elif view_type == 'trades':
-            view_trades(cursor)
+            view_trades(analytics)
         elif view_type == 'timers':
             view_timers(cursor)
+        elif view_type == 'symbols':
+            view_symbols(analytics)
+        elif view_type == 'violations':
+            view_violations(analytics)
         else:
             print(f'\nERROR: Unknown view type: {view_type}')
-            print('       Valid options: lockouts, pnl, trades, timers')
+            print('       Valid options: lockouts, pnl, trades, timers, symbols, violations')
     else:
         # Show everything
         view_lockouts(cursor)
         view_timers(cursor)
-        view_pnl(cursor)
-        view_trades(cursor)
+        view_pnl(analytics)
+        view_trades(analytics)
 
     print()
     conn.close()
+    database.close()
 
 
 if __name__ == '__main__':